@@ -0,0 +1,71 @@
+"""Report contrib card size with avatars deduplicated in <defs>.
+
+Builds contributor lists where most repositories belong to a few owners (as
+is typical: a handful of orgs plus some personal projects) and compares the
+rendered card against inlining one <image> per row.
+
+Usage:
+    uv run python benchmarks/avatar_dedup.py [--repos N] [--owners N] [--avatar-kb KB]
+"""
+
+import argparse
+import base64
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.config import ContribCardConfig  # noqa: E402
+from src.rendering.contrib import render_contrib_card  # noqa: E402
+
+# Size of one inlined row avatar (<image> tag around the data) minus its <use>
+_INLINE_IMAGE_OVERHEAD = len(
+    '<image x="0" y="7.5" width="20" height="20" clip-path="url(#avatar-clip)" '
+    'href="data:image/png;base64," />'
+)
+
+
+def _stats(repos: int, owners: int, avatar_kb: int) -> dict:
+    avatars = [
+        base64.b64encode(os.urandom(avatar_kb * 1024)).decode("ascii") for _ in range(owners)
+    ]
+    return {
+        "repos": [
+            {
+                "name": f"owner{i % owners}/repo{i}",
+                "stars": 1000 - i,
+                "commits": 10,
+                "prs": 2,
+                "issues": 1,
+                "reviews": 0,
+                "rank_level": "A",
+                "avatar_b64": avatars[i % owners],
+            }
+            for i in range(repos)
+        ]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=10)
+    parser.add_argument("--owners", type=int, nargs="+", default=[1, 2, 3, 5, 10])
+    parser.add_argument("--avatar-kb", type=int, default=8, help="Raw avatar size in KiB")
+    args = parser.parse_args()
+
+    print(f"{args.repos} repos, {args.avatar_kb} KiB avatars")
+    print(f"{'owners':>6}  {'inline':>10}  {'deduped':>10}  {'saved':>7}")
+    for owners in args.owners:
+        stats = _stats(args.repos, owners, args.avatar_kb)
+        deduped = len(render_contrib_card(stats, ContribCardConfig()).encode("utf-8"))
+        # Every row past the first per owner would repeat the full image
+        repeated = sum(
+            len(repo["avatar_b64"]) + _INLINE_IMAGE_OVERHEAD for repo in stats["repos"][owners:]
+        )
+        inline = deduped + repeated
+        saved = (1 - deduped / inline) * 100
+        print(f"{owners:>6}  {inline:>10}  {deduped:>10}  {saved:>6.1f}%")
+
+
+if __name__ == "__main__":
+    main()
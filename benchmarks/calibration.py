@@ -0,0 +1,74 @@
+"""Measure building a rank calibration table from a large user population.
+
+Feeds N synthetic users' stats to a CalibrationBuilder one row at a time
+(add) and as columns (add_columns), then builds the quantile table, and
+reports wall time and peak traced memory (of a second, traced run) for
+each step.
+
+Usage:
+    uv run python benchmarks/calibration.py [--users N] [--points P]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.github.calibration import CalibrationBuilder  # noqa: E402
+from src.github.stats_store import INT_FIELDS  # noqa: E402
+
+
+def _columns(users: int, seed: int = 0) -> dict[str, array]:
+    """Heavy-tailed counts, roughly shaped like real GitHub activity."""
+    rng = random.Random(seed)
+    return {
+        field: array("q", (int(rng.paretovariate(1.2)) - 1 for _ in range(users)))
+        for field in INT_FIELDS
+    }
+
+
+def _measure(label: str, func) -> None:
+    # Timed without tracing: tracemalloc slows allocation-heavy loops a lot
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:<22} {elapsed:7.2f} s   peak {peak / 1e6:7.1f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--points", type=int, default=1000)
+    args = parser.parse_args()
+    n = args.users
+
+    columns = _columns(n)
+    print(f"{n} users ({sum(c.itemsize * len(c) for c in columns.values()) / 1e6:.0f} MB input)")
+
+    def add_rows() -> None:
+        rows = CalibrationBuilder()
+        row = dict.fromkeys(INT_FIELDS, 0)
+        for i in range(n):
+            for field, column in columns.items():
+                row[field] = column[i]
+            rows.add(row)
+
+    _measure("add (per user)", add_rows)
+
+    _measure("add_columns", lambda: CalibrationBuilder().add_columns(columns))
+    bulk = CalibrationBuilder()
+    bulk.add_columns(columns)
+    _measure(f"build ({args.points} points)", lambda: bulk.build(args.points))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Report CLI cold-start time: import cost and wall time per command.
+
+For each invocation the CLI is started in a fresh interpreter with
+``-X importtime``. Reported are the best wall time over several runs, the
+cumulative import time of src.cli, and the import time of the modules the
+command loads once it actually runs (fetchers and renderers).
+
+Usage:
+    uv run python benchmarks/cold_start.py [--runs N]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+INVOCATIONS = [
+    ["--help"],
+    ["stats", "--help"],
+    ["top-langs", "--help"],
+    ["contrib", "--help"],
+    ["serve", "--help"],
+]
+
+# Modules each command imports when it runs (beyond src.cli itself)
+COMMAND_MODULES = {
+    "stats": ["src.github.fetcher", "src.rendering.stats", "src.rendering.cache"],
+    "top-langs": ["src.github.langs_fetcher", "src.rendering.langs", "src.rendering.cache"],
+    "contrib": ["src.github.fetcher", "src.rendering.contrib", "src.rendering.cache"],
+    "serve": ["src.server"],
+}
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)")
+
+
+def _top_level_import_us(stderr: str) -> dict[str, int]:
+    """Cumulative microseconds of each top-level import in -X importtime output."""
+    times = {}
+    for match in _IMPORTTIME_RE.finditer(stderr):
+        cumulative, indent, module = match.groups()
+        if len(indent) == 1:
+            times[module] = int(cumulative)
+    return times
+
+
+def _run(args: list[str], runs: int) -> tuple[float, int]:
+    """Best wall time (s) and src.cli import time (us) for the CLI with args."""
+    best_wall = float("inf")
+    best_import = sys.maxsize
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "from src.cli import cli; cli()", *args],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        best_wall = min(best_wall, time.perf_counter() - start)
+        best_import = min(best_import, _top_level_import_us(result.stderr).get("src.cli", 0))
+    return best_wall, best_import
+
+
+def _command_import_us(modules: list[str], runs: int) -> int:
+    """Best extra import time (us) of modules on top of src.cli."""
+    code = "import src.cli; " + "; ".join(f"import {m}" for m in modules)
+    best = sys.maxsize
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times = _top_level_import_us(result.stderr)
+        best = min(best, sum(t for m, t in times.items() if m.startswith("src.") and m != "src.cli"))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per invocation (best of)")
+    args = parser.parse_args()
+
+    print(f"{'invocation':<20}  {'wall':>8}  {'src.cli import':>14}  {'on run':>9}")
+    for argv in INVOCATIONS:
+        wall, import_us = _run(argv, args.runs)
+        command = argv[0] if argv[0] in COMMAND_MODULES else None
+        on_run = (
+            f"{_command_import_us(COMMAND_MODULES[command], args.runs) / 1000:>7.1f}ms"
+            if command
+            else f"{'-':>9}"
+        )
+        print(f"{' '.join(argv):<20}  {wall * 1000:>6.1f}ms  {import_us / 1000:>12.1f}ms  {on_run}")
+
+
+if __name__ == "__main__":
+    main()
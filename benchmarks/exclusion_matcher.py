@@ -0,0 +1,84 @@
+"""Benchmark repository exclusion filtering with many patterns.
+
+Compares RepoExclusionMatcher against checking every pattern with fnmatch
+for every repository (the previous is_repo_excluded behaviour), on a mix of
+literal names, owner/name pairs and wildcard patterns.
+
+Usage:
+    uv run python benchmarks/exclusion_matcher.py [--patterns N] [--repos N] [--repeat R]
+"""
+
+import argparse
+import fnmatch
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.utils import RepoExclusionMatcher  # noqa: E402
+
+
+def _naive_excluded(repo_name: str, patterns: list[str]) -> bool:
+    repo_name = repo_name.lower()
+    name_only = repo_name.split("/")[-1]
+    for pattern in patterns:
+        pattern = pattern.lower()
+        target = repo_name if "/" in pattern else name_only
+        if fnmatch.fnmatch(target, pattern):
+            return True
+    return False
+
+
+def _patterns(count: int) -> list[str]:
+    kinds = [
+        lambda i: f"project-{i}",
+        lambda i: f"Org{i % 50}/tool-{i}",
+        lambda i: f"archive-{i}-*",
+        lambda i: f"org{i % 50}/fork-{i}?",
+    ]
+    return [kinds[i % len(kinds)](i) for i in range(count)]
+
+
+def _repos(count: int) -> list[str]:
+    prefixes = ("project", "tool", "archive", "misc")
+    return [f"org{i % 50}/{prefixes[i % 4]}-{i}" for i in range(count)]
+
+
+def _best(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patterns", type=int, default=1000)
+    parser.add_argument("--repos", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    patterns = _patterns(args.patterns)
+    repos = _repos(args.repos)
+
+    naive_kept = [r for r in repos if not _naive_excluded(r, patterns)]
+    compiled_kept = [r for r in repos if not RepoExclusionMatcher(patterns).matches(r)]
+    assert naive_kept == compiled_kept, "matcher disagrees with fnmatch"
+
+    def compiled() -> None:
+        matcher = RepoExclusionMatcher(patterns)
+        [r for r in repos if not matcher.matches(r)]
+
+    naive = _best(lambda: [r for r in repos if not _naive_excluded(r, patterns)], args.repeat)
+    fast = _best(compiled, args.repeat)
+    excluded = len(repos) - len(naive_kept)
+    print(f"{args.patterns} patterns x {args.repos} repos ({excluded} excluded)")
+    print(f"  fnmatch loop: {naive * 1000:9.1f} ms")
+    print(f"  matcher:      {fast * 1000:9.1f} ms  (incl. compile, {naive / fast:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Report GraphQL payload bytes for the contributor card fetch, per user.
+
+Runs fetch_contributor_stats against an in-process fake of the GitHub GraphQL
+API that answers with exactly the fields each query asks for, and compares the
+bytes received with the previous query shape, which requested the HEAD commit
+history of every repository in all four contribution lists.
+
+The synthetic users differ in how many repositories they contribute to and
+how many of those are their own or private (both dropped by the fetcher).
+
+Usage:
+    uv run python benchmarks/graphql_payload.py [--limit N] [--seed S]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.config import ContribFetchConfig  # noqa: E402
+from src.github.client import GitHubClient  # noqa: E402
+from src.github.fetcher import fetch_contributor_stats  # noqa: E402
+
+LISTS = (
+    "commitContributionsByRepository",
+    "pullRequestContributionsByRepository",
+    "issueContributionsByRepository",
+    "pullRequestReviewContributionsByRepository",
+)
+YEARS = [2025, 2024, 2023, 2022, 2021]
+
+# (label, repositories per list and year, share owned by the user, share private)
+USERS = [
+    ("casual", 10, 0.6, 0.1),
+    ("maintainer", 40, 0.3, 0.1),
+    ("org member", 80, 0.2, 0.5),
+    ("prolific", 100, 0.1, 0.05),
+]
+
+
+class _Response:
+    def __init__(self, payload: dict):
+        self.content = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return json.loads(self.content)
+
+
+class FakeGitHub:
+    """Session stand-in answering the contributor card queries."""
+
+    def __init__(self, login: str, per_list: int, own: float, private: float, seed: int):
+        rng = random.Random(seed)
+        self.login = login
+        self.repos = {}
+        for i in range(per_list * 3):
+            owner = login if rng.random() < own else f"org{i % 7}"
+            self.repos[f"{owner}/project-{i}"] = {
+                "private": rng.random() < private,
+                "stars": int(rng.paretovariate(1.2) * 10),
+                "history": rng.randint(10, 20000),
+            }
+        names = list(self.repos)
+        self.lists = {
+            (year, key): rng.sample(names, per_list) for year in YEARS for key in LISTS
+        }
+        self.bytes = 0
+        self.requests = 0
+        self.history_everywhere = False
+
+    def _repository(self, name: str, with_history: bool) -> dict:
+        repo = self.repos[name]
+        node = {
+            "nameWithOwner": name,
+            "isPrivate": repo["private"],
+            "owner": {
+                "login": name.split("/")[0],
+                "avatarUrl": f"https://avatars.githubusercontent.com/u/{zlib.crc32(name.encode())}?v=4",
+            },
+            "stargazers": {"totalCount": repo["stars"]},
+        }
+        if with_history:
+            node["object"] = {"history": {"totalCount": repo["history"]}}
+        return node
+
+    def _answer(self, query: str, variables: dict) -> dict:
+        if "contributionYears" in query:
+            return {"data": {"user": {"contributionsCollection": {"contributionYears": YEARS}}}}
+        if "repoHistory" in query:
+            data = {}
+            for alias, owner, name in re.findall(
+                r'(r\d+): repository\(owner: "([^"]*)", name: "([^"]*)"\)', query
+            ):
+                history = self.repos[f"{owner}/{name}"]["history"]
+                data[alias] = {"object": {"history": {"totalCount": history}}}
+            return {"data": data}
+
+        year = int(variables["from"][:4])
+        sections = dict(zip(LISTS, query.split("ContributionsByRepository")[1:]))
+        collection = {
+            key: [
+                {
+                    "repository": self._repository(
+                        name, self.history_everywhere or "history" in sections[key]
+                    ),
+                    "contributions": {"totalCount": 1 + len(name) % 9},
+                }
+                for name in self.lists[(year, key)]
+            ]
+            for key in LISTS
+        }
+        return {"data": {"user": {"contributionsCollection": collection}}}
+
+    def post(self, url: str, json: dict, **kwargs) -> _Response:
+        response = _Response(self._answer(json["query"], json["variables"]))
+        if self.history_everywhere and "repoHistory" in json["query"]:
+            # The previous queries already carried every history
+            return response
+        self.bytes += len(response.content)
+        self.requests += 1
+        return response
+
+    def get(self, url: str, **kwargs) -> _Response:
+        # Avatars are fetched the same way before and after; leave them out
+        return _Response({})
+
+
+def _measure(fake: FakeGitHub, limit: int, history_everywhere: bool) -> tuple[int, int]:
+    fake.bytes = fake.requests = 0
+    fake.history_everywhere = history_everywhere
+    config = ContribFetchConfig(username=fake.login, token="token", limit=limit)
+    fetch_contributor_stats(config, client=GitHubClient("token", session=fake))
+    return fake.bytes, fake.requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=10, help="Repositories on the card")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{len(YEARS)} years, card limit {args.limit}")
+    print(f"{'user':<12} {'repos':>5} {'before':>10} {'after':>10} {'saved':>7}  requests")
+    for label, per_list, own, private in USERS:
+        fake = FakeGitHub("me", per_list, own, private, args.seed)
+        before, before_requests = _measure(fake, args.limit, history_everywhere=True)
+        after, after_requests = _measure(fake, args.limit, history_everywhere=False)
+        saved = (1 - after / before) * 100
+        print(
+            f"{label:<12} {per_list:>5} {before:>10} {after:>10} {saved:>6.1f}%"
+            f"  {before_requests} -> {after_requests}"
+        )
+
+
+if __name__ == "__main__":
+    main()
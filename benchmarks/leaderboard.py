@@ -0,0 +1,104 @@
+"""Measure leaderboard selection and member fetch concurrency.
+
+Ranks N synthetic members by rank percentile and by stars, comparing the
+top-k selection fetch_leaderboard uses (heap over UserStatsStore columns)
+with fully sorting every member's stats, then times fetching members
+through a stand-in with fixed latency at several concurrency levels.
+
+Usage:
+    uv run python benchmarks/leaderboard.py [--users N] [--limit K] [--latency MS]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.config import LeaderboardFetchConfig  # noqa: E402
+from src.github.leaderboard import _top_entries, fetch_leaderboard  # noqa: E402
+from src.github.rank import calculate_user_rank  # noqa: E402
+from src.github.stats_store import INT_FIELDS, UserStatsStore  # noqa: E402
+
+
+def _users(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "name": "",
+            "login": f"user-{i}",
+            **{field: int(rng.paretovariate(1.2)) - 1 for field in INT_FIELDS},
+        }
+        for i in range(n)
+    ]
+
+
+def _full_sort(users: list[dict], sort_by: str, limit: int) -> list[str]:
+    """Baseline: rank every member, then sort them all."""
+    if sort_by == "stars":
+        ordered = sorted(users, key=lambda stats: stats["totalStars"], reverse=True)
+        return [stats["login"] for stats in ordered[:limit]]
+    ranked = [
+        (
+            calculate_user_rank(
+                stats["totalCommits"],
+                stats["totalPRs"],
+                stats["totalIssues"],
+                stats["totalReviews"],
+                stats["totalStars"],
+                stats["followers"],
+            )["percentile"],
+            stats["login"],
+        )
+        for stats in users
+    ]
+    ranked.sort()
+    return [login for _, login in ranked[:limit]]
+
+
+def _best(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=5.0, help="simulated ms per fetch")
+    args = parser.parse_args()
+    users = _users(args.users)
+    store = UserStatsStore(users)
+
+    print(f"{args.users} members, top {args.limit}")
+    for sort_by in ("rank", "stars"):
+        top_k = [entry.login for entry in _top_entries(store, sort_by, args.limit, False, None)]
+        assert top_k == _full_sort(users, sort_by, args.limit)
+        selected = _best(lambda: _top_entries(store, sort_by, args.limit, False, None)) * 1000
+        full = _best(lambda: _full_sort(users, sort_by, args.limit)) * 1000
+        print(f"  {sort_by:<6} top-k {selected:8.2f} ms   full sort {full:8.2f} ms")
+
+    members = users[:200]
+    by_login = {stats["login"]: stats for stats in members}
+
+    def fetch_user(login: str) -> dict:
+        time.sleep(args.latency / 1000)
+        return by_login[login]
+
+    print(f"{len(members)} member fetches at {args.latency:g} ms each")
+    for concurrency in (1, 4, 8, 16):
+        config = LeaderboardFetchConfig(
+            token="t", users=list(by_login), limit=args.limit, concurrency=concurrency
+        )
+        elapsed = _best(lambda: fetch_leaderboard(config, fetch_user=fetch_user), 1)
+        print(f"  concurrency {concurrency:>2}  {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
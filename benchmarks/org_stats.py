@@ -0,0 +1,112 @@
+"""Measure organisation stats aggregation: concurrency and incremental refresh.
+
+Serves N synthetic repositories from a stand-in GraphQL client with a fixed
+latency per request, then times a cold fetch at several concurrency levels
+and a refresh from the repository cache after a fraction of the
+repositories were pushed to.
+
+Usage:
+    uv run python benchmarks/org_stats.py [--repos N] [--latency MS] [--pushed F]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.config import OrgStatsFetchConfig  # noqa: E402
+from src.github.org_stats import OrgRepoCache, fetch_org_stats  # noqa: E402
+
+_LANGUAGES = ["Python", "Go", "TypeScript", "Rust", "C", "Shell", "Java", "Ruby"]
+
+
+class LatencyClient:
+    """Serves listing pages and repository details after a fixed delay."""
+
+    def __init__(self, repos: int, latency: float, seed: int = 0):
+        rng = random.Random(seed)
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.repos = {
+            f"repo{i}": {
+                "name": f"repo{i}",
+                "pushedAt": "2026-01-01T00:00:00Z",
+                "stargazerCount": int(rng.paretovariate(1.2)) - 1,
+                "issues": {"totalCount": rng.randrange(50)},
+                "pullRequests": {"totalCount": rng.randrange(100)},
+                "mergedPullRequests": {"totalCount": rng.randrange(50)},
+            }
+            for i in range(repos)
+        }
+        self.names = list(self.repos)
+
+    def push(self, fraction: float) -> None:
+        for name in self.names[: int(len(self.names) * fraction)]:
+            self.repos[name]["pushedAt"] = "2026-02-01T00:00:00Z"
+
+    def graphql_query(self, query: str, variables: dict) -> dict:
+        time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+        if "orgRepos" in query:
+            start = int(variables["after"] or 0)
+            nodes = [self.repos[name] for name in self.names[start : start + 100]]
+            end = start + len(nodes)
+            page = {"hasNextPage": end < len(self.names), "endCursor": str(end)}
+            repositories = {"nodes": nodes, "pageInfo": page}
+            return {"data": {"organization": {"login": "acme", "repositories": repositories}}}
+        data = {}
+        for key, name in variables.items():
+            if key == "org":
+                continue
+            edges = [
+                {"size": 1000 * (j + 1), "node": {"name": lang, "color": None}}
+                for j, lang in enumerate(_LANGUAGES[int(name[4:]) % 4 :][:3])
+            ]
+            data[key] = {
+                "pushedAt": self.repos[name]["pushedAt"],
+                "defaultBranchRef": {"target": {"history": {"totalCount": 100}}},
+                "languages": {"edges": edges},
+            }
+        return {"data": data}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=3000)
+    parser.add_argument("--latency", type=float, default=20.0, help="simulated ms per request")
+    parser.add_argument("--pushed", type=float, default=0.05, help="fraction pushed before refresh")
+    args = parser.parse_args()
+    latency = args.latency / 1000
+
+    print(f"{args.repos} repositories, {args.latency:g} ms per request")
+    for concurrency in (1, 4, 8):
+        client = LatencyClient(args.repos, latency)
+        config = OrgStatsFetchConfig(token="t", org="acme", concurrency=concurrency)
+        start = time.perf_counter()
+        fetch_org_stats(config, client=client)  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+        print(f"  cold, concurrency {concurrency}  {elapsed:7.2f} s  {client.requests:5d} requests")
+
+    client = LatencyClient(args.repos, latency)
+    config = OrgStatsFetchConfig(token="t", org="acme")
+    cache = OrgRepoCache("acme")
+    fetch_org_stats(config, client=client, cache=cache)  # type: ignore[arg-type]
+    client.push(args.pushed)
+    client.requests = 0
+    start = time.perf_counter()
+    stats = fetch_org_stats(config, client=client, cache=cache)  # type: ignore[arg-type]
+    elapsed = time.perf_counter() - start
+    print(
+        f"  refresh, {args.pushed:.0%} pushed  {elapsed:7.2f} s  {client.requests:5d} requests "
+        f"({stats['fetched']} repositories refetched)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark ranking many users: scalar calls vs calculate_user_ranks.
+
+Ranks N synthetic users (heavy-tailed stats, as in a real organisation) with
+one calculate_user_rank call each, with the pure-Python batch path and, if
+numpy is installed, the vectorised path. Results are checked to be identical.
+
+Usage:
+    uv run python benchmarks/rank_batch.py [--users N] [--repeat R]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.github.rank import calculate_user_rank, calculate_user_ranks  # noqa: E402
+from src.github.stats_store import numpy_available  # noqa: E402
+
+
+def _best(func, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    scales = (200, 20, 10, 5, 30, 10)
+    users = [
+        tuple(int(rng.paretovariate(1.1) * scale) - scale for scale in scales)
+        for _ in range(args.users)
+    ]
+    columns = list(zip(*users))
+
+    def scalar() -> tuple[list[str], list[float]]:
+        results = [calculate_user_rank(*user) for user in users]
+        return [r["level"] for r in results], [r["percentile"] for r in results]
+
+    paths = [("scalar", scalar), ("batch", lambda: calculate_user_ranks(*columns, use_numpy=False))]
+    if numpy_available():
+        paths.append(("numpy", lambda: calculate_user_ranks(*columns, use_numpy=True)))
+
+    print(f"{args.users} users, best of {args.repeat}")
+    baseline, expected = None, None
+    for label, func in paths:
+        seconds, result = _best(func, args.repeat)
+        if baseline is None:
+            baseline, expected = seconds, result
+        assert result == expected, f"{label} results differ from calculate_user_rank"
+        print(f"  {label:<7} {seconds * 1000:8.1f} ms  ({baseline / seconds:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Measure the live rank sketch: update and lookup cost, size and accuracy.
+
+Streams N synthetic users into a RankSketch, then reports the time per
+update, view rebuild and percentile lookup, the retained items and saved
+file size, and the largest rank error against the exact distribution. Also
+compares the render cache key of a stats config carrying a rank
+distribution hashed in full (dataclasses.asdict) and by fingerprint.
+
+Usage:
+    uv run python benchmarks/rank_sketch.py [--users N] [--repeat R]
+"""
+
+import argparse
+import dataclasses
+import os
+import random
+import sys
+import tempfile
+import time
+from bisect import bisect_left
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.config import StatsCardConfig  # noqa: E402
+from src.github.calibration import CalibrationBuilder  # noqa: E402
+from src.github.rank import calculate_user_rank  # noqa: E402
+from src.github.rank_sketch import RankSketch, dump_rank_sketch  # noqa: E402
+from src.rendering.cache import RenderCache, stable_hash  # noqa: E402
+
+
+def _users(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+
+    def heavy_tail() -> int:
+        return int(rng.paretovariate(1.2)) - 1
+
+    return [
+        {
+            "name": "",
+            "login": f"user-{i}",
+            "totalCommits": heavy_tail(),
+            "totalPRs": heavy_tail(),
+            "totalIssues": heavy_tail(),
+            "totalReviews": heavy_tail(),
+            "totalStars": heavy_tail(),
+            "followers": heavy_tail(),
+        }
+        for i in range(n)
+    ]
+
+
+def _best(func, repeat: int, number: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    users = _users(args.users)
+
+    sketch = RankSketch()
+    start = time.perf_counter()
+    for stats in users:
+        sketch.add(stats)
+    per_update = (time.perf_counter() - start) / len(users)
+
+    view_ms = _best(lambda: (setattr(sketch, "_view", None), sketch.view()), args.repeat) * 1000
+    view = sketch.view()
+    lookup_us = _best(lambda: view.cdf("stars", 37), args.repeat, 10000) * 1e6
+    rank_us = _best(
+        lambda: calculate_user_rank(300, 40, 20, 5, 80, 30, calibration=view), args.repeat, 2000
+    )
+    rank_us *= 1e6
+    with tempfile.TemporaryDirectory() as directory:
+        size = dump_rank_sketch(sketch, os.path.join(directory, "sketch.json"))
+
+    stars = sorted(stats["totalStars"] for stats in users)
+    max_error = max(
+        abs(view.cdf("stars", value) - bisect_left(stars, value) / len(stars))
+        for value in set(stars)
+    )
+    retained = sum(len(values) for values in view.values.values())
+
+    print(f"{len(users)} users")
+    print(f"  update        {per_update * 1e6:8.2f} us/user")
+    print(f"  view rebuild  {view_ms:8.3f} ms")
+    print(f"  cdf lookup    {lookup_us:8.3f} us")
+    print(f"  user rank     {rank_us:8.3f} us")
+    print(f"  retained      {retained:8d} distinct values over all metrics")
+    print(f"  saved size    {size:8d} bytes (includes {sketch.users} logins)")
+    print(f"  max error     {max_error:8.4f} (stars rank, fraction of users)")
+
+    builder = CalibrationBuilder()
+    for stats in users:
+        builder.add(stats)
+    calibration = builder.build()
+    print(f"render cache key, best of {args.repeat}")
+    for label, distribution in (("calibration", calibration), ("sketch view", view)):
+        config = StatsCardConfig(rank_calibration=distribution)
+        full = _best(lambda: stable_hash(dataclasses.asdict(config)), args.repeat, 20) * 1000
+        key = _best(lambda: RenderCache.make_key("stats", {}, config), args.repeat, 200) * 1000
+        print(f"  {label:<12} asdict {full:7.3f} ms   fingerprint {key:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Measure memory per fetched record and aggregation speed, dicts vs slotted records.
+
+Builds N distinct UserStats, ContributorRepo and Language values both as
+the plain dicts / regular dataclass they used to be and as the current
+slotted records, and reports the traced allocation per record plus the time
+of typical batch aggregations (summing a field, accumulating language sizes).
+
+Usage:
+    uv run python benchmarks/record_memory.py [--records N] [--repeat R]
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.github.fetcher import ContributorRepo, UserStats  # noqa: E402
+from src.github.langs_fetcher import Language  # noqa: E402
+
+
+@dataclasses.dataclass
+class _PlainLanguage:
+    """Language as it was before (no __slots__)."""
+
+    name: str
+    color: str
+    size: int
+    count: int
+
+
+def _stats_fields(i: int) -> dict:
+    return {
+        "name": f"User {i}",
+        "login": f"user{i}",
+        "totalCommits": 100 + i,
+        "totalPRs": 20 + i % 7,
+        "mergedPRs": 10 + i % 5,
+        "totalIssues": i % 30,
+        "totalStars": 10 * i,
+        "contributedTo": i % 12,
+        "followers": i % 200,
+        "totalReviews": i % 9,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+
+
+def _repo_fields(i: int) -> dict:
+    return {
+        "name": f"org{i % 50}/repo{i}",
+        "stars": 1000 + i,
+        "commits": 5 + i % 3,
+        "prs": 1,
+        "issues": 0,
+        "reviews": 0,
+        "rank_level": "A",
+        "avatar_b64": None,
+    }
+
+
+def _lang_fields(i: int) -> dict:
+    return {"name": f"Lang{i}", "color": "#3572A5", "size": 1000 + i, "count": 1}
+
+
+def _bytes_per_record(build, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return (after - before) / count
+
+
+def _best(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _accumulate(langs: list) -> None:
+    for lang in langs:
+        lang.size += 1
+        lang.count += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    n = args.records
+
+    print(f"{n} records, bytes per record (traced, incl. field values)")
+    rows = [
+        ("UserStats", lambda i: _stats_fields(i), lambda i: UserStats(**_stats_fields(i))),
+        (
+            "ContributorRepo",
+            lambda i: _repo_fields(i),
+            lambda i: ContributorRepo(**_repo_fields(i)),
+        ),
+        (
+            "Language",
+            lambda i: _PlainLanguage(**_lang_fields(i)),
+            lambda i: Language(**_lang_fields(i)),
+        ),
+    ]
+    for label, old, new in rows:
+        before = _bytes_per_record(old, n)
+        after = _bytes_per_record(new, n)
+        saved = (1 - after / before) * 100
+        print(f"  {label:<16} {before:7.0f} -> {after:7.0f}  ({saved:.0f}% less)")
+
+    dicts = [_stats_fields(i) for i in range(n)]
+    records = [UserStats(**d) for d in dicts]
+    plain_langs = [_PlainLanguage(**_lang_fields(i)) for i in range(n)]
+    langs = [Language(**_lang_fields(i)) for i in range(n)]
+    timings = [
+        (
+            "build UserStats",
+            lambda: [dict(d) for d in dicts],
+            lambda: [UserStats(**d) for d in dicts],
+        ),
+        (
+            "sum totalStars",
+            lambda: sum(d["totalStars"] for d in dicts),
+            lambda: sum(r.totalStars for r in records),
+        ),
+        (
+            "sum via r[key]",
+            lambda: sum(d["totalStars"] for d in dicts),
+            lambda: sum(r["totalStars"] for r in records),
+        ),
+        ("language +=", lambda: _accumulate(plain_langs), lambda: _accumulate(langs)),
+    ]
+    print("aggregation, best of", args.repeat)
+    for label, old, new in timings:
+        before = _best(old, args.repeat) * 1000
+        after = _best(new, args.repeat) * 1000
+        print(f"  {label:<16} {before:7.2f} ms -> {after:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
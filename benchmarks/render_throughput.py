@@ -0,0 +1,117 @@
+"""Benchmark card rendering throughput (renders/sec) for batch workloads.
+
+Simulates a batch run: many users rendered with a handful of themes.
+
+Usage:
+    uv run python benchmarks/render_throughput.py [--iterations N] [--repeat R]
+        [--snapshot PATH]
+
+Reports the best of R runs to reduce scheduler noise. With --snapshot, real
+fetched data (see `github-stats-card fetch`) is rendered instead of the
+synthetic users, so results are reproducible offline.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.config import ContribCardConfig, LangsCardConfig, StatsCardConfig  # noqa: E402
+from src.github.langs_fetcher import Language  # noqa: E402
+from src.github.snapshot import load_snapshot  # noqa: E402
+from src.rendering.contrib import render_contrib_card  # noqa: E402
+from src.rendering.langs import render_top_languages  # noqa: E402
+from src.rendering.stats import render_stats_card  # noqa: E402
+
+THEMES = ["default", "dark", "radical", "vue-dark", "tokyonight"]
+
+
+def _stats(i: int) -> dict:
+    return {
+        "name": f"User {i}",
+        "login": f"user{i}",
+        "totalStars": 10 * i,
+        "totalCommits": 100 + i,
+        "totalPRs": 20 + i % 7,
+        "mergedPRs": 10 + i % 5,
+        "totalIssues": i % 30,
+        "contributedTo": i % 12,
+        "followers": i % 200,
+        "totalReviews": i % 9,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+
+
+def _langs(i: int) -> dict[str, Language]:
+    sizes = [("Python", 5000 + i), ("Go", 2000), ("Rust", 900 + i % 50), ("C", 300), ("HTML", 80)]
+    return {name: Language(name=name, color="#3572A5", size=size, count=1) for name, size in sizes}
+
+
+def _contrib(i: int) -> dict:
+    repo = {
+        "name": f"org/repo{i}",
+        "stars": 1000 + i,
+        "commits": 5,
+        "prs": 1,
+        "issues": 0,
+        "reviews": 0,
+        "rank_level": "A",
+        "avatar_b64": None,
+    }
+    return {"repos": [repo] * 5}
+
+
+CARDS = {
+    "stats": lambda i, theme: render_stats_card(
+        _stats(i), StatsCardConfig(theme=theme, show_icons=True)
+    ),
+    "top-langs": lambda i, theme: render_top_languages(_langs(i), LangsCardConfig(theme=theme)),
+    "contrib": lambda i, theme: render_contrib_card(_contrib(i), ContribCardConfig(theme=theme)),
+}
+
+
+def _snapshot_cards(path: str) -> dict:
+    snapshot = load_snapshot(path)
+    configs = {
+        "stats": lambda theme: StatsCardConfig(theme=theme, show_icons=True),
+        "top-langs": lambda theme: LangsCardConfig(theme=theme),
+        "contrib": lambda theme: ContribCardConfig(theme=theme),
+    }
+    renderers = {
+        "stats": render_stats_card,
+        "top-langs": render_top_languages,
+        "contrib": render_contrib_card,
+    }
+
+    def bind(card_type: str):
+        data = snapshot.card_data(card_type)
+        render, config = renderers[card_type], configs[card_type]
+        return lambda i, theme: render(data, config(theme))
+
+    return {card_type: bind(card_type) for card_type in snapshot.card_types()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--snapshot", help="Render data from a snapshot file")
+    args = parser.parse_args()
+
+    cards = _snapshot_cards(args.snapshot) if args.snapshot else CARDS
+    for card_type, render in cards.items():
+        render(0, THEMES[0])  # warm-up
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for i in range(args.iterations):
+                render(i, THEMES[i % len(THEMES)])
+            best = min(best, time.perf_counter() - start)
+        print(f"{card_type:>10}: {args.iterations / best:10.0f} renders/sec")
+
+
+if __name__ == "__main__":
+    main()
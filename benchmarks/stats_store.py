@@ -0,0 +1,103 @@
+"""Compare memory and aggregate speed of UserStatsStore with per-user records.
+
+Holds N users' stats as a list of dicts, a list of UserStats records and a
+UserStatsStore, and reports traced bytes per user plus the time to sum a
+field and pick the top 10 users by stars.
+
+Usage:
+    uv run python benchmarks/stats_store.py [--users N] [--repeat R]
+"""
+
+import argparse
+import heapq
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.github.fetcher import UserStats  # noqa: E402
+from src.github.stats_store import UserStatsStore  # noqa: E402
+
+
+def _stats(i: int) -> dict:
+    return {
+        "name": f"User Number {i}",
+        "login": f"user-{i}",
+        "totalCommits": 100 + i,
+        "totalPRs": 20 + i % 7,
+        "mergedPRs": 10 + i % 5,
+        "totalIssues": i % 30,
+        "totalStars": (i * 7919) % 100000,
+        "contributedTo": i % 12,
+        "followers": i % 2000,
+        "totalReviews": i % 9,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+
+
+def _bytes_per_user(build, users: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / users
+
+
+def _best(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    n = args.users
+
+    print(f"{n} users, traced bytes per user")
+    layouts = {
+        "dicts": lambda: [_stats(i) for i in range(n)],
+        "records": lambda: [UserStats(**_stats(i)) for i in range(n)],
+        "store": lambda: UserStatsStore(_stats(i) for i in range(n)),
+    }
+    for label, build in layouts.items():
+        print(f"  {label:<8} {_bytes_per_user(build, n):7.0f}")
+
+    dicts = layouts["dicts"]()
+    store = UserStatsStore(dicts)
+    print(f"aggregates, best of {args.repeat}")
+    queries = [
+        (
+            "sum stars",
+            lambda: sum(d["totalStars"] for d in dicts),
+            lambda: store.total("totalStars"),
+        ),
+        (
+            "top 10",
+            lambda: heapq.nlargest(10, dicts, key=lambda d: d["totalStars"]),
+            lambda: store.top("totalStars", 10),
+        ),
+        (
+            "lookup",
+            lambda: next(d for d in dicts if d["login"] == f"user-{n - 1}"),
+            lambda: store.get(f"user-{n - 1}"),
+        ),
+    ]
+    for label, old, new in queries:
+        before = _best(old, args.repeat) * 1000
+        after = _best(new, args.repeat) * 1000
+        print(f"  {label:<10} dicts {before:8.3f} ms   store {after:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
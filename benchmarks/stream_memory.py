@@ -0,0 +1,79 @@
+"""Measure peak memory of writing a contrib card with embedded avatars.
+
+Compares rendering the full SVG string and writing it against streaming the
+card chunk by chunk to the output file.
+
+Usage:
+    uv run python benchmarks/stream_memory.py [--repos N] [--avatar-kb KB]
+"""
+
+import argparse
+import base64
+import os
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.config import ContribCardConfig  # noqa: E402
+from src.core.output import write_output, write_output_stream  # noqa: E402
+from src.rendering.contrib import iter_contrib_card, render_contrib_card  # noqa: E402
+
+
+def _stats(repos: int, avatar_kb: int) -> dict:
+    return {
+        "repos": [
+            {
+                "name": f"org/repo{i}",
+                "stars": 1000 - i,
+                "commits": 10,
+                "prs": 2,
+                "issues": 1,
+                "reviews": 0,
+                "rank_level": "A",
+                "avatar_b64": base64.b64encode(os.urandom(avatar_kb * 1024)).decode("ascii"),
+            }
+            for i in range(repos)
+        ]
+    }
+
+
+def _peak(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=20)
+    parser.add_argument("--avatar-kb", type=int, default=32, help="Raw avatar size in KiB")
+    args = parser.parse_args()
+
+    stats = _stats(args.repos, args.avatar_kb)
+    config = ContribCardConfig()
+    with tempfile.TemporaryDirectory() as tmp:
+        whole_path = os.path.join(tmp, "whole.svg")
+        stream_path = os.path.join(tmp, "stream.svg")
+
+        whole = _peak(
+            lambda: write_output(whole_path, render_contrib_card(stats, config).encode("utf-8"))
+        )
+        streamed = _peak(lambda: write_output_stream(stream_path, iter_contrib_card(stats, config)))
+        size = os.path.getsize(whole_path)
+
+        with open(whole_path, "rb") as a, open(stream_path, "rb") as b:
+            assert a.read() == b.read(), "streamed output differs"
+
+    print(f"card size:        {size / 1024:8.0f} KiB ({args.repos} repos)")
+    print(f"peak (string):    {whole / 1024:8.0f} KiB")
+    print(f"peak (streaming): {streamed / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
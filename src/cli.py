@@ -1,32 +1,307 @@
 """Command-line interface for GitHub Stats Card generator."""
 
+import importlib
 import os
 import sys
+from collections.abc import Callable
+from dataclasses import replace
+from functools import partial
+from typing import Any
 
 import click
 
-from .core.config import (
-    FetchConfig,
-    LangsFetchConfig,
-    LangsCardConfig,
-    StatsCardConfig,
-    ContribCardConfig,
-    ContribFetchConfig,
-)
-from .core.exceptions import FetchError, LanguageFetchError
-from .github.fetcher import fetch_stats, fetch_contributor_stats
-from .github.langs_fetcher import fetch_top_languages
-from .rendering.langs import render_top_languages
-from .rendering.stats import render_stats_card
-from .rendering.contrib import render_contrib_card
-
-# Weighting presets for language ranking
-WEIGHTING_PRESETS = {
-    "size-only": {"size_weight": 1.0, "count_weight": 0.0},
-    "balanced": {"size_weight": 0.7, "count_weight": 0.3},
-    "expertise": {"size_weight": 0.5, "count_weight": 0.5},
-    "diversity": {"size_weight": 0.4, "count_weight": 0.6},
-}
+from .core.constants import (
+    DEFAULT_CALIBRATION_POINTS,
+    LEADERBOARD_CONCURRENCY,
+    LEADERBOARD_MAX_LIMIT,
+    LEADERBOARD_MAX_MEMBERS,
+    LEADERBOARD_SORT_KEYS,
+    ORG_STATS_CONCURRENCY,
+    RANK_SKETCH_EXPECTED_USERS,
+    RANK_SKETCH_FALSE_POSITIVE_RATE,
+    SERVER_CACHE_TTL,
+    SERVER_DEFAULT_HOST,
+    SERVER_DEFAULT_PORT,
+    SERVER_STALE_IF_ERROR_TTL,
+    SERVER_STALE_TTL,
+)
+from .core.compression import (
+    COMPRESSED_FORMATS,
+    DEFAULT_BROTLI_QUALITY,
+    DEFAULT_GZIP_LEVEL,
+    brotli_available,
+)
+from .core.exceptions import FetchError, GitHubStatsCardError, LanguageFetchError
+
+
+def _lazy(module: str, name: str) -> Callable[..., Any]:
+    """
+    Return a stand-in for module.name that imports it on first call.
+
+    Fetchers pull in requests and renderers the theme, i18n and icon tables,
+    which would otherwise be paid by every invocation (including --help and
+    usage errors) before click has parsed the command line. The stand-ins are
+    plain module attributes, so they can still be patched in tests.
+    """
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(importlib.import_module(module, __package__), name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = f"Lazily imported {module.lstrip('.')}.{name}."
+    return call
+
+
+fetch_stats = _lazy(".github.fetcher", "fetch_stats")
+fetch_contributor_stats = _lazy(".github.fetcher", "fetch_contributor_stats")
+fetch_top_languages = _lazy(".github.langs_fetcher", "fetch_top_languages")
+render_stats_card = _lazy(".rendering.stats", "render_stats_card")
+render_top_languages = _lazy(".rendering.langs", "render_top_languages")
+render_contrib_card = _lazy(".rendering.contrib", "render_contrib_card")
+fetch_leaderboard = _lazy(".github.leaderboard", "fetch_leaderboard")
+render_leaderboard_card = _lazy(".rendering.leaderboard", "render_leaderboard_card")
+fetch_org_stats = _lazy(".github.org_stats", "fetch_org_stats")
+render_org_stats_card = _lazy(".rendering.org_stats", "render_org_stats_card")
+render_org_langs_card = _lazy(".rendering.org_stats", "render_org_langs_card")
+
+MINIFY_OPTION = click.option(
+    "--minify",
+    is_flag=True,
+    help="Emit minified SVG (no whitespace, deduplicated CSS, shortened numbers)",
+)
+
+CACHE_DIR_OPTION = click.option(
+    "--cache-dir",
+    envvar="GITHUB_STATS_CARD_CACHE_DIR",
+    type=click.Path(file_okay=False),
+    help="Directory for the render cache; unchanged cards skip rendering and writing",
+)
+
+
+def _parse_compress_formats(
+    ctx: click.Context, param: click.Parameter, value: str
+) -> tuple[str, ...]:
+    """Validate the comma-separated --compress value."""
+    formats = tuple(dict.fromkeys(f.strip().lower() for f in value.split(",") if f.strip()))
+    for fmt in formats:
+        if fmt not in COMPRESSED_FORMATS:
+            raise click.BadParameter(
+                f"unknown format '{fmt}' (choose from {', '.join(COMPRESSED_FORMATS)})"
+            )
+    if "br" in formats and not brotli_available():
+        raise click.BadParameter(
+            "br requires the optional 'brotli' package (pip install 'github-stats-card[brotli]')"
+        )
+    return formats
+
+
+COMPRESS_OPTION = click.option(
+    "--compress",
+    default="",
+    callback=_parse_compress_formats,
+    help="Comma-separated pre-compressed outputs to write next to the SVG: "
+    "svgz (card.svgz), gz (card.svg.gz), br (card.svg.br)",
+)
+
+GZIP_LEVEL_OPTION = click.option(
+    "--gzip-level",
+    type=click.IntRange(1, 9),
+    default=DEFAULT_GZIP_LEVEL,
+    show_default=True,
+    help="Compression level for svgz/gz outputs",
+)
+
+BROTLI_QUALITY_OPTION = click.option(
+    "--brotli-quality",
+    type=click.IntRange(0, 11),
+    default=DEFAULT_BROTLI_QUALITY,
+    show_default=True,
+    help="Compression quality for br outputs",
+)
+
+RANK_CALIBRATION_OPTION = click.option(
+    "--rank-calibration",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Calibration table from the calibrate command; ranks the user against that "
+    "population instead of the built-in medians (stats card)",
+)
+
+RANK_SKETCH_OPTION = click.option(
+    "--rank-sketch",
+    type=click.Path(dir_okay=False),
+    help="File holding a live distribution of the fetched users' stats, loaded if it "
+    "exists and saved as users are added",
+)
+
+RANK_SKETCH_USERS_OPTION = click.option(
+    "--rank-sketch-users",
+    type=click.IntRange(min=1),
+    default=RANK_SKETCH_EXPECTED_USERS,
+    help="Users a new --rank-sketch file's login filter is sized for "
+    f"(default: {RANK_SKETCH_EXPECTED_USERS})",
+)
+
+RANK_SKETCH_FP_RATE_OPTION = click.option(
+    "--rank-sketch-fp-rate",
+    type=click.FloatRange(0, 1, min_open=True, max_open=True),
+    default=RANK_SKETCH_FALSE_POSITIVE_RATE,
+    help="False-positive rate of a new --rank-sketch file's login filter at "
+    f"--rank-sketch-users users (default: {RANK_SKETCH_FALSE_POSITIVE_RATE})",
+)
+
+LIVE_RANK_OPTION = click.option(
+    "--live-rank",
+    is_flag=True,
+    help="Rank stats cards against the --rank-sketch population once it is large enough",
+)
+
+CARD_TYPES = ("stats", "top-langs", "contrib")
+
+
+def _parse_card_types(ctx: click.Context, param: click.Parameter, value: str) -> tuple[str, ...]:
+    """Validate the comma-separated --cards value."""
+    cards = tuple(dict.fromkeys(c.strip().lower() for c in value.split(",") if c.strip()))
+    if not cards:
+        raise click.BadParameter("at least one card type is required")
+    for card in cards:
+        if card not in CARD_TYPES:
+            raise click.BadParameter(
+                f"unknown card type '{card}' (choose from {', '.join(CARD_TYPES)})"
+            )
+    return cards
+
+
+def _load_rank_calibration(path: str | None) -> Any:
+    """Load a rank calibration table, exiting with an error message if it is invalid."""
+    if path is None:
+        return None
+    from .github.calibration import load_calibration
+
+    try:
+        return load_calibration(path)
+    except (GitHubStatsCardError, OSError) as e:
+        click.echo(f"❌ Invalid rank calibration: {e}", err=True)
+        sys.exit(1)
+
+
+def _rank_sketch_options(
+    path: str | None, live_rank: bool, expected_users: int, false_positive_rate: float
+) -> dict[str, Any]:
+    """Load or create the server's rank sketch, exiting with an error message if invalid."""
+    if path is None:
+        if live_rank:
+            raise click.UsageError("--live-rank requires --rank-sketch")
+        return {}
+    from .github.rank_sketch import RankSketch, load_rank_sketch
+
+    try:
+        if os.path.exists(path):
+            sketch = load_rank_sketch(path)
+        else:
+            sketch = RankSketch(
+                expected_users=expected_users, false_positive_rate=false_positive_rate
+            )
+    except (GitHubStatsCardError, OSError) as e:
+        click.echo(f"❌ Invalid rank sketch: {e}", err=True)
+        sys.exit(1)
+    click.echo(f"Rank sketch {path}: {sketch.users} users", err=True)
+    return {"rank_sketch": sketch, "rank_sketch_path": path, "live_rank": live_rank}
+
+
+def _save_rank_sketch(card_server: Any) -> None:
+    """Save the server's rank sketch on shutdown."""
+    try:
+        if card_server.save_rank_sketch():
+            click.echo(f"Saved rank sketch {card_server.rank_sketch_path}", err=True)
+    except OSError as e:
+        click.echo(f"❌ Error saving rank sketch: {e}", err=True)
+
+
+def _load_org_repo_cache(path: str | None, org: str) -> Any:
+    """Load an organisation's repository cache, starting afresh if it is missing or unusable."""
+    if path is None:
+        return None
+    from .github.org_stats import OrgRepoCache, load_org_repo_cache
+
+    if os.path.exists(path):
+        try:
+            cache = load_org_repo_cache(path)
+        except (GitHubStatsCardError, OSError) as e:
+            click.echo(f"⚠️  Ignoring repository cache {path}: {e}", err=True)
+        else:
+            if cache.org.lower() == org.lower():
+                return cache
+            click.echo(f"⚠️  Ignoring repository cache {path}: it belongs to {cache.org}", err=True)
+    return OrgRepoCache(org)
+
+
+def _write_compressed(
+    card_type: str,
+    output_path: str,
+    svg: bytes,
+    formats: tuple[str, ...],
+    gzip_level: int,
+    brotli_quality: int,
+) -> None:
+    """Write pre-compressed variants of a card and report their ratios."""
+    from .core.compression import compress_variants, compressed_path, compression_ratio
+    from .core.output import write_output
+
+    variants = compress_variants(svg, formats, gzip_level=gzip_level, brotli_quality=brotli_quality)
+    for fmt, content in variants.items():
+        path = compressed_path(output_path, fmt)
+        status = "Generated" if write_output(path, content) else "Unchanged"
+        ratio = compression_ratio(len(svg), len(content))
+        click.echo(
+            f"✅ {status} {path} ({card_type} {fmt}: {len(svg)} → {len(content)} bytes, "
+            f"{ratio:.1%} of original)",
+            err=True,
+        )
+
+
+def _render_and_write(
+    card_type: str,
+    data: Any,
+    render_config: Any,
+    render: Callable[[Any], str],
+    output: str,
+    cache_dir: str | None,
+    compress: tuple[str, ...] = (),
+    gzip_level: int = DEFAULT_GZIP_LEVEL,
+    brotli_quality: int = DEFAULT_BROTLI_QUALITY,
+) -> None:
+    """Render a card (through the render cache if enabled) and write it to output."""
+    from .core.output import write_output
+    from .rendering.cache import RenderCache
+    from .rendering.minify import minify_svg, size_report
+
+    output_path = os.path.abspath(output)
+
+    def render_with_progress() -> str:
+        click.echo("Generating SVG card...", err=True)
+        if not render_config.minify:
+            return render(render_config)
+        svg = render(replace(render_config, minify=False))
+        minified = minify_svg(svg)
+        click.echo(f"Minified SVG: {size_report(svg, minified)}", err=True)
+        return minified
+
+    cached = False
+    if cache_dir:
+        cache = RenderCache(cache_dir=cache_dir)
+        card, cached = cache.render(card_type, data, render_config, render_with_progress)
+        svg = card.svg
+    else:
+        svg = render_with_progress().encode("utf-8")
+
+    if write_output(output_path, svg):
+        click.echo(f"✅ Generated {output_path}", err=True)
+    else:
+        note = " (render cache hit)" if cached else ""
+        click.echo(f"✅ Unchanged {output_path}{note}", err=True)
+
+    if compress:
+        _write_compressed(card_type, output_path, svg, compress, gzip_level, brotli_quality)
 
 
 @click.group()
@@ -178,6 +453,12 @@ def cli() -> None:
     default=True,
     help="Use bold text (default: yes)",
 )
+@MINIFY_OPTION
+@CACHE_DIR_OPTION
+@COMPRESS_OPTION
+@GZIP_LEVEL_OPTION
+@BROTLI_QUALITY_OPTION
+@RANK_CALIBRATION_OPTION
 def stats(
     username: str,
     token: str,
@@ -207,6 +488,12 @@ def stats(
     rank_icon: str,
     disable_animations: bool,
     text_bold: bool,
+    minify: bool,
+    cache_dir: str | None,
+    compress: tuple[str, ...],
+    gzip_level: int,
+    brotli_quality: int,
+    rank_calibration: str | None,
 ) -> None:
     """
     Generate GitHub Stats Card SVG.
@@ -230,6 +517,10 @@ def stats(
       # Show additional stats
       github-stats-card -u octocat -o stats.svg --show reviews,discussions_started
     """
+    from .core.config import FetchConfig, StatsCardConfig
+
+    calibration = _load_rank_calibration(rank_calibration)
+
     try:
         # Create fetch configuration
         fetch_config = FetchConfig.from_cli_args(
@@ -278,20 +569,22 @@ def stats(
             rank_icon=rank_icon,
             disable_animations=disable_animations,
             text_bold=text_bold,
+            minify=minify,
+            rank_calibration=calibration,
         )
 
-        # Render SVG card
-        click.echo("Generating SVG card...", err=True)
-        svg = render_stats_card(stats, render_config)
-
-        # Write to file
-        output_path = os.path.abspath(output)
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(svg)
-
-        click.echo(f"✅ Generated {output_path}", err=True)
+        # Render SVG card and write to file
+        _render_and_write(
+            "stats",
+            stats,
+            render_config,
+            lambda config: render_stats_card(stats, config),
+            output,
+            cache_dir,
+            compress,
+            gzip_level,
+            brotli_quality,
+        )
 
     except FetchError as e:
         click.echo(f"❌ Error fetching data: {e}", err=True)
@@ -420,6 +713,11 @@ def stats(
     is_flag=True,
     help="Disable CSS animations",
 )
+@MINIFY_OPTION
+@CACHE_DIR_OPTION
+@COMPRESS_OPTION
+@GZIP_LEVEL_OPTION
+@BROTLI_QUALITY_OPTION
 def top_langs(
     username: str,
     token: str,
@@ -444,6 +742,11 @@ def top_langs(
     border_radius: float,
     stats_format: str,
     disable_animations: bool,
+    minify: bool,
+    cache_dir: str | None,
+    compress: tuple[str, ...],
+    gzip_level: int,
+    brotli_quality: int,
 ) -> None:
     """
     Generate Top Languages Card SVG.
@@ -472,24 +775,13 @@ def top_langs(
       github-stats-card top-langs -u octocat -o langs.svg \\
         --weighting balanced
     """
+    from .core.config import LangsCardConfig, LangsFetchConfig, resolve_language_weights
+
     try:
-        # Resolve weighting preset if specified
-        final_size_weight = size_weight
-        final_count_weight = count_weight
-
-        if weighting:
-            preset = WEIGHTING_PRESETS[weighting]
-            # Only use preset values if individual weights not specified
-            if size_weight is None:
-                final_size_weight = preset["size_weight"]
-            if count_weight is None:
-                final_count_weight = preset["count_weight"]
-
-        # Apply defaults if still None
-        if final_size_weight is None:
-            final_size_weight = 1.0
-        if final_count_weight is None:
-            final_count_weight = 0.0
+        # Resolve weighting preset (explicit weights take precedence)
+        final_size_weight, final_count_weight = resolve_language_weights(
+            weighting, size_weight, count_weight
+        )
 
         # Create fetch configuration
         fetch_config = LangsFetchConfig.from_cli_args(
@@ -533,20 +825,21 @@ def top_langs(
             border_radius=border_radius,
             stats_format=stats_format,
             disable_animations=disable_animations,
+            minify=minify,
         )
 
-        # Render SVG card
-        click.echo("Generating SVG card...", err=True)
-        svg = render_top_languages(top_languages, render_config)
-
-        # Write to file
-        output_path = os.path.abspath(output)
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(svg)
-
-        click.echo(f"✅ Generated {output_path}", err=True)
+        # Render SVG card and write to file
+        _render_and_write(
+            "top-langs",
+            top_languages,
+            render_config,
+            lambda config: render_top_languages(top_languages, config),
+            output,
+            cache_dir,
+            compress,
+            gzip_level,
+            brotli_quality,
+        )
 
     except LanguageFetchError as e:
         click.echo(f"❌ Error fetching language data: {e}", err=True)
@@ -640,6 +933,11 @@ def top_langs(
     is_flag=True,
     help="Disable CSS animations",
 )
+@MINIFY_OPTION
+@CACHE_DIR_OPTION
+@COMPRESS_OPTION
+@GZIP_LEVEL_OPTION
+@BROTLI_QUALITY_OPTION
 def contrib(
     username: str,
     token: str,
@@ -657,6 +955,11 @@ def contrib(
     custom_title: str | None,
     border_radius: float,
     disable_animations: bool,
+    minify: bool,
+    cache_dir: str | None,
+    compress: tuple[str, ...],
+    gzip_level: int,
+    brotli_quality: int,
 ) -> None:
     """
     Generate Top Contributions Card SVG.
@@ -677,6 +980,8 @@ def contrib(
       github-stats-card contrib -u octocat -o contrib.svg \\
         --exclude-repo "facebook/react,microsoft/vscode"
     """
+    from .core.config import ContribCardConfig, ContribFetchConfig
+
     try:
         # Create fetch configuration
         fetch_config = ContribFetchConfig.from_cli_args(
@@ -707,20 +1012,262 @@ def contrib(
             custom_title=custom_title,
             border_radius=border_radius,
             disable_animations=disable_animations,
+            minify=minify,
         )
 
-        # Render SVG card
-        click.echo("Generating SVG card...", err=True)
-        svg = render_contrib_card(stats, render_config)
+        # Render SVG card and write to file
+        _render_and_write(
+            "contrib",
+            stats,
+            render_config,
+            lambda config: render_contrib_card(stats, config),
+            output,
+            cache_dir,
+            compress,
+            gzip_level,
+            brotli_quality,
+        )
 
-        # Write to file
-        output_path = os.path.abspath(output)
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    except FetchError as e:
+        click.echo(f"❌ Error fetching data: {e}", err=True)
+        sys.exit(1)
+    except (GitHubStatsCardError, OSError) as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(svg)
 
-        click.echo(f"✅ Generated {output_path}", err=True)
+@cli.command(name="leaderboard")
+@click.option(
+    "--org",
+    help="Rank the members of this GitHub organization",
+)
+@click.option(
+    "--users",
+    default="",
+    help="Comma-separated GitHub usernames to rank (instead of --org)",
+)
+@click.option(
+    "--token",
+    "-t",
+    envvar="GITHUB_TOKEN",
+    required=True,
+    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
+)
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    type=click.Path(),
+    help="Output SVG file path",
+)
+@click.option(
+    "--sort-by",
+    type=click.Choice(list(LEADERBOARD_SORT_KEYS)),
+    default="rank",
+    help="Rank percentile or stat to sort by (default: rank)",
+)
+@click.option(
+    "--limit",
+    "-l",
+    type=click.IntRange(1, LEADERBOARD_MAX_LIMIT),
+    default=10,
+    help="Number of users to show (default: 10)",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=LEADERBOARD_CONCURRENCY,
+    help=f"Member stats fetched in parallel (default: {LEADERBOARD_CONCURRENCY})",
+)
+@click.option(
+    "--max-members",
+    type=click.IntRange(min=1),
+    default=LEADERBOARD_MAX_MEMBERS,
+    help="Refuse organizations or user lists larger than this "
+    f"(default: {LEADERBOARD_MAX_MEMBERS})",
+)
+@click.option(
+    "--include-all-commits",
+    is_flag=True,
+    help="Count all-time commits instead of just the current year",
+)
+@click.option(
+    "--theme",
+    default="default",
+    help="Theme name (default, dark, radical, etc.)",
+)
+@click.option(
+    "--hide-border",
+    is_flag=True,
+    help="Hide card border",
+)
+@click.option(
+    "--hide-title",
+    is_flag=True,
+    help="Hide card title",
+)
+@click.option(
+    "--hide-rank",
+    is_flag=True,
+    help="Hide the rank level badges",
+)
+@click.option(
+    "--card-width",
+    type=int,
+    help="Card width in pixels (default: 467)",
+)
+@click.option(
+    "--title-color",
+    help="Custom title color (hex without #)",
+)
+@click.option(
+    "--text-color",
+    help="Custom text color (hex without #)",
+)
+@click.option(
+    "--bg-color",
+    help="Custom background color (hex without # or gradient)",
+)
+@click.option(
+    "--border-color",
+    help="Custom border color (hex without #)",
+)
+@click.option(
+    "--ring-color",
+    help="Custom rank badge color (hex without #)",
+)
+@click.option(
+    "--custom-title",
+    help="Custom card title text",
+)
+@click.option(
+    "--border-radius",
+    type=float,
+    default=4.5,
+    help="Border radius (default: 4.5)",
+)
+@click.option(
+    "--number-format",
+    type=click.Choice(["short", "long"]),
+    default="short",
+    help="Number format: short (6.6k) or long (6626)",
+)
+@click.option(
+    "--disable-animations",
+    is_flag=True,
+    help="Disable CSS animations",
+)
+@MINIFY_OPTION
+@CACHE_DIR_OPTION
+@COMPRESS_OPTION
+@GZIP_LEVEL_OPTION
+@BROTLI_QUALITY_OPTION
+@RANK_CALIBRATION_OPTION
+def leaderboard(
+    org: str | None,
+    users: str,
+    token: str,
+    output: str,
+    sort_by: str,
+    limit: int,
+    concurrency: int,
+    max_members: int,
+    include_all_commits: bool,
+    theme: str,
+    hide_border: bool,
+    hide_title: bool,
+    hide_rank: bool,
+    card_width: int | None,
+    title_color: str | None,
+    text_color: str | None,
+    bg_color: str | None,
+    border_color: str | None,
+    ring_color: str | None,
+    custom_title: str | None,
+    border_radius: float,
+    number_format: str,
+    disable_animations: bool,
+    minify: bool,
+    cache_dir: str | None,
+    compress: tuple[str, ...],
+    gzip_level: int,
+    brotli_quality: int,
+    rank_calibration: str | None,
+) -> None:
+    """
+    Generate a Leaderboard Card SVG.
+
+    Ranks the members of an organization, or a list of users, by rank
+    percentile or by one of the stats card stats.
+
+    Examples:
+
+      # Top 10 members of an organization by rank
+      github-stats-card leaderboard --org github -o leaderboard.svg
+
+      # A team sorted by stars
+      github-stats-card leaderboard --users "alice,bob,carol" \\
+        --sort-by stars -o team.svg
+    """
+    from .core.config import LeaderboardCardConfig, LeaderboardFetchConfig
+
+    if bool(org) == bool(users):
+        raise click.UsageError("Pass exactly one of --org or --users")
+    calibration = _load_rank_calibration(rank_calibration)
+
+    try:
+        fetch_config = LeaderboardFetchConfig.from_cli_args(
+            token=token,
+            org=org,
+            users=users,
+            sort_by=sort_by,
+            limit=limit,
+            include_all_commits=include_all_commits,
+            concurrency=concurrency,
+            max_members=max_members,
+        )
+
+        source = org or f"{len(fetch_config.users)} users"
+        click.echo(f"Fetching leaderboard stats for {source}...", err=True)
+        board = fetch_leaderboard(fetch_config, calibration=calibration)
+
+        click.echo(f"Ranked {board['members']} users", err=True)
+        if board["failed"]:
+            click.echo(
+                f"⚠️  Skipped {len(board['failed'])} users whose stats could not be fetched: "
+                f"{', '.join(board['failed'])}",
+                err=True,
+            )
+
+        render_config = LeaderboardCardConfig.from_cli_args(
+            theme=theme,
+            hide_border=hide_border,
+            hide_title=hide_title,
+            hide_rank=hide_rank,
+            card_width=card_width,
+            title_color=title_color,
+            text_color=text_color,
+            bg_color=bg_color,
+            border_color=border_color,
+            ring_color=ring_color,
+            custom_title=custom_title,
+            border_radius=border_radius,
+            number_format=number_format,
+            disable_animations=disable_animations,
+            minify=minify,
+        )
+
+        _render_and_write(
+            "leaderboard",
+            board,
+            render_config,
+            lambda config: render_leaderboard_card(board, config),
+            output,
+            cache_dir,
+            compress,
+            gzip_level,
+            brotli_quality,
+        )
 
     except FetchError as e:
         click.echo(f"❌ Error fetching data: {e}", err=True)
@@ -730,5 +1277,1278 @@ def contrib(
         sys.exit(1)
 
 
+@cli.command(name="org-stats")
+@click.option(
+    "--org",
+    required=True,
+    help="GitHub organization",
+)
+@click.option(
+    "--token",
+    "-t",
+    envvar="GITHUB_TOKEN",
+    required=True,
+    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
+)
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    type=click.Path(),
+    help="Output SVG file path of the stats card",
+)
+@click.option(
+    "--langs-output",
+    type=click.Path(),
+    help="Also write the organization's top languages card to this path",
+)
+@click.option(
+    "--exclude-repo",
+    default="",
+    help="Comma-separated repos to exclude",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=ORG_STATS_CONCURRENCY,
+    help=f"Repository detail requests in flight (default: {ORG_STATS_CONCURRENCY})",
+)
+@click.option(
+    "--repo-cache",
+    type=click.Path(dir_okay=False),
+    help=(
+        "Per-repository cache file; only repositories pushed to since the last run are "
+        "fetched again (default: <cache-dir>/org-repos/<org>.json with --cache-dir)"
+    ),
+)
+@click.option(
+    "--theme",
+    default="default",
+    help="Theme name (default, dark, radical, etc.)",
+)
+@click.option(
+    "--hide",
+    default="",
+    help="Comma-separated stats to hide (stars,commits,prs,issues)",
+)
+@click.option(
+    "--show",
+    default="",
+    help="Comma-separated additional stats to show (prs_merged,prs_merged_percentage)",
+)
+@click.option(
+    "--hide-border",
+    is_flag=True,
+    help="Hide card border",
+)
+@click.option(
+    "--hide-title",
+    is_flag=True,
+    help="Hide card title",
+)
+@click.option(
+    "--show-icons",
+    is_flag=True,
+    help="Show icons next to stats",
+)
+@click.option(
+    "--layout",
+    type=click.Choice(["normal", "compact", "donut", "donut-vertical", "pie"]),
+    default="normal",
+    help="Top languages card layout (default: normal)",
+)
+@click.option(
+    "--langs-count",
+    type=int,
+    help="Number of languages on the top languages card",
+)
+@click.option(
+    "--title-color",
+    help="Custom title color (hex without #)",
+)
+@click.option(
+    "--text-color",
+    help="Custom text color (hex without #)",
+)
+@click.option(
+    "--icon-color",
+    help="Custom icon color (hex without #)",
+)
+@click.option(
+    "--bg-color",
+    help="Custom background color (hex without # or gradient)",
+)
+@click.option(
+    "--border-color",
+    help="Custom border color (hex without #)",
+)
+@click.option(
+    "--custom-title",
+    help="Custom stats card title text",
+)
+@click.option(
+    "--number-format",
+    type=click.Choice(["short", "long"]),
+    default="short",
+    help="Number format: short (6.6k) or long (6626)",
+)
+@click.option(
+    "--disable-animations",
+    is_flag=True,
+    help="Disable CSS animations",
+)
+@MINIFY_OPTION
+@CACHE_DIR_OPTION
+@COMPRESS_OPTION
+@GZIP_LEVEL_OPTION
+@BROTLI_QUALITY_OPTION
+def org_stats(
+    org: str,
+    token: str,
+    output: str,
+    langs_output: str | None,
+    exclude_repo: str,
+    concurrency: int,
+    repo_cache: str | None,
+    theme: str,
+    hide: str,
+    show: str,
+    hide_border: bool,
+    hide_title: bool,
+    show_icons: bool,
+    layout: str,
+    langs_count: int | None,
+    title_color: str | None,
+    text_color: str | None,
+    icon_color: str | None,
+    bg_color: str | None,
+    border_color: str | None,
+    custom_title: str | None,
+    number_format: str,
+    disable_animations: bool,
+    minify: bool,
+    cache_dir: str | None,
+    compress: tuple[str, ...],
+    gzip_level: int,
+    brotli_quality: int,
+) -> None:
+    """
+    Generate cards aggregating all public repositories of an organization.
+
+    Sums stars, default-branch commits, pull requests and issues over the
+    organization's public, non-fork repositories, and optionally its most
+    used languages.
+
+    Examples:
+
+      # Stats and languages of an organization, refreshed incrementally
+      github-stats-card org-stats --org github -o org.svg \\
+        --langs-output org-langs.svg --cache-dir .cache
+    """
+    from .core.config import LangsCardConfig, OrgStatsFetchConfig, StatsCardConfig
+    from .github.org_stats import dump_org_repo_cache
+
+    if repo_cache is None and cache_dir:
+        repo_cache = os.path.join(cache_dir, "org-repos", f"{org.lower()}.json")
+
+    try:
+        fetch_config = OrgStatsFetchConfig.from_cli_args(
+            token=token,
+            org=org,
+            exclude_repo=exclude_repo,
+            concurrency=concurrency,
+        )
+        cache = _load_org_repo_cache(repo_cache, org)
+
+        click.echo(f"Fetching repository stats for {org}...", err=True)
+        data = fetch_org_stats(fetch_config, cache=cache)
+        cached = data["repos"] - data["fetched"]
+        click.echo(
+            f"Aggregated {data['repos']} repositories "
+            f"({data['fetched']} fetched, {cached} from cache)",
+            err=True,
+        )
+        if cache is not None and repo_cache is not None:
+            try:
+                dump_org_repo_cache(cache, repo_cache)
+            except OSError as e:
+                click.echo(f"⚠️  Could not save repository cache: {e}", err=True)
+
+        colors = {
+            "theme": theme,
+            "title_color": title_color,
+            "text_color": text_color,
+            "bg_color": bg_color,
+            "border_color": border_color,
+            "hide_border": hide_border,
+            "hide_title": hide_title,
+            "disable_animations": disable_animations,
+            "minify": minify,
+        }
+        render_config = StatsCardConfig.from_cli_args(
+            **colors,
+            icon_color=icon_color,
+            hide=hide,
+            show=show,
+            show_icons=show_icons,
+            custom_title=custom_title,
+            number_format=number_format,
+        )
+        _render_and_write(
+            "org-stats",
+            data["stats"],
+            render_config,
+            lambda config: render_org_stats_card(data, config),
+            output,
+            cache_dir,
+            compress,
+            gzip_level,
+            brotli_quality,
+        )
+
+        if langs_output:
+            langs_config = LangsCardConfig.from_cli_args(
+                **colors, layout=layout, langs_count=langs_count
+            )
+            _render_and_write(
+                "org-langs",
+                data["languages"],
+                langs_config,
+                lambda config: render_org_langs_card(data, config),
+                langs_output,
+                cache_dir,
+                compress,
+                gzip_level,
+                brotli_quality,
+            )
+
+    except FetchError as e:
+        click.echo(f"❌ Error fetching data: {e}", err=True)
+        sys.exit(1)
+    except (GitHubStatsCardError, OSError) as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+
+def _fetch_configs(
+    username: str,
+    token: str,
+    include_all_commits: bool = False,
+    commits_year: int | None = None,
+    show_stats: str = "",
+    exclude_repo: str = "",
+    weighting: str | None = None,
+    size_weight: float | None = None,
+    count_weight: float | None = None,
+    limit: int = 10,
+) -> dict[str, Any]:
+    """Build the fetch configuration of every card type from CLI arguments."""
+    from .core.config import (
+        ContribFetchConfig,
+        FetchConfig,
+        LangsFetchConfig,
+        resolve_language_weights,
+    )
+
+    final_size_weight, final_count_weight = resolve_language_weights(
+        weighting, size_weight, count_weight
+    )
+    return {
+        "stats": FetchConfig.from_cli_args(
+            username=username,
+            token=token,
+            include_all_commits=include_all_commits,
+            commits_year=commits_year,
+            show=show_stats,
+        ),
+        "top-langs": LangsFetchConfig.from_cli_args(
+            username=username,
+            token=token,
+            exclude_repo=exclude_repo,
+            size_weight=final_size_weight,
+            count_weight=final_count_weight,
+        ),
+        "contrib": ContribFetchConfig.from_cli_args(
+            username=username, token=token, limit=limit, exclude_repo=exclude_repo
+        ),
+    }
+
+
+def _fetch_cards(
+    cards: tuple[str, ...], fetch_configs: dict[str, Any]
+) -> tuple[dict[str, Any], float]:
+    """
+    Fetch the data of several card types concurrently over one pooled client.
+
+    Returns:
+        Tuple of (future per card type resolving to (data, seconds), wall seconds)
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    from .github.client import GitHubClient
+
+    stats_config = fetch_configs["stats"]
+    langs_config = fetch_configs["top-langs"]
+    client = GitHubClient(stats_config.token, session=requests.Session())
+    fetchers: dict[str, Callable[[], Any]] = {
+        "stats": lambda: fetch_stats(
+            username=stats_config.username,
+            token=stats_config.token,
+            include_all_commits=stats_config.include_all_commits,
+            commits_year=stats_config.commits_year,
+            show=stats_config.show,
+            client=client,
+        ),
+        "top-langs": lambda: fetch_top_languages(
+            username=langs_config.username,
+            token=langs_config.token,
+            exclude_repo=langs_config.exclude_repo,
+            size_weight=langs_config.size_weight,
+            count_weight=langs_config.count_weight,
+            client=client,
+        ),
+        "contrib": lambda: fetch_contributor_stats(fetch_configs["contrib"], client=client),
+    }
+
+    def timed_fetch(card_type: str) -> tuple[Any, float]:
+        fetch_start = time.perf_counter()
+        data = fetchers[card_type]()
+        return data, time.perf_counter() - fetch_start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(cards), thread_name_prefix="fetch") as executor:
+        futures = {card_type: executor.submit(timed_fetch, card_type) for card_type in cards}
+    return futures, time.perf_counter() - start
+
+
+@cli.command(name="generate")
+@click.option(
+    "--username",
+    "-u",
+    required=True,
+    help="GitHub username",
+)
+@click.option(
+    "--token",
+    "-t",
+    envvar="GITHUB_TOKEN",
+    required=True,
+    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
+)
+@click.option(
+    "--cards",
+    default=",".join(CARD_TYPES),
+    show_default=True,
+    callback=_parse_card_types,
+    help="Comma-separated card types to generate",
+)
+@click.option(
+    "--output-dir",
+    "-d",
+    default=".",
+    type=click.Path(file_okay=False),
+    help="Directory for the cards (written as <card>.svg, e.g. top-langs.svg)",
+)
+@click.option(
+    "--theme",
+    default="default",
+    help="Theme name (default, dark, radical, etc.)",
+)
+@click.option(
+    "--hide-border",
+    is_flag=True,
+    help="Hide card border",
+)
+@click.option(
+    "--hide-title",
+    is_flag=True,
+    help="Hide card title",
+)
+@click.option(
+    "--title-color",
+    help="Custom title color (hex without #)",
+)
+@click.option(
+    "--text-color",
+    help="Custom text color (hex without #)",
+)
+@click.option(
+    "--bg-color",
+    help="Custom background color (hex without # or gradient: angle,color1,color2)",
+)
+@click.option(
+    "--border-color",
+    help="Custom border color (hex without #)",
+)
+@click.option(
+    "--card-width",
+    type=int,
+    help="Card width in pixels",
+)
+@click.option(
+    "--border-radius",
+    type=float,
+    default=4.5,
+    help="Border radius (default: 4.5)",
+)
+@click.option(
+    "--disable-animations",
+    is_flag=True,
+    help="Disable CSS animations",
+)
+@click.option(
+    "--exclude-repo",
+    default="",
+    help="Comma-separated repos to exclude (top-langs and contrib)",
+)
+@click.option(
+    "--show-icons",
+    is_flag=True,
+    help="Show icons next to stats (stats)",
+)
+@click.option(
+    "--hide-rank",
+    is_flag=True,
+    help="Hide rank circle (stats)",
+)
+@click.option(
+    "--include-all-commits",
+    is_flag=True,
+    help="Count all commits, not just current year (stats)",
+)
+@click.option(
+    "--hide-stats",
+    default="",
+    help="Comma-separated stats to hide (stats)",
+)
+@click.option(
+    "--show-stats",
+    default="",
+    help="Comma-separated additional stats to show (stats)",
+)
+@click.option(
+    "--commits-year",
+    type=int,
+    help="Filter commits to specific year (stats)",
+)
+@click.option(
+    "--icon-color",
+    help="Custom icon color, hex without # (stats)",
+)
+@click.option(
+    "--ring-color",
+    help="Custom rank ring color, hex without # (stats)",
+)
+@click.option(
+    "--stats-title",
+    help="Custom card title (stats)",
+)
+@click.option(
+    "--locale",
+    default="en",
+    help="Language locale (stats, default: en)",
+)
+@click.option(
+    "--line-height",
+    type=int,
+    default=25,
+    help="Line height between stats (stats, default: 25)",
+)
+@click.option(
+    "--number-format",
+    type=click.Choice(["short", "long"]),
+    default="short",
+    help="Number format: short (6.6k) or long (6626) (stats)",
+)
+@click.option(
+    "--number-precision",
+    type=int,
+    help="Decimal places for short format, 0-2 (stats)",
+)
+@click.option(
+    "--rank-icon",
+    type=click.Choice(["default", "github", "percentile"]),
+    default="default",
+    help="Rank icon style (stats)",
+)
+@click.option(
+    "--text-bold/--no-text-bold",
+    default=True,
+    help="Use bold text (stats, default: yes)",
+)
+@click.option(
+    "--layout",
+    type=click.Choice(["normal", "compact", "donut", "donut-vertical", "pie"]),
+    default="normal",
+    help="Card layout style (top-langs)",
+)
+@click.option(
+    "--langs-count",
+    type=int,
+    help="Number of languages to show, 1-20 (top-langs)",
+)
+@click.option(
+    "--hide-langs",
+    default="",
+    help="Comma-separated languages to hide (top-langs)",
+)
+@click.option(
+    "--hide-progress",
+    is_flag=True,
+    help="Hide progress bars (top-langs)",
+)
+@click.option(
+    "--weighting",
+    type=click.Choice(["size-only", "balanced", "expertise", "diversity"]),
+    help="Weighting preset (top-langs)",
+)
+@click.option(
+    "--size-weight",
+    type=float,
+    help="Weight for byte count in ranking (top-langs, overrides --weighting)",
+)
+@click.option(
+    "--count-weight",
+    type=float,
+    help="Weight for repo count in ranking (top-langs, overrides --weighting)",
+)
+@click.option(
+    "--stats-format",
+    type=click.Choice(["percentages", "bytes"]),
+    default="percentages",
+    help="Show language percentages or bytes (top-langs)",
+)
+@click.option(
+    "--langs-title",
+    help="Custom card title (top-langs)",
+)
+@click.option(
+    "--limit",
+    "-l",
+    type=int,
+    default=10,
+    help="Number of repositories to show (contrib, default: 10)",
+)
+@click.option(
+    "--contrib-title",
+    help="Custom card title (contrib)",
+)
+@MINIFY_OPTION
+@CACHE_DIR_OPTION
+@COMPRESS_OPTION
+@GZIP_LEVEL_OPTION
+@BROTLI_QUALITY_OPTION
+@RANK_CALIBRATION_OPTION
+def generate(
+    username: str,
+    token: str,
+    cards: tuple[str, ...],
+    output_dir: str,
+    theme: str,
+    hide_border: bool,
+    hide_title: bool,
+    title_color: str | None,
+    text_color: str | None,
+    bg_color: str | None,
+    border_color: str | None,
+    card_width: int | None,
+    border_radius: float,
+    disable_animations: bool,
+    exclude_repo: str,
+    show_icons: bool,
+    hide_rank: bool,
+    include_all_commits: bool,
+    hide_stats: str,
+    show_stats: str,
+    commits_year: int | None,
+    icon_color: str | None,
+    ring_color: str | None,
+    stats_title: str | None,
+    locale: str,
+    line_height: int,
+    number_format: str,
+    number_precision: int | None,
+    rank_icon: str,
+    text_bold: bool,
+    layout: str,
+    langs_count: int | None,
+    hide_langs: str,
+    hide_progress: bool,
+    weighting: str | None,
+    size_weight: float | None,
+    count_weight: float | None,
+    stats_format: str,
+    langs_title: str | None,
+    limit: int,
+    contrib_title: str | None,
+    minify: bool,
+    cache_dir: str | None,
+    compress: tuple[str, ...],
+    gzip_level: int,
+    brotli_quality: int,
+    rank_calibration: str | None,
+) -> None:
+    """
+    Generate several card types in one run.
+
+    The data behind each requested card is fetched once, concurrently, over a
+    shared connection pool; all cards are then rendered and written by this
+    one process. Timings for each phase are printed at the end.
+
+    Every option of the stats, top-langs and contrib commands is accepted;
+    options marked with a card type only apply to that card, and the title
+    and hidden items are set per card (--stats-title, --hide-langs, ...).
+
+    Examples:
+
+      \b
+      # All cards into the current directory
+      # (stats.svg, top-langs.svg, contrib.svg)
+      github-stats-card generate -u octocat
+
+      \b
+      # Two cards with a shared theme
+      github-stats-card generate -u octocat --cards stats,top-langs \\
+        -d profile --theme vue-dark --show-icons --layout compact
+    """
+    import time
+
+    from .core.config import ContribCardConfig, LangsCardConfig, StatsCardConfig
+
+    calibration = _load_rank_calibration(rank_calibration)
+    start = time.perf_counter()
+    common = {
+        "theme": theme,
+        "hide_border": hide_border,
+        "hide_title": hide_title,
+        "title_color": title_color,
+        "text_color": text_color,
+        "bg_color": bg_color,
+        "border_color": border_color,
+        "card_width": card_width,
+        "border_radius": border_radius,
+        "disable_animations": disable_animations,
+        "minify": minify,
+    }
+    try:
+        fetch_configs = _fetch_configs(
+            username,
+            token,
+            include_all_commits=include_all_commits,
+            commits_year=commits_year,
+            show_stats=show_stats,
+            exclude_repo=exclude_repo,
+            weighting=weighting,
+            size_weight=size_weight,
+            count_weight=count_weight,
+            limit=limit,
+        )
+        render_configs: dict[str, Any] = {
+            "stats": StatsCardConfig.from_cli_args(
+                **common,
+                show_icons=show_icons,
+                hide_rank=hide_rank,
+                include_all_commits=include_all_commits,
+                hide=hide_stats,
+                show=show_stats,
+                icon_color=icon_color,
+                ring_color=ring_color,
+                custom_title=stats_title,
+                locale=locale,
+                line_height=line_height,
+                number_format=number_format,
+                number_precision=number_precision,
+                rank_icon=rank_icon,
+                text_bold=text_bold,
+                rank_calibration=calibration,
+            ),
+            "top-langs": LangsCardConfig.from_cli_args(
+                **common,
+                layout=layout,
+                langs_count=langs_count,
+                hide=hide_langs,
+                hide_progress=hide_progress,
+                stats_format=stats_format,
+                custom_title=langs_title,
+            ),
+            "contrib": ContribCardConfig.from_cli_args(
+                **common, limit=limit, exclude_repo=exclude_repo, custom_title=contrib_title
+            ),
+        }
+    except GitHubStatsCardError as e:
+        click.echo(f"❌ Invalid options: {e}", err=True)
+        sys.exit(1)
+
+    renderers: dict[str, Callable[[Any, Any], str]] = {
+        "stats": lambda data, config: render_stats_card(data, config),
+        "top-langs": lambda data, config: render_top_languages(data, config),
+        "contrib": lambda data, config: render_contrib_card(data, config),
+    }
+
+    click.echo(f"Fetching data for {username}: {', '.join(cards)}...", err=True)
+    futures, fetch_wall = _fetch_cards(cards, fetch_configs)
+
+    failed = []
+    fetch_total = 0.0
+    render_start = time.perf_counter()
+    for card_type in cards:
+        try:
+            data, elapsed = futures[card_type].result()
+        except GitHubStatsCardError as e:
+            click.echo(f"❌ Error fetching {card_type} data: {e}", err=True)
+            failed.append(card_type)
+            continue
+
+        fetch_total += elapsed
+        click.echo(f"Fetched {card_type} data in {elapsed:.2f}s", err=True)
+        try:
+            _render_and_write(
+                card_type,
+                data,
+                render_configs[card_type],
+                partial(renderers[card_type], data),
+                os.path.join(output_dir, f"{card_type}.svg"),
+                cache_dir,
+                compress,
+                gzip_level,
+                brotli_quality,
+            )
+        except (GitHubStatsCardError, OSError) as e:
+            click.echo(f"❌ Error generating {card_type} card: {e}", err=True)
+            failed.append(card_type)
+    render_elapsed = time.perf_counter() - render_start
+
+    click.echo(
+        f"⏱  {len(cards) - len(failed)}/{len(cards)} cards in "
+        f"{time.perf_counter() - start:.2f}s: fetch {fetch_wall:.2f}s "
+        f"(sequential {fetch_total:.2f}s), render and write {render_elapsed:.2f}s",
+        err=True,
+    )
+    if failed:
+        sys.exit(1)
+
+
+def _parse_key_values(
+    ctx: click.Context, param: click.Parameter, value: tuple[str, ...]
+) -> dict[str, str]:
+    """Validate repeated KEY=VALUE options."""
+    options = {}
+    for item in value:
+        key, sep, option_value = item.partition("=")
+        if not sep or not key.strip():
+            raise click.BadParameter(f"expected KEY=VALUE, got '{item}'")
+        options[key.strip()] = option_value
+    return options
+
+
+@cli.command(name="fetch")
+@click.option(
+    "--username",
+    "-u",
+    required=True,
+    help="GitHub username",
+)
+@click.option(
+    "--token",
+    "-t",
+    envvar="GITHUB_TOKEN",
+    required=True,
+    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
+)
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    type=click.Path(),
+    help="Snapshot file path (.json, .json.gz or .msgpack)",
+)
+@click.option(
+    "--cards",
+    default=",".join(CARD_TYPES),
+    show_default=True,
+    callback=_parse_card_types,
+    help="Comma-separated card types to fetch data for",
+)
+@click.option(
+    "--include-all-commits",
+    is_flag=True,
+    help="Count all commits, not just current year (stats)",
+)
+@click.option(
+    "--commits-year",
+    type=int,
+    help="Filter commits to specific year (stats)",
+)
+@click.option(
+    "--show-stats",
+    default="",
+    help="Comma-separated additional stats to fetch, e.g. reviews (stats)",
+)
+@click.option(
+    "--exclude-repo",
+    default="",
+    help="Comma-separated repos to exclude (top-langs and contrib)",
+)
+@click.option(
+    "--weighting",
+    type=click.Choice(["size-only", "balanced", "expertise", "diversity"]),
+    help="Weighting preset (top-langs)",
+)
+@click.option(
+    "--size-weight",
+    type=float,
+    help="Weight for byte count in ranking (top-langs, overrides --weighting)",
+)
+@click.option(
+    "--count-weight",
+    type=float,
+    help="Weight for repo count in ranking (top-langs, overrides --weighting)",
+)
+@click.option(
+    "--limit",
+    "-l",
+    type=int,
+    default=10,
+    help="Number of repositories to fetch (contrib, default: 10)",
+)
+def fetch(
+    username: str,
+    token: str,
+    output: str,
+    cards: tuple[str, ...],
+    include_all_commits: bool,
+    commits_year: int | None,
+    show_stats: str,
+    exclude_repo: str,
+    weighting: str | None,
+    size_weight: float | None,
+    count_weight: float | None,
+    limit: int,
+) -> None:
+    """
+    Fetch card data into a snapshot file for offline rendering.
+
+    The snapshot holds the fetched data only, so any theme, layout or
+    option can later be rendered from it with `render --from-snapshot`
+    without GitHub access or a token.
+
+    Examples:
+
+      \b
+      # Fetch everything once on a worker with API access
+      github-stats-card fetch -u octocat -o octocat.json.gz
+
+      \b
+      # Render cards from the snapshot elsewhere
+      github-stats-card render --from-snapshot octocat.json.gz \\
+        --card top-langs -o langs.svg -O layout=donut -O theme=dark
+    """
+    from dataclasses import asdict
+
+    from .github.snapshot import Snapshot, dump_snapshot
+
+    try:
+        fetch_configs = _fetch_configs(
+            username,
+            token,
+            include_all_commits=include_all_commits,
+            commits_year=commits_year,
+            show_stats=show_stats,
+            exclude_repo=exclude_repo,
+            weighting=weighting,
+            size_weight=size_weight,
+            count_weight=count_weight,
+            limit=limit,
+        )
+    except GitHubStatsCardError as e:
+        click.echo(f"❌ Invalid options: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"Fetching data for {username}: {', '.join(cards)}...", err=True)
+    futures, fetch_wall = _fetch_cards(cards, fetch_configs)
+
+    snapshot = Snapshot(username=username)
+    failed = False
+    for card_type in cards:
+        try:
+            data, elapsed = futures[card_type].result()
+        except GitHubStatsCardError as e:
+            click.echo(f"❌ Error fetching {card_type} data: {e}", err=True)
+            failed = True
+            continue
+
+        click.echo(f"Fetched {card_type} data in {elapsed:.2f}s", err=True)
+        setattr(snapshot, card_type.replace("-", "_"), data)
+        snapshot.fetch_options[card_type] = {
+            k: v for k, v in asdict(fetch_configs[card_type]).items() if k != "token"
+        }
+
+    if failed:
+        click.echo("❌ Snapshot not written", err=True)
+        sys.exit(1)
+
+    try:
+        size = dump_snapshot(snapshot, output)
+    except (GitHubStatsCardError, OSError) as e:
+        click.echo(f"❌ Error writing snapshot: {e}", err=True)
+        sys.exit(1)
+    click.echo(f"✅ Wrote snapshot {output} ({size} bytes, fetch {fetch_wall:.2f}s)", err=True)
+
+
+@cli.command(name="render")
+@click.option(
+    "--from-snapshot",
+    "snapshot_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Snapshot file written by the fetch command",
+)
+@click.option(
+    "--card",
+    "card_type",
+    required=True,
+    type=click.Choice(CARD_TYPES),
+    help="Card type to render",
+)
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    type=click.Path(),
+    help="Output SVG file path",
+)
+@click.option(
+    "--option",
+    "-O",
+    "options",
+    multiple=True,
+    metavar="KEY=VALUE",
+    callback=_parse_key_values,
+    help="Card option by CLI option name, e.g. -O theme=dark -O show-icons=true (repeatable)",
+)
+@MINIFY_OPTION
+@CACHE_DIR_OPTION
+@COMPRESS_OPTION
+@GZIP_LEVEL_OPTION
+@BROTLI_QUALITY_OPTION
+@RANK_CALIBRATION_OPTION
+def render(
+    snapshot_path: str,
+    card_type: str,
+    output: str,
+    options: dict[str, str],
+    minify: bool,
+    cache_dir: str | None,
+    compress: tuple[str, ...],
+    gzip_level: int,
+    brotli_quality: int,
+    rank_calibration: str | None,
+) -> None:
+    """
+    Render a card from a snapshot without contacting GitHub.
+
+    Examples:
+
+      \b
+      github-stats-card render --from-snapshot octocat.json.gz \\
+        --card stats -o stats.svg -O theme=radical -O show-icons=true
+    """
+    from .core.config import ContribCardConfig, LangsCardConfig, StatsCardConfig
+    from .github.snapshot import load_snapshot
+
+    config_types: dict[str, Any] = {
+        "stats": StatsCardConfig,
+        "top-langs": LangsCardConfig,
+        "contrib": ContribCardConfig,
+    }
+    renderers: dict[str, Callable[[Any, Any], str]] = {
+        "stats": lambda data, config: render_stats_card(data, config),
+        "top-langs": lambda data, config: render_top_languages(data, config),
+        "contrib": lambda data, config: render_contrib_card(data, config),
+    }
+
+    try:
+        snapshot = load_snapshot(snapshot_path)
+        data = snapshot.card_data(card_type)
+        params = {**options, **({"minify": "true"} if minify else {})}
+        render_config = config_types[card_type].from_query_params(params)
+    except (GitHubStatsCardError, OSError) as e:
+        click.echo(f"❌ Invalid snapshot or options: {e}", err=True)
+        sys.exit(1)
+
+    if rank_calibration is not None:
+        if card_type != "stats":
+            click.echo("❌ --rank-calibration only applies to the stats card", err=True)
+            sys.exit(1)
+        render_config = replace(
+            render_config, rank_calibration=_load_rank_calibration(rank_calibration)
+        )
+
+    click.echo(
+        f"Rendering {card_type} card for {snapshot.username} "
+        f"from snapshot taken {snapshot.created_at}",
+        err=True,
+    )
+    try:
+        _render_and_write(
+            card_type,
+            data,
+            render_config,
+            lambda config: renderers[card_type](data, config),
+            output,
+            cache_dir,
+            compress,
+            gzip_level,
+            brotli_quality,
+        )
+    except (GitHubStatsCardError, OSError) as e:
+        click.echo(f"❌ Unexpected error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command(name="calibrate")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    type=click.Path(),
+    help="Output calibration table (JSON)",
+)
+@click.option(
+    "--points",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CALIBRATION_POINTS,
+    show_default=True,
+    help="Quantile steps per metric",
+)
+def calibrate(paths: tuple[str, ...], output: str, points: int) -> None:
+    """
+    Build a rank calibration table from a corpus of snapshots.
+
+    PATHS are snapshot files or directories searched recursively. The table
+    records the distribution of each rank metric over the users in the
+    corpus; pass it to --rank-calibration to rank users against that
+    population instead of the built-in medians.
+
+    Examples:
+
+      \b
+      github-stats-card calibrate snapshots/ -o calibration.json
+      github-stats-card stats -u octocat --rank-calibration calibration.json
+    """
+    import time
+
+    from .github.calibration import CalibrationBuilder, dump_calibration, iter_snapshot_paths
+    from .github.snapshot import load_snapshot
+
+    start = time.perf_counter()
+    builder = CalibrationBuilder()
+    skipped = 0
+    for path in iter_snapshot_paths(paths):
+        try:
+            snapshot = load_snapshot(path)
+        except (GitHubStatsCardError, OSError) as e:
+            click.echo(f"⚠️  Skipping {path}: {e}", err=True)
+            skipped += 1
+            continue
+        if snapshot.stats is None:
+            continue
+        all_commits = bool(snapshot.fetch_options.get("stats", {}).get("include_all_commits"))
+        builder.add(snapshot.stats, all_commits=all_commits)
+
+    try:
+        calibration = builder.build(points)
+        size = dump_calibration(calibration, output)
+    except (GitHubStatsCardError, OSError) as e:
+        click.echo(f"❌ Calibration failed: {e}", err=True)
+        sys.exit(1)
+
+    elapsed = time.perf_counter() - start
+    click.echo(
+        f"✅ Calibrated from {calibration.users} users"
+        + (f" ({skipped} unreadable snapshots skipped)" if skipped else "")
+        + f" in {elapsed:.2f}s: {output} ({size} bytes)",
+        err=True,
+    )
+
+
+@cli.command(name="serve")
+@click.option(
+    "--token",
+    "-t",
+    envvar="GITHUB_TOKEN",
+    required=True,
+    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
+)
+@click.option(
+    "--host",
+    default=SERVER_DEFAULT_HOST,
+    help=f"Interface to bind (default: {SERVER_DEFAULT_HOST})",
+)
+@click.option(
+    "--port",
+    "-p",
+    type=int,
+    default=SERVER_DEFAULT_PORT,
+    help=f"Port to listen on (default: {SERVER_DEFAULT_PORT})",
+)
+@click.option(
+    "--cache-ttl",
+    type=int,
+    default=SERVER_CACHE_TTL,
+    help=f"Seconds fetched data and rendered cards stay fresh (default: {SERVER_CACHE_TTL})",
+)
+@click.option(
+    "--stale-ttl",
+    type=int,
+    default=SERVER_STALE_TTL,
+    help="Extra seconds stale data is served while refreshing in the background "
+    f"(default: {SERVER_STALE_TTL})",
+)
+@click.option(
+    "--stale-if-error-ttl",
+    type=int,
+    default=SERVER_STALE_IF_ERROR_TTL,
+    help="Extra seconds stale data is served when GitHub is unavailable "
+    f"(default: {SERVER_STALE_IF_ERROR_TTL})",
+)
+@RANK_SKETCH_OPTION
+@RANK_SKETCH_USERS_OPTION
+@RANK_SKETCH_FP_RATE_OPTION
+@LIVE_RANK_OPTION
+def serve(
+    token: str,
+    host: str,
+    port: int,
+    cache_ttl: int,
+    stale_ttl: int,
+    stale_if_error_ttl: int,
+    rank_sketch: str | None,
+    rank_sketch_users: int,
+    rank_sketch_fp_rate: float,
+    live_rank: bool,
+) -> None:
+    """
+    Serve cards over HTTP from a long-lived process.
+
+    Cards are rendered on demand at /stats, /top-langs and /contrib using the
+    same option names as the CLI as query parameters (hyphens or underscores).
+
+    Examples:
+
+      # Start the server
+      github-stats-card serve --port 8080
+
+      # Then request a card
+      curl "http://127.0.0.1:8080/stats?username=octocat&theme=dark&show_icons=true"
+    """
+    from .server import CardServer, create_http_server
+
+    card_server = CardServer(
+        token,
+        cache_ttl=cache_ttl,
+        stale_ttl=stale_ttl,
+        stale_if_error_ttl=stale_if_error_ttl,
+        **_rank_sketch_options(rank_sketch, live_rank, rank_sketch_users, rank_sketch_fp_rate),
+    )
+    httpd = create_http_server(card_server, host, port)
+    click.echo(f"Serving cards on http://{host}:{httpd.server_port}", err=True)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        _save_rank_sketch(card_server)
+
+
+@cli.command(name="serve-stdio")
+@click.option(
+    "--token",
+    "-t",
+    envvar="GITHUB_TOKEN",
+    required=True,
+    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
+)
+@click.option(
+    "--cache-ttl",
+    type=int,
+    default=SERVER_CACHE_TTL,
+    help=f"Seconds fetched data and rendered cards stay fresh (default: {SERVER_CACHE_TTL})",
+)
+@click.option(
+    "--stale-ttl",
+    type=int,
+    default=SERVER_STALE_TTL,
+    help="Extra seconds stale data is served while refreshing in the background "
+    f"(default: {SERVER_STALE_TTL})",
+)
+@click.option(
+    "--stale-if-error-ttl",
+    type=int,
+    default=SERVER_STALE_IF_ERROR_TTL,
+    help="Extra seconds stale data is served when GitHub is unavailable "
+    f"(default: {SERVER_STALE_IF_ERROR_TTL})",
+)
+@RANK_SKETCH_OPTION
+@RANK_SKETCH_USERS_OPTION
+@RANK_SKETCH_FP_RATE_OPTION
+@LIVE_RANK_OPTION
+def serve_stdio(
+    token: str,
+    cache_ttl: int,
+    stale_ttl: int,
+    stale_if_error_ttl: int,
+    rank_sketch: str | None,
+    rank_sketch_users: int,
+    rank_sketch_fp_rate: float,
+    live_rank: bool,
+) -> None:
+    """
+    Render cards for JSON-line jobs read from stdin.
+
+    Keeps the interpreter, HTTP connection pool and caches warm across jobs,
+    replying with one JSON line per job on stdout until stdin is closed.
+
+    Each job is one JSON object per line with "card" (stats, top-langs or
+    contrib), "username", optional "options" (CLI option names) and an
+    optional "output" path, plus an "id" echoed in the reply. Replies report
+    "ok", "status" (generated, unchanged or rendered) or "error", and fetch,
+    render and write timings in milliseconds.
+
+    Examples:
+
+      \b
+      # jobs.jsonl
+      {"id": 1, "card": "stats", "username": "octocat", "output": "stats.svg"}
+      {"id": 2, "card": "contrib", "username": "octocat", "options": {"limit": 5}}
+
+      github-stats-card serve-stdio < jobs.jsonl > replies.jsonl
+    """
+    from .server import CardServer
+    from .worker import StdioWorker
+
+    card_server = CardServer(
+        token,
+        cache_ttl=cache_ttl,
+        stale_ttl=stale_ttl,
+        stale_if_error_ttl=stale_if_error_ttl,
+        **_rank_sketch_options(rank_sketch, live_rank, rank_sketch_users, rank_sketch_fp_rate),
+    )
+    worker = StdioWorker(card_server)
+    click.echo("Worker ready; reading JSON-line jobs from stdin", err=True)
+    try:
+        jobs = worker.serve(sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        jobs = worker.jobs
+    finally:
+        _save_rank_sketch(card_server)
+    click.echo(f"Processed {jobs} jobs ({worker.failures} failed)", err=True)
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,186 @@
+"""In-memory caches shared by long-lived processes (server, batch runs)."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from .exceptions import APIError
+from .singleflight import SingleFlight
+
+
+class StaleWhileRevalidateCache[K: Hashable, V]:
+    """
+    Fetch-result cache with stale-while-revalidate and stale-if-error semantics.
+
+    For an entry of a given age:
+
+    - younger than ``fresh_ttl``: served directly
+    - within ``fresh_ttl + stale_ttl``: served immediately while a background
+      worker refreshes it
+    - older: loaded synchronously; if loading raises one of ``error_types`` and
+      the entry is within ``fresh_ttl + stale_if_error_ttl``, the stale value is
+      served instead of the error
+
+    Synchronous loads and background refreshes for the same key go through a
+    shared SingleFlight, so concurrent misses trigger a single load.
+
+    Args:
+        fresh_ttl: Seconds an entry is considered fresh
+        stale_ttl: Additional seconds a stale entry may be served while refreshing
+        stale_if_error_ttl: Additional seconds a stale entry may be served on errors
+        maxsize: Maximum number of entries kept in memory (LRU eviction)
+        error_types: Exceptions that allow falling back to a stale entry
+        executor: Executor for background refreshes (a small thread pool by default)
+        clock: Monotonic time source (overridable for tests)
+    """
+
+    def __init__(
+        self,
+        fresh_ttl: float,
+        stale_ttl: float = 0,
+        stale_if_error_ttl: float = 0,
+        maxsize: int = 1024,
+        error_types: tuple[type[BaseException], ...] = (APIError,),
+        executor: Executor | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.stale_if_error_ttl = stale_if_error_ttl
+        self.maxsize = maxsize
+        self.error_types = error_types
+        self._executor = executor
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set[K] = set()
+        self.flight: SingleFlight[K, V] = SingleFlight()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.stale_errors = 0
+        self.refresh_errors = 0
+
+    def get(self, key: K, load: Callable[[], V]) -> V:
+        """
+        Return the value for key, loading or refreshing it as needed.
+
+        Args:
+            key: Cache key
+            load: Zero-argument callable fetching a fresh value
+
+        Returns:
+            Fresh, stale or newly loaded value
+
+        Raises:
+            Exception: Whatever load raised, when no usable stale entry exists
+        """
+        stale = False
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+                stored_at, value = entry
+                age = self._clock() - stored_at
+                if age < self.fresh_ttl:
+                    self.hits += 1
+                    return value
+                stale = age < self.fresh_ttl + self.stale_ttl
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.misses += 1
+
+        if stale:
+            self._schedule_refresh(key, load)
+            return value
+
+        try:
+            return self.flight.do(key, lambda: self._load(key, load))
+        except self.error_types:
+            if entry is not None and self._clock() - entry[0] < (
+                self.fresh_ttl + self.stale_if_error_ttl
+            ):
+                with self._lock:
+                    self.stale_errors += 1
+                return entry[1]
+            raise
+
+    def peek(self, key: K) -> V | None:
+        """
+        Return the value for key if it is fresh, without loading or refreshing.
+
+        Neither the hit counters nor the LRU order are updated.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Fresh value, or None
+        """
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None or self._clock() - entry[0] >= self.fresh_ttl:
+            return None
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store a freshly loaded value under key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = (self._clock(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def _load(self, key: K, load: Callable[[], V]) -> V:
+        value = load()
+        self.set(key, value)
+        return value
+
+    def _schedule_refresh(self, key: K, load: Callable[[], V]) -> None:
+        """Start a background refresh for key unless one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="cache-refresh"
+                )
+            executor = self._executor
+        executor.submit(self._refresh, key, load)
+
+    def _refresh(self, key: K, load: Callable[[], V]) -> None:
+        try:
+            self.flight.do(key, lambda: self._load(key, load))
+        except Exception:  # noqa: BLE001
+            # Keep serving the stale entry; the next request past the stale
+            # window retries synchronously.
+            with self._lock:
+                self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    @property
+    def refreshing(self) -> int:
+        """Number of background refreshes currently running."""
+        with self._lock:
+            return len(self._refreshing)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
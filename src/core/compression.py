@@ -0,0 +1,136 @@
+"""Deterministic compression helpers for generated SVG output."""
+
+import gzip
+import os
+from collections.abc import Iterable
+from typing import Any
+
+from .exceptions import ValidationError
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+DEFAULT_GZIP_LEVEL = 9
+DEFAULT_BROTLI_QUALITY = 11
+
+# Pre-compressed output formats: gzip-compressed SVG (.svgz) and
+# .svg.gz/.svg.br sidecars for static hosts that serve them transparently
+COMPRESSED_FORMATS = ("svgz", "gz", "br")
+
+
+def gzip_compress(data: bytes, level: int = DEFAULT_GZIP_LEVEL) -> bytes:
+    """
+    Gzip-compress data deterministically.
+
+    The header timestamp is fixed so identical input always yields identical
+    bytes (unchanged cards stay unchanged on disk).
+
+    Args:
+        data: Bytes to compress
+        level: Compression level (1-9)
+
+    Returns:
+        Gzip-compressed bytes
+    """
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def brotli_available() -> bool:
+    """Return True if the optional brotli module is installed."""
+    return brotli is not None
+
+
+def brotli_compress(data: bytes, quality: int = DEFAULT_BROTLI_QUALITY) -> bytes | None:
+    """
+    Brotli-compress data if the optional brotli module is installed.
+
+    Args:
+        data: Bytes to compress
+        quality: Compression quality (0-11)
+
+    Returns:
+        Brotli-compressed bytes, or None if brotli is unavailable
+    """
+    if brotli is None:
+        return None
+    module: Any = brotli
+    return bytes(module.compress(data, quality=quality))
+
+
+def compressed_path(path: str, fmt: str) -> str:
+    """
+    Return the output path for a compressed variant of an SVG file.
+
+    Args:
+        path: Path of the plain SVG output
+        fmt: One of COMPRESSED_FORMATS
+
+    Returns:
+        "card.svgz" for svgz, "card.svg.gz"/"card.svg.br" for sidecars
+    """
+    if fmt == "svgz":
+        root, ext = os.path.splitext(path)
+        return f"{root}.svgz" if ext.lower() == ".svg" else f"{path}z"
+    return f"{path}.{fmt}"
+
+
+def compress_variants(
+    data: bytes,
+    formats: Iterable[str],
+    gzip_level: int = DEFAULT_GZIP_LEVEL,
+    brotli_quality: int = DEFAULT_BROTLI_QUALITY,
+) -> dict[str, bytes]:
+    """
+    Compress data once per requested format.
+
+    svgz and gz share the same gzip stream, so requesting both costs a single
+    compression.
+
+    Args:
+        data: Plain SVG bytes
+        formats: Requested formats (subset of COMPRESSED_FORMATS)
+        gzip_level: Gzip compression level (1-9)
+        brotli_quality: Brotli quality (0-11)
+
+    Returns:
+        Mapping of format to compressed bytes, in request order
+
+    Raises:
+        ValidationError: If a format is unknown or brotli is requested but not installed
+    """
+    variants: dict[str, bytes] = {}
+    gzipped: bytes | None = None
+    for fmt in formats:
+        if fmt not in COMPRESSED_FORMATS:
+            raise ValidationError(
+                f"Unknown compression format '{fmt}'. Valid formats: {', '.join(COMPRESSED_FORMATS)}"
+            )
+        if fmt == "br":
+            compressed = brotli_compress(data, quality=brotli_quality)
+            if compressed is None:
+                raise ValidationError(
+                    "Brotli output requires the optional 'brotli' package "
+                    "(pip install 'github-stats-card[brotli]')"
+                )
+            variants[fmt] = compressed
+        else:
+            if gzipped is None:
+                gzipped = gzip_compress(data, level=gzip_level)
+            variants[fmt] = gzipped
+    return variants
+
+
+def compression_ratio(original_size: int, compressed_size: int) -> float:
+    """
+    Return compressed size as a fraction of the original size.
+
+    Args:
+        original_size: Size of the uncompressed data in bytes
+        compressed_size: Size of the compressed data in bytes
+
+    Returns:
+        Ratio in [0, 1] for effective compression (0.0 for empty input)
+    """
+    return compressed_size / original_size if original_size else 0.0
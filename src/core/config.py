@@ -1,11 +1,38 @@
 """Configuration dataclasses for GitHub Stats Card rendering."""
 
 from dataclasses import dataclass, field
-from typing import Any
-
+from typing import Any, get_args, get_type_hints
+
+from .constants import (
+    LEADERBOARD_CONCURRENCY,
+    LEADERBOARD_MAX_MEMBERS,
+    ORG_STATS_CONCURRENCY,
+    WEIGHTING_PRESETS,
+)
+from .exceptions import ValidationError
 from .utils import parse_list_arg
 
 
+def _coerce_query_value(name: str, value: str, annotation: Any) -> Any:
+    """Coerce a query string value to the annotated field type."""
+    types = get_args(annotation) or (annotation,)
+    try:
+        if bool in types:
+            lowered = value.strip().lower()
+            if lowered in ("", "1", "true", "yes", "on"):
+                return True
+            if lowered in ("0", "false", "no", "off"):
+                return False
+            raise ValueError(value)
+        if int in types:
+            return int(value)
+        if float in types:
+            return float(value)
+    except ValueError as e:
+        raise ValidationError(f"Invalid value for '{name}': {value!r}") from e
+    return value
+
+
 @dataclass
 class BaseConfig:
     """Base configuration class with CLI argument parsing."""
@@ -29,12 +56,38 @@ class BaseConfig:
         filtered = {k: v for k, v in kwargs.items() if k in valid_fields and v is not None}
 
         # Handle known list fields
-        for list_key in ["hide", "show", "exclude_repo"]:
+        for list_key in ["hide", "show", "exclude_repo", "users"]:
             if list_key in filtered:
                 filtered[list_key] = parse_list_arg(filtered[list_key])
 
         return cls(**filtered)
 
+    @classmethod
+    def from_query_params(cls, params: dict[str, str]) -> Any:
+        """
+        Create configuration from URL query parameters.
+
+        Parameter names may use hyphens or underscores. String values are
+        coerced to the annotated field type before delegating to from_cli_args.
+        Fields whose metadata sets ``query`` to False are ignored.
+
+        Args:
+            params: Query parameter values (last value wins for repeated keys)
+
+        Returns:
+            Config instance
+
+        Raises:
+            ValidationError: If a value cannot be coerced to its field type
+        """
+        hints = get_type_hints(cls)
+        kwargs: dict[str, Any] = {}
+        for raw_key, raw_value in params.items():
+            key = raw_key.replace("-", "_")
+            if key in hints and cls.__dataclass_fields__[key].metadata.get("query", True):
+                kwargs[key] = _coerce_query_value(key, raw_value, hints[key])
+        return cls.from_cli_args(**kwargs)
+
 
 @dataclass
 class StatsCardConfig(BaseConfig):
@@ -75,9 +128,17 @@ class StatsCardConfig(BaseConfig):
     disable_animations: bool = False
     rank_icon: str = "default"  # "default", "github", "percentile"
 
+    # Output options
+    minify: bool = False
+
     # Commit filtering
     include_all_commits: bool = False
 
+    # Rank distribution to rank against: a RankCalibration table (see the
+    # calibrate command) or the server's live rank sketch; set by the CLI or
+    # server, never from query parameters
+    rank_calibration: Any = field(default=None, metadata={"query": False})
+
 
 @dataclass
 class LangsCardConfig(BaseConfig):
@@ -116,6 +177,9 @@ class LangsCardConfig(BaseConfig):
     # Animation options
     disable_animations: bool = False
 
+    # Output options
+    minify: bool = False
+
 
 @dataclass
 class FetchConfig(BaseConfig):
@@ -139,6 +203,38 @@ class LangsFetchConfig(BaseConfig):
     count_weight: float = 0.0
 
 
+def resolve_language_weights(
+    weighting: str | None = None,
+    size_weight: float | None = None,
+    count_weight: float | None = None,
+) -> tuple[float, float]:
+    """
+    Resolve language ranking weights from a preset and explicit overrides.
+
+    Explicit weights take precedence over the preset; anything still unset
+    falls back to size-only ranking (1.0, 0.0).
+
+    Args:
+        weighting: Optional preset name (see WEIGHTING_PRESETS)
+        size_weight: Explicit weight for byte count
+        count_weight: Explicit weight for repo count
+
+    Returns:
+        Tuple of (size_weight, count_weight)
+    """
+    if weighting:
+        preset = WEIGHTING_PRESETS[weighting]
+        if size_weight is None:
+            size_weight = preset["size_weight"]
+        if count_weight is None:
+            count_weight = preset["count_weight"]
+
+    return (
+        size_weight if size_weight is not None else 1.0,
+        count_weight if count_weight is not None else 0.0,
+    )
+
+
 @dataclass
 class ContribCardConfig(BaseConfig):
     """Configuration for contributor card rendering."""
@@ -166,6 +262,9 @@ class ContribCardConfig(BaseConfig):
     # Animation options
     disable_animations: bool = False
 
+    # Output options
+    minify: bool = False
+
 
 @dataclass
 class ContribFetchConfig(BaseConfig):
@@ -175,3 +274,64 @@ class ContribFetchConfig(BaseConfig):
     token: str
     limit: int = 10
     exclude_repo: list[str] = field(default_factory=list)
+
+
+@dataclass
+class LeaderboardCardConfig(BaseConfig):
+    """Configuration for leaderboard card rendering."""
+
+    # Theme and colors
+    theme: str = "default"
+    title_color: str | None = None
+    text_color: str | None = None
+    bg_color: str | None = None
+    border_color: str | None = None
+    ring_color: str | None = None
+
+    # Visibility options
+    hide_border: bool = False
+    hide_title: bool = False
+    hide_rank: bool = False
+
+    # Layout options
+    card_width: int = 467
+    border_radius: float = 4.5
+
+    # Display options
+    custom_title: str | None = None
+    number_format: str = "short"  # "short" or "long"
+
+    # Animation options
+    disable_animations: bool = False
+
+    # Output options
+    minify: bool = False
+
+
+@dataclass
+class LeaderboardFetchConfig(BaseConfig):
+    """Configuration for fetching leaderboard data (an organisation or a user list)."""
+
+    token: str
+    org: str | None = None
+    users: list[str] = field(default_factory=list)
+    sort_by: str = "rank"  # "rank" or a stats card stat key, e.g. "stars"
+    limit: int = 10
+    include_all_commits: bool = False
+    # Parallel member fetches; chosen by the operator, never by query parameters
+    concurrency: int = field(default=LEADERBOARD_CONCURRENCY, metadata={"query": False})
+    # Most members or users ranked; chosen by the operator, never by query parameters
+    max_members: int = field(default=LEADERBOARD_MAX_MEMBERS, metadata={"query": False})
+
+
+@dataclass
+class OrgStatsFetchConfig(BaseConfig):
+    """Configuration for fetching aggregate stats of an organisation's public repositories."""
+
+    token: str
+    org: str
+    exclude_repo: list[str] = field(default_factory=list)
+    size_weight: float = 1.0
+    count_weight: float = 0.0
+    # Parallel detail requests; chosen by the operator, never by query parameters
+    concurrency: int = field(default=ORG_STATS_CONCURRENCY, metadata={"query": False})
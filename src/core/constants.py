@@ -9,6 +9,96 @@ API_BASE_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com")
 GRAPHQL_ENDPOINT = os.environ.get("GITHUB_GRAPHQL_URL", f"{API_BASE_URL}/graphql")
 API_TIMEOUT = 30
 
+# Weighting presets for language ranking
+WEIGHTING_PRESETS = {
+    "size-only": {"size_weight": 1.0, "count_weight": 0.0},
+    "balanced": {"size_weight": 0.7, "count_weight": 0.3},
+    "expertise": {"size_weight": 0.5, "count_weight": 0.5},
+    "diversity": {"size_weight": 0.4, "count_weight": 0.6},
+}
+
+# Server Settings
+SERVER_DEFAULT_HOST = "127.0.0.1"
+SERVER_DEFAULT_PORT = 8080
+SERVER_CACHE_TTL = 4 * 60 * 60  # seconds, matches upstream default cache_seconds
+SERVER_STALE_TTL = 24 * 60 * 60  # serve stale data while refreshing in the background
+SERVER_STALE_IF_ERROR_TTL = 7 * 24 * 60 * 60  # serve stale data when GitHub is unavailable
+SERVER_CACHE_MAXSIZE = 1024
+# Leaderboard member stats are cached apart so large boards cannot evict other cards
+SERVER_MEMBER_CACHE_MAXSIZE = 4096
+
+# Render Cache
+# Bump when renderer output changes so cached cards are not reused
+RENDER_CACHE_VERSION = 4
+RENDER_CACHE_MAXSIZE = 256
+
+# Snapshots
+# Bump when the snapshot document layout changes incompatibly
+SNAPSHOT_SCHEMA_VERSION = 1
+
+# Rank Calibration
+# Bump when the calibration table layout changes incompatibly
+CALIBRATION_SCHEMA_VERSION = 1
+# Quantile steps per metric (0.1% resolution)
+DEFAULT_CALIBRATION_POINTS = 1000
+# Bump when the live rank sketch file layout changes incompatibly
+RANK_SKETCH_SCHEMA_VERSION = 2
+# Live rank sketch: KLL accuracy parameter (rank error around 1.7 / k)
+RANK_SKETCH_K = 200
+# Bloom filter of counted logins: users it is sized for and the false-positive rate
+# at that many users (117 KiB); the rate keeps growing past it, see /metrics
+RANK_SKETCH_EXPECTED_USERS = 100_000
+RANK_SKETCH_FALSE_POSITIVE_RATE = 0.01
+# Users the live rank sketch must hold before server mode ranks against it
+RANK_SKETCH_MIN_USERS = 100
+# New users between saves of the live rank sketch
+RANK_SKETCH_SAVE_INTERVAL = 100
+# New users between rebuilds of the view server mode ranks against (each rebuild
+# changes the stats render cache keys)
+RANK_SKETCH_VIEW_INTERVAL = 100
+
+# Leaderboard
+# Organisation members requested per GraphQL page (API maximum)
+LEADERBOARD_MEMBERS_PAGE_SIZE = 100
+# Member stats fetched in parallel
+LEADERBOARD_CONCURRENCY = 8
+# Most users a leaderboard card lists
+LEADERBOARD_MAX_LIMIT = 100
+# Most organisation members or listed users a leaderboard fetches stats for
+# (one request each on the operator's token)
+LEADERBOARD_MAX_MEMBERS = 1000
+# Leaderboard sort key -> UserStats field ("rank" sorts by rank percentile).
+# Keys match the stat keys of the stats card.
+LEADERBOARD_SORT_KEYS: dict[str, str | None] = {
+    "rank": None,
+    "stars": "totalStars",
+    "commits": "totalCommits",
+    "prs": "totalPRs",
+    "prs_merged": "mergedPRs",
+    "issues": "totalIssues",
+    "contribs": "contributedTo",
+    "reviews": "totalReviews",
+    "followers": "followers",
+    "discussions_started": "discussionsStarted",
+    "discussions_answered": "discussionsAnswered",
+}
+
+# Organisation Stats
+# Repositories listed per GraphQL page (API maximum)
+ORG_REPOS_PAGE_SIZE = 100
+# Repositories whose details are fetched in one GraphQL request
+ORG_REPO_BATCH_SIZE = 20
+# Detail requests in flight at once
+ORG_STATS_CONCURRENCY = 4
+# Format version of the per-repository cache file
+ORG_REPO_CACHE_SCHEMA_VERSION = 1
+
+# Compiled Templates
+# Skeletons cached per resolved colours and layout flags (LRU)
+TEMPLATE_CACHE_MAXSIZE = 128
+# Memoized get_card_colors results for non-default colour overrides (LRU)
+COLOR_CACHE_MAXSIZE = 512
+
 # Card Dimensions
 CARD_PADDING = 25
 DEFAULT_CARD_WIDTH = 495
@@ -39,6 +129,12 @@ LANGS_DONUT_RADIUS = 40
 LANGS_DONUT_STROKE_WIDTH = 25
 LANGS_PIE_RADIUS = 90
 
+# Contributor Card Layout
+CONTRIB_ITEM_HEIGHT = 35
+
+# Leaderboard Card Layout
+LEADERBOARD_ROW_HEIGHT = 30
+
 # Animation Settings
 ANIMATION_INITIAL_DELAY_MS = 450
 ANIMATION_STAGGER_DELAY_MS = 150
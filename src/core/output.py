@@ -0,0 +1,194 @@
+"""Output file writing: atomic replace, skipped when content is unchanged."""
+
+import hashlib
+import io
+import os
+import stat
+import tempfile
+from collections.abc import Iterable
+from typing import IO, Any
+
+_HASH_CHUNK_SIZE = 64 * 1024
+
+
+def _read_umask() -> int:
+    """Return the process umask (os.umask can only read it by replacing it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import: swapping the umask on every write races with other
+# threads creating files in the meantime.
+_UMASK = _read_umask()
+
+
+def _default_file_mode() -> int:
+    """Return the permission bits a regular open() would create a file with."""
+    return 0o666 & ~_UMASK
+
+
+def file_digest(path: str) -> str | None:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest, or None if the file cannot be read
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _write_temp(path: str, chunks: Iterable[bytes]) -> tuple[str, str, int]:
+    """
+    Write chunks to a synced temporary file next to path.
+
+    Returns:
+        Tuple of (temporary path, SHA-256 hex digest, size in bytes)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        _discard(tmp_path)
+        raise
+    return tmp_path, digest.hexdigest(), size
+
+
+def _replace(tmp_path: str, path: str) -> None:
+    """Move a temporary file over path, keeping the existing permissions."""
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = _default_file_mode()
+
+    try:
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+
+def _discard(tmp_path: str) -> None:
+    try:
+        os.unlink(tmp_path)
+    except OSError:
+        pass
+
+
+def atomic_write(path: str, content: bytes) -> None:
+    """
+    Write content to path atomically.
+
+    Data goes to a temporary file in the same directory which then replaces
+    the target with os.replace, so readers never see a truncated file even if
+    the process dies mid-write. Existing permissions are preserved.
+
+    Args:
+        path: Destination file path
+        content: Bytes to write
+    """
+    tmp_path, _, _ = _write_temp(path, [content])
+    _replace(tmp_path, path)
+
+
+def write_output(path: str, content: bytes) -> bool:
+    """
+    Write content to path unless the file already holds identical bytes.
+
+    Args:
+        path: Destination file path
+        content: Bytes to write
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        existing_size = os.stat(path).st_size
+    except OSError:
+        existing_size = None
+
+    if existing_size == len(content) and file_digest(path) == hashlib.sha256(content).hexdigest():
+        return False
+
+    atomic_write(path, content)
+    return True
+
+
+def write_output_stream(path: str, chunks: Iterable[str]) -> bool:
+    """
+    Stream text chunks to path atomically, unless the result is unchanged.
+
+    The document is never held in memory: chunks are encoded and written to a
+    temporary file as they arrive while their digest is computed. If the
+    existing file has the same digest the temporary file is dropped.
+
+    Args:
+        path: Destination file path
+        chunks: UTF-8 text chunks (e.g. from iter_contrib_card)
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    tmp_path, digest, size = _write_temp(path, (chunk.encode("utf-8") for chunk in chunks))
+
+    try:
+        existing_size = os.stat(path).st_size
+    except OSError:
+        existing_size = None
+
+    if existing_size == size and file_digest(path) == digest:
+        _discard(tmp_path)
+        return False
+
+    _replace(tmp_path, path)
+    return True
+
+
+def write_stream(chunks: Iterable[str], sink: IO[Any]) -> int:
+    """
+    Write text chunks to a file-like sink as they are produced.
+
+    Text sinks (open(..., "w"), gzip.open(..., "wt"), io.StringIO) receive
+    the chunks as-is; binary sinks (open(..., "wb"), gzip.GzipFile,
+    socket.makefile("wb")) receive them UTF-8 encoded.
+
+    Args:
+        chunks: Text chunks (e.g. from iter_stats_card)
+        sink: Writable text or binary file-like object
+
+    Returns:
+        Number of characters (text sinks) or bytes (binary sinks) written
+    """
+    written = 0
+    if isinstance(sink, io.TextIOBase):
+        for chunk in chunks:
+            sink.write(chunk)
+            written += len(chunk)
+    else:
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            sink.write(data)
+            written += len(data)
+    return written
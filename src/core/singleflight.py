@@ -0,0 +1,90 @@
+"""Request coalescing: concurrent callers with the same key share one execution."""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    """State of one in-flight execution."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight[K: Hashable, V]:
+    """
+    Coalesce concurrent calls for the same key into a single execution.
+
+    The first caller for a key (the leader) runs the function; callers arriving
+    while it is in flight block and receive the leader's result or exception.
+    Nothing is cached once the call completes.
+
+    Attributes:
+        executions: Number of times a function was actually executed
+        coalesced: Number of callers that shared another caller's execution
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, _Call] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: K, fn: Callable[[], V]) -> V:
+        """
+        Run fn for key, or wait for an identical in-flight call to finish.
+
+        Args:
+            key: Identity of the call (e.g. fetcher name plus normalized config)
+            fn: Zero-argument callable to execute
+
+        Returns:
+            Result of the (possibly shared) execution
+
+        Raises:
+            Exception: Whatever the shared execution raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+            return call.result  # type: ignore[no-any-return]
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently being executed."""
+        with self._lock:
+            return len(self._calls)
+
+    def metrics(self) -> dict[str, int]:
+        """Return execution counters as a dictionary."""
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
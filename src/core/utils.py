@@ -1,6 +1,9 @@
 """Utility functions for formatting and data manipulation."""
 
 import fnmatch
+import re
+from collections.abc import Iterable
+from functools import lru_cache
 
 from .constants import NUMBER_FORMAT_THOUSAND_DIVISOR
 
@@ -40,6 +43,67 @@ def k_formatter(num: int, precision: int | None = None) -> str:
     return f"{formatted}k"
 
 
+class RepoExclusionMatcher:
+    """
+    Repository exclusion patterns compiled for repeated matching.
+
+    Patterns follow is_repo_excluded: matching is case-insensitive, patterns
+    without a '/' match the repository name only and fnmatch wildcards are
+    supported. Literal patterns go into hash sets and all wildcard patterns
+    of a class (name-only or owner/name) are merged into one regex, so the
+    cost of a lookup barely depends on the number of patterns.
+
+    Args:
+        patterns: Exclusion patterns (e.g. "owner/repo", "awesome-*")
+    """
+
+    __slots__ = ("_full_names", "_full_regex", "_name_regex", "_names")
+
+    def __init__(self, patterns: Iterable[str]):
+        names: set[str] = set()
+        full_names: set[str] = set()
+        name_globs: list[str] = []
+        full_globs: list[str] = []
+        for pattern in patterns:
+            pattern = pattern.lower()
+            full = "/" in pattern
+            if any(char in pattern for char in "*?["):
+                (full_globs if full else name_globs).append(fnmatch.translate(pattern))
+            else:
+                (full_names if full else names).add(pattern)
+
+        self._names = frozenset(names)
+        self._full_names = frozenset(full_names)
+        self._name_regex = re.compile("|".join(name_globs)) if name_globs else None
+        self._full_regex = re.compile("|".join(full_globs)) if full_globs else None
+
+    def __bool__(self) -> bool:
+        return bool(self._names or self._full_names or self._name_regex or self._full_regex)
+
+    def matches(self, repo_name: str) -> bool:
+        """
+        Check if a repository matches any pattern.
+
+        Args:
+            repo_name: Repository name (e.g., "owner/repo" or "repo")
+
+        Returns:
+            True if the repo should be excluded
+        """
+        repo_name = repo_name.lower()
+        name_only = repo_name.rpartition("/")[2]
+        if name_only in self._names or repo_name in self._full_names:
+            return True
+        if self._name_regex is not None and self._name_regex.match(name_only):
+            return True
+        return self._full_regex is not None and self._full_regex.match(repo_name) is not None
+
+
+@lru_cache(maxsize=32)
+def _compiled_exclusions(patterns: tuple[str, ...]) -> RepoExclusionMatcher:
+    return RepoExclusionMatcher(patterns)
+
+
 def is_repo_excluded(repo_name: str, exclude_patterns: list[str]) -> bool:
     """
     Check if a repository should be excluded based on patterns.
@@ -47,6 +111,9 @@ def is_repo_excluded(repo_name: str, exclude_patterns: list[str]) -> bool:
     If the pattern does not contain a '/', it matches against the repo name only.
     Matching is case-insensitive.
 
+    Filtering many repositories against the same patterns is faster with a
+    RepoExclusionMatcher built once.
+
     Args:
         repo_name: Repository name (e.g., "owner/repo" or "repo")
         exclude_patterns: List of exclusion patterns
@@ -54,21 +121,7 @@ def is_repo_excluded(repo_name: str, exclude_patterns: list[str]) -> bool:
     Returns:
         True if the repo matches any pattern
     """
-    repo_name = repo_name.lower()
-    # Extract just the repo name part if repo_name is "owner/repo"
-    repo_name_only = repo_name.split("/")[-1] if "/" in repo_name else repo_name
-
-    for pattern in exclude_patterns:
-        pattern = pattern.lower()
-        # If pattern has no '/', match against the repo name only
-        if "/" not in pattern:
-            if fnmatch.fnmatch(repo_name_only, pattern):
-                return True
-        else:
-            # If pattern has '/', match against the full provided repo_name
-            if fnmatch.fnmatch(repo_name, pattern):
-                return True
-    return False
+    return _compiled_exclusions(tuple(exclude_patterns)).matches(repo_name)
 
 
 def clamp_value(value: float, min_val: float, max_val: float) -> float:
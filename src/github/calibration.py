@@ -0,0 +1,351 @@
+"""Empirical rank calibration built from a corpus of fetched user stats."""
+
+import hashlib
+import json
+import os
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import pairwise
+from typing import Any, Protocol
+
+from .. import __version__
+from ..core.constants import CALIBRATION_SCHEMA_VERSION, DEFAULT_CALIBRATION_POINTS
+from ..core.exceptions import ValidationError
+from ..core.output import atomic_write
+
+# Rank metric -> UserStats field. "all_commits" holds commit counts fetched
+# with include_all_commits, which follow a different distribution.
+CALIBRATION_METRICS = {
+    "commits": "totalCommits",
+    "all_commits": "totalCommits",
+    "prs": "totalPRs",
+    "issues": "totalIssues",
+    "reviews": "totalReviews",
+    "stars": "totalStars",
+    "followers": "followers",
+}
+
+# (metric, field) pairs counted for users fetched without/with include_all_commits
+METRIC_FIELDS = {
+    all_commits: [
+        (metric, stat_field)
+        for metric, stat_field in CALIBRATION_METRICS.items()
+        if metric != ("commits" if all_commits else "all_commits")
+    ]
+    for all_commits in (False, True)
+}
+
+# File extensions load_snapshot understands
+SNAPSHOT_EXTENSIONS = (".json", ".json.gz", ".msgpack")
+
+
+class RankDistribution(Protocol):
+    """
+    Population the ranker can compare a user against.
+
+    Implemented by RankCalibration (a fixed table) and the live rank sketch
+    of server mode. The fingerprint identifies the distribution's contents,
+    so render cache keys hash it instead of the whole distribution.
+    """
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of the distribution's contents."""
+        ...
+
+    def cdf(self, metric: str, value: float) -> float | None:
+        """Return the fraction of the population below value, or None."""
+        ...
+
+
+def distribution_fingerprint(users: int, tables: Mapping[str, Any]) -> str:
+    """
+    Return a content digest of a rank distribution.
+
+    Args:
+        users: Number of users in the distribution
+        tables: Metric name -> JSON-serializable values describing it
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps([users, tables], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class RankCalibration:
+    """
+    Per-metric quantiles of a user population.
+
+    For each metric, ``quantiles[metric][j]`` is the value reached by a
+    fraction ``j / points`` of the users. Metrics missing from the table
+    keep the built-in distribution when ranking.
+
+    Attributes:
+        users: Number of users the table was built from
+        quantiles: Metric name -> non-decreasing quantile values
+        created_at: ISO 8601 UTC timestamp of the calibration
+        fingerprint: Digest of users and quantiles (see RankDistribution)
+    """
+
+    users: int
+    quantiles: dict[str, tuple[int, ...]]
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat(timespec="seconds"))
+    fingerprint: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "fingerprint", distribution_fingerprint(self.users, self.quantiles)
+        )
+
+    def cdf(self, metric: str, value: float) -> float | None:
+        """
+        Return the approximate fraction of the population below a value.
+
+        Interpolates linearly between quantiles; O(log points).
+
+        Args:
+            metric: Metric name (see CALIBRATION_METRICS)
+            value: The user's value
+
+        Returns:
+            Fraction in [0, 1], or None if the table has no such metric
+        """
+        table = self.quantiles.get(metric)
+        if table is None:
+            return None
+        if value <= table[0]:
+            return 0.0
+        if value > table[-1]:
+            return 1.0
+        j = bisect_left(table, value)
+        low, high = table[j - 1], table[j]
+        return (j - 1 + (value - low) / (high - low)) / (len(table) - 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize to plain data.
+
+        Returns:
+            Calibration document including the schema version
+        """
+        return {
+            "schema": CALIBRATION_SCHEMA_VERSION,
+            "generator": f"github-stats-card {__version__}",
+            "created_at": self.created_at,
+            "users": self.users,
+            "quantiles": {metric: list(values) for metric, values in self.quantiles.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, document: Any) -> "RankCalibration":
+        """
+        Build a calibration from a decoded calibration document.
+
+        Args:
+            document: Output of to_dict, after a round trip through a file
+
+        Returns:
+            RankCalibration instance
+
+        Raises:
+            ValidationError: If the document is malformed or has an
+                unsupported schema version
+        """
+        if not isinstance(document, dict) or "schema" not in document:
+            raise ValidationError("Not a github-stats-card calibration table")
+        schema = document["schema"]
+        if schema != CALIBRATION_SCHEMA_VERSION:
+            raise ValidationError(
+                f"Unsupported calibration schema {schema!r} "
+                f"(expected {CALIBRATION_SCHEMA_VERSION})"
+            )
+
+        try:
+            quantiles = {
+                metric: tuple(int(v) for v in values)
+                for metric, values in document["quantiles"].items()
+            }
+            calibration = cls(
+                users=int(document["users"]),
+                quantiles=quantiles,
+                created_at=document["created_at"],
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValidationError(f"Malformed calibration table: {e}") from e
+
+        for metric, values in quantiles.items():
+            if metric not in CALIBRATION_METRICS:
+                raise ValidationError(f"Unknown calibration metric: {metric!r}")
+            if len(values) < 2 or any(a > b for a, b in pairwise(values)):
+                raise ValidationError(f"Calibration quantiles for {metric!r} must be sorted")
+        return calibration
+
+
+class CalibrationBuilder:
+    """
+    Accumulates value counts per metric for building a RankCalibration.
+
+    Memory grows with the number of distinct values per metric, not with
+    the number of users: integer counts repeat heavily (most users share
+    small values), so millions of rows fit in a few thousand counters.
+    """
+
+    __slots__ = ("_counts", "users")
+
+    def __init__(self) -> None:
+        self._counts: dict[str, Counter[int]] = {
+            metric: Counter() for metric in CALIBRATION_METRICS
+        }
+        self.users = 0
+
+    def add(self, stats: Mapping[str, Any], all_commits: bool = False) -> None:
+        """
+        Count one user's stats.
+
+        Args:
+            stats: UserStats record or dict with the same keys
+            all_commits: Whether the commit count is all-time
+        """
+        counts = self._counts
+        for metric, stat_field in METRIC_FIELDS[all_commits]:
+            counts[metric][stats[stat_field]] += 1
+        self.users += 1
+
+    def add_columns(self, columns: Mapping[str, Sequence[int]], all_commits: bool = False) -> None:
+        """
+        Count many users' stats given one column per UserStats field.
+
+        Much faster than add() per user: each column is counted in one pass
+        (e.g. the columns of a UserStatsStore).
+
+        Args:
+            columns: UserStats field -> values (all of equal length)
+            all_commits: Whether the commit counts are all-time
+
+        Raises:
+            ValidationError: If a column is missing or the lengths differ
+        """
+        pairs = METRIC_FIELDS[all_commits]
+        try:
+            selected = [(metric, columns[stat_field]) for metric, stat_field in pairs]
+        except KeyError as e:
+            raise ValidationError(f"Missing column: {e.args[0]}") from None
+        lengths = {len(column) for _, column in selected}
+        if len(lengths) > 1:
+            raise ValidationError("Calibration columns must all have the same length")
+
+        for metric, column in selected:
+            self._counts[metric].update(column)
+        self.users += lengths.pop()
+
+    def build(self, points: int = DEFAULT_CALIBRATION_POINTS) -> RankCalibration:
+        """
+        Compute the quantile table.
+
+        Metrics without any values (e.g. "all_commits" when no snapshot was
+        fetched with include_all_commits) are left out.
+
+        Args:
+            points: Number of quantile steps per metric
+
+        Returns:
+            RankCalibration instance
+
+        Raises:
+            ValidationError: If points is not positive or no users were added
+        """
+        if points < 1:
+            raise ValidationError("Calibration needs at least one quantile step")
+        if not self.users:
+            raise ValidationError("No user stats to calibrate from")
+
+        quantiles = {}
+        for metric, counts in self._counts.items():
+            total = counts.total()
+            if total:
+                quantiles[metric] = _quantiles(counts, total, points)
+        return RankCalibration(users=self.users, quantiles=quantiles)
+
+
+def _quantiles(counts: Counter[int], total: int, points: int) -> tuple[int, ...]:
+    """Return the values at order statistics ceil(j * total / points), j = 0..points."""
+    values = sorted(counts)
+    result = []
+    seen = 0
+    i = -1
+    for j in range(points + 1):
+        # 1-based rank of the order statistic for this step
+        target = max(1, -(-j * total // points))
+        while seen < target:
+            i += 1
+            seen += counts[values[i]]
+        result.append(values[i])
+    return tuple(result)
+
+
+def dump_calibration(calibration: RankCalibration, path: str) -> int:
+    """
+    Write a calibration table atomically as compact JSON.
+
+    Args:
+        calibration: Calibration to write
+        path: Destination file path
+
+    Returns:
+        Number of bytes written
+    """
+    content = json.dumps(calibration.to_dict(), separators=(",", ":")).encode("utf-8")
+    atomic_write(path, content)
+    return len(content)
+
+
+def load_calibration(path: str) -> RankCalibration:
+    """
+    Read a calibration table written by dump_calibration.
+
+    Args:
+        path: Calibration file path
+
+    Returns:
+        RankCalibration instance
+
+    Raises:
+        ValidationError: If the file is not a valid calibration table
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    try:
+        document = json.loads(content)
+    except ValueError as e:
+        raise ValidationError(f"Cannot decode calibration table {path}: {e}") from e
+    return RankCalibration.from_dict(document)
+
+
+def iter_snapshot_paths(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Expand files and directories into snapshot file paths.
+
+    Directories are walked recursively in sorted order and only files with a
+    snapshot extension are returned; files given directly are returned as-is.
+
+    Args:
+        paths: Files and/or directories
+
+    Yields:
+        Snapshot file paths
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(SNAPSHOT_EXTENSIONS):
+                    yield os.path.join(root, name)
@@ -8,15 +8,25 @@ from ..core.constants import API_TIMEOUT, GRAPHQL_ENDPOINT
 
 
 class GitHubClient:
-    """Helper client for GitHub API interactions."""
+    """Helper client for GitHub API interactions.
 
-    def __init__(self, token: str):
+    By default every request goes through the module-level ``requests`` helpers.
+    Long-lived processes (e.g. the HTTP server) can pass a shared
+    ``requests.Session`` so connections are pooled and reused across fetches.
+    """
+
+    def __init__(self, token: str, session: requests.Session | None = None):
         self.token = token
+        self.session = session
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
 
+    def _http(self) -> Any:
+        """Return the object used to issue HTTP requests (session or module)."""
+        return self.session if self.session is not None else requests
+
     def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
         """
         Execute a GraphQL query.
@@ -31,7 +41,7 @@ class GitHubClient:
         Raises:
             requests.exceptions.RequestException: If API request fails
         """
-        response = requests.post(
+        response = self._http().post(
             GRAPHQL_ENDPOINT,
             json={"query": query, "variables": variables or {}},
             headers=self.headers,
@@ -58,7 +68,7 @@ class GitHubClient:
         if headers:
             request_headers.update(headers)
 
-        response = requests.get(
+        response = self._http().get(
             url,
             headers=request_headers,
             timeout=API_TIMEOUT,
@@ -77,7 +87,7 @@ class GitHubClient:
             Image binary content or None if failed
         """
         try:
-            response = requests.get(
+            response = self._http().get(
                 url,
                 timeout=API_TIMEOUT,
             )
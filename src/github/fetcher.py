@@ -1,18 +1,46 @@
 """GitHub API client for fetching user statistics."""
 
 import base64
+import json
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
 import requests  # type: ignore
 from typing import TypedDict, Any
 
 from ..core.constants import API_BASE_URL
 from ..core.config import ContribFetchConfig
 from ..core.exceptions import FetchError
-from ..core.utils import is_repo_excluded
+from ..core.utils import RepoExclusionMatcher
 from .client import GitHubClient
 from .rank import calculate_repo_rank
 
 
-class ContributorRepo(TypedDict):
+class _RecordMapping(Mapping[str, Any]):
+    """
+    Read-only mapping view of a dataclass record.
+
+    Lets records be used wherever the plain dicts they replaced were:
+    ``record["field"]``, ``.get()``, ``dict(record)``, ``**record`` and
+    comparison with dicts all behave as before.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__dataclass_fields__:  # type: ignore[attr-defined]
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dataclass_fields__)  # type: ignore[attr-defined]
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)  # type: ignore[attr-defined]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ContributorRepo(_RecordMapping):
     """Contributor repository details."""
 
     name: str  # owner/repo
@@ -31,7 +59,8 @@ class ContributorStats(TypedDict):
     repos: list[ContributorRepo]
 
 
-class UserStats(TypedDict):
+@dataclass(frozen=True, slots=True, eq=False)
+class UserStats(_RecordMapping):
     """GitHub user statistics."""
 
     name: str
@@ -48,12 +77,37 @@ class UserStats(TypedDict):
     discussionsAnswered: int
 
 
+@dataclass(slots=True)
+class _RawRepo:
+    """Contribution totals for one repository while they are being collected."""
+
+    name: str
+    stars: int
+    avatar_url: str | None
+    total_repo_commits: int
+    commits: int = 0
+    prs: int = 0
+    issues: int = 0
+    reviews: int = 0
+
+
+def _more_starred_repos(repositories: dict[str, Any]) -> bool:
+    """Return True if a star-ordered repository page may be followed by starred repos."""
+    nodes = repositories["nodes"]
+    return bool(
+        repositories["pageInfo"]["hasNextPage"]
+        and nodes
+        and nodes[-1]["stargazers"]["totalCount"] > 0
+    )
+
+
 def fetch_stats(
     username: str,
     token: str,
     include_all_commits: bool = False,
     commits_year: int | None = None,
     show: list[str] | None = None,
+    client: GitHubClient | None = None,
 ) -> UserStats:
     """
     Fetch GitHub user statistics via GraphQL and REST APIs.
@@ -64,6 +118,7 @@ def fetch_stats(
         include_all_commits: If True, count all commits (uses REST API)
         commits_year: If specified, filter commits to this year
         show: Optional list of additional stats to fetch
+        client: Optional pre-configured client (e.g. sharing a connection pool)
 
     Returns:
         Dictionary with user statistics
@@ -71,7 +126,7 @@ def fetch_stats(
     Raises:
         FetchError: If API request fails
     """
-    client = GitHubClient(token)
+    client = client or GitHubClient(token)
     show = show or []
 
     # Build date range for commits_year filter
@@ -203,8 +258,9 @@ def fetch_stats(
     # Calculate total stars
     total_stars = sum(repo["stargazers"]["totalCount"] for repo in user["repositories"]["nodes"])
 
-    # Handle pagination for repositories if needed
-    has_next_page = user["repositories"]["pageInfo"]["hasNextPage"]
+    # Handle pagination for repositories if needed. Repositories come ordered by
+    # stars, so pages after one ending with an unstarred repo add nothing.
+    has_next_page = _more_starred_repos(user["repositories"])
     end_cursor = user["repositories"]["pageInfo"]["endCursor"]
 
     while has_next_page:
@@ -241,7 +297,7 @@ def fetch_stats(
                 total_stars += sum(
                     repo["stargazers"]["totalCount"] for repo in page_user["repositories"]["nodes"]
                 )
-                has_next_page = page_user["repositories"]["pageInfo"]["hasNextPage"]
+                has_next_page = _more_starred_repos(page_user["repositories"])
                 end_cursor = page_user["repositories"]["pageInfo"]["endCursor"]
             else:
                 break
@@ -306,28 +362,68 @@ def fetch_stats(
             # If discussions query fails, continue with zeros
             pass
 
-    return {
-        "name": user["name"] or user["login"],
-        "login": user["login"],
-        "totalCommits": total_commits,
-        "totalPRs": user["pullRequests"]["totalCount"],
-        "mergedPRs": user["mergedPullRequests"]["totalCount"],
-        "totalIssues": total_issues,
-        "totalStars": total_stars,
-        "contributedTo": user["repositoriesContributedTo"]["totalCount"],
-        "followers": user["followers"]["totalCount"],
-        "totalReviews": user["contributionsCollection"]["totalPullRequestReviewContributions"],
-        "discussionsStarted": discussions_started,
-        "discussionsAnswered": discussions_answered,
-    }
+    return UserStats(
+        name=user["name"] or user["login"],
+        login=user["login"],
+        totalCommits=total_commits,
+        totalPRs=user["pullRequests"]["totalCount"],
+        mergedPRs=user["mergedPullRequests"]["totalCount"],
+        totalIssues=total_issues,
+        totalStars=total_stars,
+        contributedTo=user["repositoriesContributedTo"]["totalCount"],
+        followers=user["followers"]["totalCount"],
+        totalReviews=user["contributionsCollection"]["totalPullRequestReviewContributions"],
+        discussionsStarted=discussions_started,
+        discussionsAnswered=discussions_answered,
+    )
+
+
+def _fill_repo_history(client: GitHubClient, repos: list[_RawRepo]) -> None:
+    """
+    Fetch HEAD commit counts for repositories in one aliased query.
+
+    Sets total_repo_commits on each repo that has a history. Repositories
+    that cannot be resolved keep their current value, as do all of them if
+    the request fails.
+
+    Args:
+        client: GitHub client
+        repos: Raw repo entries
+    """
+    if not repos:
+        return
+
+    fields = []
+    for i, repo in enumerate(repos):
+        owner, _, name = repo.name.partition("/")
+        fields.append(
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            '{ object(expression: "HEAD") { ... on Commit { history { totalCount } } } }'
+        )
+    query = "query repoHistory {\n  " + "\n  ".join(fields) + "\n}"
+
+    try:
+        data = client.graphql_query(query)
+    except requests.exceptions.RequestException:
+        return
 
+    # Partial results come back alongside "errors" for unresolvable repos
+    results = data.get("data") or {}
+    for i, repo in enumerate(repos):
+        obj = (results.get(f"r{i}") or {}).get("object")
+        if obj and "history" in obj:
+            repo.total_repo_commits = obj["history"]["totalCount"]
 
-def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
+
+def fetch_contributor_stats(
+    config: ContribFetchConfig, client: GitHubClient | None = None
+) -> ContributorStats:
     """
     Fetch contributor statistics (repos contributed to).
 
     Args:
         config: Fetch configuration
+        client: Optional pre-configured client (e.g. sharing a connection pool)
 
     Returns:
         Contributor statistics
@@ -335,7 +431,7 @@ def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
     Raises:
         FetchError: If API request fails
     """
-    client = GitHubClient(config.token)
+    client = client or GitHubClient(config.token)
 
     # 1. Get contribution years to iterate over
     years_query = """
@@ -364,14 +460,19 @@ def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
     # We limit to 5 years to balance performance vs accuracy
     target_years = sorted(years, reverse=True)[:5]
 
-    raw_repos_map: dict[str, dict[str, Any]] = {}
+    raw_repos_map: dict[str, _RawRepo] = {}
+    # Repos seen in commitContributionsByRepository, which carries their history
+    history_known: set[str] = set()
 
     for year in target_years:
         from_date = f"{year}-01-01T00:00:00Z"
         to_date = f"{year}-12-31T23:59:59Z"
 
         # Note: We fetch total commit count (history) only in commitContributions
-        # to avoid complexity. It serves as a proxy for repo size.
+        # to avoid complexity. It serves as a proxy for repo size. History is
+        # expensive to count and most repositories are dropped below (private,
+        # own, excluded or past the limit), so repos only seen through PRs,
+        # issues or reviews get it afterwards if they make the final list.
         col_query = """
         query userContribs($login: String!, $from: DateTime!, $to: DateTime!) {
           user(login: $login) {
@@ -410,13 +511,6 @@ def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
                   stargazers {
                     totalCount
                   }
-                  object(expression: "HEAD") {
-                    ... on Commit {
-                      history {
-                        totalCount
-                      }
-                    }
-                  }
                 }
                 contributions {
                   totalCount
@@ -433,13 +527,6 @@ def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
                   stargazers {
                     totalCount
                   }
-                  object(expression: "HEAD") {
-                    ... on Commit {
-                      history {
-                        totalCount
-                      }
-                    }
-                  }
                 }
                 contributions {
                   totalCount
@@ -456,13 +543,6 @@ def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
                   stargazers {
                     totalCount
                   }
-                  object(expression: "HEAD") {
-                    ... on Commit {
-                      history {
-                        totalCount
-                      }
-                    }
-                  }
                 }
                 contributions {
                   totalCount
@@ -516,27 +596,26 @@ def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
                         if obj and "history" in obj:
                             total_repo_commits = obj["history"]["totalCount"]
 
-                        raw_repos_map[name] = {
-                            "name": name,
-                            "stars": repo["stargazers"]["totalCount"],
-                            "avatar_url": repo["owner"]["avatarUrl"],
-                            "commits": 0,
-                            "prs": 0,
-                            "issues": 0,
-                            "reviews": 0,
-                            "total_repo_commits": total_repo_commits,
-                        }
+                        raw_repos_map[name] = _RawRepo(
+                            name=name,
+                            stars=repo["stargazers"]["totalCount"],
+                            avatar_url=repo["owner"]["avatarUrl"],
+                            total_repo_commits=total_repo_commits,
+                        )
                     else:
                         # Update total_repo_commits if we found it now but didn't have it before
                         # (e.g. first found via PRs, now via Commits)
-                        if raw_repos_map[name]["total_repo_commits"] == 0:
+                        if raw_repos_map[name].total_repo_commits == 0:
                             obj = repo.get("object")
                             if obj and "history" in obj:
-                                raw_repos_map[name]["total_repo_commits"] = obj["history"][
+                                raw_repos_map[name].total_repo_commits = obj["history"][
                                     "totalCount"
                                 ]
 
-                    raw_repos_map[name][contrib_type] += count
+                    entry = raw_repos_map[name]
+                    setattr(entry, contrib_type, getattr(entry, contrib_type) + count)
+                    if contrib_type == "commits":
+                        history_known.add(name)
 
             process_list(collection["commitContributionsByRepository"], "commits")
             process_list(collection["pullRequestContributionsByRepository"], "prs")
@@ -547,46 +626,42 @@ def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
             # Continue to next year on error
             continue
 
-    # Calculate ranks for all repositories
-    final_repos_data: list[dict[str, Any]] = []
-    for repo_data in raw_repos_map.values():
-        repo_data["rank_level"] = calculate_repo_rank(
-            repo_data["stars"], repo_data["total_repo_commits"]
-        )
-        final_repos_data.append(repo_data)
-
     # Filter excluded repos
+    excluded = RepoExclusionMatcher(config.exclude_repo)
     final_repos_data = [
-        r for r in final_repos_data if not is_repo_excluded(r["name"], config.exclude_repo)
+        r for r in raw_repos_map.values() if not (excluded and excluded.matches(r.name))
     ]
 
     # Sort by stars descending (or maybe by rank? the user said "top X ... based on score (stars amount)")
     # We'll keep sorting by stars as per original requirement, but display the rank level.
-    final_repos_data.sort(key=lambda r: r["stars"], reverse=True)
+    final_repos_data.sort(key=lambda r: r.stars, reverse=True)
 
     # Limit results
     final_repos_data = final_repos_data[: config.limit]
 
-    # Fetch avatars
+    # History for repos only seen through PRs, issues or reviews
+    _fill_repo_history(client, [r for r in final_repos_data if r.name not in history_known])
+
+    # Calculate ranks and fetch avatars
     final_repos: list[ContributorRepo] = []
     for repo in final_repos_data:
         avatar_b64 = None
-        if repo["avatar_url"]:
-            image_data = client.fetch_image(repo["avatar_url"])
+        if repo.avatar_url:
+            image_data = client.fetch_image(repo.avatar_url)
             if image_data:
                 avatar_b64 = base64.b64encode(image_data).decode("utf-8")
 
         final_repos.append(
-            {
-                "name": repo["name"],
-                "stars": repo["stars"],
-                "commits": repo["commits"],
-                "prs": repo["prs"],
-                "issues": repo["issues"],
-                "reviews": repo["reviews"],
-                "rank_level": repo["rank_level"],
-                "avatar_b64": avatar_b64,
-            }
+            ContributorRepo(
+                name=repo.name,
+                stars=repo.stars,
+                commits=repo.commits,
+                prs=repo.prs,
+                issues=repo.issues,
+                reviews=repo.reviews,
+                rank_level=calculate_repo_rank(repo.stars, repo.total_repo_commits),
+                avatar_b64=avatar_b64,
+            )
         )
 
     return {"repos": final_repos}
@@ -1,16 +1,18 @@
 """GitHub API client for fetching language statistics."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Any
 
 import requests  # type: ignore
 
 from ..core.constants import DEFAULT_LANG_COLOR
 from ..core.exceptions import LanguageFetchError
-from ..core.utils import is_repo_excluded
+from ..core.utils import RepoExclusionMatcher
 from .client import GitHubClient
 
 
-@dataclass
+@dataclass(slots=True)
 class Language:
     """Represents a programming language with its statistics."""
 
@@ -20,12 +22,89 @@ class Language:
     count: int  # number of repos using this language
 
 
+class LanguageAggregator:
+    """
+    Running per-language totals over repositories.
+
+    Repositories are folded in one at a time, so a caller streaming thousands
+    of them only keeps one Language per distinct language.
+    """
+
+    __slots__ = ("_languages",)
+
+    def __init__(self) -> None:
+        self._languages: dict[str, Language] = {}
+
+    def __len__(self) -> int:
+        return len(self._languages)
+
+    def add_repo(self, languages: Iterable[tuple[str, str | None, int]]) -> None:
+        """
+        Add one repository's languages.
+
+        Args:
+            languages: (name, color, size in bytes) of each language in the
+                repository, each language at most once
+        """
+        for name, color, size in languages:
+            language = self._languages.get(name)
+            if language is None:
+                self._languages[name] = Language(
+                    name=name, color=color or DEFAULT_LANG_COLOR, size=size, count=1
+                )
+            else:
+                language.size += size
+                language.count += 1
+
+    def result(self, size_weight: float = 1.0, count_weight: float = 0.0) -> dict[str, Language]:
+        """
+        Return the weighted totals, largest first.
+
+        Args:
+            size_weight: Weight for byte count in ranking
+            count_weight: Weight for repo count in ranking
+
+        Returns:
+            Dictionary mapping language name to a new Language object
+        """
+        weighted = [
+            Language(
+                name=lang.name,
+                color=lang.color,
+                size=int((lang.size**size_weight) * (lang.count**count_weight)),
+                count=lang.count,
+            )
+            for lang in self._languages.values()
+        ]
+        weighted.sort(key=lambda lang: lang.size, reverse=True)
+        return {lang.name: lang for lang in weighted}
+
+
+def repo_languages(repo: dict[str, Any]) -> list[tuple[str, str | None, int]]:
+    """
+    Extract (name, color, size) of each language from a GraphQL repository node.
+
+    Args:
+        repo: Repository node with a languages { edges { size node { name color } } } field
+
+    Returns:
+        Languages of the repository, in API order
+    """
+    languages = []
+    for edge in (repo.get("languages") or {}).get("edges", []):
+        node = edge.get("node", {})
+        if node.get("name"):
+            languages.append((node["name"], node.get("color"), edge.get("size", 0)))
+    return languages
+
+
 def fetch_top_languages(
     username: str,
     token: str,
     exclude_repo: list[str] | None = None,
     size_weight: float = 1.0,
     count_weight: float = 0.0,
+    client: GitHubClient | None = None,
 ) -> dict[str, Language]:
     """
     Fetch top programming languages for a GitHub user.
@@ -36,6 +115,7 @@ def fetch_top_languages(
         exclude_repo: List of repository names to exclude
         size_weight: Weight for byte count in ranking (default: 1.0)
         count_weight: Weight for repo count in ranking (default: 0.0)
+        client: Optional pre-configured client (e.g. sharing a connection pool)
 
     Returns:
         Dictionary mapping language name to Language object, sorted by size descending
@@ -43,7 +123,7 @@ def fetch_top_languages(
     Raises:
         LanguageFetchError: If API request fails or returns errors
     """
-    client = GitHubClient(token)
+    client = client or GitHubClient(token)
     exclude_repo = exclude_repo or []
 
     query = """
@@ -87,38 +167,13 @@ def fetch_top_languages(
     repos = user_data.get("repositories", {}).get("nodes", [])
 
     # Filter out excluded repositories
-    repos = [r for r in repos if not is_repo_excluded(r.get("name", ""), exclude_repo)]
+    excluded = RepoExclusionMatcher(exclude_repo)
+    if excluded:
+        repos = [r for r in repos if not excluded.matches(r.get("name", ""))]
 
     # Aggregate languages across all repositories
-    languages: dict[str, Language] = {}
-
+    languages = LanguageAggregator()
     for repo in repos:
-        lang_edges = repo.get("languages", {}).get("edges", [])
-        for edge in lang_edges:
-            node = edge.get("node", {})
-            lang_name = node.get("name")
-            if not lang_name:
-                continue
-
-            lang_color = node.get("color") or DEFAULT_LANG_COLOR
-            lang_size = edge.get("size", 0)
-
-            if lang_name in languages:
-                languages[lang_name].size += lang_size
-                languages[lang_name].count += 1
-            else:
-                languages[lang_name] = Language(
-                    name=lang_name,
-                    color=lang_color,
-                    size=lang_size,
-                    count=1,
-                )
-
-    # Apply size and count weights for ranking
-    for lang in languages.values():
-        lang.size = int((lang.size**size_weight) * (lang.count**count_weight))
-
-    # Sort by size descending
-    sorted_langs = dict(sorted(languages.items(), key=lambda x: x[1].size, reverse=True))
+        languages.add_repo(repo_languages(repo))
 
-    return sorted_langs
+    return languages.result(size_weight, count_weight)
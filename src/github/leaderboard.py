@@ -0,0 +1,337 @@
+"""Leaderboards ranking an organisation's members or a list of users."""
+
+import heapq
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypedDict
+
+import requests  # type: ignore
+
+from ..core.config import LeaderboardFetchConfig
+from ..core.constants import (
+    LEADERBOARD_MAX_LIMIT,
+    LEADERBOARD_MEMBERS_PAGE_SIZE,
+    LEADERBOARD_SORT_KEYS,
+)
+from ..core.exceptions import APIError, FetchError, ValidationError
+from .calibration import RankDistribution
+from .client import GitHubClient
+from .fetcher import UserStats, fetch_stats
+from .rank import calculate_user_rank, calculate_user_ranks
+from .stats_store import UserStatsStore
+
+# Sort keys whose counts fetch_stats only fetches when asked to show them
+_OPTIONAL_STATS = ("discussions_started", "discussions_answered")
+
+
+@dataclass(frozen=True, slots=True)
+class LeaderboardEntry:
+    """
+    One user on a leaderboard.
+
+    Attributes:
+        login: GitHub login
+        name: Display name
+        value: Value sorted by (rank percentile, or the UserStats count)
+        rank_level: Rank level (S, A+, ... C)
+        percentile: Rank percentile (0 = best, 100 = worst)
+    """
+
+    login: str
+    name: str
+    value: int | float
+    rank_level: str
+    percentile: float
+
+
+class Leaderboard(TypedDict):
+    """Leaderboard data."""
+
+    owner: str | None  # organisation login, None for a user list
+    sort_by: str
+    members: int  # users whose stats were fetched and ranked
+    failed: list[str]  # logins whose stats could not be fetched
+    entries: list[LeaderboardEntry]
+
+
+def fetch_org_members(
+    org: str,
+    token: str,
+    client: GitHubClient | None = None,
+    max_members: int | None = None,
+) -> list[str]:
+    """
+    Fetch the logins of an organisation's members.
+
+    Pages through organization.membersWithRole; only members visible to the
+    token are returned.
+
+    Args:
+        org: Organisation login
+        token: GitHub Personal Access Token
+        client: Optional pre-configured client (e.g. sharing a connection pool)
+        max_members: Reject organisations with more members, checked against
+            the member count on the first page
+
+    Returns:
+        Member logins in API order
+
+    Raises:
+        FetchError: If the organisation does not exist or a request fails
+        ValidationError: If the organisation has more than max_members members
+    """
+    client = client or GitHubClient(token)
+    query = f"""
+    query orgMembers($org: String!, $after: String) {{
+      organization(login: $org) {{
+        membersWithRole(first: {LEADERBOARD_MEMBERS_PAGE_SIZE}, after: $after) {{
+          totalCount
+          nodes {{
+            login
+          }}
+          pageInfo {{
+            hasNextPage
+            endCursor
+          }}
+        }}
+      }}
+    }}
+    """
+
+    logins: list[str] = []
+    after = None
+    while True:
+        try:
+            data = client.graphql_query(query, {"org": org, "after": after})
+        except requests.exceptions.RequestException as e:
+            raise FetchError(f"Failed to fetch members of '{org}': {e}")
+        if "errors" in data:
+            raise FetchError(f"GraphQL error: {data['errors'][0].get('message')}")
+
+        organization = (data.get("data") or {}).get("organization")
+        if not organization:
+            raise FetchError(f"Organization '{org}' not found")
+
+        members = organization["membersWithRole"]
+        logins.extend(node["login"] for node in members["nodes"])
+        total = max(members.get("totalCount", 0), len(logins))
+        if max_members is not None and total > max_members:
+            raise ValidationError(
+                f"Organization '{org}' has {total} members; "
+                f"a leaderboard ranks at most {max_members}"
+            )
+        if not members["pageInfo"]["hasNextPage"]:
+            return logins
+        after = members["pageInfo"]["endCursor"]
+
+
+def _unique_logins(logins: list[str]) -> list[str]:
+    """Drop repeated logins (case-insensitive), keeping the first spelling."""
+    seen: set[str] = set()
+    unique = []
+    for login in logins:
+        key = login.lower()
+        if login and key not in seen:
+            seen.add(key)
+            unique.append(login)
+    return unique
+
+
+def _validate(config: LeaderboardFetchConfig) -> None:
+    if bool(config.org) == bool(config.users):
+        raise ValidationError("A leaderboard needs either an organization or a list of users")
+    if config.sort_by not in LEADERBOARD_SORT_KEYS:
+        raise ValidationError(
+            f"Invalid value for 'sort_by': {config.sort_by!r} "
+            f"(expected one of {', '.join(LEADERBOARD_SORT_KEYS)})"
+        )
+    if not 1 <= config.limit <= LEADERBOARD_MAX_LIMIT:
+        raise ValidationError(f"Leaderboard limit must be between 1 and {LEADERBOARD_MAX_LIMIT}")
+    if config.concurrency < 1:
+        raise ValidationError("Leaderboard concurrency must be at least 1")
+    if config.max_members < 1:
+        raise ValidationError("Leaderboard max_members must be at least 1")
+    users = len(_unique_logins(config.users))
+    if users > config.max_members:
+        raise ValidationError(
+            f"Leaderboard lists {users} users; a leaderboard ranks at most {config.max_members}"
+        )
+
+
+def _fetch_member_stats(
+    logins: list[str], fetch_user: Callable[[str], UserStats], concurrency: int
+) -> tuple[UserStatsStore, list[str]]:
+    """
+    Fetch stats for many users with at most `concurrency` requests in flight.
+
+    Results go straight into a columnar store, so only the counts are kept.
+    Users whose fetch fails are reported rather than failing the board.
+
+    Raises:
+        FetchError: If no user could be fetched at all
+    """
+    errors: dict[str, APIError] = {}
+
+    def fetch_one(login: str) -> UserStats | None:
+        try:
+            return fetch_user(login)
+        except APIError as e:
+            errors[login] = e
+            return None
+
+    store = UserStatsStore()
+    failed = []
+    workers = max(1, min(concurrency, len(logins)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="leaderboard") as executor:
+        # map yields in input order, so ties keep the member order
+        for login, stats in zip(logins, executor.map(fetch_one, logins)):
+            if stats is None:
+                failed.append(login)
+            else:
+                store.append(stats)
+
+    if failed and not len(store):
+        raise FetchError(
+            f"Could not fetch stats for any of {len(failed)} users: {errors[failed[0]]}"
+        )
+    return store, failed
+
+
+def _top_entries(
+    store: UserStatsStore,
+    sort_by: str,
+    limit: int,
+    all_commits: bool,
+    calibration: RankDistribution | None,
+) -> list[LeaderboardEntry]:
+    """Select the best `limit` users without sorting the whole store."""
+    field = LEADERBOARD_SORT_KEYS[sort_by]
+    if field is not None:
+        entries = []
+        for stats in store.top(field, limit):
+            rank = calculate_user_rank(
+                commits=stats["totalCommits"],
+                prs=stats["totalPRs"],
+                issues=stats["totalIssues"],
+                reviews=stats["totalReviews"],
+                stars=stats["totalStars"],
+                followers=stats["followers"],
+                all_commits=all_commits,
+                calibration=calibration,
+            )
+            entries.append(
+                LeaderboardEntry(
+                    login=stats["login"],
+                    name=stats["name"],
+                    value=stats[field],
+                    rank_level=rank["level"],
+                    percentile=rank["percentile"],
+                )
+            )
+        return entries
+
+    levels, percentiles = calculate_user_ranks(
+        store.column("totalCommits"),
+        store.column("totalPRs"),
+        store.column("totalIssues"),
+        store.column("totalReviews"),
+        store.column("totalStars"),
+        store.column("followers"),
+        all_commits=all_commits,
+        calibration=calibration,
+    )
+    rows = heapq.nsmallest(limit, range(len(store)), key=percentiles.__getitem__)
+    entries = []
+    for row in rows:
+        stats = store.row(row)
+        entries.append(
+            LeaderboardEntry(
+                login=stats["login"],
+                name=stats["name"],
+                value=percentiles[row],
+                rank_level=levels[row],
+                percentile=percentiles[row],
+            )
+        )
+    return entries
+
+
+def fetch_leaderboard(
+    config: LeaderboardFetchConfig,
+    client: GitHubClient | None = None,
+    fetch_user: Callable[[str], UserStats] | None = None,
+    calibration: RankDistribution | None = None,
+) -> Leaderboard:
+    """
+    Fetch stats for an organisation's members or a list of users and rank them.
+
+    Member stats are fetched with bounded concurrency into a UserStatsStore,
+    then only the top `limit` users are selected (a heap over the columns),
+    so organisations with thousands of members never get fully sorted.
+
+    Args:
+        config: Fetch configuration
+        client: Optional pre-configured client (e.g. sharing a connection pool)
+        fetch_user: Optional function returning one user's stats, e.g. through
+            a cache of previously fetched UserStats; defaults to fetch_stats
+        calibration: Rank distribution to rank against (see calculate_user_rank)
+
+    Returns:
+        Leaderboard data
+
+    Raises:
+        ValidationError: If the configuration is invalid or the board has more
+            than config.max_members members or users
+        FetchError: If the members cannot be listed or no user can be fetched
+    """
+    _validate(config)
+    client = client or GitHubClient(config.token)
+
+    options = leaderboard_fetch_options(config)
+
+    def fetch_member(login: str) -> UserStats:
+        return fetch_stats(username=login, token=config.token, client=client, **options)
+
+    if config.users:
+        logins = _unique_logins(config.users)
+    else:
+        logins = _unique_logins(
+            fetch_org_members(config.org or "", config.token, client, config.max_members)
+        )
+
+    entries: list[LeaderboardEntry] = []
+    failed: list[str] = []
+    members = 0
+    if logins:
+        store, failed = _fetch_member_stats(logins, fetch_user or fetch_member, config.concurrency)
+        members = len(store)
+        entries = _top_entries(
+            store, config.sort_by, config.limit, config.include_all_commits, calibration
+        )
+    return Leaderboard(
+        owner=config.org or None,
+        sort_by=config.sort_by,
+        members=members,
+        failed=failed,
+        entries=entries,
+    )
+
+
+def leaderboard_fetch_options(config: LeaderboardFetchConfig) -> dict[str, Any]:
+    """
+    Return the fetch_stats options used for each member of a leaderboard.
+
+    Lets callers with a cache of fetched stats (e.g. the server) look members
+    up under the same options a stats card would use.
+
+    Args:
+        config: Fetch configuration
+
+    Returns:
+        Keyword arguments for fetch_stats besides username, token and client
+    """
+    return {
+        "include_all_commits": config.include_all_commits,
+        "show": [config.sort_by] if config.sort_by in _OPTIONAL_STATS else [],
+    }
@@ -0,0 +1,426 @@
+"""Aggregate statistics over all public repositories of an organisation."""
+
+import json
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, TypedDict
+
+import requests  # type: ignore
+
+from .. import __version__
+from ..core.config import OrgStatsFetchConfig
+from ..core.constants import (
+    ORG_REPO_BATCH_SIZE,
+    ORG_REPO_CACHE_SCHEMA_VERSION,
+    ORG_REPOS_PAGE_SIZE,
+)
+from ..core.exceptions import FetchError, ValidationError
+from ..core.output import atomic_write
+from ..core.utils import RepoExclusionMatcher
+from .client import GitHubClient
+from .fetcher import UserStats
+from .langs_fetcher import Language, LanguageAggregator, repo_languages
+
+# Counts that can change without a push come with every listing page; only
+# fields that a push changes are fetched per repository and cached.
+_LIST_QUERY = f"""
+query orgRepos($org: String!, $after: String) {{
+  organization(login: $org) {{
+    login
+    name
+    repositories(first: {ORG_REPOS_PAGE_SIZE}, after: $after, privacy: PUBLIC, isFork: false) {{
+      nodes {{
+        name
+        pushedAt
+        stargazerCount
+        issues {{
+          totalCount
+        }}
+        pullRequests {{
+          totalCount
+        }}
+        mergedPullRequests: pullRequests(states: MERGED) {{
+          totalCount
+        }}
+      }}
+      pageInfo {{
+        hasNextPage
+        endCursor
+      }}
+    }}
+  }}
+}}
+"""
+
+_DETAILS_FRAGMENT = """
+fragment details on Repository {
+  pushedAt
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        history {
+          totalCount
+        }
+      }
+    }
+  }
+  languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
+    edges {
+      size
+      node {
+        name
+        color
+      }
+    }
+  }
+}
+"""
+
+
+@lru_cache(maxsize=ORG_REPO_BATCH_SIZE)
+def _details_query(count: int) -> str:
+    """Build a query fetching the details of `count` repositories by alias."""
+    variables = "".join(f", $r{i}: String!" for i in range(count))
+    fields = "".join(
+        f"\n  r{i}: repository(owner: $org, name: $r{i}) {{\n    ...details\n  }}"
+        for i in range(count)
+    )
+    return f"query orgRepoDetails($org: String!{variables}) {{{fields}\n}}\n{_DETAILS_FRAGMENT}"
+
+
+@dataclass(frozen=True, slots=True)
+class RepoDetails:
+    """
+    Push-dependent details of one repository.
+
+    Attributes:
+        pushed_at: pushedAt of the repository when the details were fetched
+        commits: Commits on the default branch
+        languages: (name, color, size in bytes) of each language
+    """
+
+    pushed_at: str | None
+    commits: int
+    languages: tuple[tuple[str, str | None, int], ...]
+
+
+@dataclass(slots=True)
+class OrgRepoCache:
+    """
+    Repository details of one organisation from previous fetches.
+
+    Entries are reused while a repository's pushedAt is unchanged, so a
+    refresh only fetches the repositories pushed to since the last run.
+
+    Attributes:
+        org: Organisation login (case-insensitive)
+        repos: Repository name -> details
+    """
+
+    org: str
+    repos: dict[str, RepoDetails] = field(default_factory=dict)
+
+    def get(self, name: str, pushed_at: str | None) -> RepoDetails | None:
+        """
+        Return a repository's cached details if they are still current.
+
+        Args:
+            name: Repository name
+            pushed_at: Current pushedAt of the repository
+
+        Returns:
+            Cached details, or None if missing or pushed to since
+        """
+        details = self.repos.get(name)
+        if details is None or pushed_at is None or details.pushed_at != pushed_at:
+            return None
+        return details
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize to plain data.
+
+        Returns:
+            Cache document including the schema version
+        """
+        return {
+            "schema": ORG_REPO_CACHE_SCHEMA_VERSION,
+            "generator": f"github-stats-card {__version__}",
+            "org": self.org,
+            "repos": {
+                name: [details.pushed_at, details.commits, list(map(list, details.languages))]
+                for name, details in self.repos.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, document: Any) -> "OrgRepoCache":
+        """
+        Build a cache from a decoded cache document.
+
+        Args:
+            document: Output of to_dict, after a round trip through a file
+
+        Returns:
+            OrgRepoCache instance
+
+        Raises:
+            ValidationError: If the document is malformed or has an
+                unsupported schema version
+        """
+        if not isinstance(document, dict) or "schema" not in document:
+            raise ValidationError("Not a github-stats-card repository cache")
+        schema = document["schema"]
+        if schema != ORG_REPO_CACHE_SCHEMA_VERSION:
+            raise ValidationError(
+                f"Unsupported repository cache schema {schema!r} "
+                f"(expected {ORG_REPO_CACHE_SCHEMA_VERSION})"
+            )
+        try:
+            repos = {
+                str(name): RepoDetails(
+                    pushed_at=pushed_at,
+                    commits=int(commits),
+                    languages=tuple((str(n), c, int(s)) for n, c, s in languages),
+                )
+                for name, (pushed_at, commits, languages) in document["repos"].items()
+            }
+            return cls(str(document["org"]), repos)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"Malformed repository cache: {e}") from e
+
+
+def dump_org_repo_cache(cache: OrgRepoCache, path: str) -> int:
+    """
+    Write a repository cache atomically as compact JSON.
+
+    Args:
+        cache: Cache to write
+        path: Destination file path
+
+    Returns:
+        Number of bytes written
+    """
+    content = json.dumps(cache.to_dict(), separators=(",", ":")).encode("utf-8")
+    atomic_write(path, content)
+    return len(content)
+
+
+def load_org_repo_cache(path: str) -> OrgRepoCache:
+    """
+    Read a repository cache written by dump_org_repo_cache.
+
+    Args:
+        path: Cache file path
+
+    Returns:
+        OrgRepoCache instance
+
+    Raises:
+        ValidationError: If the file is not a valid repository cache
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    try:
+        document = json.loads(content)
+    except ValueError as e:
+        raise ValidationError(f"Cannot decode repository cache {path}: {e}") from e
+    return OrgRepoCache.from_dict(document)
+
+
+class OrgStats(TypedDict):
+    """Aggregate organisation statistics."""
+
+    stats: UserStats  # organisation totals, in the stats card's format
+    languages: dict[str, Language]  # sorted by weighted size, largest first
+    repos: int  # public, non-fork repositories aggregated
+    fetched: int  # repositories whose details were fetched rather than cached
+
+
+def _graphql(client: GitHubClient, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+    """Run a query, turning transport failures and errors without data into FetchError."""
+    try:
+        data = client.graphql_query(query, variables)
+    except requests.exceptions.RequestException as e:
+        raise FetchError(f"Failed to fetch data from GitHub API: {e}") from e
+    if not data.get("data"):
+        errors = data.get("errors") or [{}]
+        raise FetchError(f"GraphQL error: {errors[0].get('message', 'No data returned')}")
+    result = data["data"]
+    if not isinstance(result, dict):
+        raise FetchError("Unexpected GraphQL response: data is not an object")
+    return result
+
+
+def _fetch_details(
+    client: GitHubClient, org: str, names: list[str]
+) -> list[tuple[str, RepoDetails | None]]:
+    """Fetch the details of up to ORG_REPO_BATCH_SIZE repositories in one request."""
+    variables: dict[str, Any] = {"org": org}
+    variables.update((f"r{i}", name) for i, name in enumerate(names))
+    data = _graphql(client, _details_query(len(names)), variables)
+
+    results: list[tuple[str, RepoDetails | None]] = []
+    for i, name in enumerate(names):
+        repo = data.get(f"r{i}")
+        if repo is None:
+            # Deleted or made private since it was listed
+            results.append((name, None))
+            continue
+        target = (repo.get("defaultBranchRef") or {}).get("target") or {}
+        commits = (target.get("history") or {}).get("totalCount", 0)
+        languages = tuple(repo_languages(repo))
+        results.append((name, RepoDetails(repo.get("pushedAt"), commits, languages)))
+    return results
+
+
+@dataclass(slots=True)
+class _OrgTotals:
+    """Running totals, folded in one repository at a time."""
+
+    repos: int = 0
+    stars: int = 0
+    issues: int = 0
+    prs: int = 0
+    merged_prs: int = 0
+    commits: int = 0
+    languages: LanguageAggregator = field(default_factory=LanguageAggregator)
+
+    def add_listing(self, node: dict[str, Any]) -> None:
+        self.repos += 1
+        self.stars += node["stargazerCount"]
+        self.issues += node["issues"]["totalCount"]
+        self.prs += node["pullRequests"]["totalCount"]
+        self.merged_prs += node["mergedPullRequests"]["totalCount"]
+
+    def add_details(self, details: RepoDetails) -> None:
+        self.commits += details.commits
+        self.languages.add_repo(details.languages)
+
+
+def fetch_org_stats(
+    config: OrgStatsFetchConfig,
+    client: GitHubClient | None = None,
+    cache: OrgRepoCache | None = None,
+) -> OrgStats:
+    """
+    Aggregate stars, commits, PRs, issues and languages over an organisation.
+
+    Covers the organisation's public repositories, excluding forks (their
+    history is mostly upstream's). Repository pages are listed one after the
+    other (GraphQL cursors are sequential) with the counts that change
+    without a push; commit counts and languages are fetched for repositories
+    pushed to since the cached copy, ORG_REPO_BATCH_SIZE per request and
+    `concurrency` requests at a time, overlapping with the listing. Every
+    repository is folded into running totals as soon as it is known, so only
+    the cache and the requests in flight are held in memory.
+
+    Args:
+        config: Fetch configuration
+        client: Optional pre-configured client (e.g. sharing a connection pool)
+        cache: Optional repository cache of this organisation; it is updated
+            in place (new details added, vanished repositories dropped) and
+            can then be saved with dump_org_repo_cache
+
+    Returns:
+        Aggregate organisation statistics
+
+    Raises:
+        ValidationError: If the configuration or cache does not fit
+        FetchError: If the organisation does not exist or a request fails
+    """
+    if not config.org:
+        raise ValidationError("Missing organization")
+    if config.concurrency < 1:
+        raise ValidationError("Organization stats concurrency must be at least 1")
+    if cache is not None and cache.org.lower() != config.org.lower():
+        raise ValidationError(f"Repository cache belongs to '{cache.org}', not '{config.org}'")
+    client = client or GitHubClient(config.token)
+    excluded = RepoExclusionMatcher(config.exclude_repo)
+
+    totals = _OrgTotals()
+    current: dict[str, RepoDetails] = {}
+    pending: set[Future[list[tuple[str, RepoDetails | None]]]] = set()
+    # Listing nodes of repositories awaiting details; counted once details arrive
+    listings: dict[str, dict[str, Any]] = {}
+    batch: list[str] = []
+    fetched = 0
+
+    def collect(future: Future[list[tuple[str, RepoDetails | None]]]) -> None:
+        nonlocal fetched
+        pending.discard(future)
+        for name, details in future.result():
+            listing = listings.pop(name)
+            if details is not None:
+                fetched += 1
+                current[name] = details
+                totals.add_listing(listing)
+                totals.add_details(details)
+
+    executor = ThreadPoolExecutor(max_workers=config.concurrency, thread_name_prefix="org-stats")
+    try:
+        after = None
+        while True:
+            data = _graphql(client, _LIST_QUERY, {"org": config.org, "after": after})
+            organization = data.get("organization")
+            if not organization:
+                raise FetchError(f"Organization '{config.org}' not found")
+            repositories = organization["repositories"]
+
+            for node in repositories["nodes"]:
+                name = node["name"]
+                if excluded and excluded.matches(name):
+                    continue
+                details = cache.get(name, node["pushedAt"]) if cache is not None else None
+                if details is not None:
+                    current[name] = details
+                    totals.add_listing(node)
+                    totals.add_details(details)
+                    continue
+                listings[name] = node
+                batch.append(name)
+                if len(batch) == ORG_REPO_BATCH_SIZE:
+                    pending.add(executor.submit(_fetch_details, client, config.org, batch))
+                    batch = []
+
+            # Fold in whatever finished while this page was being fetched
+            for future in [f for f in pending if f.done()]:
+                collect(future)
+
+            if not repositories["pageInfo"]["hasNextPage"]:
+                break
+            after = repositories["pageInfo"]["endCursor"]
+
+        if batch:
+            pending.add(executor.submit(_fetch_details, client, config.org, batch))
+        for future in as_completed(list(pending)):
+            collect(future)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if cache is not None:
+        cache.org = organization["login"]
+        cache.repos = current
+
+    stats = UserStats(
+        name=organization.get("name") or organization["login"],
+        login=organization["login"],
+        totalCommits=totals.commits,
+        totalPRs=totals.prs,
+        mergedPRs=totals.merged_prs,
+        totalIssues=totals.issues,
+        totalStars=totals.stars,
+        contributedTo=0,
+        followers=0,
+        totalReviews=0,
+        discussionsStarted=0,
+        discussionsAnswered=0,
+    )
+    return OrgStats(
+        stats=stats,
+        languages=totals.languages.result(config.size_weight, config.count_weight),
+        repos=totals.repos,
+        fetched=fetched,
+    )
@@ -1,6 +1,26 @@
 """Rank calculation algorithm for GitHub stats."""
 
-from typing import TypedDict
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, TypedDict
+
+from ..core.exceptions import ValidationError
+from .calibration import RankDistribution
+
+# Median values and weights for normalization
+COMMITS_MEDIAN, ALL_COMMITS_MEDIAN, COMMITS_WEIGHT = 250, 1000, 2
+PRS_MEDIAN, PRS_WEIGHT = 50, 3
+ISSUES_MEDIAN, ISSUES_WEIGHT = 25, 1
+REVIEWS_MEDIAN, REVIEWS_WEIGHT = 2, 1
+STARS_MEDIAN, STARS_WEIGHT = 50, 4
+FOLLOWERS_MEDIAN, FOLLOWERS_WEIGHT = 10, 1
+TOTAL_WEIGHT = (
+    COMMITS_WEIGHT + PRS_WEIGHT + ISSUES_WEIGHT + REVIEWS_WEIGHT + STARS_WEIGHT + FOLLOWERS_WEIGHT
+)
+
+# Upper percentile bound of each level, best first
+RANK_THRESHOLDS = (1, 12.5, 25, 37.5, 50, 62.5, 75, 87.5, 100)
+RANK_LEVELS = ("S", "A+", "A", "A-", "B+", "B", "B-", "C+", "C")
 
 
 class RankResult(TypedDict):
@@ -44,6 +64,7 @@ def calculate_user_rank(
     stars: int,
     followers: int,
     all_commits: bool = False,
+    calibration: RankDistribution | None = None,
 ) -> RankResult:
     """
     Calculate user rank based on GitHub statistics.
@@ -59,6 +80,10 @@ def calculate_user_rank(
         stars: Total stars earned across all repositories
         followers: Total followers
         all_commits: Whether commits include all-time or just current year
+        calibration: Empirical distributions to rank against instead of the
+            built-in medians, e.g. a RankCalibration table or the live
+            RankSketch of server mode (metrics missing from it keep the
+            built-in CDF)
 
     Returns:
         Dictionary with 'level' (S, A+, A, A-, B+, B, B-, C+, C) and 'percentile'
@@ -70,30 +95,37 @@ def calculate_user_rank(
         >>> 0 <= result['percentile'] <= 100
         True
     """
-    # Median values for normalization
-    COMMITS_MEDIAN = 1000 if all_commits else 250
-    COMMITS_WEIGHT = 2
-
-    PRS_MEDIAN, PRS_WEIGHT = 50, 3
-    ISSUES_MEDIAN, ISSUES_WEIGHT = 25, 1
-    REVIEWS_MEDIAN, REVIEWS_WEIGHT = 2, 1
-    STARS_MEDIAN, STARS_WEIGHT = 50, 4
-    FOLLOWERS_MEDIAN, FOLLOWERS_WEIGHT = 10, 1
-
-    TOTAL_WEIGHT = (
-        COMMITS_WEIGHT
-        + PRS_WEIGHT
-        + ISSUES_WEIGHT
-        + REVIEWS_WEIGHT
-        + STARS_WEIGHT
-        + FOLLOWERS_WEIGHT
-    )
+    if calibration is not None:
+        percentile = _calibrated_percentile(
+            (commits, prs, issues, reviews, stars, followers), all_commits, calibration
+        )
+    else:
+        percentile = _rank_percentile(
+            commits,
+            prs,
+            issues,
+            reviews,
+            stars,
+            followers,
+            ALL_COMMITS_MEDIAN if all_commits else COMMITS_MEDIAN,
+        )
+    return {"level": _rank_level(percentile), "percentile": percentile}
 
-    # Calculate normalized rank (0 = best, 1 = worst)
+
+def _rank_percentile(
+    commits: float,
+    prs: float,
+    issues: float,
+    reviews: float,
+    stars: float,
+    followers: float,
+    commits_median: int,
+) -> float:
+    """Return the rank percentile (0 = best, 100 = worst) of one user."""
     rank = (
         1
         - (
-            COMMITS_WEIGHT * exponential_cdf(commits / COMMITS_MEDIAN)
+            COMMITS_WEIGHT * exponential_cdf(commits / commits_median)
             + PRS_WEIGHT * exponential_cdf(prs / PRS_MEDIAN)
             + ISSUES_WEIGHT * exponential_cdf(issues / ISSUES_MEDIAN)
             + REVIEWS_WEIGHT * exponential_cdf(reviews / REVIEWS_MEDIAN)
@@ -102,22 +134,130 @@ def calculate_user_rank(
         )
         / TOTAL_WEIGHT
     )
+    return rank * 100
 
-    # Define thresholds and corresponding levels
-    THRESHOLDS = [1, 12.5, 25, 37.5, 50, 62.5, 75, 87.5, 100]
-    LEVELS = ["S", "A+", "A", "A-", "B+", "B", "B-", "C+", "C"]
 
-    # Convert to percentile (0-100)
-    percentile = rank * 100
+def _calibrated_percentile(
+    values: Sequence[float], all_commits: bool, calibration: RankDistribution
+) -> float:
+    """Return the rank percentile using the calibration's CDF for each metric it has."""
+    commits_metric, commits_median = (
+        ("all_commits", ALL_COMMITS_MEDIAN) if all_commits else ("commits", COMMITS_MEDIAN)
+    )
+    metrics = (
+        (commits_metric, COMMITS_WEIGHT, commits_median, exponential_cdf),
+        ("prs", PRS_WEIGHT, PRS_MEDIAN, exponential_cdf),
+        ("issues", ISSUES_WEIGHT, ISSUES_MEDIAN, exponential_cdf),
+        ("reviews", REVIEWS_WEIGHT, REVIEWS_MEDIAN, exponential_cdf),
+        ("stars", STARS_WEIGHT, STARS_MEDIAN, log_normal_cdf),
+        ("followers", FOLLOWERS_WEIGHT, FOLLOWERS_MEDIAN, log_normal_cdf),
+    )
+    score = 0.0
+    for (metric, weight, median, default_cdf), value in zip(metrics, values):
+        fraction = calibration.cdf(metric, value)
+        if fraction is None:
+            fraction = default_cdf(value / median)
+        score += weight * fraction
+    return (1 - score / TOTAL_WEIGHT) * 100
+
+
+def _rank_level(percentile: float) -> str:
+    """Return the level of the first threshold the percentile does not exceed."""
+    i = bisect_left(RANK_THRESHOLDS, percentile)
+    return RANK_LEVELS[i] if i < len(RANK_LEVELS) else "C"
+
+
+def _load_numpy() -> Any:
+    """Import numpy on first use: it is optional and slow to import."""
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return None
+    return numpy
+
+
+def calculate_user_ranks(
+    commits: Sequence[int],
+    prs: Sequence[int],
+    issues: Sequence[int],
+    reviews: Sequence[int],
+    stars: Sequence[int],
+    followers: Sequence[int],
+    all_commits: bool = False,
+    use_numpy: bool | None = None,
+    calibration: RankDistribution | None = None,
+) -> tuple[list[str], list[float]]:
+    """
+    Calculate the ranks of many users at once.
+
+    Gives exactly the results of calculate_user_rank for each position, in
+    one vectorised pass with numpy or a tight loop without it. Inputs can be
+    lists, arrays (e.g. UserStatsStore columns) or numpy arrays.
+
+    Args:
+        commits: Commit contributions per user
+        prs: Pull requests per user
+        issues: Issues per user
+        reviews: Pull request reviews per user
+        stars: Stars earned per user
+        followers: Followers per user
+        all_commits: Whether commits include all-time or just current year
+        use_numpy: Force (True) or avoid (False) numpy; by default it is used
+            when installed
+        calibration: Empirical distributions to rank against (see
+            calculate_user_rank); ranks are then computed without numpy
+
+    Returns:
+        Tuple of (levels, percentiles), one entry per user
+
+    Raises:
+        ValidationError: If the inputs differ in length, or numpy is
+            requested but not installed
+    """
+    columns = (commits, prs, issues, reviews, stars, followers)
+    if len({len(column) for column in columns}) > 1:
+        raise ValidationError("Rank inputs must all have the same length")
+    commits_median = ALL_COMMITS_MEDIAN if all_commits else COMMITS_MEDIAN
 
-    # Find the appropriate level
-    level = "C"  # Default to lowest
-    for i, threshold in enumerate(THRESHOLDS):
-        if percentile <= threshold:
-            level = LEVELS[i]
-            break
+    if calibration is not None:
+        percentiles = [
+            _calibrated_percentile(values, all_commits, calibration) for values in zip(*columns)
+        ]
+        return [_rank_level(p) for p in percentiles], percentiles
 
-    return {"level": level, "percentile": percentile}
+    np = _load_numpy() if use_numpy is not False else None
+    if use_numpy and np is None:
+        raise ValidationError(
+            "Vectorised ranks require the optional 'numpy' package "
+            "(pip install 'github-stats-card[numpy]')"
+        )
+    if np is None:
+        percentiles = [
+            _rank_percentile(c, p, i, r, s, f, commits_median)
+            for c, p, i, r, s, f in zip(*columns, strict=True)
+        ]
+        return [_rank_level(p) for p in percentiles], percentiles
+
+    c, p, i, r, s, f = (np.asarray(column, dtype=np.float64) for column in columns)
+    # Same operations in the same order as _rank_percentile, element-wise.
+    # float_power goes through the C library pow() like Python's **; the SIMD
+    # kernels behind np.power and np.exp2 can differ in the last bit.
+    rank = (
+        1
+        - (
+            COMMITS_WEIGHT * (1 - np.float_power(2.0, -(c / commits_median)))
+            + PRS_WEIGHT * (1 - np.float_power(2.0, -(p / PRS_MEDIAN)))
+            + ISSUES_WEIGHT * (1 - np.float_power(2.0, -(i / ISSUES_MEDIAN)))
+            + REVIEWS_WEIGHT * (1 - np.float_power(2.0, -(r / REVIEWS_MEDIAN)))
+            + STARS_WEIGHT * ((s / STARS_MEDIAN) / (1 + s / STARS_MEDIAN))
+            + FOLLOWERS_WEIGHT * ((f / FOLLOWERS_MEDIAN) / (1 + f / FOLLOWERS_MEDIAN))
+        )
+        / TOTAL_WEIGHT
+    )
+    percentile = rank * 100
+    level_index = np.searchsorted(np.asarray(RANK_THRESHOLDS, dtype=np.float64), percentile)
+    levels = np.asarray(RANK_LEVELS + ("C",))[np.minimum(level_index, len(RANK_LEVELS))]
+    return levels.tolist(), percentile.tolist()
 
 
 def calculate_repo_rank(stars: int, total_repo_commits: int) -> str:
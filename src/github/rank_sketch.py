@@ -0,0 +1,535 @@
+"""Streaming quantile sketches of the users a long-lived server has fetched."""
+
+import base64
+import hashlib
+import json
+import math
+import random
+import threading
+import zlib
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any
+
+from .. import __version__
+from ..core.constants import (
+    RANK_SKETCH_EXPECTED_USERS,
+    RANK_SKETCH_FALSE_POSITIVE_RATE,
+    RANK_SKETCH_K,
+    RANK_SKETCH_SCHEMA_VERSION,
+)
+from ..core.exceptions import ValidationError
+from ..core.output import atomic_write
+from .calibration import CALIBRATION_METRICS, METRIC_FIELDS, distribution_fingerprint
+
+# Capacity ratio between a KLL compactor and the one above it
+_CAPACITY_RATIO = 2 / 3
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch of a stream of integers.
+
+    Items are kept in a stack of compactors; an item at level h stands for
+    2**h stream items. When the sketch is full, a level is sorted and every
+    other item (from a random offset) is promoted to the next level. The
+    sketch keeps O(k) items however long the stream, and the rank of any
+    value is off by about 1.7 / k of the stream length at most with high
+    probability. Streams shorter than about 3 * k are kept exactly.
+
+    Args:
+        k: Accuracy parameter (capacity of the top compactor)
+        rng: Random source for compaction offsets (seeded by default, so
+            sketches are reproducible)
+    """
+
+    __slots__ = ("_capacity", "_levels", "_rng", "_size", "k", "n")
+
+    def __init__(self, k: int = RANK_SKETCH_K, rng: random.Random | None = None):
+        if k < 2:
+            raise ValidationError("KLL sketch accuracy k must be at least 2")
+        self.k = k
+        self.n = 0
+        self._levels: list[list[int]] = [[]]
+        self._size = 0
+        self._capacity = 0
+        self._rng = rng or random.Random(0)
+        self._update_capacity()
+
+    def __len__(self) -> int:
+        """Number of retained items (not the stream length, see n)."""
+        return self._size
+
+    def update(self, value: int) -> None:
+        """
+        Add one value to the stream.
+
+        Args:
+            value: Stream item
+        """
+        self._levels[0].append(value)
+        self.n += 1
+        self._size += 1
+        if self._size >= self._capacity:
+            self._compress()
+
+    def weighted_values(self) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """
+        Return the distinct retained values and their cumulative weights.
+
+        Returns:
+            Tuple of (sorted values, number of stream items estimated to be
+            at most each value)
+        """
+        weights: Counter[int] = Counter()
+        for height, level in enumerate(self._levels):
+            weight = 1 << height
+            for value in level:
+                weights[value] += weight
+        values = sorted(weights)
+        return tuple(values), tuple(accumulate(weights[value] for value in values))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the stream length and compactor levels."""
+        return {"n": self.n, "levels": [list(level) for level in self._levels]}
+
+    @classmethod
+    def from_dict(
+        cls, document: Any, k: int = RANK_SKETCH_K, rng: random.Random | None = None
+    ) -> "KLLSketch":
+        """
+        Rebuild a sketch from to_dict output.
+
+        Args:
+            document: Output of to_dict
+            k: Accuracy parameter the sketch was built with
+            rng: Random source for later compactions
+
+        Returns:
+            KLLSketch instance
+
+        Raises:
+            ValidationError: If the levels do not add up to the stream length
+        """
+        sketch = cls(k, rng)
+        try:
+            levels = [[int(value) for value in level] for level in document["levels"]]
+            n = int(document["n"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"Malformed rank sketch: {e}") from e
+        if not levels or sum(len(level) << h for h, level in enumerate(levels)) != n:
+            raise ValidationError("Rank sketch levels do not match its item count")
+        sketch._levels = levels
+        sketch.n = n
+        sketch._size = sum(map(len, levels))
+        sketch._update_capacity()
+        return sketch
+
+    def _level_capacity(self, height: int) -> int:
+        depth = len(self._levels) - height - 1
+        return math.ceil(self.k * _CAPACITY_RATIO**depth) + 1
+
+    def _update_capacity(self) -> None:
+        self._capacity = sum(self._level_capacity(h) for h in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        levels = self._levels
+        height = 0
+        while height < len(levels):
+            if len(levels[height]) >= self._level_capacity(height):
+                if height + 1 == len(levels):
+                    levels.append([])
+                    self._update_capacity()
+                level = sorted(levels[height])
+                # An odd item out stays behind with its current weight
+                levels[height] = [level.pop()] if len(level) % 2 else []
+                levels[height + 1].extend(level[self._rng.getrandbits(1) :: 2])
+                self._size = sum(map(len, levels))
+                if self._size < self._capacity:
+                    break
+            height += 1
+
+
+class BloomFilter:
+    """
+    Fixed-size set membership filter for strings.
+
+    Each item sets ``hashes`` bits derived from a BLAKE2 digest (stable
+    across processes, unlike hash()). Memory and serialized size depend only
+    on ``bits``; the price is a small chance that an item never added is
+    reported as present, which grows with the number of items. Use
+    for_capacity to size a filter, and false_positive_rate to watch it fill.
+
+    Args:
+        bits: Filter size in bits (a multiple of 8)
+        hashes: Bits set per item
+    """
+
+    __slots__ = ("_array", "_set_bits", "bits", "hashes")
+
+    def __init__(self, bits: int, hashes: int):
+        if bits <= 0 or bits % 8 or hashes < 1:
+            raise ValidationError("Bloom filter needs a positive multiple of 8 bits and a hash")
+        self.bits = bits
+        self.hashes = hashes
+        self._array = bytearray(bits // 8)
+        self._set_bits = 0
+
+    @classmethod
+    def for_capacity(
+        cls,
+        capacity: int = RANK_SKETCH_EXPECTED_USERS,
+        false_positive_rate: float = RANK_SKETCH_FALSE_POSITIVE_RATE,
+    ) -> "BloomFilter":
+        """
+        Create the smallest filter meeting a false-positive rate at a capacity.
+
+        Uses the optimal size m = -n ln p / (ln 2)^2 bits and k = (m / n) ln 2
+        hashes for n items and rate p.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            false_positive_rate: Target false-positive rate at capacity
+
+        Returns:
+            BloomFilter instance
+
+        Raises:
+            ValidationError: If capacity is not positive or the rate is not in (0, 1)
+        """
+        if capacity < 1 or not 0 < false_positive_rate < 1:
+            raise ValidationError(
+                "Bloom filter needs a positive capacity and a false-positive rate in (0, 1)"
+            )
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        bits = max(8, -(-bits // 8) * 8)
+        return cls(bits, max(1, round(bits / capacity * math.log(2))))
+
+    @property
+    def fill_ratio(self) -> float:
+        """Fraction of the bits that are set."""
+        return self._set_bits / self.bits
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Estimated chance that an item never added is reported as present."""
+        return self.fill_ratio**self.hashes
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        return all(self._array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+
+        Args:
+            item: Item to add
+
+        Returns:
+            True if the item was not (probably) present before
+        """
+        added = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not self._array[pos >> 3] & mask:
+                self._array[pos >> 3] |= mask
+                self._set_bits += 1
+                added = True
+        return added
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the parameters and the zlib-compressed, base64-encoded bits."""
+        data = base64.b64encode(zlib.compress(bytes(self._array))).decode("ascii")
+        return {"bits": self.bits, "hashes": self.hashes, "data": data}
+
+    @classmethod
+    def from_dict(cls, document: Any) -> "BloomFilter":
+        """
+        Rebuild a filter from to_dict output.
+
+        Args:
+            document: Output of to_dict
+
+        Returns:
+            BloomFilter instance
+
+        Raises:
+            ValidationError: If the document is malformed
+        """
+        try:
+            bloom = cls(int(document["bits"]), int(document["hashes"]))
+            array = zlib.decompress(base64.b64decode(document["data"], validate=True))
+        except (KeyError, TypeError, ValueError, zlib.error) as e:
+            raise ValidationError(f"Malformed rank sketch login filter: {e}") from e
+        if len(array) != len(bloom._array):
+            raise ValidationError("Rank sketch login filter does not match its size")
+        bloom._array[:] = array
+        bloom._set_bits = int.from_bytes(array, "little").bit_count()
+        return bloom
+
+
+@dataclass(frozen=True, slots=True)
+class SketchView:
+    """
+    Immutable snapshot of a RankSketch, for ranking and cache keys.
+
+    Attributes:
+        users: Number of distinct users in the sketch
+        values: Metric name -> sorted distinct retained values
+        cumulative: Metric name -> estimated users at or below each value
+        fingerprint: Digest of the view (see RankDistribution)
+    """
+
+    users: int
+    values: dict[str, tuple[int, ...]]
+    cumulative: dict[str, tuple[int, ...]]
+    fingerprint: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        tables = {metric: [self.values[metric], self.cumulative[metric]] for metric in self.values}
+        object.__setattr__(self, "fingerprint", distribution_fingerprint(self.users, tables))
+
+    def cdf(self, metric: str, value: float) -> float | None:
+        """
+        Return the estimated fraction of users with a smaller value.
+
+        One binary search over the retained values: O(log k).
+
+        Args:
+            metric: Metric name (see CALIBRATION_METRICS)
+            value: The user's value
+
+        Returns:
+            Fraction in [0, 1], or None if no user has been seen for the metric
+        """
+        values = self.values.get(metric)
+        if values is None:
+            return None
+        cumulative = self.cumulative[metric]
+        j = bisect_left(values, value)
+        return (cumulative[j - 1] if j else 0) / cumulative[-1]
+
+
+class RankSketch:
+    """
+    Live distribution of rank metrics over the users fetched so far.
+
+    Keeps one KLLSketch per metric plus a BloomFilter of the logins seen, so
+    memory and file size stay bounded by the accuracy parameter and filter
+    size rather than the population. Each user is counted once, with their
+    stats from the first fetch, however often they are refreshed; a Bloom
+    false positive skips a new user instead (false_positive_rate of new users
+    once expected_users are counted, more as the filter keeps filling). Safe
+    to share between server threads.
+
+    Pass the sketch (or a view of it) as the calibration of
+    calculate_user_rank to rank against the served population.
+
+    Args:
+        k: KLL accuracy parameter
+        expected_users: Users the login filter is sized for
+        false_positive_rate: Login filter false-positive rate at expected_users
+    """
+
+    __slots__ = ("_lock", "_logins", "_rng", "_sketches", "_users", "_view", "k")
+
+    def __init__(
+        self,
+        k: int = RANK_SKETCH_K,
+        expected_users: int = RANK_SKETCH_EXPECTED_USERS,
+        false_positive_rate: float = RANK_SKETCH_FALSE_POSITIVE_RATE,
+    ):
+        self.k = k
+        self._rng = random.Random(0)
+        self._sketches = {metric: KLLSketch(k, self._rng) for metric in CALIBRATION_METRICS}
+        self._logins = BloomFilter.for_capacity(expected_users, false_positive_rate)
+        self._users = 0
+        self._lock = threading.Lock()
+        self._view: SketchView | None = None
+
+    @property
+    def users(self) -> int:
+        """Number of distinct users counted."""
+        return self._users
+
+    @property
+    def filter_fill(self) -> float:
+        """Fraction of the login filter's bits that are set."""
+        return self._logins.fill_ratio
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Estimated chance that a new user is mistaken for a counted one."""
+        return self._logins.false_positive_rate
+
+    def __contains__(self, login: object) -> bool:
+        return isinstance(login, str) and login.lower() in self._logins
+
+    def add(self, stats: Mapping[str, Any], all_commits: bool = False) -> bool:
+        """
+        Count a user's stats unless the user was already counted.
+
+        Args:
+            stats: UserStats record or dict with the same keys
+            all_commits: Whether the commit count is all-time
+
+        Returns:
+            True if the user was new
+
+        Raises:
+            ValidationError: If a rank metric is missing from stats
+        """
+        try:
+            login = stats["login"].lower()
+            values = [(metric, stats[name]) for metric, name in METRIC_FIELDS[all_commits]]
+        except KeyError as e:
+            raise ValidationError(f"UserStats field missing: {e.args[0]}") from e
+
+        with self._lock:
+            if not self._logins.add(login):
+                return False
+            self._users += 1
+            for metric, value in values:
+                self._sketches[metric].update(value)
+            self._view = None
+        return True
+
+    def view(self) -> SketchView:
+        """
+        Return the current distribution; rebuilt only after new users.
+
+        Returns:
+            SketchView instance
+        """
+        with self._lock:
+            if self._view is None:
+                values: dict[str, tuple[int, ...]] = {}
+                cumulative: dict[str, tuple[int, ...]] = {}
+                for metric, sketch in self._sketches.items():
+                    if sketch.n:
+                        values[metric], cumulative[metric] = sketch.weighted_values()
+                self._view = SketchView(self._users, values, cumulative)
+            return self._view
+
+    def cdf(self, metric: str, value: float) -> float | None:
+        """
+        Return the estimated fraction of users with a smaller value.
+
+        Args:
+            metric: Metric name (see CALIBRATION_METRICS)
+            value: The user's value
+
+        Returns:
+            Fraction in [0, 1], or None if no user has been seen for the metric
+        """
+        return self.view().cdf(metric, value)
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of the current distribution (see RankDistribution)."""
+        return self.view().fingerprint
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize to plain data.
+
+        Returns:
+            Rank sketch document including the schema version
+        """
+        with self._lock:
+            return {
+                "schema": RANK_SKETCH_SCHEMA_VERSION,
+                "generator": f"github-stats-card {__version__}",
+                "k": self.k,
+                "users": self._users,
+                "logins": self._logins.to_dict(),
+                "metrics": {metric: sketch.to_dict() for metric, sketch in self._sketches.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, document: Any) -> "RankSketch":
+        """
+        Build a sketch from a decoded rank sketch document.
+
+        Args:
+            document: Output of to_dict, after a round trip through a file
+
+        Returns:
+            RankSketch instance
+
+        Raises:
+            ValidationError: If the document is malformed or has an
+                unsupported schema version
+        """
+        if not isinstance(document, dict) or "schema" not in document:
+            raise ValidationError("Not a github-stats-card rank sketch")
+        schema = document["schema"]
+        if schema != RANK_SKETCH_SCHEMA_VERSION:
+            raise ValidationError(
+                f"Unsupported rank sketch schema {schema!r} (expected {RANK_SKETCH_SCHEMA_VERSION})"
+            )
+
+        try:
+            sketch = cls(int(document["k"]))
+            metrics = document["metrics"]
+            sketch._users = int(document["users"])
+            sketch._logins = BloomFilter.from_dict(document["logins"])
+            unknown = set(metrics) - set(CALIBRATION_METRICS)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"Malformed rank sketch: {e}") from e
+        if unknown:
+            raise ValidationError(f"Unknown rank sketch metric: {min(unknown)!r}")
+
+        for metric, state in metrics.items():
+            sketch._sketches[metric] = KLLSketch.from_dict(state, sketch.k, sketch._rng)
+        return sketch
+
+
+def dump_rank_sketch(sketch: RankSketch, path: str) -> int:
+    """
+    Write a rank sketch atomically as compact JSON.
+
+    Args:
+        sketch: Sketch to write
+        path: Destination file path
+
+    Returns:
+        Number of bytes written
+    """
+    content = json.dumps(sketch.to_dict(), separators=(",", ":")).encode("utf-8")
+    atomic_write(path, content)
+    return len(content)
+
+
+def load_rank_sketch(path: str) -> RankSketch:
+    """
+    Read a rank sketch written by dump_rank_sketch.
+
+    Args:
+        path: Rank sketch file path
+
+    Returns:
+        RankSketch instance
+
+    Raises:
+        ValidationError: If the file is not a valid rank sketch
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    try:
+        document = json.loads(content)
+    except ValueError as e:
+        raise ValidationError(f"Cannot decode rank sketch {path}: {e}") from e
+    return RankSketch.from_dict(document)
@@ -0,0 +1,218 @@
+"""Versioned snapshots of fetched card data, for rendering without GitHub access."""
+
+import gzip
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from .. import __version__
+from ..core.constants import SNAPSHOT_SCHEMA_VERSION
+from ..core.exceptions import ValidationError
+from ..core.output import atomic_write
+from .fetcher import ContributorRepo, ContributorStats, UserStats
+from .langs_fetcher import Language
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+# Card types a snapshot can hold data for
+SNAPSHOT_CARD_TYPES = ("stats", "top-langs", "contrib")
+
+
+def msgpack_available() -> bool:
+    """Return True if the optional msgpack module is installed."""
+    return msgpack is not None
+
+
+@dataclass
+class Snapshot:
+    """
+    Fetched data for one user, independent of how it will be rendered.
+
+    Attributes:
+        username: GitHub username the data was fetched for
+        created_at: ISO 8601 UTC timestamp of the fetch
+        stats: Result of fetch_stats, if fetched
+        top_langs: Result of fetch_top_languages (ordered by size), if fetched
+        contrib: Result of fetch_contributor_stats, if fetched
+        fetch_options: Token-free fetch options per card type, for reference
+    """
+
+    username: str
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat(timespec="seconds"))
+    stats: UserStats | None = None
+    top_langs: dict[str, Language] | None = None
+    contrib: ContributorStats | None = None
+    fetch_options: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def card_types(self) -> list[str]:
+        """Return the card types this snapshot holds data for."""
+        return [card_type for card_type in SNAPSHOT_CARD_TYPES if self._data(card_type) is not None]
+
+    def card_data(self, card_type: str) -> Any:
+        """
+        Return the fetched data a card renderer expects.
+
+        Args:
+            card_type: Card identifier ("stats", "top-langs" or "contrib")
+
+        Returns:
+            UserStats, language mapping or ContributorStats
+
+        Raises:
+            ValidationError: If the card type is unknown or was not fetched
+        """
+        if card_type not in SNAPSHOT_CARD_TYPES:
+            raise ValidationError(f"Unknown card type: {card_type!r}")
+        data = self._data(card_type)
+        if data is None:
+            available = ", ".join(self.card_types()) or "none"
+            raise ValidationError(f"Snapshot has no {card_type} data (available: {available})")
+        return data
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize to plain data (lists, dicts and scalars only).
+
+        Returns:
+            Snapshot document including the schema version
+        """
+        cards: dict[str, Any] = {}
+        if self.stats is not None:
+            cards["stats"] = dict(self.stats)
+        if self.top_langs is not None:
+            cards["top-langs"] = [asdict(lang) for lang in self.top_langs.values()]
+        if self.contrib is not None:
+            cards["contrib"] = {"repos": [dict(repo) for repo in self.contrib["repos"]]}
+        return {
+            "schema": SNAPSHOT_SCHEMA_VERSION,
+            "generator": f"github-stats-card {__version__}",
+            "username": self.username,
+            "created_at": self.created_at,
+            "fetch_options": self.fetch_options,
+            "cards": cards,
+        }
+
+    @classmethod
+    def from_dict(cls, document: Any) -> "Snapshot":
+        """
+        Build a snapshot from a decoded snapshot document.
+
+        Args:
+            document: Output of to_dict, after a round trip through a file
+
+        Returns:
+            Snapshot instance
+
+        Raises:
+            ValidationError: If the document is malformed or has an
+                unsupported schema version
+        """
+        if not isinstance(document, dict) or "schema" not in document:
+            raise ValidationError("Not a github-stats-card snapshot")
+        schema = document["schema"]
+        if schema != SNAPSHOT_SCHEMA_VERSION:
+            raise ValidationError(
+                f"Unsupported snapshot schema {schema!r} (expected {SNAPSHOT_SCHEMA_VERSION})"
+            )
+
+        try:
+            cards = document["cards"]
+            stats = cards.get("stats")
+            langs = cards.get("top-langs")
+            contrib = cards.get("contrib")
+            return cls(
+                username=document["username"],
+                created_at=document["created_at"],
+                stats=UserStats(**stats) if stats is not None else None,
+                top_langs=(
+                    {lang["name"]: Language(**lang) for lang in langs}
+                    if langs is not None
+                    else None
+                ),
+                contrib=(
+                    {"repos": [ContributorRepo(**repo) for repo in contrib["repos"]]}
+                    if contrib is not None
+                    else None
+                ),
+                fetch_options=document.get("fetch_options", {}),
+            )
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValidationError(f"Malformed snapshot: {e}") from e
+
+    def _data(self, card_type: str) -> Any:
+        return {"stats": self.stats, "top-langs": self.top_langs, "contrib": self.contrib}.get(
+            card_type
+        )
+
+
+def _format(path: str) -> str:
+    if path.endswith(".msgpack"):
+        if msgpack is None:
+            raise ValidationError(
+                "msgpack snapshots require the optional 'msgpack' package "
+                "(pip install 'github-stats-card[msgpack]')"
+            )
+        return "msgpack"
+    return "json.gz" if path.endswith(".gz") else "json"
+
+
+def dump_snapshot(snapshot: Snapshot, path: str) -> int:
+    """
+    Write a snapshot file atomically.
+
+    The format follows the extension: ``.msgpack`` (requires msgpack),
+    ``.json.gz`` (gzip-compressed JSON) or compact JSON otherwise.
+
+    Args:
+        snapshot: Snapshot to write
+        path: Destination file path
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        ValidationError: If msgpack output is requested but not installed
+    """
+    fmt = _format(path)
+    document = snapshot.to_dict()
+    if fmt == "msgpack":
+        content = bytes(msgpack.packb(document, use_bin_type=True))
+    else:
+        content = json.dumps(document, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        if fmt == "json.gz":
+            content = gzip.compress(content, mtime=0)
+    atomic_write(path, content)
+    return len(content)
+
+
+def load_snapshot(path: str) -> Snapshot:
+    """
+    Read a snapshot file written by dump_snapshot.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        Snapshot instance
+
+    Raises:
+        ValidationError: If the file cannot be decoded or is not a supported snapshot
+        OSError: If the file cannot be read
+    """
+    fmt = _format(path)
+    with open(path, "rb") as f:
+        content = f.read()
+    try:
+        if fmt == "msgpack":
+            document = msgpack.unpackb(content, raw=False)
+        else:
+            if fmt == "json.gz":
+                content = gzip.decompress(content)
+            document = json.loads(content)
+    except (ValueError, OSError, EOFError) as e:
+        raise ValidationError(f"Cannot decode snapshot {path}: {e}") from e
+    return Snapshot.from_dict(document)
@@ -0,0 +1,272 @@
+"""Columnar in-memory store of UserStats for batch and organisation-wide runs."""
+
+import heapq
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import fields
+from typing import Any
+
+from ..core.exceptions import ValidationError
+from .fetcher import UserStats
+from .snapshot import Snapshot
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+# UserStats fields kept as Python strings; all others are integer columns
+TEXT_FIELDS = ("name", "login")
+INT_FIELDS = tuple(f.name for f in fields(UserStats) if f.name not in TEXT_FIELDS)
+
+# array typecode of the integer columns (signed 64-bit)
+_INT_TYPECODE = "q"
+
+
+def numpy_available() -> bool:
+    """Return True if the optional numpy module is installed."""
+    return numpy is not None
+
+
+class UserStatsStore:
+    """
+    UserStats for many users, stored one column per field.
+
+    Integer fields live in typed arrays (8 bytes per value) instead of one
+    dict or record per user, so tens of thousands of users fit in a few
+    megabytes and aggregates run over contiguous buffers. Appending a login
+    that is already stored replaces its row; logins are matched
+    case-insensitively, as on GitHub.
+
+    Args:
+        records: Initial UserStats records (or dicts with the same keys)
+    """
+
+    __slots__ = ("_columns", "_index", "_logins", "_names")
+
+    def __init__(self, records: Iterable[Mapping[str, Any]] = ()):
+        self._names: list[str] = []
+        self._logins: list[str] = []
+        self._columns = {name: array(_INT_TYPECODE) for name in INT_FIELDS}
+        self._index: dict[str, int] = {}
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return len(self._logins)
+
+    def __contains__(self, login: object) -> bool:
+        return isinstance(login, str) and login.lower() in self._index
+
+    def __iter__(self) -> Iterator[UserStats]:
+        for row in range(len(self)):
+            yield self.row(row)
+
+    def append(self, stats: Mapping[str, Any]) -> int:
+        """
+        Add or replace one user's stats.
+
+        Args:
+            stats: UserStats record or dict with the same keys
+
+        Returns:
+            Row number of the user
+
+        Raises:
+            ValidationError: If a field is missing or a count is not an integer
+        """
+        try:
+            login = stats["login"]
+            name = stats["name"]
+            # Converted up front so a bad value cannot leave columns uneven
+            values = array(_INT_TYPECODE, [stats[field] for field in INT_FIELDS])
+        except KeyError as e:
+            raise ValidationError(f"UserStats field missing: {e.args[0]}") from e
+        except (TypeError, OverflowError) as e:
+            raise ValidationError(f"UserStats counts must be 64-bit integers: {e}") from e
+
+        key = login.lower()
+        if key == login:
+            # Share the string instead of keeping an equal copy in the index
+            key = login
+
+        row = self._index.get(key)
+        if row is None:
+            row = len(self._logins)
+            self._index[key] = row
+            self._logins.append(login)
+            self._names.append(name)
+            for field, value in zip(INT_FIELDS, values):
+                self._columns[field].append(value)
+        else:
+            self._logins[row] = login
+            self._names[row] = name
+            for field, value in zip(INT_FIELDS, values):
+                self._columns[field][row] = value
+        return row
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Add or replace several users' stats.
+
+        Args:
+            records: UserStats records or dicts with the same keys
+        """
+        for stats in records:
+            self.append(stats)
+
+    def row(self, row: int) -> UserStats:
+        """
+        Rebuild the record stored at a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            UserStats record
+        """
+        columns = self._columns
+        return UserStats(
+            name=self._names[row],
+            login=self._logins[row],
+            **{field: columns[field][row] for field in INT_FIELDS},
+        )
+
+    def get(self, login: str) -> UserStats | None:
+        """
+        Look up a user's stats by login (case-insensitive).
+
+        Args:
+            login: GitHub login
+
+        Returns:
+            UserStats record, or None if the user is not stored
+        """
+        row = self._index.get(login.lower())
+        return None if row is None else self.row(row)
+
+    @property
+    def logins(self) -> list[str]:
+        """Logins in row order."""
+        return list(self._logins)
+
+    def column(self, field: str) -> array:
+        """
+        Return the values of an integer field for all users, in row order.
+
+        The array is the store's own buffer: treat it as read-only.
+
+        Args:
+            field: UserStats integer field (e.g. "totalStars")
+
+        Returns:
+            Array of signed 64-bit integers
+
+        Raises:
+            ValidationError: If the field is unknown or not an integer field
+        """
+        try:
+            return self._columns[field]
+        except KeyError:
+            raise ValidationError(
+                f"Unknown numeric UserStats field: {field!r} (expected one of "
+                f"{', '.join(INT_FIELDS)})"
+            ) from None
+
+    def as_numpy(self, field: str) -> Any:
+        """
+        Return an integer field as a numpy array.
+
+        The values are copied: a view exporting the column buffer would make
+        later appends fail.
+
+        Args:
+            field: UserStats integer field
+
+        Returns:
+            numpy int64 array
+
+        Raises:
+            ValidationError: If numpy is not installed or the field is unknown
+        """
+        if numpy is None:
+            raise ValidationError(
+                "numpy views require the optional 'numpy' package "
+                "(pip install 'github-stats-card[numpy]')"
+            )
+        return numpy.frombuffer(self.column(field), dtype=numpy.int64).copy()
+
+    def total(self, field: str) -> int:
+        """
+        Sum an integer field over all users.
+
+        Args:
+            field: UserStats integer field
+
+        Returns:
+            Sum of the column
+        """
+        return sum(self.column(field))
+
+    def top(self, field: str, n: int) -> list[UserStats]:
+        """
+        Return the users with the largest values of a field.
+
+        Ties keep row order.
+
+        Args:
+            field: UserStats integer field
+            n: Number of users
+
+        Returns:
+            Up to n UserStats records, largest first
+        """
+        column = self.column(field)
+        if n <= 0 or not column:
+            return []
+        # Find the n-th largest value on the plain column (fast on ints), then
+        # rank only the rows reaching it
+        threshold = heapq.nlargest(n, column)[-1]
+        candidates = [row for row, value in enumerate(column) if value >= threshold]
+        rows = heapq.nlargest(n, candidates, key=column.__getitem__)
+        return [self.row(row) for row in rows]
+
+    def nbytes(self) -> int:
+        """Return the size of the integer column buffers in bytes."""
+        return sum(column.itemsize * len(column) for column in self._columns.values())
+
+    def to_snapshots(
+        self, created_at: str | None = None, fetch_options: dict[str, Any] | None = None
+    ) -> Iterator[Snapshot]:
+        """
+        Export every user as a stats snapshot.
+
+        Args:
+            created_at: Timestamp to record (defaults to now)
+            fetch_options: Token-free fetch options to record in each snapshot
+
+        Yields:
+            One Snapshot per user, in row order
+        """
+        extra: dict[str, Any] = {"created_at": created_at} if created_at else {}
+        for stats in self:
+            yield Snapshot(
+                username=stats.login,
+                stats=stats,
+                fetch_options={"stats": dict(fetch_options)} if fetch_options else {},
+                **extra,
+            )
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Iterable[Snapshot]) -> "UserStatsStore":
+        """
+        Build a store from the stats of several snapshots.
+
+        Snapshots without stats data are skipped.
+
+        Args:
+            snapshots: Snapshots (e.g. from load_snapshot)
+
+        Returns:
+            UserStatsStore instance
+        """
+        return cls(snapshot.stats for snapshot in snapshots if snapshot.stats is not None)
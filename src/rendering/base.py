@@ -1,6 +1,12 @@
 """Base SVG card renderer with common styling and structure."""
 
-from .colors import format_gradient
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .colors import CardColor, CardColors, format_gradient, get_card_colors
+from .minify import minify_svg
+from .templates import CompiledTemplate, compile_template, slot
 from ..core.constants import (
     ANIMATION_FADE_DURATION_MS,
     ANIMATION_SCALE_DURATION_MS,
@@ -13,43 +19,47 @@ from ..core.constants import (
     FONT_WEIGHT_RANK,
     FONT_WEIGHT_STAT,
     FONT_WEIGHT_STAT_BOLD,
+    TEMPLATE_CACHE_MAXSIZE,
 )
 from ..core.utils import encode_html
 
+ColorsKey = tuple[tuple[str, CardColor], ...]
 
-def render_card(
-    title: str,
-    body: str,
-    width: int = 450,
-    height: int = 200,
-    colors: dict[str, str | list[str]] | None = None,
-    hide_title: bool = False,
-    hide_border: bool = False,
-    border_radius: float = 4.5,
-    disable_animations: bool = False,
-    a11y_title: str = "",
-    a11y_desc: str = "",
-) -> str:
+XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
+
+
+def svg_use(element_id: str, attributes: str = "") -> str:
     """
-    Render base SVG card with title and body content.
+    Build a <use> element referencing another element of the card.
+
+    The reference is given both as href and as xlink:href, which SVG 1.1
+    renderers require; the xlink namespace is declared on the element so
+    the card's root <svg> stays unchanged.
 
     Args:
-        title: Card title text
-        body: SVG content for the card body
-        width: Card width in pixels
-        height: Card height in pixels
-        colors: Color dictionary (titleColor, textColor, bgColor, borderColor, iconColor)
-        hide_title: Whether to hide the title
-        hide_border: Whether to hide the border
-        border_radius: Border radius in pixels
-        disable_animations: Whether to disable CSS animations
-        a11y_title: Accessibility title
-        a11y_desc: Accessibility description
+        element_id: id of the referenced element
+        attributes: Extra attribute markup placed before the reference
 
     Returns:
-        Complete SVG markup as string
+        SVG <use> element
     """
-    colors = colors or {}
+    prefix = f"{attributes} " if attributes else ""
+    return (
+        f'<use {prefix}href="#{element_id}" '
+        f'xmlns:xlink="{XLINK_NAMESPACE}" xlink:href="#{element_id}" />'
+    )
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_MAXSIZE)
+def _compile_card_template(
+    colors_key: ColorsKey,
+    hide_title: bool,
+    hide_border: bool,
+    disable_animations: bool,
+) -> CompiledTemplate:
+    """Build the card skeleton for one colour/flag combination."""
+    # Gradients are formatted as lists, as they were before colours were frozen
+    colors = {k: list(v) if isinstance(v, tuple) else v for k, v in colors_key}
 
     title_color = colors.get("titleColor", "#2f80ed")
     text_color = colors.get("textColor", "#434d58")
@@ -159,17 +169,12 @@ def render_card(
     </style>
     """
 
-    # Encode title for safe XML embedding
-    safe_title = encode_html(title)
-    safe_a11y_title = encode_html(a11y_title or title)
-    safe_a11y_desc = encode_html(a11y_desc or f"{title} statistics")
-
     # Title section
     title_section = ""
     if not hide_title:
         title_section = f"""
     <g transform="translate(25, 35)">
-      <text class="header">{safe_title}</text>
+      <text class="header">{slot("title")}</text>
     </g>
     """
 
@@ -178,11 +183,11 @@ def render_card(
 
     border_opacity = 0 if hide_border else 1
 
-    svg = f"""<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}"
+    svg = f"""<svg width="{slot("width")}" height="{slot("height")}" viewBox="0 0 {slot("width")} {slot("height")}"
      fill="none" xmlns="http://www.w3.org/2000/svg"
      role="img" aria-labelledby="titleId descId">
-  <title id="titleId">{safe_a11y_title}</title>
-  <desc id="descId">{safe_a11y_desc}</desc>
+  <title id="titleId">{slot("a11y_title")}</title>
+  <desc id="descId">{slot("a11y_desc")}</desc>
   {css}
   
   <defs>
@@ -192,10 +197,10 @@ def render_card(
   <rect
     x="0.5"
     y="0.5"
-    rx="{border_radius}"
-    height="{height - 1}"
+    rx="{slot("border_radius")}"
+    height="{slot("rect_height")}"
     stroke="{border_color}"
-    width="{width - 1}"
+    width="{slot("rect_width")}"
     fill="{fill_color}"
     stroke-opacity="{border_opacity}"
   />
@@ -203,8 +208,207 @@ def render_card(
   {title_section}
   
   <g transform="translate(0, {body_y_offset})">
-    {body}
+    {slot("body")}
   </g>
 </svg>"""
 
-    return svg
+    return compile_template(svg)
+
+
+def _get_skeleton(
+    colors: Mapping[str, str | Sequence[str]] | None,
+    hide_title: bool,
+    hide_border: bool,
+    disable_animations: bool,
+) -> CompiledTemplate:
+    """Return the cached skeleton for already-resolved colours."""
+    colors_key = tuple(colors.items()) if colors else ()
+    try:
+        return _compile_card_template(colors_key, hide_title, hide_border, disable_animations)
+    except TypeError:
+        # Colours not from get_card_colors may hold gradients as lists
+        colors_key = tuple(
+            (name, value if isinstance(value, str) else tuple(value)) for name, value in colors_key
+        )
+        return _compile_card_template(colors_key, hide_title, hide_border, disable_animations)
+
+
+@dataclass(frozen=True)
+class CardTemplate:
+    """
+    Theme-resolved colours and compiled skeleton shared by identically styled cards.
+
+    Attributes:
+        colors: Resolved colours (read-only, shared between cards)
+        skeleton: Compiled card markup with slots width, height, rect_width,
+            rect_height, border_radius, title, a11y_title, a11y_desc and body
+    """
+
+    colors: CardColors
+    skeleton: CompiledTemplate
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_MAXSIZE)
+def get_card_template(
+    theme: str = "default",
+    title_color: str | None = None,
+    text_color: str | None = None,
+    icon_color: str | None = None,
+    bg_color: str | None = None,
+    border_color: str | None = None,
+    ring_color: str | None = None,
+    hide_title: bool = False,
+    hide_border: bool = False,
+    disable_animations: bool = False,
+) -> CardTemplate:
+    """
+    Get the compiled card template for a theme, colour overrides and flags.
+
+    Colour resolution, the <style> block, gradient defs and border attributes
+    depend only on these arguments, so in batch runs they are computed once per
+    combination (bounded LRU of TEMPLATE_CACHE_MAXSIZE entries) and only the
+    per-card values are filled in.
+
+    Args:
+        theme: Theme name
+        title_color: Custom title color (hex without #)
+        text_color: Custom text color
+        icon_color: Custom icon color
+        bg_color: Custom background color (or gradient)
+        border_color: Custom border color
+        ring_color: Custom rank ring color
+        hide_title: Whether to hide the title
+        hide_border: Whether to hide the border
+        disable_animations: Whether to disable CSS animations
+
+    Returns:
+        Resolved colours and compiled skeleton
+    """
+    colors = get_card_colors(
+        theme=theme,
+        title_color=title_color,
+        text_color=text_color,
+        icon_color=icon_color,
+        bg_color=bg_color,
+        border_color=border_color,
+        ring_color=ring_color,
+    )
+    skeleton = _get_skeleton(colors, hide_title, hide_border, disable_animations)
+    return CardTemplate(colors=colors, skeleton=skeleton)
+
+
+def template_cache_info() -> dict[str, int]:
+    """Return hit/miss counters of the card template cache."""
+    info = get_card_template.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+def _card_slots(
+    title: str,
+    body: str | Iterable[str],
+    width: int,
+    height: int,
+    border_radius: float,
+    a11y_title: str,
+    a11y_desc: str,
+) -> dict[str, object]:
+    """Build the per-card slot values of the card skeleton."""
+    return {
+        "width": width,
+        "height": height,
+        "rect_width": width - 1,
+        "rect_height": height - 1,
+        "border_radius": border_radius,
+        "title": encode_html(title),
+        "a11y_title": encode_html(a11y_title or title),
+        "a11y_desc": encode_html(a11y_desc or f"{title} statistics"),
+        "body": body,
+    }
+
+
+def render_card(
+    title: str,
+    body: str | Iterable[str],
+    width: int = 450,
+    height: int = 200,
+    colors: Mapping[str, str | Sequence[str]] | None = None,
+    hide_title: bool = False,
+    hide_border: bool = False,
+    border_radius: float = 4.5,
+    disable_animations: bool = False,
+    a11y_title: str = "",
+    a11y_desc: str = "",
+    minify: bool = False,
+    template: CardTemplate | None = None,
+) -> str:
+    """
+    Render base SVG card with title and body content.
+
+    Args:
+        title: Card title text
+        body: SVG content for the card body (string or iterable of chunks)
+        width: Card width in pixels
+        height: Card height in pixels
+        colors: Color dictionary (titleColor, textColor, bgColor, borderColor, iconColor)
+        hide_title: Whether to hide the title
+        hide_border: Whether to hide the border
+        border_radius: Border radius in pixels
+        disable_animations: Whether to disable CSS animations
+        a11y_title: Accessibility title
+        a11y_desc: Accessibility description
+        minify: Whether to emit minified markup
+        template: Template from get_card_template; when given, its colours and
+            skeleton are used instead of colors and the hide/animation flags
+
+    Returns:
+        Complete SVG markup as string
+    """
+    if template is not None:
+        skeleton = template.skeleton
+    else:
+        skeleton = _get_skeleton(colors, hide_title, hide_border, disable_animations)
+    if not isinstance(body, str):
+        body = "".join(body)
+    svg = skeleton.render(
+        **_card_slots(title, body, width, height, border_radius, a11y_title, a11y_desc)
+    )
+
+    return minify_svg(svg) if minify else svg
+
+
+def iter_card(
+    title: str,
+    body: str | Iterable[str],
+    width: int = 450,
+    height: int = 200,
+    colors: Mapping[str, str | Sequence[str]] | None = None,
+    hide_title: bool = False,
+    hide_border: bool = False,
+    border_radius: float = 4.5,
+    disable_animations: bool = False,
+    a11y_title: str = "",
+    a11y_desc: str = "",
+    minify: bool = False,
+    template: CardTemplate | None = None,
+) -> Iterator[str]:
+    """
+    Stream a card as SVG chunks; same arguments and output as render_card.
+
+    Body chunks are passed through as they are produced, so the full document
+    is never held in memory. Minification needs the whole document, so with
+    minify=True the card is yielded as a single chunk.
+
+    Yields:
+        SVG markup chunks in document order
+    """
+    if template is not None:
+        skeleton = template.skeleton
+    else:
+        skeleton = _get_skeleton(colors, hide_title, hide_border, disable_animations)
+    chunks = skeleton.iter_render(
+        **_card_slots(title, body, width, height, border_radius, a11y_title, a11y_desc)
+    )
+    if minify:
+        yield minify_svg("".join(chunks))
+    else:
+        yield from chunks
@@ -0,0 +1,214 @@
+"""Render cache keyed by a stable hash of the card data and its configuration."""
+
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from .. import __version__
+from ..core.compression import brotli_compress, gzip_compress
+from ..core.constants import RENDER_CACHE_MAXSIZE, RENDER_CACHE_VERSION
+from ..core.output import atomic_write
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize dataclasses (e.g. Language) and rank distributions for hashing."""
+    # Rank distributions hold thousands of values: hash their digest instead
+    fingerprint = getattr(obj, "fingerprint", None)
+    if isinstance(fingerprint, str):
+        return fingerprint
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not hashable for caching")
+
+
+def stable_hash(obj: Any) -> str:
+    """
+    Compute a stable SHA-256 hex digest of JSON-serializable data.
+
+    Dictionary keys are sorted, so the digest does not depend on insertion
+    order. Dataclasses are hashed by their fields, objects with a
+    ``fingerprint`` string (rank distributions) by that fingerprint.
+
+    Args:
+        obj: Data to hash (dicts, lists, scalars, dataclasses)
+
+    Returns:
+        Hex digest string
+    """
+    payload = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class RenderedCard:
+    """
+    Final card output.
+
+    The compressed copies are built the first time they are read, so
+    callers that only write the SVG (CLI, worker) never pay for them.
+    """
+
+    key: str
+    svg: bytes
+
+    @cached_property
+    def gzip(self) -> bytes:
+        """Gzip-compressed SVG."""
+        return gzip_compress(self.svg)
+
+    @cached_property
+    def brotli(self) -> bytes | None:
+        """Brotli-compressed SVG, or None if brotli is unavailable."""
+        return brotli_compress(self.svg)
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag derived from the cache key."""
+        return f'"{self.key[:32]}"'
+
+
+class RenderCache:
+    """
+    LRU cache of rendered cards, optionally persisted to a directory.
+
+    Keys combine the card type, a hash of the input data and a hash of the
+    config dataclass, so a card is only re-rendered when either changes. With
+    a cache directory, entries survive across CLI runs.
+
+    Args:
+        maxsize: Maximum number of cards kept in memory
+        cache_dir: Optional directory for persistent entries
+    """
+
+    def __init__(self, maxsize: int = RENDER_CACHE_MAXSIZE, cache_dir: str | None = None):
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self._data: OrderedDict[str, RenderedCard] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(card_type: str, data: Any, config: Any) -> str:
+        """
+        Build the cache key for a card.
+
+        Args:
+            card_type: Card identifier (e.g. "stats")
+            data: Fetched data passed to the renderer
+            config: Render configuration dataclass
+
+        Returns:
+            Hex digest identifying the rendered output
+        """
+        return stable_hash(
+            [
+                card_type,
+                RENDER_CACHE_VERSION,
+                __version__,
+                stable_hash(data),
+                # Field by field rather than asdict, which would deep-copy
+                # nested rank distributions only to hash them
+                stable_hash({f.name: getattr(config, f.name) for f in dataclasses.fields(config)}),
+            ]
+        )
+
+    def get(self, key: str) -> RenderedCard | None:
+        """
+        Look up a rendered card in memory, then on disk.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached card or None
+        """
+        with self._lock:
+            card = self._data.get(key)
+            if card is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return card
+
+        card = self._load(key)
+        with self._lock:
+            if card is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(card)
+        return card
+
+    def put(self, key: str, svg: str) -> RenderedCard:
+        """
+        Store rendered SVG text under key.
+
+        Args:
+            key: Key from make_key
+            svg: Rendered SVG markup
+
+        Returns:
+            Stored card
+        """
+        card = RenderedCard(key=key, svg=svg.encode("utf-8"))
+        self._remember(card)
+        self._store(card)
+        return card
+
+    def render(
+        self, card_type: str, data: Any, config: Any, render: Callable[[], str]
+    ) -> tuple[RenderedCard, bool]:
+        """
+        Return the cached card for (data, config), rendering it on a miss.
+
+        Args:
+            card_type: Card identifier (e.g. "stats")
+            data: Fetched data passed to the renderer
+            config: Render configuration dataclass
+            render: Zero-argument callable producing the SVG string
+
+        Returns:
+            Tuple of (card, True if served from cache)
+        """
+        # Hash before rendering: some renderers normalize config in place
+        key = self.make_key(card_type, data, config)
+        card = self.get(key)
+        if card is not None:
+            return card, True
+        return self.put(key, render()), False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _remember(self, card: RenderedCard) -> None:
+        with self._lock:
+            self._data[card.key] = card
+            self._data.move_to_end(card.key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(str(self.cache_dir), f"{key}{suffix}")
+
+    def _load(self, key: str) -> RenderedCard | None:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key, ".svg"), "rb") as f:
+                svg = f.read()
+        except OSError:
+            return None
+        return RenderedCard(key=key, svg=svg)
+
+    def _store(self, card: RenderedCard) -> None:
+        if not self.cache_dir:
+            return
+        atomic_write(self._path(card.key, ".svg"), card.svg)
@@ -1,9 +1,17 @@
 """Color parsing and validation utilities."""
 
 import re
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
 
+from ..core.constants import COLOR_CACHE_MAXSIZE
 from .themes import THEMES
 
+# Resolved color: "#rrggbb" or a gradient (angle, color1, color2, ...)
+CardColor = str | tuple[str, ...]
+CardColors = Mapping[str, CardColor]
+
 
 def is_valid_hex_color(color: str) -> bool:
     """
@@ -64,34 +72,25 @@ def parse_color(color: str | None, fallback: str) -> str | list[str]:
     return fallback
 
 
-def get_card_colors(
-    theme: str = "default",
-    title_color: str | None = None,
-    text_color: str | None = None,
-    icon_color: str | None = None,
-    bg_color: str | None = None,
-    border_color: str | None = None,
-    ring_color: str | None = None,
-) -> dict[str, str | list[str]]:
-    """
-    Get resolved colors with theme defaults and custom overrides.
+def _freeze(color: str | list[str]) -> CardColor:
+    """Convert a parsed color to its immutable form (gradients become tuples)."""
+    return color if isinstance(color, str) else tuple(color)
 
-    Args:
-        theme: Theme name
-        title_color: Custom title color (hex without #)
-        text_color: Custom text color
-        icon_color: Custom icon color
-        bg_color: Custom background color (or gradient)
-        border_color: Custom border color
-        ring_color: Custom rank ring color
 
-    Returns:
-        Dictionary with resolved colors
-    """
+def _resolve_card_colors(
+    theme: str,
+    title_color: str | None,
+    text_color: str | None,
+    icon_color: str | None,
+    bg_color: str | None,
+    border_color: str | None,
+    ring_color: str | None,
+) -> CardColors:
+    """Resolve colors from scratch (uncached)."""
     selected_theme = THEMES.get(theme, THEMES["default"])
     default_theme = THEMES["default"]
 
-    return {
+    resolved = {
         "titleColor": parse_color(
             title_color or selected_theme.get("title_color"),
             f"#{default_theme['title_color']}",
@@ -117,9 +116,57 @@ def get_card_colors(
             f"#{default_theme['title_color']}",
         ),
     }
+    return MappingProxyType({name: _freeze(color) for name, color in resolved.items()})
+
+
+@lru_cache(maxsize=1)
+def _get_theme_table() -> dict[str, CardColors]:
+    """Resolve every built-in theme without overrides (built on first use)."""
+    return {name: _resolve_card_colors(name, None, None, None, None, None, None) for name in THEMES}
+
+
+_resolve_card_colors_cached = lru_cache(maxsize=COLOR_CACHE_MAXSIZE)(_resolve_card_colors)
+
+
+def get_card_colors(
+    theme: str = "default",
+    title_color: str | None = None,
+    text_color: str | None = None,
+    icon_color: str | None = None,
+    bg_color: str | None = None,
+    border_color: str | None = None,
+    ring_color: str | None = None,
+) -> CardColors:
+    """
+    Get resolved colors with theme defaults and custom overrides.
+
+    Built-in themes without overrides are served from a table resolved once on
+    first use; other combinations are memoized (LRU keyed on all arguments).
+    The result is shared between callers and therefore read-only: a mapping
+    proxy whose gradient values are tuples.
+
+    Args:
+        theme: Theme name
+        title_color: Custom title color (hex without #)
+        text_color: Custom text color
+        icon_color: Custom icon color
+        bg_color: Custom background color (or gradient)
+        border_color: Custom border color
+        ring_color: Custom rank ring color
+
+    Returns:
+        Read-only mapping with resolved colors
+    """
+    if not (title_color or text_color or icon_color or bg_color or border_color or ring_color):
+        table = _get_theme_table()
+        return table.get(theme) or table["default"]
+
+    return _resolve_card_colors_cached(
+        theme, title_color, text_color, icon_color, bg_color, border_color, ring_color
+    )
 
 
-def format_gradient(colors: list[str]) -> tuple[str, str]:
+def format_gradient(colors: Sequence[str]) -> tuple[str, str]:
     """
     Format gradient colors for SVG.
 
@@ -1,116 +1,183 @@
 """Contributor card renderer."""
 
+import hashlib
+from collections.abc import Iterator
+from typing import Any
+
 from ..core.config import ContribCardConfig
+from ..core.constants import CONTRIB_ITEM_HEIGHT
 from ..core.utils import encode_html
 from ..github.fetcher import ContributorStats
-from .base import render_card
-from .colors import get_card_colors
+from .base import get_card_template, iter_card, render_card, svg_use
+from .colors import CardColors
 
 
-def render_contrib_card(stats: ContributorStats, config: ContribCardConfig) -> str:
+def _avatar_ids(stats: ContributorStats) -> dict[str, str]:
     """
-    Render contributor statistics card.
+    Assign an element id to each distinct embedded avatar.
+
+    Ids are derived from a hash of the image data, so repositories from the
+    same owner share one definition and ids are stable across renders.
 
     Args:
         stats: Contributor statistics
-        config: Card configuration
 
     Returns:
-        SVG string
+        Mapping of base64 avatar data to element id, in first-use order
     """
-    colors = get_card_colors(
-        theme=config.theme,
-        title_color=config.title_color,
-        text_color=config.text_color,
-        bg_color=config.bg_color,
-        border_color=config.border_color,
-    )
-
-    # Calculate height based on number of repos
-    # body_y_offset + items * 35 + padding (15)
-    body_y_offset = 25 if config.hide_title else 55
-    item_height = 35
-    num_items = len(stats["repos"])
-    if num_items == 0:
-        height = body_y_offset + 45
-    else:
-        height = body_y_offset + (num_items * item_height) + 15
-
-    # Generate body content
-    body = []
+    ids: dict[str, str] = {}
+    for repo in stats["repos"]:
+        avatar = repo["avatar_b64"]
+        if avatar and avatar not in ids:
+            digest = hashlib.sha256(avatar.encode("ascii")).hexdigest()
+            ids[avatar] = f"avatar-{digest[:12]}"
+    return ids
+
+
+def _iter_contrib_body(
+    stats: ContributorStats, config: ContribCardConfig, colors: CardColors
+) -> Iterator[str]:
+    """
+    Yield the card body in chunks.
 
-    if num_items == 0:
+    Each distinct avatar is embedded once in <defs> and referenced from its
+    rows with <use>. Base64 data is yielded as separate chunks rather than
+    formatted into strings, so it is never copied.
+    """
+    if not stats["repos"]:
         text_color = colors["textColor"]
-        body.append(
-            f'<text x="25" y="15" class="stat bold" fill="{text_color}">No contributions found</text>'
-        )
-    else:
-        # Avatar clip path definition (reused)
-        # Using objectBoundingBox ensures the circle is always centered on the element
-        body.append("""
+        yield f'<text x="25" y="15" class="stat bold" fill="{text_color}">No contributions found</text>'
+        return
+
+    # Avatar clip path definition (reused)
+    # Using objectBoundingBox ensures the circle is always centered on the element
+    yield """
         <defs>
             <clipPath id="avatar-clip" clipPathUnits="objectBoundingBox">
                 <circle cx="0.5" cy="0.5" r="0.5" />
-            </clipPath>
+            </clipPath>"""
+
+    avatar_ids = _avatar_ids(stats)
+    for avatar, avatar_id in avatar_ids.items():
+        yield f"""
+            <image id="{avatar_id}" width="20" height="20" clip-path="url(#avatar-clip)" 
+                   href="data:image/png;base64,"""
+        yield avatar
+        yield """" />"""
+
+    yield """
         </defs>
-        """)
-
-        for i, repo in enumerate(stats["repos"]):
-            y_pos = i * item_height
-
-            # Row group
-            body.append(f'<g transform="translate(25, {y_pos})">')
-
-            # 1. Avatar (centered vertically: (35-20)/2 = 7.5)
-            if repo["avatar_b64"]:
-                # Use embedded base64 image
-                body.append(f"""
-                <image x="0" y="7.5" width="20" height="20" clip-path="url(#avatar-clip)" 
-                       href="data:image/png;base64,{repo['avatar_b64']}" />
-                """)
-            else:
-                # Fallback circle
-                body.append(f"""
+        """
+
+    # Use ring color from theme or fallback to title color
+    ring_color = colors.get("ringColor", colors["titleColor"])
+    right_edge = config.card_width - 75
+
+    for i, repo in enumerate(stats["repos"]):
+        y_pos = i * CONTRIB_ITEM_HEIGHT
+
+        # Row group
+        yield f'\n<g transform="translate(25, {y_pos})">\n'
+
+        # 1. Avatar (centered vertically: (35-20)/2 = 7.5)
+        if repo["avatar_b64"]:
+            # Reference the shared image definition
+            yield f"""
+                {svg_use(avatar_ids[repo["avatar_b64"]], 'x="0" y="7.5"')}
+                """
+        else:
+            # Fallback circle
+            yield f"""
                 <circle cx="10" cy="17.5" r="10" fill="{colors['iconColor']}" opacity="0.5" />
-                """)
+                """
 
-            # 2. Repo Name (centered vertically: baseline at ~22)
-            full_name = repo["name"]
-            display_name = full_name.split("/")[-1] if "/" in full_name else full_name
-            name = encode_html(display_name)
-            body.append(f"""
-            <text x="30" y="22" class="stat bold">{name}</text>
-            """)
+        # 2. Repo Name (centered vertically: baseline at ~22)
+        full_name = repo["name"]
+        display_name = full_name.split("/")[-1] if "/" in full_name else full_name
+        name = encode_html(display_name)
+        yield f"""
 
-            # 3. Rank Level (right aligned in a circle)
-            right_edge = config.card_width - 75
-            rank = repo["rank_level"]
+            <text x="30" y="22" class="stat bold">{name}</text>
+            """
 
-            # Use ring color from theme or fallback to title color
-            ring_color = colors.get("ringColor", colors["titleColor"])
+        # 3. Rank Level (right aligned in a circle)
+        rank = repo["rank_level"]
+        rank_size = 8 if len(rank) > 1 else 10
 
-            rank_size = 8 if len(rank) > 1 else 10
+        yield f"""
 
-            body.append(f"""
             <g transform="translate({right_edge}, 7.5)">
                 <circle cx="10" cy="10" r="12" stroke="{ring_color}" stroke-width="2" fill="none" opacity="0.2" />
                 <text x="10" y="10" alignment-baseline="central" dominant-baseline="central" 
                       text-anchor="middle" class="stat bold" style="font-size: {rank_size}px;">{rank}</text>
             </g>
-            """)
+            """
 
-            body.append("</g>")
+        yield "\n</g>"
 
-    return render_card(
-        title=config.custom_title or "Top Contributions",
-        body="\n".join(body),
-        width=config.card_width,
-        height=height,
-        colors=colors,
+
+def _contrib_card_args(stats: ContributorStats, config: ContribCardConfig) -> dict[str, Any]:
+    """Build render_card/iter_card arguments with a lazily generated body."""
+    template = get_card_template(
+        theme=config.theme,
+        title_color=config.title_color,
+        text_color=config.text_color,
+        bg_color=config.bg_color,
+        border_color=config.border_color,
         hide_title=config.hide_title,
         hide_border=config.hide_border,
-        border_radius=config.border_radius,
         disable_animations=config.disable_animations,
-        a11y_title="Top Contributions Card",
-        a11y_desc=f"List of top {num_items} repositories contributed to, sorted by stars.",
     )
+
+    # Calculate height based on number of repos
+    # body_y_offset + items * 35 + padding (15)
+    body_y_offset = 25 if config.hide_title else 55
+    num_items = len(stats["repos"])
+    if num_items == 0:
+        height = body_y_offset + 45
+    else:
+        height = body_y_offset + (num_items * CONTRIB_ITEM_HEIGHT) + 15
+
+    return {
+        "title": config.custom_title or "Top Contributions",
+        "body": _iter_contrib_body(stats, config, template.colors),
+        "width": config.card_width,
+        "height": height,
+        "border_radius": config.border_radius,
+        "minify": config.minify,
+        "a11y_title": "Top Contributions Card",
+        "a11y_desc": f"List of top {num_items} repositories contributed to, sorted by stars.",
+        "template": template,
+    }
+
+
+def render_contrib_card(stats: ContributorStats, config: ContribCardConfig) -> str:
+    """
+    Render contributor statistics card.
+
+    Args:
+        stats: Contributor statistics
+        config: Card configuration
+
+    Returns:
+        SVG string
+    """
+    return render_card(**_contrib_card_args(stats, config))
+
+
+def iter_contrib_card(stats: ContributorStats, config: ContribCardConfig) -> Iterator[str]:
+    """
+    Stream contributor statistics card as SVG chunks.
+
+    Produces the same markup as render_contrib_card without materialising it,
+    so cards with many embedded avatars can be written straight to a file,
+    socket or gzip stream (see core.output.write_stream).
+
+    Args:
+        stats: Contributor statistics
+        config: Card configuration
+
+    Yields:
+        SVG markup chunks
+    """
+    return iter_card(**_contrib_card_args(stats, config))
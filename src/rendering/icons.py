@@ -1,5 +1,10 @@
 """SVG icon definitions for GitHub stats."""
 
+from functools import lru_cache
+
+from ..core.constants import TEMPLATE_CACHE_MAXSIZE
+from .base import svg_use
+
 # All icons are 16x16 viewBox
 ICONS: dict[str, str] = {
     "star": """<path fill-rule="evenodd" d="M8 .25a.75.75 0 01.673.418l1.882 3.815 4.21.612a.75.75 0 01.416 1.279l-3.046 2.97.719 4.192a.75.75 0 01-1.088.791L8 12.347l-3.766 1.98a.75.75 0 01-1.088-.79l.72-4.194L.818 6.374a.75.75 0 01.416-1.28l4.21-.611L7.327.668A.75.75 0 018 .25zm0 2.445L6.615 5.5a.75.75 0 01-.564.41l-3.097.45 2.24 2.184a.75.75 0 01.216.664l-.528 3.084 2.769-1.456a.75.75 0 01.698 0l2.77 1.456-.53-3.084a.75.75 0 01.216-.664l2.24-2.183-3.096-.45a.75.75 0 01-.564-.41L8 2.694v.001z"/>""",
@@ -34,3 +39,47 @@ def get_icon_svg(name: str, color: str = "currentColor") -> str:
       {icon_path}
     </svg>
   """
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_MAXSIZE)
+def get_icon_sprite(names: tuple[str, ...]) -> str:
+    """
+    Get a <defs> block defining icons as reusable <symbol> elements.
+
+    Each icon is defined once and drawn with get_icon_use, so cards showing an
+    icon several times do not repeat its path data. Icons drawn only once are
+    smaller inline (get_icon_svg) and should not be put in the sprite.
+
+    Symbols carry no colour: the referencing <use class="icon"> is filled by
+    the card's .icon rule, so one cached block serves every theme.
+
+    Args:
+        names: Icon names to define (duplicates and unknown names are skipped)
+
+    Returns:
+        SVG <defs> markup, or an empty string if no icon is known
+    """
+    symbols = "".join(f"""
+      <symbol id="icon-{name}" viewBox="0 0 16 16">
+        {ICONS[name]}
+      </symbol>""" for name in dict.fromkeys(names) if name in ICONS)
+    if not symbols:
+        return ""
+    return f"""
+    <defs>{symbols}
+    </defs>"""
+
+
+def get_icon_use(name: str) -> str:
+    """
+    Get markup drawing an icon defined by get_icon_sprite.
+
+    Args:
+        name: Icon name (star, commits, prs, issues, etc.)
+
+    Returns:
+        SVG <use> element, or an empty string for unknown icons
+    """
+    if name not in ICONS:
+        return ""
+    return svg_use(f"icon-{name}", 'data-testid="icon" class="icon" width="16" height="16"')
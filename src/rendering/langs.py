@@ -1,9 +1,11 @@
 """Top Languages card renderer with multiple layout styles."""
 
 import math
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
 
-from .base import render_card
-from .colors import get_card_colors
+from .base import get_card_template, iter_card, render_card
 from ..core.config import LangsCardConfig
 from ..core.constants import (
     CARD_PADDING,
@@ -17,6 +19,7 @@ from ..core.constants import (
     LANGS_DONUT_RADIUS,
     LANGS_PIE_RADIUS,
     ANIMATION_STAGGER_DELAY_MS,
+    TEMPLATE_CACHE_MAXSIZE,
 )
 from ..github.langs_fetcher import Language
 from ..core.utils import clamp_value, encode_html
@@ -361,20 +364,40 @@ def render_pie_layout(
 # ============ Main Renderer ============
 
 
-def render_top_languages(
-    top_langs: dict[str, Language],
-    config: LangsCardConfig,
-) -> str:
+@lru_cache(maxsize=TEMPLATE_CACHE_MAXSIZE)
+def _get_langs_style(text_color: str, disable_animations: bool) -> str:
+    """Get the card-specific <style> block (cached per colour and animation flag)."""
+    css = f"""
+    .lang-name {{
+      font: 400 11px "Segoe UI", Ubuntu, Sans-Serif;
+      fill: {text_color};
+    }}
     """
-    Render top languages card as SVG.
-
-    Args:
-        top_langs: Dictionary of language name to Language object
-        config: Configuration object with all rendering options
 
-    Returns:
-        SVG string
+    if not disable_animations:
+        css += """
+    .stagger {
+      opacity: 0;
+      animation: fadeInAnimation 0.3s ease-in-out forwards;
+    }
+    .lang-progress {
+      animation: growWidthAnimation 0.6s ease-in-out forwards;
+    }
+    @keyframes growWidthAnimation {
+      from { width: 0; }
+      to { width: 100%; }
+    }
+    @keyframes fadeInAnimation {
+      from { opacity: 0; }
+      to { opacity: 1; }
+    }
     """
+
+    return f"<style>{css}</style>"
+
+
+def _top_languages_args(top_langs: dict[str, Language], config: LangsCardConfig) -> dict[str, Any]:
+    """Build render_card/iter_card arguments for a card."""
     # Validate layout
     valid_layouts = ["normal", "compact", "donut", "donut-vertical", "pie"]
     if config.layout not in valid_layouts:
@@ -418,14 +441,18 @@ def render_top_languages(
     if not config.hide_title:
         height += 30
 
-    # Get theme colors
-    colors = get_card_colors(
+    # Get theme colors and compiled card template
+    template = get_card_template(
         theme=config.theme,
         title_color=config.title_color,
         text_color=config.text_color,
         bg_color=config.bg_color,
         border_color=config.border_color,
+        hide_title=config.hide_title,
+        hide_border=config.hide_border,
+        disable_animations=config.disable_animations,
     )
+    colors = template.colors
 
     # Extract text color for rendering
     final_text_color = (
@@ -459,33 +486,6 @@ def render_top_languages(
             langs, width, total_size, config.stats_format, final_text_color
         )
 
-    # Add CSS
-    css = f"""
-    .lang-name {{
-      font: 400 11px "Segoe UI", Ubuntu, Sans-Serif;
-      fill: {final_text_color};
-    }}
-    """
-
-    if not config.disable_animations:
-        css += """
-    .stagger {
-      opacity: 0;
-      animation: fadeInAnimation 0.3s ease-in-out forwards;
-    }
-    .lang-progress {
-      animation: growWidthAnimation 0.6s ease-in-out forwards;
-    }
-    @keyframes growWidthAnimation {
-      from { width: 0; }
-      to { width: 100%; }
-    }
-    @keyframes fadeInAnimation {
-      from { opacity: 0; }
-      to { opacity: 1; }
-    }
-    """
-
     # Wrap in padding group for most layouts
     if config.layout in ["pie", "donut-vertical"]:
         body = final_layout
@@ -493,20 +493,49 @@ def render_top_languages(
         body = f'<svg data-testid="lang-items" x="{CARD_PADDING}">{final_layout}</svg>'
 
     # Add CSS to body
-    body = f"<style>{css}</style>\n{body}"
+    body = f"{_get_langs_style(final_text_color, config.disable_animations)}\n{body}"
 
-    # Render card
     title = config.custom_title or "Most Used Languages"
-    svg = render_card(
-        title=title,
-        body=body,
-        width=width,
-        height=height,
-        colors=colors,
-        hide_title=config.hide_title,
-        hide_border=config.hide_border,
-        border_radius=config.border_radius,
-        disable_animations=config.disable_animations,
-    )
+    return {
+        "title": title,
+        "body": body,
+        "width": width,
+        "height": height,
+        "border_radius": config.border_radius,
+        "minify": config.minify,
+        "template": template,
+    }
+
+
+def render_top_languages(
+    top_langs: dict[str, Language],
+    config: LangsCardConfig,
+) -> str:
+    """
+    Render top languages card as SVG.
+
+    Args:
+        top_langs: Dictionary of language name to Language object
+        config: Configuration object with all rendering options
 
-    return svg
+    Returns:
+        SVG string
+    """
+    return render_card(**_top_languages_args(top_langs, config))
+
+
+def iter_top_languages(
+    top_langs: dict[str, Language],
+    config: LangsCardConfig,
+) -> Iterator[str]:
+    """
+    Stream top languages card as SVG chunks (same markup as render_top_languages).
+
+    Args:
+        top_langs: Dictionary of language name to Language object
+        config: Configuration object with all rendering options
+
+    Yields:
+        SVG markup chunks
+    """
+    return iter_card(**_top_languages_args(top_langs, config))
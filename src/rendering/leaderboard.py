@@ -0,0 +1,129 @@
+"""Leaderboard card renderer."""
+
+from collections.abc import Iterator
+from typing import Any
+
+from ..core.config import LeaderboardCardConfig
+from ..core.constants import (
+    ANIMATION_INITIAL_DELAY_MS,
+    ANIMATION_STAGGER_DELAY_MS,
+    LEADERBOARD_ROW_HEIGHT,
+)
+from ..core.utils import encode_html, k_formatter
+from ..github.leaderboard import Leaderboard, LeaderboardEntry
+from .base import get_card_template, iter_card, render_card
+from .colors import CardColors
+
+
+def _format_value(entry: LeaderboardEntry, sort_by: str, number_format: str) -> str:
+    """Format the sorted-by value: top percentage for rank, else the count."""
+    if sort_by == "rank":
+        return f"Top {entry.percentile:.1f}%"
+    if number_format == "long":
+        return str(entry.value)
+    return str(k_formatter(int(entry.value)))
+
+
+def _iter_leaderboard_body(
+    board: Leaderboard, config: LeaderboardCardConfig, colors: CardColors
+) -> Iterator[str]:
+    """Yield the card body in chunks, one row per entry."""
+    if not board["entries"]:
+        text_color = colors["textColor"]
+        yield f'<text x="25" y="15" class="stat bold" fill="{text_color}">No members found</text>'
+        return
+
+    ring_color = colors.get("ringColor", colors["titleColor"])
+    # Rows are translated by the 25px padding; values end left of the rank badge
+    badge_x = config.card_width - 75
+    value_x = config.card_width - 50 if config.hide_rank else badge_x - 10
+
+    for i, entry in enumerate(board["entries"]):
+        delay = ANIMATION_INITIAL_DELAY_MS + i * ANIMATION_STAGGER_DELAY_MS
+        y_pos = i * LEADERBOARD_ROW_HEIGHT
+        name = encode_html(entry.name or entry.login)
+        value = _format_value(entry, board["sort_by"], config.number_format)
+        yield f"""
+    <g class="stagger" style="animation-delay: {delay}ms"
+       transform="translate(25, {y_pos})">
+      <text x="0" y="12.5" class="stat bold">{i + 1}.</text>
+      <text x="30" y="12.5" class="stat">{name}</text>
+      <text x="{value_x}" y="12.5" class="stat bold" text-anchor="end">{value}</text>"""
+
+        if not config.hide_rank:
+            rank = entry.rank_level
+            rank_size = 8 if len(rank) > 1 else 10
+            yield f"""
+      <g transform="translate({badge_x}, -2.5)">
+        <circle cx="10" cy="10" r="11" stroke="{ring_color}" stroke-width="2" fill="none"
+                opacity="0.2" />
+        <text x="10" y="10" alignment-baseline="central" dominant-baseline="central"
+              text-anchor="middle" class="stat bold" style="font-size: {rank_size}px;">{rank}</text>
+      </g>"""
+
+        yield "\n    </g>"
+
+
+def _leaderboard_card_args(board: Leaderboard, config: LeaderboardCardConfig) -> dict[str, Any]:
+    """Build render_card/iter_card arguments with a lazily generated body."""
+    template = get_card_template(
+        theme=config.theme,
+        title_color=config.title_color,
+        text_color=config.text_color,
+        bg_color=config.bg_color,
+        border_color=config.border_color,
+        ring_color=config.ring_color,
+        hide_title=config.hide_title,
+        hide_border=config.hide_border,
+        disable_animations=config.disable_animations,
+    )
+
+    body_y_offset = 25 if config.hide_title else 55
+    num_entries = len(board["entries"])
+    if num_entries == 0:
+        height = body_y_offset + 45
+    else:
+        height = body_y_offset + num_entries * LEADERBOARD_ROW_HEIGHT + 15
+
+    owner = board["owner"]
+    title = config.custom_title or (f"{owner} Leaderboard" if owner else "Leaderboard")
+    sort_by = board["sort_by"]
+    return {
+        "title": title,
+        "body": _iter_leaderboard_body(board, config, template.colors),
+        "width": config.card_width,
+        "height": height,
+        "border_radius": config.border_radius,
+        "minify": config.minify,
+        "a11y_title": title,
+        "a11y_desc": f"Top {num_entries} of {board['members']} users, sorted by {sort_by}.",
+        "template": template,
+    }
+
+
+def render_leaderboard_card(board: Leaderboard, config: LeaderboardCardConfig) -> str:
+    """
+    Render a leaderboard card.
+
+    Args:
+        board: Leaderboard data (see fetch_leaderboard)
+        config: Card configuration
+
+    Returns:
+        SVG string
+    """
+    return render_card(**_leaderboard_card_args(board, config))
+
+
+def iter_leaderboard_card(board: Leaderboard, config: LeaderboardCardConfig) -> Iterator[str]:
+    """
+    Stream a leaderboard card as SVG chunks.
+
+    Args:
+        board: Leaderboard data (see fetch_leaderboard)
+        config: Card configuration
+
+    Yields:
+        SVG markup chunks
+    """
+    return iter_card(**_leaderboard_card_args(board, config))
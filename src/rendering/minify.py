@@ -0,0 +1,173 @@
+"""SVG minification for card output."""
+
+import re
+
+# Decimal places kept for numbers in attributes and CSS
+MINIFY_NUMBER_PRECISION = 2
+
+_STYLE_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.DOTALL)
+_TOKEN_RE = re.compile(r"<[^>]*>|[^<]+")
+_NUMBER_RE = re.compile(r"(?<![\w#.-])-?\d*\.\d+")
+_IDENTITY_TRANSFORM_RE = re.compile(r'\s+transform="translate\(0,?\s*0\)"')
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{}:;,>])\s*")
+_PATH_DATA_RE = re.compile(r'(\sd=")([^"]*)"')
+_STYLE_ATTR_RE = re.compile(r'(\sstyle=")([^"]*)"')
+_TRANSFORM_ATTR_RE = re.compile(r'(\s(?:transform|viewBox)=")([^"]*)"')
+_EMPTY_ELEMENT_RE = re.compile(r"<(rect|circle|path)([^<>]*?)></\1>")
+
+
+def shorten_number(match: re.Match[str]) -> str:
+    """Return the shortest form of a decimal number match."""
+    value = round(float(match.group(0)), MINIFY_NUMBER_PRECISION)
+    if value == 0:
+        return "0"
+    text = f"{value:.{MINIFY_NUMBER_PRECISION}f}".rstrip("0").rstrip(".")
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def _split_css_rules(css: str) -> list[str]:
+    """Split minified CSS into top-level rules (at-rules kept whole)."""
+    rules = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(css):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start : i + 1])
+                start = i + 1
+    tail = css[start:].strip()
+    if tail:
+        rules.append(tail)
+    return rules
+
+
+def minify_css(css: str) -> str:
+    """
+    Minify a CSS stylesheet and drop duplicate rules.
+
+    Identical rules (including repeated @keyframes) keep only their last
+    occurrence, which leaves the cascade unchanged.
+
+    Args:
+        css: Stylesheet text
+
+    Returns:
+        Minified stylesheet
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = _CSS_PUNCTUATION_RE.sub(r"\1", css)
+    css = css.replace(";}", "}")
+    css = _NUMBER_RE.sub(shorten_number, css)
+
+    seen: set[str] = set()
+    unique: list[str] = []
+    for rule in reversed(_split_css_rules(css.strip())):
+        if rule not in seen and not rule.endswith("{}"):
+            seen.add(rule)
+            unique.append(rule)
+    return "".join(reversed(unique))
+
+
+def _compact_path(match: re.Match[str]) -> str:
+    data = re.sub(r"\s*([MLHVCSQTAZmlhvcsqtaz])\s*", r"\1", match.group(2))
+    return f'{match.group(1)}{data}"'
+
+
+def _compact_style(match: re.Match[str]) -> str:
+    style = _CSS_PUNCTUATION_RE.sub(r"\1", match.group(2)).rstrip(";")
+    return f'{match.group(1)}{style}"'
+
+
+def _compact_transform(match: re.Match[str]) -> str:
+    value = re.sub(r"\s*,\s*", ",", match.group(2))
+    return f'{match.group(1)}{value}"'
+
+
+def _minify_tag(tag: str) -> str:
+    """Collapse whitespace and shorten numbers inside a single tag."""
+    tag = re.sub(r"\s+", " ", tag)
+    tag = re.sub(r"\s*(/?>)$", r"\1", tag)
+    tag = re.sub(r'\s*=\s*"', '="', tag)
+    tag = _IDENTITY_TRANSFORM_RE.sub("", tag)
+    tag = _NUMBER_RE.sub(shorten_number, tag)
+    tag = _PATH_DATA_RE.sub(_compact_path, tag)
+    tag = _STYLE_ATTR_RE.sub(_compact_style, tag)
+    return _TRANSFORM_ATTR_RE.sub(_compact_transform, tag)
+
+
+def minify_svg(svg: str) -> str:
+    """
+    Minify card SVG markup.
+
+    - merges all <style> blocks into one minified, deduplicated stylesheet
+    - removes whitespace between tags and collapses it inside text nodes
+      (equivalent under the default xml:space handling)
+    - shortens numbers in attributes and CSS to at most two decimals
+    - drops identity transforms, attribute-less <g> wrappers and empty <defs>
+
+    Text content (titles, labels, values) is never altered beyond whitespace.
+
+    Args:
+        svg: SVG markup produced by a card renderer
+
+    Returns:
+        Minified SVG markup
+    """
+    css = minify_css("".join(_STYLE_RE.findall(svg)))
+    svg = _STYLE_RE.sub("", svg)
+
+    out: list[str] = []
+    # One flag per open <g>: True if the wrapper is dropped
+    group_stack: list[bool] = []
+    for token in _TOKEN_RE.findall(svg):
+        if not token.startswith("<"):
+            text = " ".join(token.split())
+            if text:
+                out.append(text)
+            continue
+
+        tag = _minify_tag(token)
+        if tag.startswith("<g") and (tag[2] in " >") and not tag.endswith("/>"):
+            redundant = tag == "<g>"
+            group_stack.append(redundant)
+            if redundant:
+                continue
+        elif tag == "</g>" and group_stack and group_stack.pop():
+            continue
+        elif tag == "</defs>" and out and out[-1] == "<defs>":
+            out.pop()
+            continue
+        out.append(tag)
+
+    result = _EMPTY_ELEMENT_RE.sub(r"<\1\2/>", "".join(out))
+    if css:
+        # Keep <title>/<desc> as the first children for accessibility
+        desc_end = result.find("</desc>")
+        insert_at = desc_end + len("</desc>") if desc_end != -1 else result.find(">") + 1
+        result = f"{result[:insert_at]}<style>{css}</style>{result[insert_at:]}"
+    return result
+
+
+def size_report(original: str, minified: str) -> str:
+    """
+    Describe the size reduction achieved by minification.
+
+    Args:
+        original: Unminified SVG markup
+        minified: Minified SVG markup
+
+    Returns:
+        Human-readable summary (e.g. "4210 → 2876 bytes (-31.7%)")
+    """
+    before = len(original.encode("utf-8"))
+    after = len(minified.encode("utf-8"))
+    saved = (1 - after / before) * 100 if before else 0.0
+    return f"{before} → {after} bytes (-{saved:.1f}%)"
@@ -0,0 +1,49 @@
+"""Organisation stats cards, rendered with the stats and top languages cards."""
+
+from dataclasses import replace
+
+from ..core.config import LangsCardConfig, StatsCardConfig
+from ..github.org_stats import OrgStats
+from .langs import render_top_languages
+from .stats import render_stats_card
+
+# Per-user stats that have no organisation total
+_USER_ONLY_STATS = ("contribs",)
+
+
+def render_org_stats_card(stats: OrgStats, config: StatsCardConfig) -> str:
+    """
+    Render an organisation's aggregate stats on the stats card.
+
+    The rank circle and per-user stats are hidden: user ranks do not apply
+    to organisations.
+
+    Args:
+        stats: Organisation statistics (see fetch_org_stats)
+        config: Stats card configuration
+
+    Returns:
+        SVG string
+    """
+    config = replace(
+        config,
+        hide_rank=True,
+        hide=[*config.hide, *_USER_ONLY_STATS],
+        show=[key for key in config.show if key not in _USER_ONLY_STATS],
+        rank_calibration=None,
+    )
+    return render_stats_card(stats["stats"], config)
+
+
+def render_org_langs_card(stats: OrgStats, config: LangsCardConfig) -> str:
+    """
+    Render an organisation's most used languages on the top languages card.
+
+    Args:
+        stats: Organisation statistics (see fetch_org_stats)
+        config: Top languages card configuration
+
+    Returns:
+        SVG string
+    """
+    return render_top_languages(stats["languages"], config)
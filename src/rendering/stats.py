@@ -1,9 +1,12 @@
 """Stats card SVG renderer with all customization options."""
 
+from collections import Counter
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
 
-from .base import render_card
-from .colors import get_card_colors
+from .base import get_card_template, iter_card, render_card
+from .templates import compile_template, slot
 from ..core.config import StatsCardConfig
 from ..core.constants import (
     ANIMATION_INITIAL_DELAY_MS,
@@ -14,84 +17,72 @@ from ..core.constants import (
     STAT_LABEL_X_WITH_ICON,
     STAT_VALUE_X_POSITION,
     STATS_CARD_BASE_HEIGHT,
+    TEMPLATE_CACHE_MAXSIZE,
 )
 from ..github.fetcher import UserStats
 from ..core.i18n import get_translation
-from .icons import get_icon_svg
+from .icons import get_icon_sprite, get_icon_svg, get_icon_use
 from ..github.rank import calculate_user_rank
 from ..core.utils import encode_html, k_formatter
 
+# Stat key -> (translation key, icon name, UserStats field)
+_STAT_DEFINITIONS: dict[str, tuple[str, str, str | None]] = {
+    "stars": ("statcard_totalstars", "star", "totalStars"),
+    "commits": ("statcard_commits", "commits", "totalCommits"),
+    "prs": ("statcard_prs", "prs", "totalPRs"),
+    "prs_merged": ("statcard_prs_merged", "prs_merged", "mergedPRs"),
+    # Computed from mergedPRs / totalPRs; displayed as-is
+    "prs_merged_percentage": ("statcard_prs_merged_percentage", "prs_merged", None),
+    "issues": ("statcard_issues", "issues", "totalIssues"),
+    "contribs": ("statcard_contribs", "contribs", "contributedTo"),
+    "reviews": ("statcard_reviews", "reviews", "totalReviews"),
+    "discussions_started": (
+        "statcard_discussions_started",
+        "discussions_started",
+        "discussionsStarted",
+    ),
+    "discussions_answered": (
+        "statcard_discussions_answered",
+        "discussions_answered",
+        "discussionsAnswered",
+    ),
+}
+
+_RANK_CIRCLE_TEMPLATE = compile_template(f"""
+    <g data-testid="rank-circle"
+          transform="translate({RANK_CIRCLE_X_OFFSET}, {RANK_CIRCLE_Y_OFFSET})">
+        <circle class="rank-circle-rim" cx="-10" cy="8" r="40" />
+        <circle class="rank-circle" cx="-10" cy="8" r="40" />
+        <g class="rank-text">
+          <text x="-5" y="3" alignment-baseline="central" dominant-baseline="central" text-anchor="middle" data-testid="level-rank-icon">
+          {slot("level")}
+        </text>
+        </g>
+      </g>""")
+
 
-def _get_stat_definitions(stats: UserStats, locale: str) -> dict[str, dict[str, Any]]:
-    """Get all available stat definitions."""
+@lru_cache(maxsize=TEMPLATE_CACHE_MAXSIZE)
+def _get_stat_labels(locale: str) -> dict[str, str]:
+    """Get XML-encoded stat labels for a locale (cached; do not mutate)."""
     return {
-        "stars": {
-            "label": get_translation("statcard_totalstars", locale),
-            "value": stats["totalStars"],
-            "icon": "star",
-        },
-        "commits": {
-            "label": get_translation("statcard_commits", locale),
-            "value": stats["totalCommits"],
-            "icon": "commits",
-        },
-        "prs": {
-            "label": get_translation("statcard_prs", locale),
-            "value": stats["totalPRs"],
-            "icon": "prs",
-        },
-        "prs_merged": {
-            "label": get_translation("statcard_prs_merged", locale),
-            "value": stats["mergedPRs"],
-            "icon": "prs_merged",
-        },
-        "prs_merged_percentage": {
-            "label": get_translation("statcard_prs_merged_percentage", locale),
-            "value": f"{(stats['mergedPRs'] / stats['totalPRs'] * 100) if stats['totalPRs'] > 0 else 0:.1f}%",
-            "icon": "prs_merged",
-            "skip_format": True,
-        },
-        "issues": {
-            "label": get_translation("statcard_issues", locale),
-            "value": stats["totalIssues"],
-            "icon": "issues",
-        },
-        "contribs": {
-            "label": get_translation("statcard_contribs", locale),
-            "value": stats["contributedTo"],
-            "icon": "contribs",
-        },
-        "reviews": {
-            "label": get_translation("statcard_reviews", locale),
-            "value": stats["totalReviews"],
-            "icon": "reviews",
-        },
-        "discussions_started": {
-            "label": get_translation("statcard_discussions_started", locale),
-            "value": stats["discussionsStarted"],
-            "icon": "discussions_started",
-        },
-        "discussions_answered": {
-            "label": get_translation("statcard_discussions_answered", locale),
-            "value": stats["discussionsAnswered"],
-            "icon": "discussions_answered",
-        },
+        stat_key: encode_html(get_translation(translation_key, locale))
+        for stat_key, (translation_key, _, _) in _STAT_DEFINITIONS.items()
     }
 
 
-def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
-    """
-    Render GitHub stats card as SVG.
+def _get_stat_value(stats: UserStats, stat_key: str) -> int | str:
+    """Get the raw value of a stat (percentages are pre-formatted strings)."""
+    field = _STAT_DEFINITIONS[stat_key][2]
+    if field is None:
+        percentage = stats["mergedPRs"] / stats["totalPRs"] * 100 if stats["totalPRs"] > 0 else 0
+        return f"{percentage:.1f}%"
+    return stats[field]  # type: ignore[literal-required,no-any-return]
 
-    Args:
-        stats: User statistics dictionary from fetcher
-        config: Configuration object with all rendering options
 
-    Returns:
-        Complete SVG markup as string
-    """
-    # Get resolved colors
-    colors = get_card_colors(
+def _stats_card_args(stats: UserStats, config: StatsCardConfig) -> dict[str, Any]:
+    """Build render_card/iter_card arguments for a card."""
+    # Get resolved colors and compiled card template
+    template = get_card_template(
         theme=config.theme,
         title_color=config.title_color,
         text_color=config.text_color,
@@ -99,7 +90,11 @@ def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
         bg_color=config.bg_color,
         border_color=config.border_color,
         ring_color=config.ring_color,
+        hide_title=config.hide_title,
+        hide_border=config.hide_border,
+        disable_animations=config.disable_animations,
     )
+    colors = template.colors
 
     # Calculate rank
     rank_result = calculate_user_rank(
@@ -110,6 +105,7 @@ def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
         stars=stats["totalStars"],
         followers=stats["followers"],
         all_commits=config.include_all_commits,
+        calibration=config.rank_calibration,
     )
 
     # Determine title
@@ -118,7 +114,7 @@ def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
     )
 
     # Build stat items
-    all_stats = _get_stat_definitions(stats, config.locale)
+    labels = _get_stat_labels(config.locale)
 
     # Default stats to show
     default_stats = ["stars", "commits", "prs", "issues", "contribs"]
@@ -128,21 +124,25 @@ def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
 
     # Add explicitly requested stats
     for stat_key in config.show:
-        if stat_key in all_stats and stat_key not in stats_to_show:
+        if stat_key in _STAT_DEFINITIONS and stat_key not in stats_to_show:
             stats_to_show.append(stat_key)
 
+    # Icons drawn more than once are defined once and referenced with <use>;
+    # the rest are drawn inline, which is smaller than a symbol plus a reference
+    icon_counts = Counter(_STAT_DEFINITIONS[s][1] for s in stats_to_show if s in _STAT_DEFINITIONS)
+    shared_icons = tuple(name for name, count in icon_counts.items() if count > 1)
+
     # Build stat items SVG
     stat_items = []
     for i, stat_key in enumerate(stats_to_show):
-        stat = all_stats.get(stat_key)
-        if not stat:
+        if stat_key not in _STAT_DEFINITIONS:
             continue
 
-        label = encode_html(stat["label"])
-        value = stat["value"]
+        label = labels[stat_key]
+        value = _get_stat_value(stats, stat_key)
 
         # Format value
-        if not stat.get("skip_format"):
+        if not isinstance(value, str):
             if config.number_format == "short":
                 formatted_value = k_formatter(int(value), config.number_precision)
             else:
@@ -154,7 +154,11 @@ def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
         icon_svg = ""
         label_x = STAT_LABEL_X_BASE
         if config.show_icons:
-            icon_svg = get_icon_svg(stat["icon"], colors["iconColor"])  # type: ignore
+            icon_name = _STAT_DEFINITIONS[stat_key][1]
+            if icon_name in shared_icons:
+                icon_svg = get_icon_use(icon_name)
+            else:
+                icon_svg = get_icon_svg(icon_name, colors["iconColor"])  # type: ignore
             label_x = STAT_LABEL_X_WITH_ICON
 
         # Animation delay starts at 450ms and increments by 150ms
@@ -179,24 +183,15 @@ def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
     # Rank circle
     rank_svg = ""
     if not config.hide_rank:
-        rank_x = RANK_CIRCLE_X_OFFSET
-        rank_y = RANK_CIRCLE_Y_OFFSET
+        rank_svg = _RANK_CIRCLE_TEMPLATE.render(level=rank_result["level"])
 
-        rank_svg = f"""
-    <g data-testid="rank-circle"
-          transform="translate({rank_x}, {rank_y})">
-        <circle class="rank-circle-rim" cx="-10" cy="8" r="40" />
-        <circle class="rank-circle" cx="-10" cy="8" r="40" />
-        <g class="rank-text">
-          <text x="-5" y="3" alignment-baseline="central" dominant-baseline="central" text-anchor="middle" data-testid="level-rank-icon">
-          {rank_result['level']}
-        </text>
-        </g>
-      </g>"""
+    icon_sprite = ""
+    if config.show_icons:
+        icon_sprite = get_icon_sprite(shared_icons)
 
     # Combine stat items wrapped in SVG structure
     stats_content = "\n".join(stat_items)
-    body = f"""{rank_svg}
+    body = f"""{icon_sprite}{rank_svg}
     <svg x="0" y="0">
       {stats_content}
     </svg>"""
@@ -212,16 +207,42 @@ def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
     # Use provided width or default to 467 (matches reference)
     final_width = config.card_width or 467
 
-    return render_card(
-        title=title,
-        body=body,
-        width=final_width,
-        height=card_height,
-        colors=colors,
-        hide_title=config.hide_title,
-        hide_border=config.hide_border,
-        border_radius=config.border_radius,
-        disable_animations=config.disable_animations,
-        a11y_title=title,
-        a11y_desc=f"{stats['name']}'s GitHub statistics",
-    )
+    return {
+        "title": title,
+        "body": body,
+        "width": final_width,
+        "height": card_height,
+        "border_radius": config.border_radius,
+        "minify": config.minify,
+        "a11y_title": title,
+        "a11y_desc": f"{stats['name']}'s GitHub statistics",
+        "template": template,
+    }
+
+
+def render_stats_card(stats: UserStats, config: StatsCardConfig) -> str:
+    """
+    Render GitHub stats card as SVG.
+
+    Args:
+        stats: User statistics dictionary from fetcher
+        config: Configuration object with all rendering options
+
+    Returns:
+        Complete SVG markup as string
+    """
+    return render_card(**_stats_card_args(stats, config))
+
+
+def iter_stats_card(stats: UserStats, config: StatsCardConfig) -> Iterator[str]:
+    """
+    Stream GitHub stats card as SVG chunks (same markup as render_stats_card).
+
+    Args:
+        stats: User statistics dictionary from fetcher
+        config: Configuration object with all rendering options
+
+    Yields:
+        SVG markup chunks
+    """
+    return iter_card(**_stats_card_args(stats, config))
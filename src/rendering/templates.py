@@ -0,0 +1,118 @@
+"""Compiled SVG templates: static markup formatted once, per-card values filled in."""
+
+from collections.abc import Iterable, Iterator
+
+from ..core.exceptions import RenderError
+
+_SLOT_MARKER = "\x00"
+
+
+def slot(name: str) -> str:
+    """
+    Return the placeholder marking a per-card value in template source.
+
+    Args:
+        name: Slot name, later passed as a keyword to CompiledTemplate.render
+
+    Returns:
+        Placeholder string
+    """
+    return f"{_SLOT_MARKER}{name}{_SLOT_MARKER}"
+
+
+class CompiledTemplate:
+    """
+    Template split into static segments and named slots.
+
+    Everything that does not vary per card (theme-resolved CSS, defs, fixed
+    attributes) lives in the segments, so rendering is a single join; the
+    static markup is never re-scanned (unlike str.format).
+
+    Attributes:
+        segments: Static markup; always one more than there are slots
+        slots: Slot names in document order
+    """
+
+    __slots__ = ("_parts", "_positions", "segments", "slots")
+
+    def __init__(self, segments: tuple[str, ...], slots: tuple[str, ...]):
+        self.segments = segments
+        self.slots = slots
+        # Interleaved [segment, slot, segment, ...]; slot positions are odd
+        self._parts = [part for pair in zip(segments, slots) for part in pair] + [segments[-1]]
+        self._positions = tuple((2 * i + 1, name) for i, name in enumerate(slots))
+
+    def render(self, **values: object) -> str:
+        """
+        Fill the slots and return the markup.
+
+        Args:
+            **values: Value for each slot name (converted with str())
+
+        Returns:
+            Rendered markup
+
+        Raises:
+            RenderError: If a slot has no value
+        """
+        parts = self._parts.copy()
+        try:
+            for position, name in self._positions:
+                parts[position] = str(values[name])
+        except KeyError as e:
+            raise RenderError(f"Missing value for template slot {e}") from e
+        return "".join(parts)
+
+    def iter_render(self, **values: object) -> Iterator[str]:
+        """
+        Yield the markup chunk by chunk without joining it.
+
+        A slot value that is an iterable of strings (other than a str) is
+        streamed through, so large bodies are never copied into one string.
+
+        Args:
+            **values: Value for each slot name: str, iterable of str, or any
+                object (converted with str())
+
+        Yields:
+            Markup chunks in document order
+
+        Raises:
+            RenderError: If a slot has no value
+        """
+        yield self.segments[0]
+        for name, segment in zip(self.slots, self.segments[1:]):
+            try:
+                value = values[name]
+            except KeyError as e:
+                raise RenderError(f"Missing value for template slot {e}") from e
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, Iterable):
+                yield from value
+            else:
+                yield str(value)
+            yield segment
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """
+    Compile template source containing slot() placeholders.
+
+    Args:
+        source: Markup with placeholders produced by slot()
+
+    Returns:
+        Compiled template
+
+    Raises:
+        RenderError: If a placeholder is unterminated or its name is not an identifier
+    """
+    pieces = source.split(_SLOT_MARKER)
+    if len(pieces) % 2 == 0:
+        raise RenderError("Unterminated slot placeholder in template")
+    slots = tuple(pieces[1::2])
+    for name in slots:
+        if not name.isidentifier():
+            raise RenderError(f"Invalid template slot name: {name!r}")
+    return CompiledTemplate(tuple(pieces[0::2]), slots)
@@ -0,0 +1,573 @@
+"""HTTP server that renders cards on demand from a long-lived process."""
+
+import json
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+from urllib.parse import parse_qs, urlsplit
+
+import requests  # type: ignore
+
+from .core.cache import StaleWhileRevalidateCache
+from .core.config import (
+    BaseConfig,
+    ContribCardConfig,
+    ContribFetchConfig,
+    FetchConfig,
+    LangsCardConfig,
+    LangsFetchConfig,
+    LeaderboardCardConfig,
+    LeaderboardFetchConfig,
+    StatsCardConfig,
+    resolve_language_weights,
+)
+from .core.constants import (
+    RANK_SKETCH_MIN_USERS,
+    RANK_SKETCH_SAVE_INTERVAL,
+    RANK_SKETCH_VIEW_INTERVAL,
+    SERVER_CACHE_MAXSIZE,
+    SERVER_CACHE_TTL,
+    SERVER_MEMBER_CACHE_MAXSIZE,
+    SERVER_STALE_IF_ERROR_TTL,
+    SERVER_STALE_TTL,
+    WEIGHTING_PRESETS,
+)
+from .core.exceptions import APIError, ValidationError
+from .core.utils import encode_html
+from .github.client import GitHubClient
+from .github.fetcher import UserStats, fetch_contributor_stats, fetch_stats
+from .github.langs_fetcher import fetch_top_languages
+from .github.leaderboard import Leaderboard, fetch_leaderboard, leaderboard_fetch_options
+from .github.rank_sketch import RankSketch, SketchView, dump_rank_sketch
+from .rendering.base import render_card
+from .rendering.cache import RenderCache, RenderedCard
+from .rendering.contrib import render_contrib_card
+from .rendering.langs import render_top_languages
+from .rendering.leaderboard import render_leaderboard_card
+from .rendering.stats import render_stats_card
+
+SVG_CONTENT_TYPE = "image/svg+xml; charset=utf-8"
+
+# Parameters a route needs (any one of them); other routes need username
+_REQUIRED_PARAMS: dict[str, tuple[str, ...]] = {"/leaderboard": ("org", "users")}
+
+
+@dataclass
+class CardResponse:
+    """HTTP response produced by CardServer."""
+
+    status: int
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _config_key(config: BaseConfig) -> dict[str, Any]:
+    """Return a normalized, token-free representation of a config for cache keys."""
+    data = asdict(config)
+    data.pop("token", None)
+    if "username" in data:
+        data["username"] = data["username"].lower()
+    return data
+
+
+def _fetch_key(card_type: str, config: BaseConfig) -> str:
+    """Return the fetch cache key of a card's data."""
+    return json.dumps([card_type, _config_key(config)], sort_keys=True)
+
+
+def _missing_param(path: str, params: dict[str, str]) -> str | None:
+    """Return the required parameter(s) missing from a request, if any."""
+    names = _REQUIRED_PARAMS.get(path, ("username",))
+    if any(params.get(name) for name in names):
+        return None
+    return " or ".join(names)
+
+
+def _choose_encoding(card: RenderedCard, accept_encoding: str | None) -> tuple[str | None, bytes]:
+    """Pick the best pre-compressed representation the client accepts."""
+    accepted = {token.split(";")[0].strip() for token in (accept_encoding or "").split(",")}
+    if "br" in accepted and card.brotli is not None:
+        return "br", card.brotli
+    if "gzip" in accepted:
+        return "gzip", card.gzip
+    return None, card.svg
+
+
+class CardServer:
+    """
+    Card rendering service that keeps a shared client and caches warm.
+
+    Fetch results are cached keyed by the normalized fetch config with
+    stale-while-revalidate and stale-if-error semantics, and rendered cards
+    (with pre-compressed copies) are cached keyed by a hash of the fetched data
+    and the render config. Concurrent cache misses for the same fetch key are
+    coalesced into one fetch.
+
+    With a rank sketch, every user whose stats are fetched is added to it,
+    so it tracks the population the server actually serves; with live_rank,
+    stats cards are ranked against it once it holds RANK_SKETCH_MIN_USERS
+    users. The view they are ranked against is rebuilt every
+    RANK_SKETCH_VIEW_INTERVAL new users, so cached stats renders keyed by its
+    fingerprint survive in between. The sketch is saved to rank_sketch_path every
+    RANK_SKETCH_SAVE_INTERVAL new users and by save_rank_sketch.
+
+    Args:
+        token: GitHub Personal Access Token used for all fetches
+        cache_ttl: Seconds fetch results and rendered cards stay fresh
+        stale_ttl: Extra seconds stale results are served while refreshing
+        stale_if_error_ttl: Extra seconds stale results are served when fetching fails
+        cache_maxsize: Maximum number of entries in each cache
+        member_cache_maxsize: Maximum number of leaderboard members whose stats
+            are cached
+        session: Optional requests session (a pooled one is created by default)
+        rank_sketch: Optional live distribution fed by fetched stats
+        rank_sketch_path: Optional file the rank sketch is saved to
+        live_rank: Rank stats cards against the rank sketch
+    """
+
+    def __init__(
+        self,
+        token: str,
+        cache_ttl: float = SERVER_CACHE_TTL,
+        stale_ttl: float = SERVER_STALE_TTL,
+        stale_if_error_ttl: float = SERVER_STALE_IF_ERROR_TTL,
+        cache_maxsize: int = SERVER_CACHE_MAXSIZE,
+        member_cache_maxsize: int = SERVER_MEMBER_CACHE_MAXSIZE,
+        session: requests.Session | None = None,
+        rank_sketch: RankSketch | None = None,
+        rank_sketch_path: str | None = None,
+        live_rank: bool = False,
+    ):
+        if live_rank and rank_sketch is None:
+            raise ValidationError("Live ranking needs a rank sketch")
+        self.token = token
+        self.cache_ttl = cache_ttl
+        self.stale_ttl = stale_ttl
+        self.stale_if_error_ttl = stale_if_error_ttl
+        self.client = GitHubClient(token, session=session or requests.Session())
+        self.fetch_cache: StaleWhileRevalidateCache[str, Any] = StaleWhileRevalidateCache(
+            fresh_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            stale_if_error_ttl=stale_if_error_ttl,
+            maxsize=cache_maxsize,
+        )
+        self.member_cache: StaleWhileRevalidateCache[str, UserStats] = StaleWhileRevalidateCache(
+            fresh_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            stale_if_error_ttl=stale_if_error_ttl,
+            maxsize=member_cache_maxsize,
+        )
+        self.render_cache = RenderCache(maxsize=cache_maxsize)
+        self.rank_sketch = rank_sketch
+        self.rank_sketch_path = rank_sketch_path
+        self.live_rank = live_rank
+        self._sketch_lock = threading.Lock()
+        self._unsaved_users = 0
+        self._sketch_save_errors = 0
+        self._rank_view: SketchView | None = None
+        self.routes: dict[str, Callable[..., RenderedCard]] = {
+            "/stats": self._stats_card,
+            "/top-langs": self._top_langs_card,
+            "/contrib": self._contrib_card,
+            "/leaderboard": self._leaderboard_card,
+        }
+
+    def handle(
+        self,
+        path: str,
+        query: str,
+        if_none_match: str | None = None,
+        accept_encoding: str | None = None,
+    ) -> CardResponse:
+        """
+        Handle a card request.
+
+        Args:
+            path: Request path (e.g. "/stats")
+            query: Raw query string
+            if_none_match: Value of the If-None-Match request header, if any
+            accept_encoding: Value of the Accept-Encoding request header, if any
+
+        Returns:
+            Response with status, headers and body
+        """
+        if path.rstrip("/") == "/metrics":
+            return CardResponse(
+                200,
+                json.dumps(self.metrics()).encode("utf-8"),
+                {"Content-Type": "application/json", "Cache-Control": "no-store"},
+            )
+
+        path = path.rstrip("/") or "/"
+        route = self.routes.get(path)
+        if route is None:
+            return CardResponse(404, b"Not Found", {"Content-Type": "text/plain"})
+
+        params = {k: v[-1] for k, v in parse_qs(query, keep_blank_values=True).items()}
+        missing = _missing_param(path, params)
+        if missing:
+            return CardResponse(
+                400,
+                f"Missing required parameter: {missing}".encode(),
+                {"Content-Type": "text/plain"},
+            )
+
+        try:
+            card = route(params)
+        except ValidationError as e:
+            return CardResponse(400, str(e).encode("utf-8"), {"Content-Type": "text/plain"})
+        except APIError as e:
+            return CardResponse(
+                502,
+                render_error_card(str(e)).encode("utf-8"),
+                {"Content-Type": SVG_CONTENT_TYPE, "Cache-Control": "no-store"},
+            )
+
+        headers = {
+            "Content-Type": SVG_CONTENT_TYPE,
+            "Cache-Control": (
+                f"public, max-age={int(self.cache_ttl)}, "
+                f"stale-while-revalidate={int(self.stale_ttl)}, "
+                f"stale-if-error={int(self.stale_if_error_ttl)}"
+            ),
+            "ETag": card.etag,
+            "Vary": "Accept-Encoding",
+        }
+        if if_none_match and card.etag in [t.strip() for t in if_none_match.split(",")]:
+            return CardResponse(304, b"", headers)
+
+        encoding, body = _choose_encoding(card, accept_encoding)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return CardResponse(200, body, headers)
+
+    def render(
+        self,
+        card_type: str,
+        params: dict[str, str],
+        timings: dict[str, Any] | None = None,
+    ) -> RenderedCard:
+        """
+        Render a card without going through HTTP request handling.
+
+        Args:
+            card_type: Card identifier ("stats", "top-langs", "contrib" or
+                "leaderboard")
+            params: Card options as query-style strings (must include
+                username, or org or users for a leaderboard)
+            timings: Optional dictionary receiving fetch_ms and render_ms
+                durations and render_cached (True on a render cache hit)
+
+        Returns:
+            Rendered card
+
+        Raises:
+            ValidationError: If the card type or an option is invalid
+            APIError: If fetching from GitHub fails and no stale data is usable
+        """
+        route = self.routes.get(f"/{card_type}")
+        if route is None:
+            raise ValidationError(f"Unknown card type: {card_type!r}")
+        missing = _missing_param(f"/{card_type}", params)
+        if missing:
+            raise ValidationError(f"Missing required parameter: {missing}")
+        return route(params, timings)
+
+    def _cached_render(
+        self,
+        card_type: str,
+        fetch_config: BaseConfig,
+        render_config: BaseConfig,
+        fetch: Callable[[], Any],
+        render: Callable[[Any], str],
+        timings: dict[str, Any] | None = None,
+    ) -> RenderedCard:
+        """Return the rendered card, using the fetch and render caches."""
+        fetch_key = _fetch_key(card_type, fetch_config)
+        start = time.perf_counter()
+        data = self.fetch_cache.get(fetch_key, fetch)
+        fetched = time.perf_counter()
+        card, cached = self.render_cache.render(
+            card_type, data, render_config, lambda: render(data)
+        )
+        if timings is not None:
+            timings["fetch_ms"] = (fetched - start) * 1000
+            timings["render_ms"] = (time.perf_counter() - fetched) * 1000
+            timings["render_cached"] = cached
+        return card
+
+    def metrics(self) -> dict[str, Mapping[str, float]]:
+        """
+        Return cache, request-coalescing and rank sketch counters.
+
+        The rank sketch also reports its login filter's fill ratio and
+        estimated false-positive rate, which climb once the filter holds more
+        users than it was sized for.
+
+        Returns:
+            Nested dictionary of counters per component
+        """
+        metrics: dict[str, Mapping[str, float]] = {
+            "fetch_cache": {
+                "hits": self.fetch_cache.hits,
+                "stale_hits": self.fetch_cache.stale_hits,
+                "misses": self.fetch_cache.misses,
+                "stale_errors": self.fetch_cache.stale_errors,
+                "refresh_errors": self.fetch_cache.refresh_errors,
+                "refreshing": self.fetch_cache.refreshing,
+                "size": len(self.fetch_cache),
+            },
+            "member_cache": {
+                "hits": self.member_cache.hits,
+                "stale_hits": self.member_cache.stale_hits,
+                "misses": self.member_cache.misses,
+                "size": len(self.member_cache),
+            },
+            "render_cache": {
+                "hits": self.render_cache.hits,
+                "misses": self.render_cache.misses,
+                "size": len(self.render_cache),
+            },
+            "fetch_flight": self.fetch_cache.flight.metrics(),
+        }
+        if self.rank_sketch is not None:
+            metrics["rank_sketch"] = {
+                "users": self.rank_sketch.users,
+                "unsaved": self._unsaved_users,
+                "save_errors": self._sketch_save_errors,
+                "filter_fill": self.rank_sketch.filter_fill,
+                "false_positive_rate": self.rank_sketch.false_positive_rate,
+            }
+        return metrics
+
+    def save_rank_sketch(self) -> bool:
+        """
+        Write the rank sketch to rank_sketch_path if it has unsaved users.
+
+        Returns:
+            True if the sketch was written
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        if self.rank_sketch is None or not self.rank_sketch_path:
+            return False
+        with self._sketch_lock:
+            if not self._unsaved_users:
+                return False
+            dump_rank_sketch(self.rank_sketch, self.rank_sketch_path)
+            self._unsaved_users = 0
+        return True
+
+    def _observe_stats(self, stats: UserStats, all_commits: bool) -> None:
+        """Add fetched stats to the rank sketch, saving it every few new users."""
+        if self.rank_sketch is None or not self.rank_sketch.add(stats, all_commits):
+            return
+        with self._sketch_lock:
+            self._unsaved_users += 1
+            due = self._unsaved_users >= RANK_SKETCH_SAVE_INTERVAL
+        if due:
+            try:
+                self.save_rank_sketch()
+            except OSError:
+                # Keep serving; the users stay unsaved until the next attempt
+                with self._sketch_lock:
+                    self._sketch_save_errors += 1
+
+    def _live_rank_view(self) -> SketchView | None:
+        """Return the rank sketch view to rank against, if live ranking is active."""
+        sketch = self.rank_sketch
+        if not self.live_rank or sketch is None or sketch.users < RANK_SKETCH_MIN_USERS:
+            return None
+        with self._sketch_lock:
+            view = self._rank_view
+            if view is None or sketch.users - view.users >= RANK_SKETCH_VIEW_INTERVAL:
+                view = self._rank_view = sketch.view()
+            return view
+
+    def _user_stats_fetcher(self, fetch_config: FetchConfig) -> Callable[[], UserStats]:
+        """Return a function fetching one user's stats and feeding the rank sketch."""
+
+        def fetch() -> UserStats:
+            stats = fetch_stats(
+                username=fetch_config.username,
+                token=fetch_config.token,
+                include_all_commits=fetch_config.include_all_commits,
+                commits_year=fetch_config.commits_year,
+                show=fetch_config.show,
+                client=self.client,
+            )
+            self._observe_stats(stats, fetch_config.include_all_commits)
+            return stats
+
+        return fetch
+
+    def _stats_card(
+        self, params: dict[str, str], timings: dict[str, Any] | None = None
+    ) -> RenderedCard:
+        fetch_config = FetchConfig.from_query_params({**params, "token": self.token})
+        render_config = StatsCardConfig.from_query_params(params)
+        view = self._live_rank_view()
+        if view is not None:
+            # A view, so the render cache key follows the population it ranks against
+            render_config = replace(render_config, rank_calibration=view)
+
+        return self._cached_render(
+            "stats",
+            fetch_config,
+            render_config,
+            self._user_stats_fetcher(fetch_config),
+            lambda stats: render_stats_card(stats, render_config),
+            timings,
+        )
+
+    def _top_langs_card(
+        self, params: dict[str, str], timings: dict[str, Any] | None = None
+    ) -> RenderedCard:
+        weighting = params.get("weighting") or None
+        if weighting is not None and weighting not in WEIGHTING_PRESETS:
+            raise ValidationError(f"Invalid value for 'weighting': {weighting!r}")
+
+        fetch_config = LangsFetchConfig.from_query_params({**params, "token": self.token})
+        given = {k.replace("-", "_") for k, v in params.items() if v}
+        fetch_config.size_weight, fetch_config.count_weight = resolve_language_weights(
+            weighting,
+            fetch_config.size_weight if "size_weight" in given else None,
+            fetch_config.count_weight if "count_weight" in given else None,
+        )
+        render_config = LangsCardConfig.from_query_params(params)
+        return self._cached_render(
+            "top-langs",
+            fetch_config,
+            render_config,
+            lambda: fetch_top_languages(
+                username=fetch_config.username,
+                token=fetch_config.token,
+                exclude_repo=fetch_config.exclude_repo,
+                size_weight=fetch_config.size_weight,
+                count_weight=fetch_config.count_weight,
+                client=self.client,
+            ),
+            lambda langs: render_top_languages(langs, render_config),
+            timings,
+        )
+
+    def _contrib_card(
+        self, params: dict[str, str], timings: dict[str, Any] | None = None
+    ) -> RenderedCard:
+        fetch_config = ContribFetchConfig.from_query_params({**params, "token": self.token})
+        render_config = ContribCardConfig.from_query_params(params)
+        return self._cached_render(
+            "contrib",
+            fetch_config,
+            render_config,
+            lambda: fetch_contributor_stats(fetch_config, client=self.client),
+            lambda stats: render_contrib_card(stats, render_config),
+            timings,
+        )
+
+    def _leaderboard_card(
+        self, params: dict[str, str], timings: dict[str, Any] | None = None
+    ) -> RenderedCard:
+        fetch_config = LeaderboardFetchConfig.from_query_params({**params, "token": self.token})
+        render_config = LeaderboardCardConfig.from_query_params(params)
+        options = leaderboard_fetch_options(fetch_config)
+
+        def fetch_user(login: str) -> UserStats:
+            # Reuses fresh /stats?username=<login> entries, but caches members
+            # separately so a large board cannot evict other users' cards
+            user_config = FetchConfig(username=login, token=self.token, **options)
+            key = _fetch_key("stats", user_config)
+            stats = self.fetch_cache.peek(key)
+            if stats is not None:
+                return cast(UserStats, stats)
+            return self.member_cache.get(key, self._user_stats_fetcher(user_config))
+
+        # Ranks are computed at fetch time, so with live ranking they follow
+        # the sketch as of the last leaderboard refresh
+        def fetch() -> Leaderboard:
+            return fetch_leaderboard(
+                fetch_config,
+                client=self.client,
+                fetch_user=fetch_user,
+                calibration=self._live_rank_view(),
+            )
+
+        return self._cached_render(
+            "leaderboard",
+            fetch_config,
+            render_config,
+            fetch,
+            lambda board: render_leaderboard_card(board, render_config),
+            timings,
+        )
+
+
+def render_error_card(message: str) -> str:
+    """
+    Render a minimal error card.
+
+    Args:
+        message: Error message to display
+
+    Returns:
+        SVG string
+    """
+    body = f'<text x="25" y="15" class="stat">{encode_html(message[:80])}</text>'
+    return render_card(
+        title="Something went wrong",
+        body=body,
+        width=467,
+        height=100,
+        a11y_desc="Error card",
+    )
+
+
+def make_handler(card_server: CardServer) -> type[BaseHTTPRequestHandler]:
+    """
+    Build a request handler class bound to a CardServer.
+
+    Args:
+        card_server: Service instance shared by all request threads
+
+    Returns:
+        BaseHTTPRequestHandler subclass
+    """
+
+    class CardRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            parts = urlsplit(self.path)
+            response = card_server.handle(
+                parts.path,
+                parts.query,
+                self.headers.get("If-None-Match"),
+                self.headers.get("Accept-Encoding"),
+            )
+            self.send_response(response.status)
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(response.body)))
+            self.end_headers()
+            self.wfile.write(response.body)
+
+    return CardRequestHandler
+
+
+def create_http_server(card_server: CardServer, host: str, port: int) -> ThreadingHTTPServer:
+    """
+    Create a threaded HTTP server for the given CardServer.
+
+    Args:
+        card_server: Service instance handling requests
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        Configured server; call serve_forever() to start handling requests
+    """
+    return ThreadingHTTPServer((host, port), make_handler(card_server))
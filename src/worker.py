@@ -0,0 +1,172 @@
+"""Long-lived worker that renders cards for JSON-line jobs read from a stream."""
+
+import json
+import time
+import traceback
+from typing import IO, Any
+
+from .core.exceptions import GitHubStatsCardError, ValidationError
+from .core.output import write_output
+from .server import CardServer
+
+
+def _query_value(value: Any) -> str:
+    """Convert a JSON option value to the query-string form configs accept."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list | tuple):
+        return ",".join(str(v) for v in value)
+    return str(value)
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+class StdioWorker:
+    """
+    Card worker fed with one JSON job per line.
+
+    A worker keeps the interpreter, the pooled GitHub client, theme tables and
+    the fetch and render caches of its CardServer warm across jobs, so a
+    scheduler can push many jobs through a few long-lived processes instead
+    of spawning one per card.
+
+    Each job is an object such as::
+
+        {"id": 7, "card": "stats", "username": "octocat",
+         "options": {"theme": "dark", "show_icons": true, "hide": ["prs"]},
+         "output": "cards/octocat-stats.svg"}
+
+    Options use the CLI option names (hyphens or underscores). Without
+    "output" the SVG is returned in the reply. Every job gets exactly one
+    reply line, echoing its id, with "ok", a "status" (generated, unchanged
+    or rendered) or an "error", and timings in milliseconds. The job
+    ``{"op": "metrics"}`` replies with the server's cache counters.
+
+    Args:
+        card_server: Service that fetches, renders and caches cards
+    """
+
+    def __init__(self, card_server: CardServer):
+        self.card_server = card_server
+        self.jobs = 0
+        self.failures = 0
+
+    def handle_job(self, job: Any) -> dict[str, Any]:
+        """
+        Run one job.
+
+        Args:
+            job: Decoded job object
+
+        Returns:
+            Reply object
+        """
+        start = time.perf_counter()
+        job_id = job.get("id") if isinstance(job, dict) else None
+        try:
+            if not isinstance(job, dict):
+                raise ValidationError("Job must be a JSON object")
+            if job.get("op") == "metrics":
+                return {"id": job_id, "ok": True, "metrics": self.card_server.metrics()}
+            reply = self._run(job)
+        except (GitHubStatsCardError, OSError) as e:
+            self.failures += 1
+            reply = {"ok": False, "error": str(e), "error_type": type(e).__name__}
+        except Exception as e:  # noqa: BLE001
+            # Keep serving: one bad job must not take the worker down, but
+            # this is a bug, so leave its traceback on stderr for diagnosis
+            traceback.print_exc()
+            self.failures += 1
+            reply = {
+                "ok": False,
+                "error": f"Unexpected error: {e}",
+                "error_type": type(e).__name__,
+            }
+        finally:
+            self.jobs += 1
+
+        reply.setdefault("timings", {})["total_ms"] = _elapsed_ms(start)
+        return {"id": job_id, **reply}
+
+    def handle_line(self, line: str) -> dict[str, Any] | None:
+        """
+        Decode and run one input line.
+
+        Args:
+            line: Raw input line
+
+        Returns:
+            Reply object, or None for blank lines
+        """
+        if not line.strip():
+            return None
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as e:
+            self.jobs += 1
+            self.failures += 1
+            return {
+                "id": None,
+                "ok": False,
+                "error": f"Invalid JSON: {e}",
+                "error_type": type(e).__name__,
+            }
+        return self.handle_job(job)
+
+    def serve(self, infile: IO[str], outfile: IO[str]) -> int:
+        """
+        Process jobs until the input stream is closed.
+
+        Replies are written and flushed one line per job, in input order.
+
+        Args:
+            infile: Text stream of JSON-line jobs
+            outfile: Text stream receiving JSON-line replies
+
+        Returns:
+            Number of jobs processed
+        """
+        for line in infile:
+            reply = self.handle_line(line)
+            if reply is None:
+                continue
+            outfile.write(json.dumps(reply, separators=(",", ":")) + "\n")
+            outfile.flush()
+        return self.jobs
+
+    def _run(self, job: dict[str, Any]) -> dict[str, Any]:
+        card_type = job.get("card")
+        if not isinstance(card_type, str):
+            raise ValidationError("Missing required field: card")
+        options = job.get("options") or {}
+        if not isinstance(options, dict):
+            raise ValidationError("Field 'options' must be an object")
+
+        params = {k: _query_value(v) for k, v in options.items() if v is not None}
+        params["username"] = str(job.get("username") or params.get("username", ""))
+
+        timings: dict[str, Any] = {}
+        card = self.card_server.render(card_type, params, timings)
+        reply: dict[str, Any] = {
+            "ok": True,
+            "card": card_type,
+            "bytes": len(card.svg),
+            "etag": card.etag,
+            "render_cached": timings.pop("render_cached"),
+            "timings": {k: round(v, 3) for k, v in timings.items()},
+        }
+
+        output = job.get("output")
+        if output is None:
+            reply["status"] = "rendered"
+            reply["svg"] = card.svg.decode("utf-8")
+            return reply
+
+        write_start = time.perf_counter()
+        written = write_output(str(output), card.svg)
+        reply["timings"]["write_ms"] = _elapsed_ms(write_start)
+        reply["status"] = "generated" if written else "unchanged"
+        reply["output"] = str(output)
+        return reply
@@ -0,0 +1,137 @@
+"""Tests for in-memory caches."""
+
+from concurrent.futures import Executor, Future
+
+import pytest
+
+from src.core.cache import StaleWhileRevalidateCache
+from src.core.exceptions import APIError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ImmediateExecutor(Executor):
+    """Executor running submitted work synchronously."""
+
+    def submit(self, fn, /, *args, **kwargs):  # type: ignore[override]
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:  # noqa: BLE001
+            future.set_exception(e)
+        return future
+
+
+def make_swr(clock: FakeClock, **kwargs) -> StaleWhileRevalidateCache[str, int]:
+    return StaleWhileRevalidateCache(
+        fresh_ttl=10,
+        stale_ttl=20,
+        stale_if_error_ttl=100,
+        executor=ImmediateExecutor(),
+        clock=clock,
+        **kwargs,
+    )
+
+
+def test_swr_fresh_hit_does_not_reload():
+    clock = FakeClock()
+    cache = make_swr(clock)
+    assert cache.get("a", lambda: 1) == 1
+    clock.now = 5
+    assert cache.get("a", lambda: 2) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_swr_stale_served_and_refreshed_in_background():
+    clock = FakeClock()
+    cache = make_swr(clock)
+    cache.get("a", lambda: 1)
+
+    clock.now = 15
+    # Stale value is returned immediately, refresh stores the new one
+    assert cache.get("a", lambda: 2) == 1
+    assert cache.stale_hits == 1
+    assert cache.get("a", lambda: 3) == 2
+    assert cache.refreshing == 0
+
+
+def test_swr_failed_refresh_keeps_stale_value():
+    clock = FakeClock()
+    cache = make_swr(clock)
+    cache.get("a", lambda: 1)
+
+    def failing() -> int:
+        raise APIError("down")
+
+    clock.now = 15
+    assert cache.get("a", failing) == 1
+    assert cache.refresh_errors == 1
+    assert cache.get("a", failing) == 1
+
+
+def test_swr_expired_entry_loads_synchronously():
+    clock = FakeClock()
+    cache = make_swr(clock)
+    cache.get("a", lambda: 1)
+    clock.now = 31
+    assert cache.get("a", lambda: 2) == 2
+    assert cache.misses == 2
+
+
+def test_swr_stale_if_error():
+    clock = FakeClock()
+    cache = make_swr(clock)
+    cache.get("a", lambda: 1)
+
+    def failing() -> int:
+        raise APIError("rate limit exhausted")
+
+    clock.now = 50
+    assert cache.get("a", failing) == 1
+    assert cache.stale_errors == 1
+
+    # Past the stale-if-error window the error propagates
+    clock.now = 111
+    with pytest.raises(APIError):
+        cache.get("a", failing)
+
+
+def test_swr_unexpected_errors_propagate():
+    clock = FakeClock()
+    cache = make_swr(clock)
+    cache.get("a", lambda: 1)
+    clock.now = 50
+
+    def broken() -> int:
+        raise KeyError("bug")
+
+    with pytest.raises(KeyError):
+        cache.get("a", broken)
+
+
+def test_swr_lru_eviction():
+    clock = FakeClock()
+    cache = make_swr(clock, maxsize=1)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    assert len(cache) == 1
+    assert cache.get("a", lambda: 3) == 3
+
+
+def test_swr_peek_returns_fresh_values_only():
+    clock = FakeClock()
+    cache = make_swr(clock)
+    assert cache.peek("a") is None
+    cache.get("a", lambda: 1)
+    assert cache.peek("a") == 1
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    clock.now = 15
+    assert cache.peek("a") is None
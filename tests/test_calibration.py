@@ -0,0 +1,255 @@
+"""Tests for rank calibration tables."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.core.config import StatsCardConfig
+from src.core.constants import CALIBRATION_SCHEMA_VERSION
+from src.core.exceptions import ValidationError
+from src.github.calibration import (
+    CalibrationBuilder,
+    RankCalibration,
+    dump_calibration,
+    iter_snapshot_paths,
+    load_calibration,
+)
+from src.github.rank import calculate_user_rank
+from src.github.snapshot import Snapshot, dump_snapshot
+
+DOCUMENT = {"schema": CALIBRATION_SCHEMA_VERSION, "users": 1, "created_at": "", "quantiles": {}}
+
+
+def _stats(login: str, value: int) -> dict:
+    return {
+        "name": login,
+        "login": login,
+        "totalCommits": value,
+        "totalPRs": value,
+        "mergedPRs": 0,
+        "totalIssues": value,
+        "totalStars": value,
+        "contributedTo": 0,
+        "followers": value,
+        "totalReviews": value,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+
+
+def _calibration(values: range = range(1, 101), points: int = 100) -> RankCalibration:
+    builder = CalibrationBuilder()
+    for value in values:
+        builder.add(_stats(f"user{value}", value))
+    return builder.build(points)
+
+
+def test_builder_quantiles():
+    calibration = _calibration()
+    table = calibration.quantiles["stars"]
+    assert calibration.users == 100
+    assert len(table) == 101
+    assert table[0] == 1
+    assert table[50] == 50
+    assert table[-1] == 100
+    # Nobody was fetched with include_all_commits
+    assert "all_commits" not in calibration.quantiles
+    assert "commits" in calibration.quantiles
+
+
+def test_builder_add_columns_matches_add():
+    columns = {field: list(range(1, 101)) for field in _stats("x", 0)}
+    builder = CalibrationBuilder()
+    builder.add_columns(columns, all_commits=True)
+    calibration = builder.build(100)
+
+    assert calibration.quantiles["stars"] == _calibration().quantiles["stars"]
+    assert "commits" not in calibration.quantiles
+    assert calibration.quantiles["all_commits"][-1] == 100
+
+
+def test_builder_add_columns_validates():
+    builder = CalibrationBuilder()
+    with pytest.raises(ValidationError, match="Missing column"):
+        builder.add_columns({"totalStars": [1]})
+    columns = {field: [1, 2] for field in _stats("x", 0)}
+    columns["followers"] = [1]
+    with pytest.raises(ValidationError, match="same length"):
+        builder.add_columns(columns)
+    assert builder.users == 0
+
+
+def test_build_requires_users_and_points():
+    with pytest.raises(ValidationError, match="No user stats"):
+        CalibrationBuilder().build()
+    builder = CalibrationBuilder()
+    builder.add(_stats("octocat", 1))
+    with pytest.raises(ValidationError, match="quantile step"):
+        builder.build(0)
+
+
+def test_cdf():
+    calibration = _calibration()
+    assert calibration.cdf("stars", 0) == 0.0
+    assert calibration.cdf("stars", 1) == 0.0
+    assert calibration.cdf("stars", 50) == pytest.approx(0.5)
+    assert calibration.cdf("stars", 50.5) == pytest.approx(0.505)
+    assert calibration.cdf("stars", 1000) == 1.0
+    assert calibration.cdf("all_commits", 10) is None
+
+
+def test_cdf_with_repeated_values():
+    calibration = _calibration(range(4), points=8)
+    assert calibration.quantiles["stars"] == (0, 0, 0, 1, 1, 2, 2, 3, 3)
+    assert 0 <= calibration.cdf("stars", 1) <= calibration.cdf("stars", 2) <= 1
+
+
+def test_calibration_round_trip(tmp_path):
+    calibration = _calibration()
+    path = tmp_path / "calibration.json"
+    size = dump_calibration(calibration, str(path))
+
+    document = json.loads(path.read_bytes())
+    assert size == path.stat().st_size
+    assert document["schema"] == CALIBRATION_SCHEMA_VERSION
+    assert load_calibration(str(path)) == calibration
+
+
+@pytest.mark.parametrize(
+    "document, message",
+    [
+        ([], "Not a github-stats-card calibration"),
+        ({"schema": 999}, "Unsupported calibration schema"),
+        ({"schema": CALIBRATION_SCHEMA_VERSION}, "Malformed"),
+        ({**DOCUMENT, "quantiles": {"forks": [0, 1]}}, "Unknown calibration metric"),
+        ({**DOCUMENT, "quantiles": {"stars": [2, 1]}}, "must be sorted"),
+    ],
+)
+def test_from_dict_rejects_invalid_documents(document, message):
+    with pytest.raises(ValidationError, match=message):
+        RankCalibration.from_dict(document)
+
+
+def test_load_calibration_rejects_non_json(tmp_path):
+    path = tmp_path / "calibration.json"
+    path.write_bytes(b"not json")
+    with pytest.raises(ValidationError, match="Cannot decode"):
+        load_calibration(str(path))
+
+
+def test_calibrated_rank():
+    calibration = _calibration()
+    best = calculate_user_rank(100, 100, 100, 100, 100, 100, calibration=calibration)
+    middle = calculate_user_rank(50, 50, 50, 50, 50, 50, calibration=calibration)
+    worst = calculate_user_rank(1, 1, 1, 1, 1, 1, calibration=calibration)
+
+    assert best["percentile"] == pytest.approx(0)
+    assert middle["percentile"] == pytest.approx(50, abs=1)
+    assert worst["percentile"] == pytest.approx(100)
+    assert calculate_user_rank(50, 50, 50, 50, 50, 50)["percentile"] != middle["percentile"]
+
+
+def test_calibrated_rank_falls_back_for_missing_metrics():
+    calibration = RankCalibration(users=1, quantiles={})
+    assert calculate_user_rank(10, 2, 3, 1, 20, 5, calibration=calibration) == (
+        calculate_user_rank(10, 2, 3, 1, 20, 5)
+    )
+
+
+def test_rank_calibration_is_not_a_query_param():
+    config = StatsCardConfig.from_query_params(
+        {"username": "octocat", "rank_calibration": "/etc/passwd"}
+    )
+    assert config.rank_calibration is None
+
+
+def test_iter_snapshot_paths(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "two.json.gz").write_bytes(b"")
+    (tmp_path / "a.json").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    single = tmp_path / "other.txt"
+
+    paths = list(iter_snapshot_paths([str(tmp_path), str(single)]))
+    assert paths == [
+        str(tmp_path / "a.json"),
+        str(tmp_path / "b" / "two.json.gz"),
+        str(single),
+    ]
+
+
+def test_cli_calibrate_and_rank(tmp_path):
+    corpus = tmp_path / "snapshots"
+    for value in range(1, 11):
+        dump_snapshot(
+            Snapshot(username=f"user{value}", stats=_stats(f"user{value}", value)),
+            str(corpus / f"user{value}.json"),
+        )
+    dump_snapshot(Snapshot(username="langs-only"), str(corpus / "langs-only.json"))
+    (corpus / "broken.json").write_bytes(b"{")
+    table = tmp_path / "calibration.json"
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["calibrate", str(corpus), "-o", str(table), "--points", "10"])
+
+    assert result.exit_code == 0, result.output
+    assert "10 users" in result.output
+    assert "1 unreadable" in result.output
+    assert load_calibration(str(table)).quantiles["stars"][-1] == 10
+
+    with (
+        patch("src.cli.fetch_stats", return_value=_stats("octocat", 10)),
+        patch("src.cli.render_stats_card", return_value="<svg>stats</svg>") as mock_render,
+    ):
+        result = runner.invoke(
+            cli,
+            [
+                "stats",
+                "-u",
+                "octocat",
+                "-t",
+                "token",
+                "-o",
+                str(tmp_path / "stats.svg"),
+                "--rank-calibration",
+                str(table),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    config = mock_render.call_args[0][1]
+    assert config.rank_calibration == load_calibration(str(table))
+
+
+def test_cli_calibrate_without_stats(tmp_path):
+    snapshot = tmp_path / "langs.json"
+    dump_snapshot(Snapshot(username="octocat"), str(snapshot))
+    result = CliRunner().invoke(
+        cli, ["calibrate", str(snapshot), "-o", str(tmp_path / "calibration.json")]
+    )
+    assert result.exit_code == 1
+    assert "No user stats" in result.output
+
+
+def test_cli_rejects_invalid_calibration(tmp_path):
+    table = tmp_path / "calibration.json"
+    table.write_text("{}")
+    result = CliRunner().invoke(
+        cli,
+        [
+            "stats",
+            "-u",
+            "octocat",
+            "-t",
+            "token",
+            "-o",
+            str(tmp_path / "stats.svg"),
+            "--rank-calibration",
+            str(table),
+        ],
+    )
+    assert result.exit_code == 1
+    assert "Invalid rank calibration" in result.output
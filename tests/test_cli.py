@@ -1,11 +1,14 @@
 """Integration tests for CLI commands."""
 
+import gzip
 from unittest.mock import patch
 from click.testing import CliRunner
 from src.cli import cli
+from src.core.exceptions import FetchError
+from src.github.langs_fetcher import Language
 
 
-def test_stats_command():
+def test_stats_command(tmp_path):
     runner = CliRunner()
     with (
         patch("src.cli.fetch_stats") as mock_fetch,
@@ -28,13 +31,14 @@ def test_stats_command():
         }
         mock_render.return_value = "<svg>stats</svg>"
 
-        result = runner.invoke(cli, ["stats", "-u", "user", "-t", "token", "-o", "stats.svg"])
+        output = str(tmp_path / "stats.svg")
+        result = runner.invoke(cli, ["stats", "-u", "user", "-t", "token", "-o", output])
 
         assert result.exit_code == 0
         assert "Generated" in result.stderr
 
 
-def test_top_langs_command():
+def test_top_langs_command(tmp_path):
     runner = CliRunner()
     with (
         patch("src.cli.fetch_top_languages") as mock_fetch,
@@ -44,13 +48,14 @@ def test_top_langs_command():
         mock_fetch.return_value = [{"name": "Python", "color": "#3572A5", "size": 100}]
         mock_render.return_value = "<svg>langs</svg>"
 
-        result = runner.invoke(cli, ["top-langs", "-u", "user", "-t", "token", "-o", "langs.svg"])
+        output = str(tmp_path / "langs.svg")
+        result = runner.invoke(cli, ["top-langs", "-u", "user", "-t", "token", "-o", output])
 
         assert result.exit_code == 0
         assert "Generated" in result.stderr
 
 
-def test_contrib_command():
+def test_contrib_command(tmp_path):
     runner = CliRunner()
     with (
         patch("src.cli.fetch_contributor_stats") as mock_fetch,
@@ -62,7 +67,313 @@ def test_contrib_command():
         }
         mock_render.return_value = "<svg>contrib</svg>"
 
-        result = runner.invoke(cli, ["contrib", "-u", "user", "-t", "token", "-o", "contrib.svg"])
+        output = str(tmp_path / "contrib.svg")
+        result = runner.invoke(cli, ["contrib", "-u", "user", "-t", "token", "-o", output])
 
         assert result.exit_code == 0
         assert "Generated" in result.stderr
+
+
+def test_stats_command_render_cache_skips_unchanged_output(tmp_path):
+    runner = CliRunner()
+    output = tmp_path / "stats.svg"
+    cache_dir = tmp_path / "cache"
+    args = ["stats", "-u", "user", "-t", "token", "-o", str(output), "--cache-dir", str(cache_dir)]
+    stats_data = {
+        "name": "User",
+        "login": "user",
+        "totalStars": 100,
+        "totalCommits": 50,
+        "totalPRs": 10,
+        "mergedPRs": 5,
+        "totalIssues": 20,
+        "contributedTo": 5,
+        "followers": 10,
+        "totalReviews": 2,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+    with (
+        patch("src.cli.fetch_stats", return_value=stats_data),
+        patch("src.cli.render_stats_card", return_value="<svg>stats</svg>") as mock_render,
+    ):
+        first = runner.invoke(cli, args)
+        mtime = output.stat().st_mtime_ns
+        second = runner.invoke(cli, args)
+
+    assert first.exit_code == 0
+    assert "Generated" in first.stderr
+    assert second.exit_code == 0
+    assert "Unchanged" in second.stderr
+    assert mock_render.call_count == 1
+    assert output.read_bytes() == b"<svg>stats</svg>"
+    assert output.stat().st_mtime_ns == mtime
+
+
+def test_top_langs_command_minify(tmp_path):
+    runner = CliRunner()
+    output = tmp_path / "langs.svg"
+    with (
+        patch("src.cli.fetch_top_languages", return_value={}),
+        patch("src.cli.render_top_languages") as mock_render,
+    ):
+        mock_render.return_value = '<svg>\n  <g>\n    <text x="1.500">Top</text>\n  </g>\n</svg>'
+        result = runner.invoke(
+            cli, ["top-langs", "-u", "user", "-t", "token", "-o", str(output), "--minify"]
+        )
+
+    assert result.exit_code == 0
+    assert "Minified SVG" in result.stderr
+    assert output.read_text() == '<svg><text x="1.5">Top</text></svg>'
+    assert mock_render.call_args[0][1].minify is False
+
+
+def test_contrib_command_writes_compressed_outputs(tmp_path):
+    runner = CliRunner()
+    output = tmp_path / "contrib.svg"
+    svg = "<svg>" + "<text>contrib</text>" * 50 + "</svg>"
+    with (
+        patch("src.cli.fetch_contributor_stats", return_value={"repos": []}),
+        patch("src.cli.render_contrib_card", return_value=svg),
+    ):
+        result = runner.invoke(
+            cli,
+            ["contrib", "-u", "user", "-t", "token", "-o", str(output), "--compress", "svgz,gz"],
+        )
+
+    assert result.exit_code == 0
+    assert gzip.decompress((tmp_path / "contrib.svgz").read_bytes()) == svg.encode()
+    assert gzip.decompress((tmp_path / "contrib.svg.gz").read_bytes()) == svg.encode()
+    assert "contrib svgz" in result.stderr
+    assert "of original" in result.stderr
+
+
+def test_compress_option_rejects_unknown_format(tmp_path):
+    runner = CliRunner()
+    output = str(tmp_path / "stats.svg")
+    result = runner.invoke(
+        cli, ["stats", "-u", "user", "-t", "token", "-o", output, "--compress", "zip"]
+    )
+
+    assert result.exit_code == 2
+    assert "unknown format 'zip'" in result.output
+
+
+def test_generate_command_fetches_each_card_once(tmp_path):
+    runner = CliRunner()
+    stats_data = {"name": "User", "login": "user"}
+    with (
+        patch("src.cli.fetch_stats", return_value=stats_data) as fetch_stats,
+        patch("src.cli.fetch_top_languages", return_value={}) as fetch_langs,
+        patch("src.cli.fetch_contributor_stats", return_value={"repos": []}) as fetch_contrib,
+        patch("src.cli.render_stats_card", return_value="<svg>stats</svg>") as render_stats,
+        patch("src.cli.render_top_languages", return_value="<svg>langs</svg>") as render_langs,
+        patch("src.cli.render_contrib_card", return_value="<svg>contrib</svg>"),
+    ):
+        result = runner.invoke(
+            cli,
+            [
+                "generate",
+                "-u",
+                "user",
+                "-t",
+                "token",
+                "-d",
+                str(tmp_path),
+                "--theme",
+                "dark",
+                "--show-icons",
+                "--layout",
+                "compact",
+                "--hide-langs",
+                "HTML",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "stats.svg").read_text() == "<svg>stats</svg>"
+    assert (tmp_path / "top-langs.svg").read_text() == "<svg>langs</svg>"
+    assert (tmp_path / "contrib.svg").read_text() == "<svg>contrib</svg>"
+    for fetch in (fetch_stats, fetch_langs, fetch_contrib):
+        assert fetch.call_count == 1
+    # All fetches share one pooled client
+    clients = {
+        fetch_stats.call_args.kwargs["client"],
+        fetch_langs.call_args.kwargs["client"],
+        fetch_contrib.call_args.kwargs["client"],
+    }
+    assert len(clients) == 1
+    stats_config = render_stats.call_args.args[1]
+    langs_config = render_langs.call_args.args[1]
+    assert stats_config.theme == langs_config.theme == "dark"
+    assert stats_config.show_icons is True
+    assert langs_config.layout == "compact"
+    assert langs_config.hide == ["HTML"]
+    assert "3/3 cards in" in result.stderr
+    assert "sequential" in result.stderr
+
+
+def test_generate_command_matches_single_card_commands(tmp_path):
+    runner = CliRunner()
+    stats_data = {
+        "name": "User",
+        "login": "user",
+        "totalStars": 1500,
+        "totalCommits": 50,
+        "totalPRs": 10,
+        "mergedPRs": 5,
+        "totalIssues": 20,
+        "contributedTo": 5,
+        "followers": 10,
+        "totalReviews": 2,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+    langs_data = {"Python": Language(name="Python", color="#3572A5", size=100, count=1)}
+    base = ["-u", "user", "-t", "token"]
+    stats_options = ["--locale", "de", "--icon-color", "ff0000", "--number-format", "long"]
+    stats_options += ["--no-text-bold", "--rank-icon", "percentile", "--line-height", "30"]
+    with (
+        patch("src.cli.fetch_stats", return_value=stats_data) as fetch_stats,
+        patch("src.cli.fetch_top_languages", return_value=langs_data) as fetch_langs,
+    ):
+        single = [
+            runner.invoke(
+                cli,
+                ["stats", *base, "-o", str(tmp_path / "stats.svg"), *stats_options]
+                + ["--commits-year", "2023", "--custom-title", "Mine"],
+            ),
+            runner.invoke(
+                cli,
+                ["top-langs", *base, "-o", str(tmp_path / "top-langs.svg")]
+                + ["--stats-format", "bytes", "--size-weight", "0.5", "--custom-title", "Langs"],
+            ),
+        ]
+        generated = runner.invoke(
+            cli,
+            ["generate", *base, "--cards", "stats,top-langs", "-d", str(tmp_path / "gen")]
+            + [*stats_options, "--commits-year", "2023", "--stats-title", "Mine"]
+            + ["--stats-format", "bytes", "--size-weight", "0.5", "--langs-title", "Langs"],
+        )
+
+    for result in (*single, generated):
+        assert result.exit_code == 0, result.output
+    for card in ("stats", "top-langs"):
+        assert (tmp_path / "gen" / f"{card}.svg").read_text() == (
+            tmp_path / f"{card}.svg"
+        ).read_text()
+    assert fetch_stats.call_args_list[0].kwargs["commits_year"] == 2023
+    assert fetch_stats.call_args_list[1].kwargs["commits_year"] == 2023
+    assert fetch_langs.call_args_list[1].kwargs["size_weight"] == 0.5
+
+
+def test_generate_command_reports_failed_cards(tmp_path):
+    runner = CliRunner()
+    with (
+        patch("src.cli.fetch_stats", side_effect=FetchError("rate limited")),
+        patch("src.cli.fetch_contributor_stats", return_value={"repos": []}),
+        patch("src.cli.render_contrib_card", return_value="<svg>contrib</svg>"),
+    ):
+        result = runner.invoke(
+            cli,
+            ["generate", "-u", "user", "-t", "token", "-d", str(tmp_path)]
+            + ["--cards", "stats,contrib"],
+        )
+
+    assert result.exit_code == 1
+    assert "Error fetching stats data: rate limited" in result.stderr
+    assert not (tmp_path / "stats.svg").exists()
+    assert (tmp_path / "contrib.svg").read_text() == "<svg>contrib</svg>"
+    assert "1/2 cards in" in result.stderr
+
+
+def test_generate_command_propagates_programming_errors(tmp_path):
+    runner = CliRunner()
+    with patch("src.cli.fetch_stats", side_effect=KeyError("totalStars")):
+        result = runner.invoke(
+            cli, ["generate", "-u", "user", "-t", "token", "-d", str(tmp_path), "--cards", "stats"]
+        )
+
+    assert isinstance(result.exception, KeyError)
+    assert "Error fetching" not in result.stderr
+
+
+def test_generate_command_rejects_unknown_card_type(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["generate", "-u", "user", "-t", "token", "--cards", "stats,repo"])
+
+    assert result.exit_code == 2
+    assert "unknown card type 'repo'" in result.output
+
+
+def test_fetch_then_render_from_snapshot(tmp_path):
+    runner = CliRunner()
+    snapshot = tmp_path / "octocat.json.gz"
+    stats_data = {
+        "name": "User",
+        "login": "user",
+        "totalStars": 100,
+        "totalCommits": 50,
+        "totalPRs": 10,
+        "mergedPRs": 5,
+        "totalIssues": 20,
+        "contributedTo": 5,
+        "followers": 10,
+        "totalReviews": 2,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+    with (
+        patch("src.cli.fetch_stats", return_value=stats_data),
+        patch("src.cli.fetch_top_languages", return_value={}),
+    ):
+        fetched = runner.invoke(
+            cli,
+            ["fetch", "-u", "user", "-t", "secret-token", "-o", str(snapshot)]
+            + ["--cards", "stats,top-langs"],
+        )
+
+    assert fetched.exit_code == 0, fetched.output
+    assert b"secret-token" not in gzip.decompress(snapshot.read_bytes())
+
+    output = tmp_path / "stats.svg"
+    with (
+        patch("src.cli.fetch_stats") as mock_fetch,
+        patch("src.cli.render_stats_card", return_value="<svg>stats</svg>") as mock_render,
+    ):
+        rendered = runner.invoke(
+            cli,
+            ["render", "--from-snapshot", str(snapshot), "--card", "stats", "-o", str(output)]
+            + ["-O", "theme=dark", "-O", "show-icons=true", "--minify"],
+        )
+
+    assert rendered.exit_code == 0, rendered.output
+    mock_fetch.assert_not_called()
+    data, config = mock_render.call_args.args
+    assert data == stats_data
+    assert config.theme == "dark"
+    assert config.show_icons is True
+    assert output.read_text() == "<svg>stats</svg>"
+
+
+def test_render_from_snapshot_without_card_data(tmp_path):
+    runner = CliRunner()
+    snapshot = tmp_path / "snap.json"
+    with patch("src.cli.fetch_contributor_stats", return_value={"repos": []}):
+        runner.invoke(
+            cli, ["fetch", "-u", "user", "-t", "token", "-o", str(snapshot), "--cards", "contrib"]
+        )
+
+    result = runner.invoke(
+        cli,
+        ["render", "--from-snapshot", str(snapshot), "--card", "stats", "-o", "out.svg"],
+    )
+    bad_option = runner.invoke(
+        cli,
+        ["render", "--from-snapshot", str(snapshot), "--card", "contrib", "-o", "x", "-O", "x"],
+    )
+
+    assert result.exit_code == 1
+    assert "no stats data (available: contrib)" in result.stderr
+    assert bad_option.exit_code == 2
+    assert "expected KEY=VALUE" in bad_option.output
@@ -0,0 +1,67 @@
+"""Cold-start budget for the CLI entry point."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative `import src.cli` time (best of several runs). Eagerly importing
+# requests alone costs more than this on typical runners.
+CLI_IMPORT_BUDGET_US = 100_000
+
+# Loaded by fetchers and renderers only when a command actually runs
+DEFERRED_MODULES = [
+    "requests",
+    "src.github.fetcher",
+    "src.github.langs_fetcher",
+    "src.github.leaderboard",
+    "src.github.org_stats",
+    "src.rendering.themes",
+    "src.rendering.icons",
+    "src.core.i18n",
+    "src.server",
+]
+
+_IMPORTTIME_RE = re.compile(r"\|\s+(\d+) \| src\.cli$", re.MULTILINE)
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        ["stats", "--help"],
+        ["top-langs", "--help"],
+        ["contrib", "--help"],
+        ["leaderboard", "--help"],
+        ["org-stats", "--help"],
+        ["generate", "--help"],
+    ],
+)
+def test_cli_help_defers_fetchers_and_renderers(argv):
+    code = (
+        "import sys\n"
+        "from src.cli import cli\n"
+        f"cli({argv!r}, standalone_mode=False)\n"
+        f"print('loaded:', [m for m in {DEFERRED_MODULES!r} if m in sys.modules])\n"
+    )
+    result = _python("-c", code)
+    assert "Usage:" in result.stdout
+    assert "loaded: []" in result.stdout
+
+
+def test_cli_import_time_budget():
+    best = min(
+        int(_IMPORTTIME_RE.search(_python("-X", "importtime", "-c", "import src.cli").stderr)[1])
+        for _ in range(3)
+    )
+    assert best < CLI_IMPORT_BUDGET_US, f"import src.cli took {best}us"
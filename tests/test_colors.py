@@ -1,5 +1,7 @@
 """Tests for color parsing and validation."""
 
+import pytest
+
 from src.rendering.colors import (
     is_valid_hex_color,
     is_valid_gradient,
@@ -59,7 +61,7 @@ def test_get_card_colors_custom_overrides():
 
 def test_get_card_colors_gradient():
     colors = get_card_colors(bg_color="45,ff0000,00ff00")
-    assert colors["bgColor"] == ["45", "ff0000", "00ff00"]
+    assert colors["bgColor"] == ("45", "ff0000", "00ff00")
 
 
 def test_get_card_colors_ring_color_default():
@@ -71,3 +73,21 @@ def test_get_card_colors_ring_color_default():
 def test_get_card_colors_ring_color_custom():
     colors = get_card_colors(ring_color="ff0000")
     assert colors["ringColor"] == "#ff0000"
+
+
+def test_get_card_colors_is_memoized():
+    assert get_card_colors(theme="dark") is get_card_colors(theme="dark")
+    assert get_card_colors(title_color="ff0000") is get_card_colors(title_color="ff0000")
+    # Unknown themes without overrides share the default entry
+    assert get_card_colors(theme="no-such-theme") is get_card_colors()
+
+
+def test_get_card_colors_is_read_only():
+    colors = get_card_colors(bg_color="45,ff0000,00ff00")
+
+    with pytest.raises(TypeError):
+        colors["titleColor"] = "#000000"  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        colors["bgColor"].append("0000ff")  # type: ignore[union-attr]
+
+    assert get_card_colors(bg_color="45,ff0000,00ff00")["titleColor"] == "#2f80ed"
@@ -0,0 +1,63 @@
+"""Tests for compressed output helpers."""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+
+from src.core.compression import (
+    compress_variants,
+    compressed_path,
+    compression_ratio,
+    gzip_compress,
+)
+from src.core.exceptions import ValidationError
+
+SVG = b"<svg>" + b"<text>stats</text>" * 100 + b"</svg>"
+
+
+def test_gzip_compress_is_deterministic():
+    assert gzip_compress(SVG) == gzip_compress(SVG)
+    assert gzip.decompress(gzip_compress(SVG, level=1)) == SVG
+
+
+@pytest.mark.parametrize(
+    ("path", "fmt", "expected"),
+    [
+        ("out/stats.svg", "svgz", "out/stats.svgz"),
+        ("out/stats.SVG", "svgz", "out/stats.svgz"),
+        ("out/stats", "svgz", "out/statsz"),
+        ("out/stats.svg", "gz", "out/stats.svg.gz"),
+        ("out/stats.svg", "br", "out/stats.svg.br"),
+    ],
+)
+def test_compressed_path(path, fmt, expected):
+    assert compressed_path(path, fmt) == expected
+
+
+def test_compress_variants_shares_gzip_stream():
+    with patch("src.core.compression.gzip_compress", wraps=gzip_compress) as mock_gzip:
+        variants = compress_variants(SVG, ["svgz", "gz"], gzip_level=6)
+
+    assert list(variants) == ["svgz", "gz"]
+    assert variants["svgz"] is variants["gz"]
+    assert gzip.decompress(variants["gz"]) == SVG
+    mock_gzip.assert_called_once_with(SVG, level=6)
+
+
+def test_compress_variants_rejects_unknown_format():
+    with pytest.raises(ValidationError, match="Unknown compression format"):
+        compress_variants(SVG, ["zip"])
+
+
+def test_compress_variants_requires_brotli_for_br():
+    with (
+        patch("src.core.compression.brotli", None),
+        pytest.raises(ValidationError, match="brotli"),
+    ):
+        compress_variants(SVG, ["br"])
+
+
+def test_compression_ratio():
+    assert compression_ratio(200, 50) == 0.25
+    assert compression_ratio(0, 0) == 0.0
@@ -1,5 +1,8 @@
 """Tests for contributor card rendering logic."""
 
+import re
+import xml.dom.minidom
+
 from src.core.config import ContribCardConfig
 from src.rendering.contrib import render_contrib_card
 
@@ -102,3 +105,67 @@ def test_render_contrib_card_font_scaling():
     assert 'style="font-size: 8px;">A+<' in svg
     # S should have font-size: 10px
     assert 'style="font-size: 10px;">S<' in svg
+
+
+def test_render_contrib_card_embeds_each_avatar_once():
+    """Test that repositories sharing an avatar reference a single definition."""
+    stats = {
+        "repos": [
+            {
+                "name": f"owner{i % 2}/repo{i}",
+                "stars": 100 - i,
+                "commits": 1,
+                "prs": 0,
+                "issues": 0,
+                "reviews": 0,
+                "rank_level": "B",
+                "avatar_b64": f"avatar{i % 2}data" if i < 4 else None,
+            }
+            for i in range(5)
+        ]
+    }
+
+    svg = render_contrib_card(stats, ContribCardConfig())
+    dom = xml.dom.minidom.parseString(svg)
+
+    images = dom.getElementsByTagName("image")
+    assert [image.getAttribute("href") for image in images] == [
+        "data:image/png;base64,avatar0data",
+        "data:image/png;base64,avatar1data",
+    ]
+    assert all(image.parentNode.tagName == "defs" for image in images)
+
+    ids = [image.getAttribute("id") for image in images]
+    uses = dom.getElementsByTagName("use")
+    expected = [f"#{ids[0]}", f"#{ids[1]}", f"#{ids[0]}", f"#{ids[1]}"]
+    assert [use.getAttribute("href") for use in uses] == expected
+    xlink = "http://www.w3.org/1999/xlink"
+    assert [use.getAttributeNS(xlink, "href") for use in uses] == expected
+    # Repos without an avatar keep the fallback circle
+    assert svg.count('opacity="0.5"') == 1
+
+
+def test_render_contrib_card_avatar_ids_are_stable():
+    """Test that avatar ids depend only on the image data."""
+
+    def render(names):
+        repos = [
+            {
+                "name": name,
+                "stars": 1,
+                "commits": 1,
+                "prs": 0,
+                "issues": 0,
+                "reviews": 0,
+                "rank_level": "C",
+                "avatar_b64": f"{name.split('/')[0]}-avatar",
+            }
+            for name in names
+        ]
+        return render_contrib_card({"repos": repos}, ContribCardConfig())
+
+    first = render(["a/x", "b/y"])
+    second = render(["b/y", "a/x"])
+    ids = set(re.findall(r'<image id="(avatar-[0-9a-f]{12})"', first))
+    assert len(ids) == 2
+    assert ids == set(re.findall(r'<image id="(avatar-[0-9a-f]{12})"', second))
@@ -363,3 +363,129 @@ def test_fetch_contributor_stats_rank_calculation(mock_client):
     # Check Repo A
     a_repo = next(r for r in stats["repos"] if r["name"] == "owner/repo-a")
     assert a_repo["rank_level"] == "A-"  # 1001 Stars, 50 commits
+
+
+def test_fetch_contributor_stats_requests_history_only_for_commit_repos(mock_client):
+    """History is only requested with commit contributions."""
+    setup_mock_response(mock_client, [])
+
+    fetch_contributor_stats(ContribFetchConfig(username="user", token="token"))
+
+    query = mock_client.graphql_query.call_args_list[1].args[0]
+    sections = query.split("ContributionsByRepository")
+    assert "history" in sections[1]
+    assert all("history" not in section for section in sections[2:])
+
+
+def test_fetch_contributor_stats_history_for_displayed_pr_repos(mock_client):
+    """Repos only seen through PRs get their history if they are displayed."""
+    years_response = {"data": {"user": {"contributionsCollection": {"contributionYears": [2024]}}}}
+
+    def pr_repo(name, stars):
+        return {
+            "repository": {
+                "nameWithOwner": name,
+                "isPrivate": False,
+                "stargazers": {"totalCount": stars},
+                "owner": {"avatarUrl": "url", "login": name.split("/")[0]},
+            },
+            "contributions": {"totalCount": 1},
+        }
+
+    contribs_response = {
+        "data": {
+            "user": {
+                "contributionsCollection": {
+                    "commitContributionsByRepository": [],
+                    "pullRequestContributionsByRepository": [
+                        pr_repo("org/big", 10001),
+                        pr_repo("org/skip", 20000),
+                        pr_repo("org/small", 5),
+                    ],
+                    "issueContributionsByRepository": [],
+                    "pullRequestReviewContributionsByRepository": [],
+                }
+            }
+        }
+    }
+    history_response = {"data": {"r0": {"object": {"history": {"totalCount": 6000}}}}}
+    mock_client.graphql_query.side_effect = [years_response, contribs_response, history_response]
+
+    config = ContribFetchConfig(username="user", token="token", limit=1, exclude_repo=["org/skip"])
+    stats = fetch_contributor_stats(config)
+
+    history_query = mock_client.graphql_query.call_args_list[2].args[0]
+    assert 'r0: repository(owner: "org", name: "big")' in history_query
+    assert "skip" not in history_query and "small" not in history_query
+    assert [r["name"] for r in stats["repos"]] == ["org/big"]
+    assert stats["repos"][0]["rank_level"] == "S+"
+
+
+def test_fetch_stats_stops_paginating_after_unstarred_repos():
+    """Star pagination ends once a page ends with a repo without stars."""
+    from src.github.fetcher import fetch_stats
+
+    def page(stars, has_next):
+        return {
+            "nodes": [{"stargazers": {"totalCount": s}} for s in stars],
+            "pageInfo": {"hasNextPage": has_next, "endCursor": "cursor"},
+        }
+
+    user = {
+        "name": "User",
+        "login": "user",
+        "contributionsCollection": {
+            "totalCommitContributions": 1,
+            "totalPullRequestReviewContributions": 0,
+        },
+        "repositoriesContributedTo": {"totalCount": 0},
+        "pullRequests": {"totalCount": 0},
+        "mergedPullRequests": {"totalCount": 0},
+        "openIssues": {"totalCount": 0},
+        "closedIssues": {"totalCount": 0},
+        "followers": {"totalCount": 0},
+        "repositories": page([5, 2], True),
+    }
+    with patch("src.github.fetcher.GitHubClient") as MockClient:
+        client = MockClient.return_value
+        client.rest_get.return_value = {}
+        client.graphql_query.side_effect = [
+            {"data": {"user": user}},
+            {"data": {"user": {"repositories": page([1, 0], True)}}},
+        ]
+        stats = fetch_stats("user", "token")
+
+    assert stats["totalStars"] == 8
+    assert client.graphql_query.call_count == 2
+
+
+def test_records_keep_the_dict_interface():
+    """Slotted records read like the dicts they replaced."""
+    import dataclasses
+
+    from src.github.fetcher import ContributorRepo
+    from src.rendering.cache import stable_hash
+
+    as_dict = {
+        "name": "org/repo",
+        "stars": 10,
+        "commits": 1,
+        "prs": 2,
+        "issues": 0,
+        "reviews": 0,
+        "rank_level": "B",
+        "avatar_b64": None,
+    }
+    repo = ContributorRepo(**as_dict)
+
+    assert repo["stars"] == repo.stars == 10
+    assert repo.get("missing", "x") == "x"
+    assert "rank_level" in repo and "keys" not in repo
+    assert dict(repo) == as_dict and list(repo) == list(as_dict)
+    assert repo == as_dict
+    assert stable_hash(repo) == stable_hash(as_dict)
+    with pytest.raises(KeyError):
+        repo["keys"]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        repo.stars = 11  # type: ignore[misc]
+    assert not hasattr(repo, "__dict__")
@@ -0,0 +1,73 @@
+"""Tests for icon sprites."""
+
+import xml.dom.minidom
+
+from src.core.config import StatsCardConfig
+from src.rendering.icons import ICONS, get_icon_sprite, get_icon_use
+from src.rendering.stats import render_stats_card
+
+STATS = {
+    "name": "The Octocat",
+    "login": "octocat",
+    "totalCommits": 100,
+    "totalPRs": 50,
+    "mergedPRs": 40,
+    "totalIssues": 25,
+    "totalStars": 200,
+    "contributedTo": 10,
+    "followers": 50,
+    "totalReviews": 5,
+    "discussionsStarted": 2,
+    "discussionsAnswered": 1,
+}
+
+
+def test_icon_sprite_defines_each_icon_once():
+    sprite = get_icon_sprite(("star", "prs_merged", "prs_merged", "unknown"))
+
+    assert sprite.count("<symbol") == 2
+    assert 'id="icon-star"' in sprite
+    assert 'id="icon-prs_merged"' in sprite
+    assert ICONS["star"] in sprite
+    assert get_icon_sprite(("star", "prs_merged", "prs_merged", "unknown")) is sprite
+
+
+def test_icon_sprite_empty_for_unknown_icons():
+    assert get_icon_sprite(()) == ""
+    assert get_icon_sprite(("unknown",)) == ""
+    assert get_icon_use("unknown") == ""
+
+
+def test_icon_use_sets_xlink_href():
+    use = xml.dom.minidom.parseString(get_icon_use("star")).documentElement
+
+    assert use.getAttribute("href") == "#icon-star"
+    assert use.getAttributeNS("http://www.w3.org/1999/xlink", "href") == "#icon-star"
+
+
+def test_stats_card_references_shared_icon_symbols():
+    config = StatsCardConfig(show_icons=True, show=["prs_merged", "prs_merged_percentage"])
+    svg = render_stats_card(STATS, config)
+    dom = xml.dom.minidom.parseString(svg)
+
+    symbols = [s.getAttribute("id") for s in dom.getElementsByTagName("symbol")]
+    uses = [u.getAttribute("href") for u in dom.getElementsByTagName("use")]
+
+    # Only the icon drawn twice goes through the sprite
+    assert symbols == ["icon-prs_merged"]
+    assert uses == ["#icon-prs_merged", "#icon-prs_merged"]
+    assert svg.count(ICONS["prs_merged"]) == 1
+    assert svg.count(ICONS["star"]) == 1
+
+
+def test_stats_card_draws_unshared_icons_inline():
+    svg = render_stats_card(STATS, StatsCardConfig(show_icons=True))
+    assert "<symbol" not in svg
+    assert "<use" not in svg
+    assert svg.count('data-testid="icon"') == 5
+
+
+def test_stats_card_without_icons_has_no_sprite():
+    svg = render_stats_card(STATS, StatsCardConfig())
+    assert "<symbol" not in svg
+    assert "<use" not in svg
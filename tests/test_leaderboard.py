@@ -0,0 +1,336 @@
+"""Tests for the leaderboard card."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.core.config import LeaderboardCardConfig, LeaderboardFetchConfig
+from src.core.constants import LEADERBOARD_MAX_MEMBERS
+from src.core.exceptions import FetchError, ValidationError
+from src.github.leaderboard import (
+    Leaderboard,
+    LeaderboardEntry,
+    fetch_leaderboard,
+    fetch_org_members,
+)
+from src.github.rank import calculate_user_rank
+from src.rendering.leaderboard import iter_leaderboard_card, render_leaderboard_card
+from src.server import CardServer
+
+
+def _stats(login: str, value: int, stars: int | None = None) -> dict:
+    return {
+        "name": login.title(),
+        "login": login,
+        "totalCommits": value,
+        "totalPRs": value,
+        "mergedPRs": 0,
+        "totalIssues": value,
+        "totalStars": value if stars is None else stars,
+        "contributedTo": 0,
+        "followers": value,
+        "totalReviews": value,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+
+
+# login -> activity; stars run the other way round
+POPULATION = {f"user{i}": i * 10 for i in range(20)}
+
+
+def _fetch_user(login: str) -> dict:
+    value = POPULATION[login]
+    return _stats(login, value, stars=200 - value)
+
+
+def _members_page(logins: list[str], cursor: str | None, total: int = 0) -> dict:
+    return {
+        "data": {
+            "organization": {
+                "membersWithRole": {
+                    "totalCount": total,
+                    "nodes": [{"login": login} for login in logins],
+                    "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+                }
+            }
+        }
+    }
+
+
+def test_fetch_org_members_pages_through_members():
+    client = MagicMock()
+    client.graphql_query.side_effect = [
+        _members_page(["alice", "bob"], "c1"),
+        _members_page(["carol"], None),
+    ]
+
+    assert fetch_org_members("acme", "token", client) == ["alice", "bob", "carol"]
+    assert client.graphql_query.call_args_list[1][0][1] == {"org": "acme", "after": "c1"}
+
+
+def test_fetch_org_members_rejects_large_orgs_on_first_page():
+    client = MagicMock()
+    client.graphql_query.return_value = _members_page(["alice", "bob"], "c1", total=5000)
+
+    with pytest.raises(ValidationError, match="has 5000 members; a leaderboard ranks at most 100"):
+        fetch_org_members("acme", "token", client, max_members=100)
+    assert client.graphql_query.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "response, message",
+    [
+        ({"data": {"organization": None}}, "not found"),
+        ({"errors": [{"message": "Bad credentials"}]}, "Bad credentials"),
+    ],
+)
+def test_fetch_org_members_errors(response, message):
+    client = MagicMock()
+    client.graphql_query.return_value = response
+    with pytest.raises(FetchError, match=message):
+        fetch_org_members("acme", "token", client)
+
+
+def test_leaderboard_by_rank_matches_calculate_user_rank():
+    config = LeaderboardFetchConfig(token="t", users=list(POPULATION), limit=3)
+    board = fetch_leaderboard(
+        config, client=MagicMock(), fetch_user=lambda login: _stats(login, POPULATION[login])
+    )
+
+    assert board["members"] == 20
+    assert [entry.login for entry in board["entries"]] == ["user19", "user18", "user17"]
+    expected = calculate_user_rank(190, 190, 190, 190, 190, 190)
+    assert board["entries"][0].percentile == expected["percentile"]
+    assert board["entries"][0].rank_level == expected["level"]
+
+
+def test_leaderboard_by_stat():
+    config = LeaderboardFetchConfig(token="t", users=list(POPULATION), sort_by="stars", limit=2)
+    board = fetch_leaderboard(config, client=MagicMock(), fetch_user=_fetch_user)
+
+    assert [(entry.login, entry.value) for entry in board["entries"]] == [
+        ("user0", 200),
+        ("user1", 190),
+    ]
+    assert board["entries"][0].rank_level == calculate_user_rank(0, 0, 0, 0, 200, 0)["level"]
+
+
+def test_leaderboard_dedupes_and_reports_failures():
+    def fetch_user(login: str) -> dict:
+        if login == "ghost":
+            raise FetchError("User not found")
+        return _fetch_user(login)
+
+    config = LeaderboardFetchConfig(token="t", users=["user1", "USER1", "ghost", "user2"])
+    mock_fetch = MagicMock(side_effect=fetch_user)
+    board = fetch_leaderboard(config, client=MagicMock(), fetch_user=mock_fetch)
+
+    assert sorted(call.args[0] for call in mock_fetch.call_args_list) == ["ghost", "user1", "user2"]
+    assert board["failed"] == ["ghost"]
+    assert board["members"] == 2
+
+
+def test_leaderboard_fails_when_no_user_fetched():
+    config = LeaderboardFetchConfig(token="t", users=["ghost"])
+    with pytest.raises(FetchError, match="any of 1 users"):
+        fetch_leaderboard(
+            config, client=MagicMock(), fetch_user=MagicMock(side_effect=FetchError("gone"))
+        )
+
+
+def test_leaderboard_bounds_concurrency():
+    active = peak = 0
+    lock = threading.Lock()
+
+    def fetch_user(login: str) -> dict:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return _fetch_user(login)
+
+    config = LeaderboardFetchConfig(token="t", users=list(POPULATION), concurrency=3)
+    fetch_leaderboard(config, client=MagicMock(), fetch_user=fetch_user)
+    assert 1 < peak <= 3
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({}, "either an organization or a list of users"),
+        ({"org": "acme", "users": ["alice"]}, "either an organization or a list of users"),
+        ({"org": "acme", "sort_by": "forks"}, "sort_by"),
+        ({"org": "acme", "limit": 0}, "limit"),
+        ({"org": "acme", "concurrency": 0}, "concurrency"),
+        ({"org": "acme", "max_members": 0}, "max_members"),
+        ({"users": ["a", "b", "c", "A"], "max_members": 2}, "lists 3 users; .* at most 2"),
+    ],
+)
+def test_leaderboard_validates_config(kwargs, message):
+    with pytest.raises(ValidationError, match=message):
+        fetch_leaderboard(LeaderboardFetchConfig(token="t", **kwargs), client=MagicMock())
+
+
+def test_leaderboard_fetches_optional_stats():
+    config = LeaderboardFetchConfig(token="t", users=["alice"], sort_by="discussions_started")
+    with patch("src.github.leaderboard.fetch_stats", return_value=_stats("alice", 1)) as mock:
+        fetch_leaderboard(config, client=MagicMock())
+    assert mock.call_args.kwargs["show"] == ["discussions_started"]
+
+
+def test_leaderboard_query_params_ignore_concurrency():
+    config = LeaderboardFetchConfig.from_query_params(
+        {
+            "token": "t",
+            "users": "alice,bob",
+            "concurrency": "500",
+            "max_members": "100000",
+            "limit": "5",
+        }
+    )
+    assert config.users == ["alice", "bob"]
+    assert config.limit == 5
+    assert config.concurrency == LeaderboardFetchConfig(token="t").concurrency
+    assert config.max_members == LEADERBOARD_MAX_MEMBERS
+
+
+BOARD = Leaderboard(
+    owner="acme",
+    sort_by="stars",
+    members=40,
+    failed=[],
+    entries=[
+        LeaderboardEntry("alice", "Alice <A>", 1500, "A+", 12.5),
+        LeaderboardEntry("bob", "", 20, "B", 60.0),
+    ],
+)
+
+
+def test_render_leaderboard_card():
+    svg = render_leaderboard_card(BOARD, LeaderboardCardConfig(theme="dark"))
+
+    assert "acme Leaderboard" in svg
+    assert "Alice &lt;A&gt;" in svg
+    # Users without a display name are listed by login
+    assert ">bob<" in svg
+    assert ">1.5k<" in svg
+    assert ">A+<" in svg
+    assert "Top 2 of 40 users" in svg
+    assert svg == "".join(iter_leaderboard_card(BOARD, LeaderboardCardConfig(theme="dark")))
+
+
+def test_render_leaderboard_card_options():
+    rank_board = Leaderboard(**{**BOARD, "sort_by": "rank", "owner": None})
+    svg = render_leaderboard_card(
+        rank_board, LeaderboardCardConfig(hide_rank=True, custom_title="Team")
+    )
+    assert "Top 12.5%" in svg
+    assert ">Team<" in svg
+    assert ">A+<" not in svg
+
+    long = render_leaderboard_card(BOARD, LeaderboardCardConfig(number_format="long"))
+    assert ">1500<" in long
+
+
+def test_render_empty_leaderboard():
+    empty = Leaderboard(**{**BOARD, "entries": [], "members": 0})
+    assert "No members found" in render_leaderboard_card(empty, LeaderboardCardConfig())
+
+
+def test_server_leaderboard_reuses_stats_cache():
+    server = CardServer("token")
+    with patch(
+        "src.server.fetch_stats", side_effect=lambda **kw: _stats(kw["username"], 5)
+    ) as mock_fetch:
+        server.handle("/stats", "username=alice")
+        response = server.handle("/leaderboard", "users=alice,bob&sort_by=stars")
+
+    assert response.status == 200
+    assert b"Alice" in response.body and b"Bob" in response.body
+    assert [call.kwargs["username"] for call in mock_fetch.call_args_list] == ["alice", "bob"]
+
+
+def test_server_leaderboard_members_do_not_fill_fetch_cache():
+    server = CardServer("token", member_cache_maxsize=2)
+    with patch("src.server.fetch_stats", side_effect=lambda **kw: _stats(kw["username"], 5)):
+        server.handle("/stats", "username=alice")
+        server.handle("/leaderboard", "users=bob,carol,dave&sort_by=stars")
+
+    metrics = server.metrics()
+    # The /stats card and the leaderboard itself
+    assert metrics["fetch_cache"]["size"] == 2
+    assert metrics["member_cache"]["size"] == 2
+
+
+def test_server_leaderboard_rejects_too_many_users():
+    users = ",".join(f"user{i}" for i in range(LEADERBOARD_MAX_MEMBERS + 1))
+    with patch("src.server.fetch_stats") as mock_fetch:
+        response = CardServer("token").handle("/leaderboard", f"users={users}")
+
+    assert response.status == 400
+    assert f"at most {LEADERBOARD_MAX_MEMBERS}".encode() in response.body
+    mock_fetch.assert_not_called()
+
+
+def test_server_leaderboard_rejects_large_orgs():
+    server = CardServer("token")
+    server.client = MagicMock()
+    server.client.graphql_query.return_value = _members_page(
+        ["alice"], "c1", total=LEADERBOARD_MAX_MEMBERS + 1
+    )
+    with patch("src.server.fetch_stats") as mock_fetch:
+        response = server.handle("/leaderboard", "org=acme")
+
+    assert response.status == 400
+    assert b"Organization 'acme' has" in response.body
+    assert server.client.graphql_query.call_count == 1
+    mock_fetch.assert_not_called()
+
+
+def test_server_leaderboard_requires_org_or_users():
+    response = CardServer("token").handle("/leaderboard", "username=alice")
+    assert response.status == 400
+    assert response.body == b"Missing required parameter: org or users"
+
+
+def test_cli_leaderboard(tmp_path):
+    output = tmp_path / "board.svg"
+    with patch("src.cli.fetch_leaderboard", return_value=BOARD) as mock_fetch:
+        result = CliRunner().invoke(
+            cli,
+            [
+                "leaderboard",
+                "--org",
+                "acme",
+                "-t",
+                "token",
+                "-o",
+                str(output),
+                "--limit",
+                "5",
+                "--max-members",
+                "50",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert mock_fetch.call_args[0][0].org == "acme"
+    assert mock_fetch.call_args[0][0].limit == 5
+    assert mock_fetch.call_args[0][0].max_members == 50
+    assert "acme Leaderboard" in output.read_text()
+
+
+def test_cli_leaderboard_needs_one_source(tmp_path):
+    result = CliRunner().invoke(
+        cli, ["leaderboard", "-t", "token", "-o", str(tmp_path / "board.svg")]
+    )
+    assert result.exit_code == 2
+    assert "exactly one of --org or --users" in result.output
@@ -0,0 +1,134 @@
+"""Tests for SVG minification."""
+
+import re
+import xml.dom.minidom
+
+import pytest
+
+from src.core.config import ContribCardConfig, LangsCardConfig, StatsCardConfig
+from src.github.langs_fetcher import Language
+from src.rendering.contrib import render_contrib_card
+from src.rendering.langs import render_top_languages
+from src.rendering.minify import minify_css, minify_svg, shorten_number, size_report
+from src.rendering.stats import render_stats_card
+
+STATS = {
+    "name": "The Octocat",
+    "login": "octocat",
+    "totalCommits": 100,
+    "totalPRs": 50,
+    "mergedPRs": 40,
+    "totalIssues": 25,
+    "totalStars": 200,
+    "contributedTo": 10,
+    "followers": 50,
+    "totalReviews": 5,
+    "discussionsStarted": 2,
+    "discussionsAnswered": 1,
+}
+
+LANGS = {
+    name: Language(name=name, color="#3572A5", size=size, count=1)
+    for name, size in [("Python", 1000), ("Go", 333), ("C", 77), ("Rust", 50)]
+}
+
+CONTRIB = {
+    "repos": [
+        {
+            "name": "octocat/hello-world",
+            "stars": 10,
+            "commits": 5,
+            "prs": 1,
+            "issues": 0,
+            "reviews": 0,
+            "rank_level": "A+",
+            "avatar_b64": None,
+        }
+    ]
+}
+
+
+def _shorten(text: str) -> str:
+    return re.sub(r"-?\d*\.\d+", shorten_number, text)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("0.5", ".5"), ("33.3333", "33.33"), ("1.50", "1.5"), ("-0.001", "0"), ("-0.25", "-.25")],
+)
+def test_shorten_number(value, expected):
+    assert _shorten(value) == expected
+
+
+def test_minify_css_keeps_last_duplicate_rule():
+    css = """
+        .a { fill: red; }
+        @keyframes fade { from { opacity: 0; } to { opacity: 1; } }
+        .b { fill: blue; }
+        .a { fill: red; }
+        @keyframes fade { from { opacity: 0; } to { opacity: 1; } }
+    """
+    assert minify_css(css) == (
+        ".b{fill:blue}.a{fill:red}@keyframes fade{from{opacity:0}to{opacity:1}}"
+    )
+
+
+def test_minify_svg_merges_styles_and_strips_whitespace():
+    svg = """
+    <svg width="10" height="10" xmlns="http://www.w3.org/2000/svg">
+      <title>Card</title>
+      <desc>Description</desc>
+      <style>.a { fill: red; }</style>
+      <defs>
+      </defs>
+      <g>
+        <g transform="translate(0, 0)">
+          <text class="a">  Hello   world  </text>
+        </g>
+      </g>
+      <style>.a { fill: red; }</style>
+      <path d="M 1 2 L 3.14159 4 Z" style="opacity: 0.5;"></path>
+    </svg>
+    """
+    result = minify_svg(svg)
+
+    assert result.count("<style>") == 1
+    assert "<style>.a{fill:red}</style>" in result
+    assert "<defs>" not in result
+    assert "<g>" not in result
+    assert '<text class="a">Hello world</text>' in result
+    assert '<path d="M1 2L3.14 4Z" style="opacity:.5"/>' in result
+    assert result.index("</desc>") < result.index("<style>")
+    xml.dom.minidom.parseString(result)
+
+
+@pytest.mark.parametrize(
+    "render",
+    [
+        lambda minify: render_stats_card(STATS, StatsCardConfig(show_icons=True, minify=minify)),
+        lambda minify: render_top_languages(LANGS, LangsCardConfig(minify=minify)),
+        lambda minify: render_top_languages(
+            LANGS, LangsCardConfig(layout="compact", minify=minify)
+        ),
+        lambda minify: render_top_languages(LANGS, LangsCardConfig(layout="donut", minify=minify)),
+        lambda minify: render_top_languages(LANGS, LangsCardConfig(layout="pie", minify=minify)),
+        lambda minify: render_contrib_card(CONTRIB, ContribCardConfig(minify=minify)),
+    ],
+    ids=["stats", "normal", "compact", "donut", "pie", "contrib"],
+)
+def test_minify_flag_shrinks_every_card(render):
+    original = render(False)
+    minified = render(True)
+
+    assert len(minified) < len(original) * 0.85
+    dom = xml.dom.minidom.parseString(minified)
+    original_dom = xml.dom.minidom.parseString(original)
+    texts = [" ".join(n.toxml().split()) for n in original_dom.getElementsByTagName("text")]
+    minified_texts = [n.toxml() for n in dom.getElementsByTagName("text")]
+    assert [re.sub(r"<[^>]*>", "", t) for t in minified_texts] == [
+        " ".join(re.sub(r"<[^>]*>", "", t).split()) for t in texts
+    ]
+
+
+def test_size_report():
+    assert size_report("x" * 200, "x" * 150) == "200 → 150 bytes (-25.0%)"
@@ -0,0 +1,291 @@
+"""Tests for organisation aggregate stats."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.core.config import LangsCardConfig, OrgStatsFetchConfig, StatsCardConfig
+from src.core.constants import ORG_REPO_BATCH_SIZE, ORG_REPO_CACHE_SCHEMA_VERSION
+from src.core.exceptions import FetchError, ValidationError
+from src.github.langs_fetcher import LanguageAggregator
+from src.github.org_stats import (
+    OrgRepoCache,
+    RepoDetails,
+    dump_org_repo_cache,
+    fetch_org_stats,
+    load_org_repo_cache,
+)
+from src.rendering.org_stats import render_org_langs_card, render_org_stats_card
+
+
+def _repo(i: int) -> dict:
+    language = ("Python", "#3572A5") if i % 2 else ("Go", "#00ADD8")
+    return {
+        "name": f"repo{i}",
+        "pushedAt": f"2026-01-{i % 28 + 1:02d}T00:00:00Z",
+        "stargazerCount": i,
+        "issues": {"totalCount": 1},
+        "pullRequests": {"totalCount": 2},
+        "mergedPullRequests": {"totalCount": 1},
+        "commits": 10,
+        "languages": [language],
+    }
+
+
+class FakeOrgAPI:
+    """GraphQL stand-in serving an organisation's repositories by page and by alias."""
+
+    def __init__(self, repos: list[dict], page_size: int = 3):
+        self.repos = {repo["name"]: repo for repo in repos}
+        self.page_size = page_size
+        self.detail_requests: list[list[str]] = []
+        self.lock = threading.Lock()
+
+    def graphql_query(self, query: str, variables: dict) -> dict:
+        if "orgRepos" in query:
+            return self._page(variables)
+        names = [value for key, value in variables.items() if key != "org"]
+        with self.lock:
+            self.detail_requests.append(names)
+        return {"data": {f"r{i}": self._details(name) for i, name in enumerate(names)}}
+
+    def _page(self, variables: dict) -> dict:
+        if variables["org"] != "acme":
+            return {"data": {"organization": None}}
+        start = int(variables["after"] or 0)
+        repos = list(self.repos.values())[start : start + self.page_size]
+        end = start + len(repos)
+        nodes = [
+            {k: v for k, v in repo.items() if k not in ("commits", "languages")} for repo in repos
+        ]
+        return {
+            "data": {
+                "organization": {
+                    "login": "acme",
+                    "name": "Acme Corp",
+                    "repositories": {
+                        "nodes": nodes,
+                        "pageInfo": {
+                            "hasNextPage": end < len(self.repos),
+                            "endCursor": str(end),
+                        },
+                    },
+                }
+            }
+        }
+
+    def _details(self, name: str) -> dict | None:
+        repo = self.repos.get(name)
+        if repo is None:
+            return None
+        return {
+            "pushedAt": repo["pushedAt"],
+            "defaultBranchRef": {"target": {"history": {"totalCount": repo["commits"]}}},
+            "languages": {
+                "edges": [
+                    {"size": 100, "node": {"name": name, "color": color}}
+                    for name, color in repo["languages"]
+                ]
+            },
+        }
+
+
+def _config(**kwargs) -> OrgStatsFetchConfig:
+    return OrgStatsFetchConfig(token="t", org="acme", **kwargs)
+
+
+def test_language_aggregator_weights_and_sorts():
+    aggregator = LanguageAggregator()
+    aggregator.add_repo([("Go", None, 100), ("Python", "#3572A5", 30)])
+    aggregator.add_repo([("Python", "#3572A5", 30)])
+    aggregator.add_repo([("Python", "#3572A5", 30)])
+
+    assert list(aggregator.result()) == ["Go", "Python"]
+    weighted = aggregator.result(size_weight=0.0, count_weight=1.0)
+    assert list(weighted) == ["Python", "Go"]
+    assert weighted["Python"].count == 3
+    # Results are copies; the running totals are left alone
+    assert aggregator.result()["Python"].size == 90
+
+
+def test_fetch_org_stats_aggregates_all_pages():
+    api = FakeOrgAPI([_repo(i) for i in range(10)])
+    stats = fetch_org_stats(_config(), client=api)
+
+    assert stats["repos"] == stats["fetched"] == 10
+    totals = stats["stats"]
+    assert totals["name"] == "Acme Corp"
+    assert totals["totalStars"] == sum(range(10))
+    assert totals["totalCommits"] == 100
+    assert (totals["totalPRs"], totals["mergedPRs"], totals["totalIssues"]) == (20, 10, 10)
+    assert {name: lang.count for name, lang in stats["languages"].items()} == {
+        "Go": 5,
+        "Python": 5,
+    }
+
+
+def test_fetch_org_stats_batches_detail_requests():
+    api = FakeOrgAPI([_repo(i) for i in range(ORG_REPO_BATCH_SIZE + 5)], page_size=100)
+    fetch_org_stats(_config(concurrency=2), client=api)
+
+    assert sorted(map(len, api.detail_requests)) == [5, ORG_REPO_BATCH_SIZE]
+
+
+def test_fetch_org_stats_refreshes_only_pushed_repos():
+    repos = [_repo(i) for i in range(6)]
+    cache = OrgRepoCache("acme")
+    fetch_org_stats(_config(), client=FakeOrgAPI(repos), cache=cache)
+    assert set(cache.repos) == {f"repo{i}" for i in range(6)}
+
+    repos[2] = {**repos[2], "pushedAt": "2026-02-01T00:00:00Z", "commits": 50}
+    repos[3] = {**repos[3], "stargazerCount": 1000}  # starred, not pushed
+    del repos[5]
+    api = FakeOrgAPI(repos)
+    stats = fetch_org_stats(_config(), client=api, cache=cache)
+
+    assert api.detail_requests == [["repo2"]]
+    assert stats["fetched"] == 1
+    assert stats["stats"]["totalCommits"] == 4 * 10 + 50
+    assert stats["stats"]["totalStars"] == 0 + 1 + 2 + 1000 + 4
+    # Vanished repositories drop out of the cache
+    assert "repo5" not in cache.repos
+
+
+def test_fetch_org_stats_excludes_repos():
+    api = FakeOrgAPI([_repo(i) for i in range(4)])
+    stats = fetch_org_stats(_config(exclude_repo=["repo1", "repo3"]), client=api)
+    assert stats["repos"] == 2
+    assert stats["stats"]["totalStars"] == 2
+
+
+def test_fetch_org_stats_skips_repos_gone_before_details():
+    api = FakeOrgAPI([_repo(i) for i in range(3)])
+    original = api._details
+    api._details = lambda name: None if name == "repo1" else original(name)
+    cache = OrgRepoCache("acme")
+
+    stats = fetch_org_stats(_config(), client=api, cache=cache)
+    assert stats["fetched"] == 2
+    assert "repo1" not in cache.repos
+    # repo1's listing counts are left out along with its details
+    assert stats["repos"] == 2
+    assert stats["stats"]["totalStars"] == 0 + 2
+    assert stats["stats"]["totalIssues"] == 2
+    assert stats["stats"]["totalPRs"] == 4
+    assert stats["stats"]["mergedPRs"] == 2
+    assert stats["stats"]["totalCommits"] == 20
+
+
+@pytest.mark.parametrize(
+    "config, cache, message",
+    [
+        (OrgStatsFetchConfig(token="t", org="acme", concurrency=0), None, "concurrency"),
+        (OrgStatsFetchConfig(token="t", org="acme"), OrgRepoCache("other"), "belongs to"),
+    ],
+)
+def test_fetch_org_stats_validates(config, cache, message):
+    with pytest.raises(ValidationError, match=message):
+        fetch_org_stats(config, client=FakeOrgAPI([]), cache=cache)
+
+
+def test_fetch_org_stats_unknown_org():
+    with pytest.raises(FetchError, match="not found"):
+        fetch_org_stats(OrgStatsFetchConfig(token="t", org="nobody"), client=FakeOrgAPI([]))
+
+
+def test_fetch_org_stats_propagates_detail_errors():
+    api = FakeOrgAPI([_repo(i) for i in range(3)])
+    api.graphql_query = lambda query, variables, page=api.graphql_query: (
+        page(query, variables) if "orgRepos" in query else {"errors": [{"message": "boom"}]}
+    )
+    with pytest.raises(FetchError, match="boom"):
+        fetch_org_stats(_config(), client=api)
+
+
+def test_fetch_org_stats_rejects_non_object_data():
+    api = FakeOrgAPI([_repo(i) for i in range(3)])
+    api.graphql_query = lambda query, variables: {"data": ["unexpected"]}
+    with pytest.raises(FetchError, match="not an object"):
+        fetch_org_stats(_config(), client=api)
+
+
+def test_org_repo_cache_round_trip(tmp_path):
+    cache = OrgRepoCache("acme", {"repo": RepoDetails("2026-01-01", 3, (("Go", None, 10),))})
+    path = tmp_path / "acme.json"
+    size = dump_org_repo_cache(cache, str(path))
+
+    assert size == path.stat().st_size
+    assert load_org_repo_cache(str(path)) == cache
+    assert cache.get("repo", "2026-01-01") is not None
+    assert cache.get("repo", "2026-02-01") is None
+    assert cache.get("repo", None) is None
+
+
+@pytest.mark.parametrize(
+    "document, message",
+    [
+        ([], "Not a github-stats-card repository cache"),
+        ({"schema": 99}, "Unsupported repository cache schema"),
+        ({"schema": ORG_REPO_CACHE_SCHEMA_VERSION, "org": "acme"}, "Malformed"),
+        ({"schema": ORG_REPO_CACHE_SCHEMA_VERSION, "org": "a", "repos": {"r": [1]}}, "Malformed"),
+    ],
+)
+def test_org_repo_cache_rejects_invalid_documents(document, message):
+    with pytest.raises(ValidationError, match=message):
+        OrgRepoCache.from_dict(document)
+
+
+def test_render_org_cards():
+    stats = fetch_org_stats(_config(), client=FakeOrgAPI([_repo(i) for i in range(4)]))
+    svg = render_org_stats_card(stats, StatsCardConfig(show=["contribs", "prs_merged"]))
+
+    assert "Acme Corp" in svg
+    assert 'data-testid="rank-circle"' not in svg
+    assert "Contributed to" not in svg
+    assert "Merged" in svg
+    langs = render_org_langs_card(stats, LangsCardConfig())
+    assert "Python" in langs and "Go" in langs
+
+
+def test_cli_org_stats_uses_repo_cache(tmp_path):
+    api = FakeOrgAPI([_repo(i) for i in range(5)])
+    args = ["org-stats", "--org", "acme", "-t", "token", "-o", str(tmp_path / "org.svg")]
+    args += ["--langs-output", str(tmp_path / "langs.svg"), "--cache-dir", str(tmp_path / "cache")]
+    with patch("src.github.org_stats.GitHubClient", return_value=api):
+        first = CliRunner().invoke(cli, args)
+        second = CliRunner().invoke(cli, args)
+
+    assert first.exit_code == 0, first.output
+    assert "5 fetched, 0 from cache" in first.stderr
+    assert "0 fetched, 5 from cache" in second.stderr
+    cache_file = tmp_path / "cache" / "org-repos" / "acme.json"
+    assert len(json.loads(cache_file.read_text())["repos"]) == 5
+    assert (tmp_path / "langs.svg").exists()
+
+
+def test_cli_org_stats_ignores_invalid_repo_cache(tmp_path):
+    cache_file = tmp_path / "repos.json"
+    cache_file.write_text("not json")
+    with patch("src.github.org_stats.GitHubClient", return_value=FakeOrgAPI([_repo(1)])):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "org-stats",
+                "--org",
+                "acme",
+                "-t",
+                "token",
+                "-o",
+                str(tmp_path / "org.svg"),
+                "--repo-cache",
+                str(cache_file),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "Ignoring repository cache" in result.stderr
+    assert load_org_repo_cache(str(cache_file)).repos.keys() == {"repo1"}
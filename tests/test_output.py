@@ -0,0 +1,103 @@
+"""Tests for the output file writer."""
+
+import gzip
+import io
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.core.output import (
+    atomic_write,
+    file_digest,
+    write_output,
+    write_output_stream,
+    write_stream,
+)
+
+
+def test_write_output_creates_file_and_directories(tmp_path):
+    path = tmp_path / "nested" / "card.svg"
+    assert write_output(str(path), b"<svg/>") is True
+    assert path.read_bytes() == b"<svg/>"
+
+
+def test_write_output_skips_identical_content(tmp_path):
+    path = tmp_path / "card.svg"
+    write_output(str(path), b"<svg>1</svg>")
+    mtime = path.stat().st_mtime_ns
+
+    assert write_output(str(path), b"<svg>1</svg>") is False
+    assert path.stat().st_mtime_ns == mtime
+
+    assert write_output(str(path), b"<svg>2</svg>") is True
+    assert path.read_bytes() == b"<svg>2</svg>"
+
+
+def test_atomic_write_preserves_permissions(tmp_path):
+    path = tmp_path / "card.svg"
+    path.write_bytes(b"old")
+    os.chmod(path, 0o640)
+    atomic_write(str(path), b"new")
+    assert path.read_bytes() == b"new"
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_atomic_write_failure_keeps_original(tmp_path):
+    path = tmp_path / "card.svg"
+    path.write_bytes(b"original")
+
+    with (
+        patch("src.core.output.os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        atomic_write(str(path), b"partial")
+
+    assert path.read_bytes() == b"original"
+    assert os.listdir(tmp_path) == ["card.svg"]
+
+
+def test_file_digest_missing_file(tmp_path):
+    assert file_digest(str(tmp_path / "missing.svg")) is None
+
+
+def test_write_output_stream_writes_and_skips_unchanged(tmp_path):
+    path = tmp_path / "card.svg"
+
+    assert write_output_stream(str(path), iter(["<svg>", "é", "</svg>"])) is True
+    assert path.read_text(encoding="utf-8") == "<svg>é</svg>"
+    mtime = path.stat().st_mtime_ns
+
+    assert write_output_stream(str(path), iter(["<svg>é", "</svg>"])) is False
+    assert path.stat().st_mtime_ns == mtime
+    assert os.listdir(tmp_path) == ["card.svg"]
+
+
+def test_write_output_stream_failure_keeps_original(tmp_path):
+    path = tmp_path / "card.svg"
+    path.write_bytes(b"original")
+
+    def chunks():
+        yield "<svg>"
+        raise RuntimeError("render failed")
+
+    with pytest.raises(RuntimeError):
+        write_output_stream(str(path), chunks())
+
+    assert path.read_bytes() == b"original"
+    assert os.listdir(tmp_path) == ["card.svg"]
+
+
+def test_write_stream_text_and_binary_sinks(tmp_path):
+    text = io.StringIO()
+    assert write_stream(["<svg>", "é", "</svg>"], text) == 12
+    assert text.getvalue() == "<svg>é</svg>"
+
+    binary = io.BytesIO()
+    assert write_stream(["<svg>", "é", "</svg>"], binary) == 13
+    assert binary.getvalue() == "<svg>é</svg>".encode()
+
+    path = tmp_path / "card.svgz"
+    with gzip.open(path, "wt", encoding="utf-8") as sink:
+        write_stream(["<svg>", "</svg>"], sink)
+    assert gzip.decompress(path.read_bytes()) == b"<svg></svg>"
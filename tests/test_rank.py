@@ -1,11 +1,16 @@
 """Tests for rank calculation algorithm."""
 
+import pytest
+
+from src.core.exceptions import ValidationError
 from src.github.rank import (
     calculate_user_rank,
+    calculate_user_ranks,
     calculate_repo_rank,
     exponential_cdf,
     log_normal_cdf,
 )
+from src.github.stats_store import numpy_available
 
 
 def test_exponential_cdf():
@@ -106,3 +111,41 @@ def test_calculate_repo_rank():
     # Edge cases
     # 0 commits: Unknown magnitude, treat as neutral (no modifier)
     assert calculate_repo_rank(10001, 0) == "S"
+
+
+USERS = [
+    (0, 0, 0, 0, 0, 0),
+    (10, 1, 1, 0, 0, 0),
+    (250, 50, 25, 2, 50, 10),
+    (1000, 100, 50, 20, 100, 50),
+    (3, 0, 0, 2, 2, 0),
+    (81, 6, 0, 1, 0, 7),
+    (100000, 10000, 10000, 10000, 100000, 10000),
+]
+
+
+@pytest.mark.parametrize("all_commits", [False, True])
+@pytest.mark.parametrize(
+    "use_numpy",
+    [
+        False,
+        pytest.param(True, marks=pytest.mark.skipif(not numpy_available(), reason="no numpy")),
+    ],
+)
+def test_calculate_user_ranks_matches_scalar(all_commits, use_numpy):
+    levels, percentiles = calculate_user_ranks(
+        *zip(*USERS), all_commits=all_commits, use_numpy=use_numpy
+    )
+
+    expected = [calculate_user_rank(*user, all_commits=all_commits) for user in USERS]
+    assert [{"level": level, "percentile": p} for level, p in zip(levels, percentiles)] == expected
+
+
+def test_calculate_user_ranks_validates_input(monkeypatch):
+    with pytest.raises(ValidationError, match="same length"):
+        calculate_user_ranks([1, 2], [1], [1], [1], [1], [1])
+
+    monkeypatch.setattr("src.github.rank._load_numpy", lambda: None)
+    assert calculate_user_ranks([], [], [], [], [], []) == ([], [])
+    with pytest.raises(ValidationError, match="numpy"):
+        calculate_user_ranks([1], [1], [1], [1], [1], [1], use_numpy=True)
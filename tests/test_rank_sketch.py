@@ -0,0 +1,349 @@
+"""Tests for the live rank sketch."""
+
+import json
+import random
+from bisect import bisect_left
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.core.config import StatsCardConfig
+from src.core.constants import RANK_SKETCH_MIN_USERS, RANK_SKETCH_SCHEMA_VERSION
+from src.core.exceptions import ValidationError
+from src.github.calibration import CalibrationBuilder
+from src.github.rank import calculate_user_rank
+from src.github.rank_sketch import (
+    BloomFilter,
+    KLLSketch,
+    RankSketch,
+    dump_rank_sketch,
+    load_rank_sketch,
+)
+from src.rendering.cache import RenderCache
+from src.server import CardServer
+
+DOCUMENT = {
+    "schema": RANK_SKETCH_SCHEMA_VERSION,
+    "k": 200,
+    "users": 0,
+    "logins": BloomFilter(bits=64, hashes=7).to_dict(),
+    "metrics": {},
+}
+
+
+def _stats(login: str, value: int) -> dict:
+    return {
+        "name": login,
+        "login": login,
+        "totalCommits": value,
+        "totalPRs": value,
+        "mergedPRs": 0,
+        "totalIssues": value,
+        "totalStars": value,
+        "contributedTo": 0,
+        "followers": value,
+        "totalReviews": value,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+
+
+def _sketch(users: int) -> RankSketch:
+    sketch = RankSketch()
+    for value in range(users):
+        sketch.add(_stats(f"user{value}", value))
+    return sketch
+
+
+def test_kll_short_stream_is_exact():
+    sketch = KLLSketch(k=200)
+    for value in [5, 1, 3, 3, 9]:
+        sketch.update(value)
+    assert sketch.weighted_values() == ((1, 3, 5, 9), (1, 3, 4, 5))
+
+
+def test_kll_long_stream_is_bounded_and_accurate():
+    rng = random.Random(1)
+    data = [int(rng.paretovariate(1.1)) for _ in range(100_000)]
+    sketch = KLLSketch(k=200)
+    for value in data:
+        sketch.update(value)
+
+    values, cumulative = sketch.weighted_values()
+    assert sketch.n == cumulative[-1] == len(data)
+    assert len(sketch) < 1000
+
+    data.sort()
+    for q in (1, 2, 5, 10, 100, 1000):
+        exact = bisect_left(data, q) / len(data)
+        j = bisect_left(values, q)
+        estimate = (cumulative[j - 1] if j else 0) / len(data)
+        assert estimate == pytest.approx(exact, abs=0.02)
+
+
+def test_kll_rejects_tiny_k():
+    with pytest.raises(ValidationError):
+        KLLSketch(k=1)
+
+
+def test_bloom_filter_membership_and_round_trip():
+    bloom = BloomFilter.for_capacity()
+    assert bloom.add("octocat") is True
+    assert bloom.add("octocat") is False
+    assert "octocat" in bloom
+    assert "monalisa" not in bloom
+    assert 42 not in bloom
+
+    loaded = BloomFilter.from_dict(json.loads(json.dumps(bloom.to_dict())))
+    assert "octocat" in loaded
+    assert "monalisa" not in loaded
+    assert loaded.fill_ratio == bloom.fill_ratio == bloom.hashes / bloom.bits
+
+
+def test_bloom_filter_false_positives_are_rare():
+    bloom = BloomFilter.for_capacity()
+    for i in range(20_000):
+        bloom.add(f"user{i}")
+    false_positives = sum(f"other{i}" in bloom for i in range(10_000))
+    assert false_positives < 10
+
+
+def test_bloom_filter_sized_for_capacity():
+    bloom = BloomFilter.for_capacity(1000, 0.01)
+    assert (bloom.bits, bloom.hashes) == (9592, 7)
+    for i in range(1000):
+        bloom.add(f"user{i}")
+    assert 0.005 < bloom.false_positive_rate < 0.02
+    false_positives = sum(f"other{i}" in bloom for i in range(10_000))
+    assert 50 < false_positives < 200
+
+
+def test_bloom_filter_saturation_is_reported():
+    bloom = BloomFilter.for_capacity(100, 0.01)
+    new = [bloom.add(f"user{i}") for i in range(2000)]
+    assert all(new[:50])
+    # Past capacity, most new items are mistaken for added ones
+    assert sum(new[-500:]) < 250
+    assert bloom.fill_ratio > 0.99
+    assert bloom.false_positive_rate > 0.9
+
+
+@pytest.mark.parametrize(
+    "capacity, false_positive_rate", [(0, 0.01), (100, 0.0), (100, 1.0), (100, -1)]
+)
+def test_bloom_filter_rejects_bad_capacity(capacity, false_positive_rate):
+    with pytest.raises(ValidationError):
+        BloomFilter.for_capacity(capacity, false_positive_rate)
+
+
+def test_bloom_filter_rejects_bad_size():
+    with pytest.raises(ValidationError):
+        BloomFilter(bits=10, hashes=7)
+
+
+def test_rank_sketch_counts_each_user_once():
+    sketch = RankSketch()
+    assert sketch.add(_stats("octocat", 1)) is True
+    assert sketch.add(_stats("OctoCat", 100)) is False
+    assert "OCTOCAT" in sketch
+    assert sketch.users == 1
+    assert sketch.cdf("stars", 100) == 1.0
+
+
+def test_rank_sketch_validates_stats():
+    with pytest.raises(ValidationError, match="totalPRs"):
+        RankSketch().add({"login": "octocat", "totalCommits": 1})
+
+
+def test_rank_sketch_cdf_matches_calibration():
+    sketch = _sketch(100)
+    builder = CalibrationBuilder()
+    for value in range(100):
+        builder.add(_stats(f"user{value}", value))
+    calibration = builder.build(100)
+
+    assert sketch.cdf("all_commits", 10) is None
+    for value in (0, 1, 50, 99, 1000):
+        assert sketch.cdf("stars", value) == pytest.approx(
+            calibration.cdf("stars", value), abs=0.011
+        )
+
+
+def test_rank_sketch_view_is_cached_until_update():
+    sketch = _sketch(10)
+    view = sketch.view()
+    assert sketch.view() is view
+    assert sketch.fingerprint == view.fingerprint
+
+    sketch.add(_stats("newcomer", 3))
+    assert sketch.view() is not view
+    assert sketch.fingerprint != view.fingerprint
+    # The old view is an immutable snapshot
+    assert view.users == 10
+
+
+def test_calculate_user_rank_with_sketch():
+    sketch = _sketch(100)
+    top = calculate_user_rank(99, 99, 99, 99, 99, 99, calibration=sketch)
+    bottom = calculate_user_rank(0, 0, 0, 0, 0, 0, calibration=sketch)
+    assert top["percentile"] == pytest.approx(1, abs=0.5)
+    assert bottom["percentile"] == 100
+
+
+def test_render_cache_key_uses_fingerprint():
+    sketch = _sketch(10)
+    view = sketch.view()
+    config = StatsCardConfig(rank_calibration=view)
+    key = RenderCache.make_key("stats", {"a": 1}, config)
+
+    assert key == RenderCache.make_key("stats", {"a": 1}, StatsCardConfig(rank_calibration=view))
+    assert key != RenderCache.make_key("stats", {"a": 1}, StatsCardConfig())
+    sketch.add(_stats("newcomer", 3))
+    assert key != RenderCache.make_key(
+        "stats", {"a": 1}, StatsCardConfig(rank_calibration=sketch.view())
+    )
+
+
+def test_rank_sketch_round_trip(tmp_path):
+    sketch = _sketch(2000)
+    path = tmp_path / "sketch.json"
+    size = dump_rank_sketch(sketch, str(path))
+
+    loaded = load_rank_sketch(str(path))
+    assert size == path.stat().st_size
+    assert loaded.users == 2000
+    assert loaded.view() == sketch.view()
+    # Known users stay known, without logins being written out
+    assert loaded.add(_stats("user7", 7)) is False
+    assert "user7" not in path.read_text()
+
+
+@pytest.mark.parametrize(
+    "document, message",
+    [
+        ([], "Not a github-stats-card rank sketch"),
+        ({"schema": 99}, "Unsupported rank sketch schema"),
+        ({"schema": RANK_SKETCH_SCHEMA_VERSION}, "Malformed"),
+        ({**DOCUMENT, "metrics": {"forks": {}}}, "Unknown rank sketch metric"),
+        ({**DOCUMENT, "logins": {"bits": 64, "hashes": 7, "data": "!"}}, "Malformed"),
+        ({**DOCUMENT, "logins": {**DOCUMENT["logins"], "bits": 128}}, "does not match"),
+        ({**DOCUMENT, "metrics": {"stars": {"n": 5, "levels": [[1, 2]]}}}, "do not match"),
+    ],
+)
+def test_rank_sketch_rejects_invalid_documents(document, message):
+    with pytest.raises(ValidationError, match=message):
+        RankSketch.from_dict(document)
+
+
+def test_server_feeds_and_saves_sketch(tmp_path):
+    path = tmp_path / "sketch.json"
+    server = CardServer("token", rank_sketch=RankSketch(), rank_sketch_path=str(path))
+    with (
+        patch("src.server.RANK_SKETCH_SAVE_INTERVAL", 2),
+        patch("src.server.fetch_stats", side_effect=lambda **kw: _stats(kw["username"], 5)),
+    ):
+        server.handle("/stats", "username=alice")
+        server.handle("/stats", "username=alice&theme=dark")
+        assert not path.exists()
+        server.handle("/stats", "username=bob")
+
+    assert load_rank_sketch(str(path)).users == 2
+    assert server.metrics()["rank_sketch"] == {
+        "users": 2,
+        "unsaved": 0,
+        "save_errors": 0,
+        "filter_fill": server.rank_sketch.filter_fill,
+        "false_positive_rate": server.rank_sketch.false_positive_rate,
+    }
+    assert 0 < server.rank_sketch.false_positive_rate < 1e-20
+    assert server.save_rank_sketch() is False
+
+
+def test_server_live_rank_waits_for_population():
+    sketch = _sketch(RANK_SKETCH_MIN_USERS - 1)
+    server = CardServer("token", rank_sketch=sketch, live_rank=True)
+    with (
+        patch("src.server.fetch_stats", return_value=_stats("octocat", 0)),
+        patch("src.server.render_stats_card", return_value="<svg/>") as mock_render,
+    ):
+        server.handle("/stats", "username=octocat")
+        server.handle("/stats", "username=octocat&theme=dark")
+
+    assert mock_render.call_args_list[0][0][1].rank_calibration is None
+    assert mock_render.call_args_list[1][0][1].rank_calibration == sketch.view()
+
+
+def test_server_live_rank_view_rebuilt_every_interval():
+    sketch = _sketch(RANK_SKETCH_MIN_USERS)
+    server = CardServer("token", rank_sketch=sketch, live_rank=True)
+    with (
+        patch("src.server.RANK_SKETCH_VIEW_INTERVAL", 2),
+        patch("src.server.fetch_stats", side_effect=lambda **kw: _stats(kw["username"], 5)),
+        patch("src.server.render_stats_card", return_value="<svg/>") as mock_render,
+    ):
+        server.handle("/stats", "username=alice")
+        # A new user does not invalidate the cached render until the interval
+        server.handle("/stats", "username=alice")
+        server.handle("/stats", "username=bob")
+        server.handle("/stats", "username=alice")
+
+    assert sketch.users == RANK_SKETCH_MIN_USERS + 2
+    views = [call[0][1].rank_calibration for call in mock_render.call_args_list]
+    assert [view.users for view in views] == [
+        RANK_SKETCH_MIN_USERS,
+        RANK_SKETCH_MIN_USERS,
+        RANK_SKETCH_MIN_USERS + 2,
+    ]
+
+
+def test_server_live_rank_requires_sketch():
+    with pytest.raises(ValidationError):
+        CardServer("token", live_rank=True)
+
+
+def test_serve_stdio_saves_sketch(tmp_path):
+    path = tmp_path / "sketch.json"
+    job = json.dumps({"id": 1, "card": "stats", "username": "octocat"})
+    with patch("src.server.fetch_stats", return_value=_stats("octocat", 3)):
+        result = CliRunner().invoke(
+            cli,
+            ["serve-stdio", "-t", "token", "--rank-sketch", str(path), "--live-rank"],
+            input=job + "\n",
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "Saved rank sketch" in result.stderr
+    assert load_rank_sketch(str(path)).users == 1
+
+
+def test_serve_stdio_sizes_new_sketch(tmp_path):
+    path = tmp_path / "sketch.json"
+    job = json.dumps({"id": 1, "card": "stats", "username": "octocat"})
+    with patch("src.server.fetch_stats", return_value=_stats("octocat", 3)):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "serve-stdio",
+                "-t",
+                "token",
+                "--rank-sketch",
+                str(path),
+                "--rank-sketch-users",
+                "1000",
+                "--rank-sketch-fp-rate",
+                "0.01",
+            ],
+            input=job + "\n",
+        )
+
+    assert result.exit_code == 0, result.output
+    logins = json.loads(path.read_text())["logins"]
+    assert (logins["bits"], logins["hashes"]) == (9592, 7)
+
+
+def test_live_rank_requires_sketch_option():
+    result = CliRunner().invoke(cli, ["serve-stdio", "-t", "token", "--live-rank"], input="")
+    assert result.exit_code == 2
+    assert "--live-rank requires --rank-sketch" in result.output
@@ -0,0 +1,86 @@
+"""Tests for the rendered SVG cache."""
+
+import gzip
+
+from src.core.config import LangsCardConfig, StatsCardConfig
+from src.github.langs_fetcher import Language
+from src.rendering.cache import RenderCache, stable_hash
+
+
+def test_stable_hash_ignores_key_order():
+    assert stable_hash({"a": 1, "b": [1, 2]}) == stable_hash({"b": [1, 2], "a": 1})
+    assert stable_hash({"a": 1}) != stable_hash({"a": 2})
+
+
+def test_stable_hash_supports_dataclasses():
+    lang = Language(name="Python", color="#3572A5", size=100, count=1)
+    same = Language(name="Python", color="#3572A5", size=100, count=1)
+    assert stable_hash({"Python": lang}) == stable_hash({"Python": same})
+
+
+def test_make_key_depends_on_data_and_config():
+    data = {"login": "octocat", "totalStars": 1}
+    key = RenderCache.make_key("stats", data, StatsCardConfig())
+    assert key == RenderCache.make_key("stats", dict(data), StatsCardConfig())
+    assert key != RenderCache.make_key("stats", {**data, "totalStars": 2}, StatsCardConfig())
+    assert key != RenderCache.make_key("stats", data, StatsCardConfig(theme="dark"))
+    assert key != RenderCache.make_key("contrib", data, StatsCardConfig())
+
+
+def test_render_skips_renderer_on_hit():
+    cache = RenderCache()
+    calls = []
+
+    def render() -> str:
+        calls.append(1)
+        return "<svg>card</svg>"
+
+    card, cached = cache.render("stats", {"a": 1}, StatsCardConfig(), render)
+    again, cached_again = cache.render("stats", {"a": 1}, StatsCardConfig(), render)
+
+    assert cached is False
+    assert cached_again is True
+    assert again is card
+    assert len(calls) == 1
+    assert card.svg == b"<svg>card</svg>"
+    assert gzip.decompress(card.gzip) == card.svg
+
+
+def test_hash_taken_before_config_normalization():
+    cache = RenderCache()
+    config = LangsCardConfig(layout="bogus")
+
+    def render() -> str:
+        config.layout = "normal"  # renderers may normalize config in place
+        return "<svg/>"
+
+    card, _ = cache.render("top-langs", {}, config, render)
+    assert card.key == RenderCache.make_key("top-langs", {}, LangsCardConfig(layout="bogus"))
+
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    first = RenderCache(cache_dir=str(tmp_path))
+    card, _ = first.render("stats", {"a": 1}, StatsCardConfig(), lambda: "<svg>disk</svg>")
+    assert (tmp_path / f"{card.key}.svg").read_bytes() == b"<svg>disk</svg>"
+
+    second = RenderCache(cache_dir=str(tmp_path))
+    loaded, cached = second.render("stats", {"a": 1}, StatsCardConfig(), lambda: "<svg>new</svg>")
+    assert cached is True
+    assert loaded.svg == b"<svg>disk</svg>"
+    assert loaded.gzip == card.gzip
+    # Compressed copies are built in memory on demand, not stored
+    assert sorted(path.name for path in tmp_path.iterdir()) == [f"{card.key}.svg"]
+
+
+def test_compressed_copies_are_built_lazily():
+    card, _ = RenderCache().render("stats", {}, StatsCardConfig(), lambda: "<svg>lazy</svg>")
+    assert "gzip" not in vars(card) and "brotli" not in vars(card)
+    assert gzip.decompress(card.gzip) == card.svg
+    assert card.gzip is card.gzip
+
+
+def test_lru_eviction():
+    cache = RenderCache(maxsize=1)
+    cache.render("stats", {"a": 1}, StatsCardConfig(), lambda: "<svg>1</svg>")
+    cache.render("stats", {"a": 2}, StatsCardConfig(), lambda: "<svg>2</svg>")
+    assert len(cache) == 1
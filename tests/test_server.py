@@ -0,0 +1,181 @@
+"""Tests for the HTTP card server."""
+
+import gzip
+import threading
+import time
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from src.core.cache import StaleWhileRevalidateCache
+from src.core.exceptions import FetchError
+from src.github.langs_fetcher import Language
+from src.server import CardServer, create_http_server
+
+SAMPLE_STATS = {
+    "name": "The Octocat",
+    "login": "octocat",
+    "totalCommits": 100,
+    "totalPRs": 50,
+    "mergedPRs": 40,
+    "totalIssues": 25,
+    "totalStars": 200,
+    "contributedTo": 10,
+    "followers": 50,
+    "totalReviews": 5,
+    "discussionsStarted": 2,
+    "discussionsAnswered": 1,
+}
+
+
+@pytest.fixture
+def server():
+    return CardServer("token", cache_ttl=60)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_stats_route_renders_and_caches(server):
+    with patch("src.server.fetch_stats", return_value=SAMPLE_STATS) as mock_fetch:
+        first = server.handle("/stats", "username=octocat&theme=radical&show_icons=true")
+        second = server.handle("/stats", "username=octocat&theme=radical&show_icons=true")
+        # Different render options reuse the cached fetch result
+        third = server.handle("/stats", "username=OctoCat&theme=dark")
+
+    assert first.status == 200
+    assert first.headers["Content-Type"].startswith("image/svg+xml")
+    assert first.headers["Cache-Control"].startswith("public, max-age=60, ")
+    assert "stale-while-revalidate=" in first.headers["Cache-Control"]
+    assert b"#fe428e" in first.body
+    assert second.body == first.body
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert third.headers["ETag"] != first.headers["ETag"]
+    assert mock_fetch.call_count == 1
+    assert mock_fetch.call_args.kwargs["client"] is server.client
+
+
+def test_etag_not_modified(server):
+    with patch("src.server.fetch_stats", return_value=SAMPLE_STATS):
+        first = server.handle("/stats", "username=octocat")
+        second = server.handle("/stats", "username=octocat", first.headers["ETag"])
+
+    assert second.status == 304
+    assert second.body == b""
+
+
+def test_top_langs_route_weighting(server):
+    langs = {"Python": Language(name="Python", color="#3572A5", size=1000, count=2)}
+    with patch("src.server.fetch_top_languages", return_value=langs) as mock_fetch:
+        response = server.handle("/top-langs", "username=octocat&weighting=balanced&layout=compact")
+
+    assert response.status == 200
+    assert b"Python" in response.body
+    assert mock_fetch.call_args.kwargs["size_weight"] == 0.7
+    assert mock_fetch.call_args.kwargs["count_weight"] == 0.3
+
+
+def test_contrib_route(server):
+    stats = {"repos": []}
+    with patch("src.server.fetch_contributor_stats", return_value=stats):
+        response = server.handle("/contrib", "username=octocat&limit=5")
+
+    assert response.status == 200
+    assert b"No contributions found" in response.body
+
+
+def test_bad_requests(server):
+    assert server.handle("/unknown", "username=octocat").status == 404
+    assert server.handle("/stats", "").status == 400
+    assert server.handle("/stats", "username=octocat&line_height=abc").status == 400
+    assert server.handle("/top-langs", "username=octocat&weighting=nope").status == 400
+
+
+def test_fetch_error_is_not_cached(server):
+    with patch("src.server.fetch_stats", side_effect=FetchError("boom")):
+        response = server.handle("/stats", "username=octocat")
+
+    assert response.status == 502
+    assert response.headers["Cache-Control"] == "no-store"
+    assert b"boom" in response.body
+    assert len(server.render_cache) == 0
+
+
+def test_http_server_roundtrip(server):
+    httpd = create_http_server(server, "127.0.0.1", 0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with patch("src.server.fetch_stats", return_value=SAMPLE_STATS):
+            url = f"http://127.0.0.1:{httpd.server_port}/stats?username=octocat"
+            with urllib.request.urlopen(url) as response:
+                body = response.read()
+                assert response.status == 200
+                assert response.headers["ETag"]
+        assert body.startswith(b"<svg")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_concurrent_requests_coalesce_fetch(server):
+    release = threading.Event()
+
+    def slow_fetch(**kwargs):
+        release.wait(2)
+        return SAMPLE_STATS
+
+    with patch("src.server.fetch_stats", side_effect=slow_fetch) as mock_fetch:
+        threads = [
+            threading.Thread(
+                target=server.handle, args=("/stats", f"username=octocat&theme={theme}")
+            )
+            for theme in ("default", "dark", "radical")
+        ]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 2
+        while server.fetch_cache.flight.coalesced < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+
+    assert mock_fetch.call_count == 1
+    metrics = server.handle("/metrics", "")
+    assert metrics.status == 200
+    assert b'"coalesced": 2' in metrics.body
+
+
+def test_stale_if_error_serves_last_known_card(server):
+    clock = FakeClock()
+    server.fetch_cache = StaleWhileRevalidateCache(
+        fresh_ttl=60, stale_ttl=0, stale_if_error_ttl=3600, clock=clock
+    )
+    with patch("src.server.fetch_stats", return_value=SAMPLE_STATS):
+        first = server.handle("/stats", "username=octocat")
+
+    clock.now = 120
+    with patch("src.server.fetch_stats", side_effect=FetchError("rate limited")):
+        second = server.handle("/stats", "username=octocat")
+
+    assert second.status == 200
+    assert second.body == first.body
+    assert server.fetch_cache.stale_errors == 1
+
+
+def test_precompressed_response(server):
+    with patch("src.server.fetch_stats", return_value=SAMPLE_STATS):
+        plain = server.handle("/stats", "username=octocat")
+        compressed = server.handle("/stats", "username=octocat", accept_encoding="gzip, deflate")
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(compressed.body) == plain.body
+    assert "Content-Encoding" not in plain.headers
@@ -0,0 +1,82 @@
+"""Tests for request coalescing."""
+
+import threading
+import time
+
+import pytest
+
+from src.core.singleflight import SingleFlight
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_execution():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch() -> int:
+        calls.append(1)
+        release.wait(2)
+        return 42
+
+    results: list[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("user", slow_fetch)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    _wait_for(lambda: flight.coalesced == 4)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert results == [42] * 5
+    assert len(calls) == 1
+    assert flight.metrics() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_different_keys_run_independently():
+    flight: SingleFlight[str, str] = SingleFlight()
+    assert flight.do("a", lambda: "a") == "a"
+    assert flight.do("b", lambda: "b") == "b"
+    # Sequential calls for the same key are not cached
+    assert flight.do("a", lambda: "again") == "again"
+    assert flight.executions == 3
+    assert flight.coalesced == 0
+
+
+def test_error_is_shared_with_waiters():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = threading.Event()
+    errors: list[BaseException] = []
+
+    def failing() -> int:
+        release.wait(2)
+        raise ValueError("boom")
+
+    def call() -> None:
+        try:
+            flight.do("user", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    _wait_for(lambda: flight.coalesced == 2)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 3
+    assert flight.in_flight == 0
+    with pytest.raises(ValueError):
+        flight.do("user", failing)
@@ -0,0 +1,140 @@
+"""Tests for fetched-data snapshots."""
+
+import gzip
+import json
+
+import pytest
+
+from src.core.constants import SNAPSHOT_SCHEMA_VERSION
+from src.core.exceptions import ValidationError
+from src.github.fetcher import ContributorRepo, UserStats
+from src.github.langs_fetcher import Language
+from src.github.snapshot import Snapshot, dump_snapshot, load_snapshot, msgpack_available
+
+STATS = {
+    "name": "The Octocat",
+    "login": "octocat",
+    "totalCommits": 100,
+    "totalPRs": 50,
+    "mergedPRs": 40,
+    "totalIssues": 25,
+    "totalStars": 200,
+    "contributedTo": 10,
+    "followers": 50,
+    "totalReviews": 5,
+    "discussionsStarted": 2,
+    "discussionsAnswered": 1,
+}
+
+LANGS = {
+    "Python": Language(name="Python", color="#3572A5", size=1000, count=3),
+    "Go": Language(name="Go", color="#00ADD8", size=300, count=1),
+}
+
+CONTRIB = {
+    "repos": [
+        {
+            "name": "org/repo",
+            "stars": 10,
+            "commits": 5,
+            "prs": 1,
+            "issues": 0,
+            "reviews": 0,
+            "rank_level": "A",
+            "avatar_b64": "QUJD",
+        }
+    ]
+}
+
+
+def _snapshot() -> Snapshot:
+    return Snapshot(
+        username="octocat",
+        stats=STATS,
+        top_langs=LANGS,
+        contrib=CONTRIB,
+        fetch_options={"contrib": {"username": "octocat", "limit": 10, "exclude_repo": []}},
+    )
+
+
+@pytest.mark.parametrize("name", ["snap.json", "snap.json.gz"])
+def test_snapshot_round_trip(tmp_path, name):
+    path = str(tmp_path / name)
+    snapshot = _snapshot()
+    size = dump_snapshot(snapshot, path)
+    loaded = load_snapshot(path)
+
+    assert size == (tmp_path / name).stat().st_size
+    assert loaded == snapshot
+    assert isinstance(loaded.stats, UserStats)
+    assert all(isinstance(repo, ContributorRepo) for repo in loaded.contrib["repos"])
+    # Language order (by size) is preserved
+    assert list(loaded.card_data("top-langs")) == ["Python", "Go"]
+    assert loaded.card_types() == ["stats", "top-langs", "contrib"]
+
+
+def test_snapshot_document_is_versioned_and_compact(tmp_path):
+    path = tmp_path / "snap.json"
+    dump_snapshot(_snapshot(), str(path))
+    text = path.read_text()
+    document = json.loads(text)
+
+    assert document["schema"] == SNAPSHOT_SCHEMA_VERSION
+    assert document["username"] == "octocat"
+    assert document["cards"]["top-langs"][0] == {
+        "name": "Python",
+        "color": "#3572A5",
+        "size": 1000,
+        "count": 3,
+    }
+    assert "token" not in text
+    assert ": " not in text
+
+
+def test_gzip_snapshot_is_deterministic(tmp_path):
+    snapshot = _snapshot()
+    dump_snapshot(snapshot, str(tmp_path / "a.json.gz"))
+    dump_snapshot(snapshot, str(tmp_path / "b.json.gz"))
+
+    assert (tmp_path / "a.json.gz").read_bytes() == (tmp_path / "b.json.gz").read_bytes()
+    assert json.loads(gzip.decompress((tmp_path / "a.json.gz").read_bytes()))["cards"]
+
+
+def test_snapshot_missing_card_data():
+    snapshot = Snapshot(username="octocat", stats=STATS)
+
+    with pytest.raises(ValidationError, match=r"no contrib data \(available: stats\)"):
+        snapshot.card_data("contrib")
+    with pytest.raises(ValidationError, match="Unknown card type"):
+        snapshot.card_data("repos")
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("not json", "Cannot decode snapshot"),
+        ("[1, 2]", "Not a github-stats-card snapshot"),
+        ('{"schema": 99, "cards": {}}', "Unsupported snapshot schema 99"),
+        (f'{{"schema": {SNAPSHOT_SCHEMA_VERSION}, "cards": {{}}}}', "Malformed snapshot"),
+    ],
+)
+def test_load_snapshot_rejects_invalid_files(tmp_path, content, message):
+    path = tmp_path / "snap.json"
+    path.write_text(content)
+
+    with pytest.raises(ValidationError, match=message):
+        load_snapshot(str(path))
+
+
+@pytest.mark.skipif(msgpack_available(), reason="msgpack is installed")
+def test_msgpack_snapshot_requires_optional_dependency(tmp_path):
+    with pytest.raises(ValidationError, match="msgpack"):
+        dump_snapshot(_snapshot(), str(tmp_path / "snap.msgpack"))
+
+
+@pytest.mark.skipif(not msgpack_available(), reason="msgpack is not installed")
+def test_msgpack_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "snap.msgpack")
+    dump_snapshot(_snapshot(), path)
+
+    assert load_snapshot(path).card_data("contrib") == CONTRIB
@@ -0,0 +1,107 @@
+"""Tests for the columnar UserStats store."""
+
+import sys
+
+import pytest
+
+from src.core.exceptions import ValidationError
+from src.github.fetcher import UserStats
+from src.github.snapshot import Snapshot, dump_snapshot, load_snapshot
+from src.github.stats_store import INT_FIELDS, UserStatsStore, numpy_available
+
+
+def _stats(login: str, stars: int, **overrides) -> dict:
+    stats = {
+        "name": login.title(),
+        "login": login,
+        "totalCommits": 100,
+        "totalPRs": 10,
+        "mergedPRs": 5,
+        "totalIssues": 3,
+        "totalStars": stars,
+        "contributedTo": 2,
+        "followers": 7,
+        "totalReviews": 1,
+        "discussionsStarted": 0,
+        "discussionsAnswered": 0,
+    }
+    stats.update(overrides)
+    return stats
+
+
+def test_append_and_lookup():
+    store = UserStatsStore([_stats("alice", 10), UserStats(**_stats("Bob", 30))])
+
+    assert len(store) == 2
+    assert "ALICE" in store and "bob" in store and "carol" not in store
+    assert store.get("BOB") == _stats("Bob", 30)
+    assert isinstance(store.get("alice"), UserStats)
+    assert store.get("carol") is None
+    assert store.logins == ["alice", "Bob"]
+    assert list(store) == [_stats("alice", 10), _stats("Bob", 30)]
+
+
+def test_append_existing_login_replaces_row():
+    store = UserStatsStore([_stats("alice", 10), _stats("bob", 30)])
+
+    assert store.append(_stats("Alice", 99, name="Alice L.")) == 0
+
+    assert len(store) == 2
+    assert store.get("alice") == _stats("Alice", 99, name="Alice L.")
+    assert list(store.column("totalStars")) == [99, 30]
+
+
+def test_invalid_records_leave_store_unchanged():
+    store = UserStatsStore([_stats("alice", 10)])
+    missing = _stats("bob", 1)
+    del missing["followers"]
+
+    with pytest.raises(ValidationError, match="followers"):
+        store.append(missing)
+    with pytest.raises(ValidationError, match="integers"):
+        store.append(_stats("bob", 1, totalCommits="many"))
+
+    assert len(store) == 1
+    assert {len(store.column(field)) for field in INT_FIELDS} == {1}
+
+
+def test_aggregates():
+    store = UserStatsStore(_stats(f"user{i}", stars) for i, stars in enumerate([5, 50, 20, 50]))
+
+    assert store.total("totalStars") == 125
+    assert [s.login for s in store.top("totalStars", 3)] == ["user1", "user3", "user2"]
+    assert store.nbytes() == 4 * len(INT_FIELDS) * 8
+    with pytest.raises(ValidationError, match="numeric"):
+        store.column("login")
+
+
+def test_snapshot_export_round_trip(tmp_path):
+    store = UserStatsStore([_stats("alice", 10), _stats("bob", 30)])
+
+    paths = []
+    for snapshot in store.to_snapshots(created_at="2026-01-01T00:00:00+00:00"):
+        assert snapshot.card_types() == ["stats"]
+        path = str(tmp_path / f"{snapshot.username}.json")
+        dump_snapshot(snapshot, path)
+        paths.append(path)
+
+    loaded = UserStatsStore.from_snapshots(
+        [load_snapshot(path) for path in paths] + [Snapshot(username="nobody")]
+    )
+    assert list(loaded) == list(store)
+
+
+@pytest.mark.skipif(not numpy_available(), reason="numpy not installed")
+def test_numpy_column():
+    store = UserStatsStore([_stats("alice", 10), _stats("bob", 30)])
+
+    assert store.as_numpy("totalStars").sum() == 40
+    store.append(_stats("carol", 1))
+    assert len(store.as_numpy("totalStars")) == 3
+
+
+def test_numpy_column_without_numpy(monkeypatch):
+    monkeypatch.setattr(sys.modules["src.github.stats_store"], "numpy", None)
+
+    with pytest.raises(ValidationError, match="numpy"):
+        UserStatsStore().as_numpy("totalStars")
@@ -0,0 +1,90 @@
+"""Tests for streaming card renderers."""
+
+import base64
+import tracemalloc
+
+import pytest
+
+from src.core.config import ContribCardConfig, LangsCardConfig, StatsCardConfig
+from src.core.output import write_output_stream
+from src.github.langs_fetcher import Language
+from src.rendering.contrib import iter_contrib_card, render_contrib_card
+from src.rendering.langs import iter_top_languages, render_top_languages
+from src.rendering.stats import iter_stats_card, render_stats_card
+
+STATS = {
+    "name": "The Octocat",
+    "login": "octocat",
+    "totalCommits": 100,
+    "totalPRs": 50,
+    "mergedPRs": 40,
+    "totalIssues": 25,
+    "totalStars": 200,
+    "contributedTo": 10,
+    "followers": 50,
+    "totalReviews": 5,
+    "discussionsStarted": 2,
+    "discussionsAnswered": 1,
+}
+
+LANGS = {
+    "Python": Language(name="Python", color="#3572A5", size=1000, count=1),
+    "Go": Language(name="Go", color="#00ADD8", size=250, count=1),
+}
+
+
+def _contrib(repos: int, avatar_size: int = 64) -> dict:
+    return {
+        "repos": [
+            {
+                "name": f"octocat/repo{i}",
+                "stars": 100 - i,
+                "commits": 5,
+                "prs": 1,
+                "issues": 0,
+                "reviews": 0,
+                "rank_level": "A+",
+                "avatar_b64": (
+                    base64.b64encode(bytes([i]) * avatar_size).decode() if i % 2 else None
+                ),
+            }
+            for i in range(repos)
+        ]
+    }
+
+
+@pytest.mark.parametrize("minify", [False, True])
+@pytest.mark.parametrize(
+    ("render", "stream", "data", "config_type"),
+    [
+        (render_stats_card, iter_stats_card, STATS, StatsCardConfig),
+        (render_top_languages, iter_top_languages, LANGS, LangsCardConfig),
+        (render_contrib_card, iter_contrib_card, _contrib(5), ContribCardConfig),
+        (render_contrib_card, iter_contrib_card, _contrib(0), ContribCardConfig),
+    ],
+)
+def test_streamed_card_matches_rendered_card(render, stream, data, config_type, minify):
+    streamed = "".join(stream(data, config_type(minify=minify)))
+    assert streamed == render(data, config_type(minify=minify))
+
+
+def test_contrib_avatars_are_streamed_as_separate_chunks():
+    stats = _contrib(3)
+    chunks = list(iter_contrib_card(stats, ContribCardConfig()))
+    assert stats["repos"][1]["avatar_b64"] in chunks
+
+
+def test_streaming_contrib_card_peak_memory(tmp_path):
+    stats = _contrib(20, avatar_size=24 * 1024)
+    path = tmp_path / "contrib.svg"
+
+    tracemalloc.start()
+    try:
+        write_output_stream(str(path), iter_contrib_card(stats, ContribCardConfig()))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # Never holds the whole document (or a copy of it) in memory
+    assert peak < path.stat().st_size / 4
+    assert path.read_text() == render_contrib_card(stats, ContribCardConfig())
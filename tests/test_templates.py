@@ -0,0 +1,63 @@
+"""Tests for compiled card templates."""
+
+import pytest
+
+from src.core.constants import TEMPLATE_CACHE_MAXSIZE
+from src.core.exceptions import RenderError
+from src.rendering.base import get_card_template, render_card, template_cache_info
+from src.rendering.colors import get_card_colors
+from src.rendering.templates import compile_template, slot
+
+
+def test_compiled_template_fills_slots():
+    template = compile_template(f"<svg width='{slot('width')}'>{slot('body')}</svg>")
+
+    assert template.slots == ("width", "body")
+    assert template.render(width=10, body="<style>.a { fill: red; }</style>") == (
+        "<svg width='10'><style>.a { fill: red; }</style></svg>"
+    )
+
+
+def test_compiled_template_without_slots():
+    assert compile_template("<g>{static}</g>").render() == "<g>{static}</g>"
+
+
+def test_compiled_template_missing_value():
+    template = compile_template(f"<text>{slot('label')}</text>")
+
+    with pytest.raises(RenderError, match="label"):
+        template.render()
+
+
+@pytest.mark.parametrize("source", ["<g>\x00width</g>", f"<g>{slot('not valid')}</g>"])
+def test_compile_template_rejects_malformed_slots(source):
+    with pytest.raises(RenderError):
+        compile_template(source)
+
+
+def test_get_card_template_is_cached_per_theme_and_flags():
+    get_card_template.cache_clear()
+
+    first = get_card_template(theme="dark", hide_border=True)
+    again = get_card_template(theme="dark", hide_border=True)
+    other = get_card_template(theme="dark", hide_border=False)
+
+    assert first is again
+    assert other is not first
+    assert first.colors == get_card_colors(theme="dark")
+    assert template_cache_info() == {"hits": 1, "misses": 2, "size": 2}
+    assert get_card_template.cache_info().maxsize == TEMPLATE_CACHE_MAXSIZE
+
+
+def test_render_card_with_template_matches_resolved_colors():
+    kwargs = {"hide_title": False, "hide_border": True, "disable_animations": True}
+    template = get_card_template(theme="radical", bg_color="90,ff0000,00ff00", **kwargs)
+
+    with_template = render_card("A & B", "<g/>", 300, 120, template=template, **kwargs)
+    with_colors = render_card("A & B", "<g/>", 300, 120, colors=template.colors, **kwargs)
+
+    assert with_template == with_colors
+    assert "A &amp; B" in with_template
+    assert 'fill="url(#gradient)"' in with_template
+    assert 'stroke-opacity="0"' in with_template
+    assert "fadeInAnimation" not in with_template
@@ -80,3 +80,43 @@ def test_is_repo_excluded():
 
     # Empty patterns
     assert is_repo_excluded("repo", []) is False
+
+
+def test_repo_exclusion_matcher_matches_fnmatch_semantics():
+    import fnmatch
+
+    from src.core.utils import RepoExclusionMatcher
+
+    patterns = ["Docs", "owner/Site", "awesome-*", "*/tmp-?", "org/[ab]*", "exact[1]"]
+    names = [
+        "docs",
+        "owner/docs",
+        "owner/site",
+        "other/site",
+        "awesome-x",
+        "me/awesome-",
+        "me/tmp-1",
+        "tmp-1",
+        "org/alpha",
+        "org/cat",
+        "exact1",
+        "exact[1]",
+    ]
+    matcher = RepoExclusionMatcher(patterns)
+
+    for name in names:
+        lowered = name.lower()
+        expected = any(
+            fnmatch.fnmatchcase(lowered if "/" in p else lowered.split("/")[-1], p.lower())
+            for p in patterns
+        )
+        assert matcher.matches(name) is expected, name
+
+
+def test_repo_exclusion_matcher_truthiness():
+    from src.core.utils import RepoExclusionMatcher
+
+    assert not RepoExclusionMatcher([])
+    assert RepoExclusionMatcher(["repo"])
+    assert RepoExclusionMatcher(["repo-*"])
+    assert RepoExclusionMatcher([]).matches("owner/repo") is False
@@ -0,0 +1,138 @@
+"""Tests for the JSON-lines card worker."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.core.exceptions import FetchError
+from src.server import CardServer
+from src.worker import StdioWorker
+
+SAMPLE_STATS = {
+    "name": "The Octocat",
+    "login": "octocat",
+    "totalCommits": 100,
+    "totalPRs": 50,
+    "mergedPRs": 40,
+    "totalIssues": 25,
+    "totalStars": 200,
+    "contributedTo": 10,
+    "followers": 50,
+    "totalReviews": 5,
+    "discussionsStarted": 2,
+    "discussionsAnswered": 1,
+}
+
+
+@pytest.fixture
+def worker():
+    return StdioWorker(CardServer("token", cache_ttl=60))
+
+
+def _serve(worker, jobs):
+    lines = "\n".join(j if isinstance(j, str) else json.dumps(j) for j in jobs) + "\n"
+    out = io.StringIO()
+    worker.serve(io.StringIO(lines), out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_worker_writes_cards_and_reuses_caches(worker, tmp_path):
+    output = tmp_path / "cards" / "stats.svg"
+    job = {
+        "id": "a",
+        "card": "stats",
+        "username": "octocat",
+        "options": {"theme": "radical", "show_icons": True, "hide": ["prs", "issues"]},
+        "output": str(output),
+    }
+    with patch("src.server.fetch_stats", return_value=SAMPLE_STATS) as mock_fetch:
+        first, second = _serve(worker, [job, {**job, "id": "b"}])
+
+    assert mock_fetch.call_count == 1
+    assert first["id"] == "a"
+    assert first["ok"] is True
+    assert first["status"] == "generated"
+    assert first["output"] == str(output)
+    assert first["render_cached"] is False
+    assert set(first["timings"]) == {"fetch_ms", "render_ms", "write_ms", "total_ms"}
+
+    assert second["id"] == "b"
+    assert second["status"] == "unchanged"
+    assert second["render_cached"] is True
+    assert second["etag"] == first["etag"]
+
+    svg = output.read_text()
+    assert "#fe428e" in svg
+    assert "icon-prs" not in svg
+    assert first["bytes"] == len(svg.encode())
+
+
+def test_worker_returns_svg_without_output(worker):
+    with patch("src.server.fetch_contributor_stats", return_value={"repos": []}):
+        (reply,) = _serve(worker, [{"id": 1, "card": "contrib", "username": "octocat"}])
+
+    assert reply["ok"] is True
+    assert reply["status"] == "rendered"
+    assert reply["svg"].startswith("<svg")
+    assert "No contributions found" in reply["svg"]
+
+
+def test_worker_reports_errors_and_keeps_serving(worker):
+    with patch("src.server.fetch_stats", side_effect=FetchError("rate limited")):
+        replies = _serve(
+            worker,
+            [
+                "not json",
+                "",
+                {"id": 1, "card": "unknown", "username": "octocat"},
+                {"id": 2, "card": "stats"},
+                {"id": 3, "card": "stats", "username": "octocat", "options": {"line_height": "x"}},
+                {"id": 4, "card": "stats", "username": "octocat"},
+                [1, 2],
+                {"id": 5, "op": "metrics"},
+            ],
+        )
+
+    assert [r["id"] for r in replies] == [None, 1, 2, 3, 4, None, 5]
+    assert [r["ok"] for r in replies] == [False] * 6 + [True]
+    assert replies[0]["error_type"] == "JSONDecodeError"
+    assert "Unknown card type" in replies[1]["error"]
+    assert "username" in replies[2]["error"]
+    assert "line_height" in replies[3]["error"]
+    assert replies[4] == {
+        "id": 4,
+        "ok": False,
+        "error": "rate limited",
+        "error_type": "FetchError",
+        "timings": replies[4]["timings"],
+    }
+    assert replies[6]["metrics"]["fetch_cache"]["misses"] == 1
+    assert worker.jobs == 7
+    assert worker.failures == 6
+
+
+def test_worker_logs_unexpected_errors(worker, capsys):
+    with patch("src.server.fetch_stats", side_effect=KeyError("totalStars")):
+        reply = worker.handle_job({"id": 1, "card": "stats", "username": "octocat"})
+
+    assert reply["ok"] is False
+    assert reply["error_type"] == "KeyError"
+    assert worker.failures == 1
+    stderr = capsys.readouterr().err
+    assert "Traceback" in stderr and "KeyError: 'totalStars'" in stderr
+
+
+def test_serve_stdio_command():
+    job = json.dumps({"id": 1, "card": "stats", "username": "octocat"})
+    with patch("src.server.fetch_stats", return_value=SAMPLE_STATS):
+        result = CliRunner().invoke(cli, ["serve-stdio", "-t", "token"], input=job + "\n")
+
+    assert result.exit_code == 0
+    reply = json.loads(result.stdout)
+    assert reply["id"] == 1
+    assert reply["ok"] is True
+    assert "Processed 1 jobs (0 failed)" in result.stderr